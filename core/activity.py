@@ -5,7 +5,8 @@ that the Web UI dashboard reads. This module has NO web framework imports
 so it can be used from core/app.py (CLI path) as well as from the web layer.
 
 Both CLI runs and web-triggered runs write to the same files:
-  - data/recent_activity.json   (per-file activity feed)
+  - data/recent_activity.jsonl  (per-file activity feed, append-only segments
+                                 plus a recent_activity.json snapshot)
   - data/last_run.txt           (last run timestamp)
   - data/last_run_summary.json  (run statistics)
 """
@@ -16,9 +17,11 @@ import os
 import threading
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Optional
+from collections import deque
+from typing import Deque, List, Optional
 from dataclasses import dataclass, field
 
+from core import json_codec
 from core.system_utils import format_bytes
 from core.file_operations import save_json_atomically
 
@@ -76,7 +79,7 @@ def get_time_format() -> str:
     try:
         if SETTINGS_FILE.exists():
             with open(SETTINGS_FILE, 'r', encoding='utf-8') as f:
-                settings = json.load(f)
+                settings = json_codec.load(f)
             fmt = settings.get("time_format", "24h")
             if fmt in ("12h", "24h"):
                 return fmt
@@ -90,7 +93,7 @@ def _get_activity_retention_hours() -> int:
     try:
         if SETTINGS_FILE.exists():
             with open(SETTINGS_FILE, 'r', encoding='utf-8') as f:
-                settings = json.load(f)
+                settings = json_codec.load(f)
             return settings.get('activity_retention_hours', DEFAULT_ACTIVITY_RETENTION_HOURS)
     except (json.JSONDecodeError, IOError):
         pass
@@ -150,70 +153,225 @@ class FileActivity:
 
 # ---------------------------------------------------------------------------
 # Activity persistence (load / save)
+#
+# Storage, all next to ACTIVITY_FILE:
+#   recent_activity.json      compacted snapshot (JSON array, oldest entries)
+#   recent_activity.jsonl     active segment, one JSON object per line
+#   recent_activity.jsonl.N   rotated segments (.1 newest ... oldest)
+#
+# Recording an activity appends one line to the active segment, which is
+# rotated once it passes ACTIVITY_SEGMENT_MAX_BYTES. save_activity() is the
+# compaction step: it rewrites the snapshot and drops the segments. Readers
+# are served from an in-memory ring of the newest MAX_RECENT_ACTIVITY
+# entries that is only rebuilt when the files change on disk (e.g. the CLI
+# appended while the web UI is running).
 # ---------------------------------------------------------------------------
 
-def _load_activity_unlocked() -> List[FileActivity]:
-    """Load activity from disk without acquiring _activity_file_lock.
+ACTIVITY_SEGMENT_MAX_BYTES = 512 * 1024  # ~2000 entries, well above MAX_RECENT_ACTIVITY
+ACTIVITY_SEGMENTS_KEPT = 2  # rotated segments kept besides the active one
+
+# Newest-first ring and the on-disk signature it was built from
+_activity_ring: Deque[FileActivity] = deque(maxlen=MAX_RECENT_ACTIVITY)
+_activity_ring_signature: Optional[tuple] = None
+
+
+def _segment_paths() -> List[Path]:
+    """Return the active segment followed by the rotated segments, newest first."""
+    active = ACTIVITY_FILE.with_suffix('.jsonl')
+    return [active] + [
+        active.with_name(f"{active.name}.{i}") for i in range(1, ACTIVITY_SEGMENTS_KEPT + 1)
+    ]
+
+
+def _activity_signature() -> tuple:
+    """Identity of the snapshot and segment files, used to detect external writes."""
+    signature = []
+    for path in [ACTIVITY_FILE] + _segment_paths():
+        try:
+            st = os.stat(path)
+            signature.append((str(path), st.st_ino, st.st_size, st.st_mtime_ns))
+        except OSError:
+            signature.append((str(path), None))
+    return tuple(signature)
+
+
+def _activity_to_record(activity: FileActivity) -> dict:
+    record = {
+        'timestamp': activity.timestamp.isoformat(),
+        'action': activity.action,
+        'filename': activity.filename,
+        'size_bytes': activity.size_bytes,
+        'users': activity.users,
+    }
+    if activity.associated_files:
+        record['associated_files'] = activity.associated_files
+    return record
+
+
+def _activity_from_record(item: dict) -> FileActivity:
+    """Build a FileActivity from a stored record. Raises on malformed input."""
+    return FileActivity(
+        timestamp=datetime.fromisoformat(item['timestamp']),
+        action=item['action'],
+        filename=item['filename'],
+        size_bytes=item.get('size_bytes', 0),
+        users=item.get('users', []),
+        associated_files=item.get('associated_files', [])
+    )
 
-    Caller MUST hold _activity_file_lock.
-    """
+
+def _read_segment(path: Path) -> List[FileActivity]:
+    """Read one JSONL segment, skipping malformed or partially written lines."""
+    activities = []
     try:
-        if not ACTIVITY_FILE.exists():
-            return []
-        with open(ACTIVITY_FILE, 'r') as f:
-            data = json.load(f)
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    activities.append(_activity_from_record(json_codec.loads(line)))
+                except (KeyError, ValueError, TypeError, AttributeError):
+                    continue
+    except FileNotFoundError:
+        pass
+    return activities
 
-        cutoff = datetime.now() - timedelta(hours=_get_activity_retention_hours())
-        activities = []
 
-        for item in data:
-            try:
-                timestamp = datetime.fromisoformat(item['timestamp'])
-                if timestamp > cutoff:
-                    activities.append(FileActivity(
-                        timestamp=timestamp,
-                        action=item['action'],
-                        filename=item['filename'],
-                        size_bytes=item.get('size_bytes', 0),
-                        users=item.get('users', []),
-                        associated_files=item.get('associated_files', [])
-                    ))
-            except (KeyError, ValueError):
-                continue  # Skip malformed entries
-
-        activities.sort(key=lambda x: x.timestamp, reverse=True)
-        return activities[:MAX_RECENT_ACTIVITY]
+def _read_snapshot() -> List[FileActivity]:
+    """Read the compacted JSON snapshot (also the pre-segment file format)."""
+    try:
+        with open(ACTIVITY_FILE, 'rb') as f:
+            data = json_codec.load(f)
+    except FileNotFoundError:
+        return []
+    except (ValueError, OSError) as e:
+        logger.debug(f"Could not load activity history: {e}")
+        return []
+
+    activities = []
+    for item in data:
+        try:
+            activities.append(_activity_from_record(item))
+        except (KeyError, ValueError, TypeError, AttributeError):
+            continue  # Skip malformed entries
+    return activities
+
+
+def _refresh_ring_unlocked() -> None:
+    """Rebuild the in-memory ring if the files changed since it was built.
+
+    Segments are read newest first and the (older) snapshot is only read
+    when the segments hold fewer than MAX_RECENT_ACTIVITY entries.
+    """
+    global _activity_ring, _activity_ring_signature
+    signature = _activity_signature()
+    if signature == _activity_ring_signature:
+        return
+
+    activities: List[FileActivity] = []
+    for path in _segment_paths():
+        activities.extend(_read_segment(path))
+        if len(activities) >= MAX_RECENT_ACTIVITY:
+            break
+    else:
+        activities.extend(_read_snapshot())
+
+    activities.sort(key=lambda x: x.timestamp, reverse=True)
+    _activity_ring = deque(activities[:MAX_RECENT_ACTIVITY], maxlen=MAX_RECENT_ACTIVITY)
+    _activity_ring_signature = signature
+
+
+def _load_activity_unlocked() -> List[FileActivity]:
+    """Load activity without acquiring _activity_file_lock.
 
+    Caller MUST hold _activity_file_lock. Returns a new list (newest first)
+    of the ring entries still inside the retention window.
+    """
+    try:
+        _refresh_ring_unlocked()
     except Exception as e:
         logger.debug(f"Could not load activity history: {e}")
         return []
+    cutoff = datetime.now() - timedelta(hours=_get_activity_retention_hours())
+    return [activity for activity in _activity_ring if activity.timestamp > cutoff]
 
 
 def _save_activity_unlocked(activities: List[FileActivity]) -> None:
-    """Save activity to disk without acquiring _activity_file_lock.
+    """Compact: write ``activities`` as the snapshot and drop all segments.
 
     Caller MUST hold _activity_file_lock.
     """
+    global _activity_ring, _activity_ring_signature
     try:
         ACTIVITY_FILE.parent.mkdir(parents=True, exist_ok=True)
 
         cutoff = datetime.now() - timedelta(hours=_get_activity_retention_hours())
+        kept = [activity for activity in activities if activity.timestamp > cutoff]
+        data = [_activity_to_record(activity) for activity in kept]
+
+        if not save_json_atomically(str(ACTIVITY_FILE), data, label="activity"):
+            return
+        for path in _segment_paths():
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+        kept.sort(key=lambda x: x.timestamp, reverse=True)
+        _activity_ring = deque(kept[:MAX_RECENT_ACTIVITY], maxlen=MAX_RECENT_ACTIVITY)
+        _activity_ring_signature = _activity_signature()
+
+    except Exception as e:
+        logger.debug(f"Could not save activity history: {e}")
+
+
+def _rotate_segments_unlocked() -> bool:
+    """Shift segments down one slot (active becomes .1), dropping the oldest.
+
+    Once a rotated segment falls off the end, the snapshot only holds even
+    older entries, so it is removed as well.
 
-        data = []
-        for activity in activities:
-            if activity.timestamp > cutoff:
-                entry = {
-                    'timestamp': activity.timestamp.isoformat(),
-                    'action': activity.action,
-                    'filename': activity.filename,
-                    'size_bytes': activity.size_bytes,
-                    'users': activity.users,
-                }
-                if activity.associated_files:
-                    entry['associated_files'] = activity.associated_files
-                data.append(entry)
-
-        save_json_atomically(str(ACTIVITY_FILE), data, label="activity")
+    Returns:
+        True if old entries were dropped from disk.
+    """
+    paths = _segment_paths()
+    dropping_oldest = paths[-1].exists()
+    for i in range(len(paths) - 1, 0, -1):
+        try:
+            os.replace(paths[i - 1], paths[i])
+        except FileNotFoundError:
+            pass
+    if dropping_oldest:
+        try:
+            ACTIVITY_FILE.unlink()
+        except FileNotFoundError:
+            pass
+    return dropping_oldest
+
+
+def _append_activity_unlocked(entry: FileActivity) -> None:
+    """Append one entry to the active segment without acquiring the lock.
+
+    Caller MUST hold _activity_file_lock.
+    """
+    global _activity_ring_signature
+    try:
+        ring_in_sync = _activity_signature() == _activity_ring_signature
+        active = _segment_paths()[0]
+        active.parent.mkdir(parents=True, exist_ok=True)
+        with open(active, 'a', encoding='utf-8') as f:
+            f.write(json_codec.dumps(_activity_to_record(entry)) + "\n")
+            size = f.tell()
+        if size >= ACTIVITY_SEGMENT_MAX_BYTES and _rotate_segments_unlocked():
+            ring_in_sync = False  # rebuild from disk on next read
+
+        # Keep the ring current instead of re-reading what we just wrote
+        if ring_in_sync:
+            _activity_ring.appendleft(entry)
+            _activity_ring_signature = _activity_signature()
+        else:
+            _activity_ring_signature = None
 
     except Exception as e:
         logger.debug(f"Could not save activity history: {e}")
@@ -231,8 +389,14 @@ def save_activity(activities: List[FileActivity]) -> None:
         _save_activity_unlocked(activities)
 
 
+def append_activity(entry: FileActivity) -> None:
+    """Append a single entry to the activity log (O(1), no rewrite)."""
+    with _activity_file_lock:
+        _append_activity_unlocked(entry)
+
+
 # ---------------------------------------------------------------------------
-# Convenience: record a single file activity (load-merge-save)
+# Convenience: record a single file activity
 # ---------------------------------------------------------------------------
 
 def record_file_activity(
@@ -242,10 +406,10 @@ def record_file_activity(
     users: Optional[List[str]] = None,
     associated_files: Optional[List[dict]] = None,
 ) -> None:
-    """Record a single file activity entry using load-merge-save pattern.
+    """Record a single file activity entry by appending it to the activity log.
 
-    Thread-safe: acquires _activity_file_lock for the full sequence.
-    Safe for concurrent use by CLI and web writers.
+    Thread-safe: acquires _activity_file_lock for the append. Safe for
+    concurrent use by CLI and web writers (each write is one appended line).
     """
     entry = FileActivity(
         timestamp=datetime.now(),
@@ -255,11 +419,7 @@ def record_file_activity(
         users=users or [],
         associated_files=associated_files or [],
     )
-    with _activity_file_lock:
-        activities = _load_activity_unlocked()
-        activities.insert(0, entry)
-        activities = activities[:MAX_RECENT_ACTIVITY]
-        _save_activity_unlocked(activities)
+    append_activity(entry)
 
 
 # ---------------------------------------------------------------------------
@@ -285,7 +445,7 @@ def load_last_run_summary() -> Optional[dict]:
     try:
         if LAST_RUN_SUMMARY_FILE.exists():
             with open(LAST_RUN_SUMMARY_FILE, 'r', encoding='utf-8') as f:
-                return json.load(f)
+                return json_codec.load(f)
     except (json.JSONDecodeError, IOError):
         pass
     return None
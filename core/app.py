@@ -25,10 +25,14 @@ except ImportError:
 from core import __version__
 from core.config import ConfigManager
 from core.logging_config import LoggingManager, reset_warning_error_flag
-from core.system_utils import SystemDetector, FileUtils, SingleInstanceLock, get_disk_usage, get_array_direct_path, detect_zfs, set_zfs_prefixes, format_bytes
+from core.system_utils import SystemDetector, FileUtils, SingleInstanceLock, get_disk_usage, get_array_direct_path, detect_zfs, set_zfs_prefixes, format_bytes, write_text_atomically, remove_stale_partial_copies
 from core.plex_api import PlexManager, OnDeckItem
+from core.http_sessions import log_connection_stats
+from core.rate_limiter import log_rate_limit_stats
 from core.file_operations import MultiPathModifier, SiblingFileFinder, FileFilter, FileMover, PlexcachedRestorer, CacheTimestampTracker, WatchlistTracker, OnDeckTracker, CachePriorityManager, PlexcachedMigration, get_media_identity, find_matching_plexcached, is_directory_level_file
 from core.pinned_media import PinnedMediaTracker, resolve_pins_to_paths
+from core.state_store import create_state_backend, JournaledStateBackend
+from core.exclude_list import get_exclude_list
 
 
 class PlexCacheApp:
@@ -87,6 +91,8 @@ class PlexCacheApp:
         self.evicted_bytes = 0
         # Deferred exclude list removal for move-back files (issue #13)
         self._move_back_exclude_paths: list = []
+        # Unraid mover exclusions sync result (None = not run this time)
+        self.mover_exclusions_changed: Optional[int] = None
 
         # Stop request flag (for web UI to abort operations)
         self._stop_requested = False
@@ -209,6 +215,7 @@ class PlexCacheApp:
             # Clean up stale exclude list entries (self-healing)
             # Skip in dry-run mode to avoid modifying tracking files
             if not self.dry_run:
+                self._remove_stale_partial_copies()
                 self.file_filter.clean_stale_exclude_entries()
             else:
                 logging.debug("[DRY RUN] Skipping stale exclude list cleanup")
@@ -270,6 +277,11 @@ class PlexCacheApp:
             else:
                 print(f"Application error: {type(e).__name__}: {e}")
             raise
+        finally:
+            # Compact the timestamp write-behind journal on every exit path
+            # (stop requests return early and skip _finish)
+            if getattr(self, 'timestamp_tracker', None):
+                self.timestamp_tracker.flush()
 
     def _migrate_exclude_file(self) -> None:
         """One-time migration: rename old exclude file to new name."""
@@ -301,24 +313,30 @@ class PlexCacheApp:
                 logging.warning(f"Could not remove legacy exclude file: {e}")
     
 
-    def _update_unraid_mover_exclusions(self, tag_line: str = "### Plexcache exclusions below this line") -> None:
+    def _update_unraid_mover_exclusions(self, tag_line: str = "### Plexcache exclusions below this line") -> int:
         """
         Update the Unraid mover exclusions file by inserting or updating the
         PlexCache exclusions section. Paths are retrieved from the config.
+
+        The file is only rewritten (atomically, temp file + rename) when its
+        content actually changes, to avoid needless writes to flash storage.
+
+        Returns:
+            Number of entries added to or removed from the PlexCache section.
         """
 
         # Get paths from config
         exclusion_path = self.config_manager.get_unraid_mover_exclusions_file()
         plexcache_path = self.config_manager.get_cached_files_file()
 
-        # Ensure the main file exists
-        if not exclusion_path.exists():
+        # Read current exclusion file (missing file = empty)
+        try:
+            with open(exclusion_path, "r", encoding="utf-8") as f:
+                current_content = f.read()
+        except FileNotFoundError:
             exclusion_path.parent.mkdir(parents=True, exist_ok=True)
-            exclusion_path.touch()
-
-        # Read current exclusion file
-        with open(exclusion_path, "r", encoding="utf-8") as f:
-            lines = f.read().splitlines()
+            current_content = None
+        lines = (current_content or "").splitlines()
 
         # Ensure the tag line exists
         if tag_line not in lines:
@@ -328,21 +346,34 @@ class PlexCacheApp:
 
         # Keep only content above the tag (inclusive)
         tag_index = lines.index(tag_line)
+        old_entries = [ln.strip() for ln in lines[tag_index + 1:] if ln.strip()]
         lines = lines[:tag_index + 1]
 
         # Load new exclusion entries from plexcache file
         if plexcache_path.exists():
-            with open(plexcache_path, "r", encoding="utf-8") as f:
-                new_entries = [ln.strip() for ln in f if ln.strip()]
+            new_entries = get_exclude_list(plexcache_path).entries()
         else:
             new_entries = []
 
         # Append the new entries
         lines.extend(new_entries)
 
-        # Write updated file back
-        with open(exclusion_path, "w", encoding="utf-8") as f:
-            f.write("\n".join(lines) + "\n")
+        old_set = set(old_entries)
+        new_set = set(new_entries)
+        changed = len(new_set - old_set) + len(old_set - new_set)
+        self.mover_exclusions_changed = changed
+
+        new_content = "\n".join(lines) + "\n"
+        if new_content == current_content:
+            logging.debug(f"[MOVER] Exclusions file unchanged ({len(new_entries)} PlexCache entries), skipping write")
+            return changed
+
+        write_text_atomically(exclusion_path, new_content)
+        logging.debug(
+            f"[MOVER] Exclusions file updated: +{len(new_set - old_set)} / -{len(old_set - new_set)} "
+            f"PlexCache entries ({len(new_entries)} total)"
+        )
+        return changed
 
 
 
@@ -427,6 +458,15 @@ class PlexCacheApp:
         move_verb = "Would move" if self.dry_run else "Moved"
         logging.info(f"[RESULTS] {move_verb} to cache: {actually_moved} files")
         logging.info(f"[RESULTS] {move_verb} to array: {moved_to_array} files")
+        file_utils = getattr(self, 'file_utils', None)
+        if getattr(file_utils, 'reflinked_files', 0) > 0:
+            logging.info(f"[RESULTS] Reflinked: {file_utils.reflinked_files} files "
+                         f"({format_bytes(file_utils.reflinked_bytes)}, no data copied)")
+        if self.file_mover and not self.dry_run:
+            for line in self.file_mover.disk_throughput_lines():
+                logging.info(f"[RESULTS] Disk throughput {line}")
+        if self.mover_exclusions_changed is not None:
+            logging.info(f"[RESULTS] Mover exclusions: {self.mover_exclusions_changed} entries changed")
 
         # Show eviction stats if any files were evicted
         if self.evicted_count > 0:
@@ -437,6 +477,12 @@ class PlexCacheApp:
         # Additional detail at DEBUG level
         # Note: Empty folder cleanup now happens immediately during file operations
         # (per File and Folder Management Policy) and is logged at DEBUG level as it occurs
+        plex_manager = getattr(self, 'plex_manager', None)
+        if plex_manager is not None:
+            plex_manager.log_episode_cache_stats()
+            plex_manager.log_library_index_stats()
+        log_connection_stats()
+        log_rate_limit_stats()
 
     def _is_mover_running(self) -> bool:
         """Check if the Unraid mover is currently running.
@@ -495,14 +541,17 @@ class PlexCacheApp:
         logging.debug("Initializing Plex manager...")
         token_cache_file = str(self.config_manager.get_user_tokens_file())
         rss_cache_file = str(self.config_manager.get_rss_cache_file())
+        library_index_file = str(self.config_manager.get_library_index_file())
         self.plex_manager = PlexManager(
             plex_url=self.config_manager.plex.plex_url,
             plex_token=self.config_manager.plex.plex_token,
-            retry_limit=self.config_manager.performance.retry_limit,
-            delay=self.config_manager.performance.delay,
             token_cache_file=token_cache_file,
             rss_cache_file=rss_cache_file,
-            plex_db_path=self.config_manager.plex.plex_db_path
+            plex_db_path=self.config_manager.plex.plex_db_path,
+            fetch_engine=self.config_manager.performance.plex_fetch_engine,
+            ondeck_source=self.config_manager.plex.ondeck_source,
+            plex_db_snapshot=self.config_manager.plex.plex_db_snapshot,
+            library_index_file=library_index_file
         )
 
     def _init_path_modifier(self) -> None:
@@ -540,19 +589,40 @@ class PlexCacheApp:
             max_concurrent = self.config_manager.performance.max_concurrent_moves_array
             migration.run_migration(dry_run=self.dry_run, max_concurrent=max_concurrent)
 
-        self.timestamp_tracker = CacheTimestampTracker(str(timestamp_file))
+        state_backend = self.config_manager.performance.state_backend
+        if state_backend != "json":
+            logging.info(f"[CONFIG] Tracker state backend: {state_backend}")
+
+        timestamp_backend = create_state_backend(timestamp_file, state_backend, "timestamp")
+        if self.config_manager.performance.timestamp_write_behind:
+            logging.info("[CONFIG] Timestamp write-behind journal: ENABLED")
+            timestamp_backend = JournaledStateBackend(timestamp_backend)
+        self.timestamp_tracker = CacheTimestampTracker(str(timestamp_file), backend=timestamp_backend)
 
         watchlist_tracker_file = self.config_manager.get_watchlist_tracker_file()
-        self.watchlist_tracker = WatchlistTracker(str(watchlist_tracker_file))
+        self.watchlist_tracker = WatchlistTracker(
+            str(watchlist_tracker_file),
+            backend=create_state_backend(watchlist_tracker_file, state_backend, "watchlist"))
 
         ondeck_tracker_file = str(self.config_manager.get_ondeck_tracker_file())
-        self.ondeck_tracker = OnDeckTracker(ondeck_tracker_file)
+        self.ondeck_tracker = OnDeckTracker(
+            ondeck_tracker_file,
+            backend=create_state_backend(ondeck_tracker_file, state_backend, "OnDeck"))
 
         pinned_media_file = str(self.config_manager.get_pinned_media_file())
-        self.pinned_tracker = PinnedMediaTracker(pinned_media_file)
+        self.pinned_tracker = PinnedMediaTracker(
+            pinned_media_file,
+            backend=create_state_backend(pinned_media_file, state_backend, "pinned_media"))
 
     def _init_file_operations(self, mover_exclude) -> None:
         """Initialize file filter and file mover."""
+        performance = self.config_manager.performance
+        self.file_utils.copy_preallocate = performance.copy_preallocate
+        self.file_utils.copy_drop_page_cache = performance.copy_drop_page_cache
+        if performance.copy_preallocate or performance.copy_drop_page_cache:
+            logging.info(f"[CONFIG] Copy modes: preallocate={performance.copy_preallocate}, "
+                         f"drop_page_cache={performance.copy_drop_page_cache}")
+
         self.file_filter = FileFilter(
             real_source=self.config_manager.paths.real_source,
             cache_dir=self.config_manager.paths.cache_dir,
@@ -586,9 +656,23 @@ class PlexCacheApp:
             bytes_progress_callback=self._bytes_progress_callback,
             ondeck_tracker=self.ondeck_tracker,
             watchlist_tracker=self.watchlist_tracker,
-            file_activity_callback=self._record_file_activity if self._record_activity else None
+            file_activity_callback=self._record_file_activity if self._record_activity else None,
+            max_concurrent_moves_per_disk=performance.max_concurrent_moves_per_disk,
+            copy_resumable=performance.copy_resumable
         )
 
+    def _remove_stale_partial_copies(self) -> None:
+        """Remove resumable-copy partials that were not resumed in time (copy_resumable only)."""
+        if not self.config_manager.performance.copy_resumable:
+            return
+        cache_roots = {mapping.cache_path for mapping in self.config_manager.paths.path_mappings or []
+                       if mapping.enabled and mapping.cacheable and mapping.cache_path}
+        if not cache_roots and self.config_manager.paths.cache_dir:
+            cache_roots = {self.config_manager.paths.cache_dir}
+        removed = sum(remove_stale_partial_copies(root) for root in sorted(cache_roots) if os.path.isdir(root))
+        if removed:
+            logging.info(f"[COPY] Removed {removed} stale partial copies")
+
     def _init_cache_management(self) -> None:
         """Initialize cache priority manager."""
         # Note: Empty folder cleanup is now handled immediately during file operations
@@ -2117,8 +2201,7 @@ class PlexCacheApp:
         plexcache_tracked = 0
         cached_files = []
         try:
-            with open(exclude_file, 'r') as f:
-                host_paths = [line.strip() for line in f if line.strip()]
+            host_paths = get_exclude_list(exclude_file).entries()
 
             for host_path in host_paths:
                 # In Docker, exclude file has host paths but we need container paths
@@ -2877,6 +2960,7 @@ class PlexCacheApp:
         restored_count = getattr(self, 'restored_count', 0)
         restored_bytes = getattr(self, 'restored_bytes', 0)
         already_cached = getattr(self.file_filter, 'last_already_cached_count', 0) if self.file_filter else 0
+        reflinked_bytes = getattr(getattr(self, 'file_utils', None), 'reflinked_bytes', 0)
 
         self.logging_manager.set_summary_data(
             cached_count=cached_count,
@@ -2887,7 +2971,8 @@ class PlexCacheApp:
             duration_seconds=execution_time_seconds,
             had_errors=False,  # Could track this via error count if needed
             had_warnings=False,
-            dry_run=self.dry_run
+            dry_run=self.dry_run,
+            reflinked_bytes=reflinked_bytes,
         )
 
         self.logging_manager.log_summary()
@@ -2922,6 +3007,7 @@ class PlexCacheApp:
                 "files_restored": restored_count,
                 "bytes_cached": cached_bytes,
                 "bytes_restored": restored_bytes,
+                "bytes_reflinked": reflinked_bytes,
                 "duration_seconds": round(execution_time_seconds, 1),
                 "error_count": 0,
                 "dry_run": False,
@@ -3079,8 +3165,7 @@ def _run_show_priorities(config_file: str, verbose: bool = False) -> None:
         return
 
     # Read cached files from exclude list
-    with open(mover_exclude, 'r') as f:
-        cached_files = [line.strip() for line in f if line.strip()]
+    cached_files = get_exclude_list(mover_exclude).entries()
 
     if not cached_files:
         print("Exclude file is empty. No files are currently cached.")
@@ -3091,9 +3176,13 @@ def _run_show_priorities(config_file: str, verbose: bool = False) -> None:
     watchlist_tracker_file = config_manager.get_watchlist_tracker_file()
     ondeck_tracker_file = config_manager.get_ondeck_tracker_file()
 
-    timestamp_tracker = CacheTimestampTracker(str(timestamp_file))
-    watchlist_tracker = WatchlistTracker(str(watchlist_tracker_file))
-    ondeck_tracker = OnDeckTracker(str(ondeck_tracker_file))
+    state_backend = config_manager.performance.state_backend
+    timestamp_tracker = CacheTimestampTracker(
+        str(timestamp_file), backend=create_state_backend(timestamp_file, state_backend, "timestamp"))
+    watchlist_tracker = WatchlistTracker(
+        str(watchlist_tracker_file), backend=create_state_backend(watchlist_tracker_file, state_backend, "watchlist"))
+    ondeck_tracker = OnDeckTracker(
+        str(ondeck_tracker_file), backend=create_state_backend(ondeck_tracker_file, state_backend, "OnDeck"))
 
     # Get eviction settings (use defaults if not set)
     eviction_min_priority = getattr(config_manager.cache, 'eviction_min_priority', 60)
@@ -9,7 +9,10 @@ import logging
 from pathlib import Path
 from typing import Dict, Any, Optional, List, Tuple
 from dataclasses import dataclass
+from core import json_codec
 from core.system_utils import parse_size_bytes
+from core.state_store import normalize_state_backend
+from core.plex_async import normalize_fetch_engine
 
 # Get the directory where config.py is located
 _SCRIPT_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
@@ -97,6 +100,18 @@ class PathConfig:
             self.plex_library_folders = []
 
 
+ONDECK_SOURCES = ("api", "db", "verify")
+
+
+def normalize_ondeck_source(value: Any) -> str:
+    """Return a valid ondeck_source, falling back to "api" on bad input."""
+    source = str(value or "api").strip().lower()
+    if source not in ONDECK_SOURCES:
+        logging.warning(f"Invalid ondeck_source '{value}', using 'api'")
+        return "api"
+    return source
+
+
 @dataclass
 class PlexConfig:
     """Configuration for Plex server settings."""
@@ -117,6 +132,15 @@ class PlexConfig:
     # "highest", "lowest", "1080p", "720p", "4k", "first".
     # See core/pinned_media.select_media_version().
     pinned_preferred_resolution: str = "highest"
+    # Where OnDeck comes from: "api" (Plex API per user; plex_db_path only covers
+    # tokenless shared users), "db" (every user straight from the Plex database,
+    # API only if the DB is missing/locked/unreadable), or "verify" (API result is
+    # used, and the DB result is diffed against it in the log).
+    ondeck_source: str = "api"
+    # Copy the Plex database to a local temp file (SQLite backup API) once per
+    # run and query that copy, instead of reading the live file Plex is writing.
+    # Needs temp space for a full copy of the database.
+    plex_db_snapshot: bool = False
 
     def __post_init__(self):
         if self.valid_sections is None:
@@ -246,9 +270,39 @@ class PerformanceConfig:
     """Configuration for performance settings."""
     max_concurrent_moves_array: int = 2
     max_concurrent_moves_cache: int = 5
+    # Moves are queued per physical array disk and dispatched round-robin, with at
+    # most this many running on any one Unraid array disk (/mnt/diskN). Paths that
+    # don't resolve to an array disk (Docker without the disk mounts, non-Unraid)
+    # are only bounded by the global caps above.
+    max_concurrent_moves_per_disk: int = 1
+    # Deprecated: plex.tv retries and 429 backoff are handled by the shared rate
+    # limiter (core/rate_limiter.py) and _retry_plextv_call; these are no longer
+    # read and are only kept so existing code referencing them keeps working.
     retry_limit: int = 5
     delay: int = 10
     permissions: int = 0o777
+    # Tracker state storage: "json" (one file per tracker, rewritten on every change)
+    # or "sqlite" (single WAL-mode database with per-entry upserts, for large libraries).
+    # Switching in either direction migrates the existing data on the next load.
+    state_backend: str = "json"
+    # Write-behind journaling for the timestamp tracker: per-file changes are appended
+    # to timestamps.json.journal (fsynced in batches) and compacted into the snapshot at
+    # end of run, instead of rewriting the snapshot on every cached/restored file.
+    timestamp_write_behind: bool = False
+    # Plex OnDeck/watchlist fetch engine: "threads" (one worker per user, serial
+    # requests inside it) or "async" (per-user, per-section and per-item requests
+    # overlapped under global/per-host limits — see core/plex_async.py).
+    plex_fetch_engine: str = "threads"
+    # Large-file copy modes (see core.system_utils.copy_file_data):
+    # preallocate the destination with posix_fallocate before writing (fewer
+    # extents, ENOSPC up front), and keep copies from flushing Plex's working set
+    # out of the page cache (SEQUENTIAL + DONTNEED on the copied ranges).
+    copy_preallocate: bool = False
+    copy_drop_page_cache: bool = False
+    # Resumable cache copies: files of RESUMABLE_MIN_SIZE and up are copied through a
+    # hidden partial file with a resume record, so a stopped or crashed run continues
+    # the copy next time instead of starting from byte 0.
+    copy_resumable: bool = False
 
 
 @dataclass
@@ -392,8 +446,8 @@ class ConfigManager:
             raise FileNotFoundError(f"Settings file not found: {self.config_file}")
         
         try:
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                self.settings_data = json.load(f)
+            with open(self.config_file, 'rb') as f:
+                self.settings_data = json_codec.load(f)
             logging.debug("Configuration file loaded successfully")
         except json.JSONDecodeError as e:
             logging.error(f"Invalid JSON in settings file: {type(e).__name__}: {e}")
@@ -449,6 +503,8 @@ class ConfigManager:
         self.plex.pinned_preferred_resolution = self.settings_data.get(
             'pinned_preferred_resolution', 'highest'
         )
+        self.plex.ondeck_source = normalize_ondeck_source(self.settings_data.get('ondeck_source', 'api'))
+        self.plex.plex_db_snapshot = bool(self.settings_data.get('plex_db_snapshot', False))
 
         # Load users list first (contains tokens and per-user skip settings)
         self.plex.users = self.settings_data.get('users', [])
@@ -620,6 +676,14 @@ class ConfigManager:
         """Load performance-related configuration."""
         self.performance.max_concurrent_moves_array = self.settings_data['max_concurrent_moves_array']
         self.performance.max_concurrent_moves_cache = self.settings_data['max_concurrent_moves_cache']
+        self.performance.max_concurrent_moves_per_disk = max(
+            1, int(self.settings_data.get('max_concurrent_moves_per_disk', 1)))
+        self.performance.state_backend = normalize_state_backend(self.settings_data.get('state_backend', 'json'))
+        self.performance.timestamp_write_behind = bool(self.settings_data.get('timestamp_write_behind', False))
+        self.performance.plex_fetch_engine = normalize_fetch_engine(self.settings_data.get('plex_fetch_engine', 'threads'))
+        self.performance.copy_preallocate = bool(self.settings_data.get('copy_preallocate', False))
+        self.performance.copy_drop_page_cache = bool(self.settings_data.get('copy_drop_page_cache', False))
+        self.performance.copy_resumable = bool(self.settings_data.get('copy_resumable', False))
 
     def _load_notification_config(self) -> None:
         """Load notification-related configuration."""
@@ -1017,6 +1081,10 @@ class ConfigManager:
         """Get the path for the RSS feed cache file."""
         return self.get_data_folder() / "rss_cache.json"
 
+    def get_library_index_file(self) -> Path:
+        """Get the path for the library GUID index file."""
+        return self.get_data_folder() / "library_index.json"
+
     def get_lock_file(self) -> Path:
         """Get the path for the instance lock file."""
         script_folder = Path(self.paths.script_folder)
@@ -0,0 +1,228 @@
+"""Shared in-memory view of the mover exclude list (plexcache_cached_files.txt).
+
+The exclude list is read by the Unraid mover (via the mover exclusions file)
+and written by the CLI run, the web UI and maintenance actions. Historically
+every add re-read the whole file to dedupe and every remove rewrote it, so a
+300-file batch did hundreds of full reads of a file with thousands of lines.
+
+``ExcludeList`` keeps the entries as an ordered set for the life of the
+process:
+
+- ``add()`` appends one line when the entry is new. No read is needed.
+- ``remove()`` drops the entry in memory. Inside ``batch()`` the rewrite is
+  deferred until the batch ends, so many removals cost one atomic rewrite
+  (temp file + rename).
+- Every access stat()s the file. If another process changed it, the
+  entries are reloaded before use.
+
+Use ``get_exclude_list(path)`` to get the process-wide instance for a file so
+the CLI run, FileFilter/FileMover and the web services share one view.
+"""
+
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from core.system_utils import write_text_atomically
+
+
+class ExcludeList:
+    """Ordered, deduplicated exclude list backed by a line-per-path file.
+
+    Entries are stored exactly as written to the file (host paths in Docker);
+    callers translate container paths before adding/removing.
+    """
+
+    def __init__(self, path: str):
+        """Initialize the list. The file is read lazily on first access.
+
+        Args:
+            path: Path to the exclude file (str or Path).
+        """
+        self.path = str(path)
+        self._lock = threading.RLock()
+        self._entries: Dict[str, None] = {}  # insertion-ordered set
+        self._signature: Optional[Tuple[int, int, int]] = None  # (ino, size, mtime_ns) last seen
+        self._loaded = False
+        self._missing_newline = False  # file doesn't end in "\n" (hand-edited)
+        self._removed: set = set()  # removed in memory, not yet rewritten
+        self._batch_depth = 0
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def _stat_signature(self) -> Optional[Tuple[int, int, int]]:
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return None
+        return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+    def _refresh(self) -> None:
+        """Reload from disk if the file changed since we last read or wrote it."""
+        signature = self._stat_signature()
+        if self._loaded and signature == self._signature:
+            return
+        entries: Dict[str, None] = {}
+        missing_newline = False
+        if signature is not None:
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    content = f.read()
+                missing_newline = bool(content) and not content.endswith('\n')
+                for line in content.splitlines():
+                    line = line.strip()
+                    if line:
+                        entries[line] = None
+            except OSError as e:
+                logging.warning(f"Could not read exclude file: {e}")
+                return
+        # Removals not yet rewritten still apply on top of the reloaded file
+        for entry in self._removed:
+            entries.pop(entry, None)
+        self._entries = entries
+        self._missing_newline = missing_newline
+        self._signature = signature
+        self._loaded = True
+
+    def entries(self) -> List[str]:
+        """Return the current entries in file order."""
+        with self._lock:
+            self._refresh()
+            return list(self._entries)
+
+    def exists(self) -> bool:
+        """Whether the exclude file exists on disk."""
+        return os.path.exists(self.path)
+
+    def __contains__(self, entry: str) -> bool:
+        with self._lock:
+            self._refresh()
+            return entry in self._entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._refresh()
+            return len(self._entries)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.entries())
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def add(self, entry: str) -> bool:
+        """Append an entry if it isn't already present.
+
+        Returns:
+            True if the entry was added, False if it was already listed.
+        """
+        return self.add_many([entry]) == 1
+
+    def add_many(self, entries: Iterable[str]) -> int:
+        """Append every new entry with a single file open.
+
+        Returns:
+            Number of entries added.
+
+        Raises:
+            OSError: If the file can't be written (in-memory state is unchanged).
+        """
+        with self._lock:
+            self._refresh()
+            new_entries: Dict[str, None] = {}
+            for entry in entries:
+                entry = entry.strip()
+                if entry and entry not in self._entries:
+                    new_entries[entry] = None
+            if not new_entries:
+                return 0
+            prefix = "\n" if self._missing_newline else ""
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(prefix + "".join(f"{entry}\n" for entry in new_entries))
+            for entry in new_entries:
+                self._entries[entry] = None
+                self._removed.discard(entry)
+            self._missing_newline = False
+            self._signature = self._stat_signature()
+            return len(new_entries)
+
+    def remove(self, entry: str) -> bool:
+        """Remove an entry. Written immediately, or at the end of the current batch.
+
+        Returns:
+            True if the entry was present.
+        """
+        return self.remove_many([entry]) == 1
+
+    def remove_many(self, entries: Iterable[str]) -> int:
+        """Remove entries with at most one rewrite of the file.
+
+        Returns:
+            Number of entries that were present and removed.
+        """
+        with self._lock:
+            self._refresh()
+            removed = 0
+            for entry in entries:
+                if entry in self._entries:
+                    del self._entries[entry]
+                    self._removed.add(entry)
+                    removed += 1
+            if removed and self._batch_depth == 0:
+                self.flush()
+            return removed
+
+    @contextmanager
+    def batch(self):
+        """Defer removal rewrites until the outermost batch exits.
+
+        Adds are still appended immediately (they are cheap and must be
+        visible to the mover as soon as the file lands on cache).
+        """
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                if self._batch_depth == 0:
+                    self.flush()
+
+    def flush(self) -> None:
+        """Atomically rewrite the file if removals are pending."""
+        with self._lock:
+            if not self._removed:
+                return
+            # Pick up concurrent external edits before overwriting them
+            self._refresh()
+            try:
+                self._write_atomically(list(self._entries))
+            except OSError as e:
+                logging.warning(f"Could not update exclude file: {e}")
+                return
+            self._removed.clear()
+
+    def _write_atomically(self, entries: List[str]) -> None:
+        write_text_atomically(self.path, "".join(f"{entry}\n" for entry in entries))
+        self._missing_newline = False
+        self._signature = self._stat_signature()
+
+
+_instances: Dict[str, ExcludeList] = {}
+_instances_lock = threading.Lock()
+
+
+def get_exclude_list(path) -> ExcludeList:
+    """Return the process-wide ``ExcludeList`` for ``path``."""
+    key = os.path.abspath(str(path))
+    with _instances_lock:
+        instance = _instances.get(key)
+        if instance is None:
+            instance = _instances[key] = ExcludeList(key)
+        return instance
@@ -0,0 +1,130 @@
+"""Shared, pooled HTTP sessions for Plex and plex.tv traffic.
+
+plexapi creates a fresh ``requests.Session`` for every ``PlexServer`` and
+``MyPlexAccount`` unless one is passed in, so each object pays its own TCP
+(and, for plex.tv, TLS) handshake. This module hands out long-lived
+sessions instead:
+
+- ``get_plex_session()`` — one session for the local Plex server, shared by
+  every ``PlexServer`` instance. plexapi sends the token as a header on each
+  request, so per-user server objects can safely share it.
+- ``get_plextv_session(username)`` — one session per plex.tv identity.
+  ``MyPlexAccount`` and ``switchHomeUser()`` keep per-account state, so
+  accounts are never mixed on a session; each user still reuses its own
+  connections across runs in a long-lived (web) process. These sessions
+  also feed 429 responses to the plex.tv rate limiter (core/rate_limiter.py).
+
+Connection pools are sized to the fetch executor width so concurrent
+OnDeck/watchlist workers don't open and discard overflow connections.
+"""
+
+import logging
+import threading
+from typing import Dict, Optional
+
+import requests
+
+from core.rate_limiter import get_plextv_limiter
+
+# Matches ThreadPoolExecutor(max_workers=10) in PlexManager's OnDeck/watchlist fetches
+POOL_MAXSIZE = 10
+# Distinct hosts kept per session (local server, plex.tv, metadata, discover, ...)
+POOL_CONNECTIONS = 4
+
+_sessions: Dict[str, requests.Session] = {}
+_sessions_lock = threading.Lock()
+
+
+def create_session(pool_maxsize: int = POOL_MAXSIZE) -> requests.Session:
+    """Create a keep-alive session with a bounded connection pool.
+
+    ``pool_block`` stays False: a burst beyond ``pool_maxsize`` opens a
+    temporary extra connection rather than stalling a worker.
+    """
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=pool_maxsize)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _get_session(key: str, plextv: bool = False) -> requests.Session:
+    with _sessions_lock:
+        session = _sessions.get(key)
+        if session is None:
+            session = _sessions[key] = create_session()
+            if plextv:
+                session.hooks["response"].append(get_plextv_limiter().observe_response)
+        return session
+
+
+def get_plex_session() -> requests.Session:
+    """Return the shared session for local Plex server requests."""
+    return _get_session("plex")
+
+
+def get_plextv_session(username: Optional[str] = None) -> requests.Session:
+    """Return the plex.tv session for one account.
+
+    Args:
+        username: Plex account the session belongs to; None for the admin
+            (main token) account.
+    """
+    return _get_session(f"plextv:{username or ''}", plextv=True)
+
+
+def close_sessions() -> None:
+    """Close and forget every pooled session (e.g. after credentials change)."""
+    with _sessions_lock:
+        sessions = list(_sessions.values())
+        _sessions.clear()
+    for session in sessions:
+        try:
+            session.close()
+        except Exception:
+            pass
+
+
+def get_connection_stats() -> Dict[str, int]:
+    """Summarize connection reuse across all pooled sessions.
+
+    Returns:
+        Dict with ``sessions``, ``requests`` (sent through live pools),
+        ``connections`` (new connections opened, i.e. handshakes) and
+        ``reused`` (requests that rode an existing connection).
+    """
+    with _sessions_lock:
+        sessions = list(_sessions.values())
+
+    total_requests = 0
+    total_connections = 0
+    for session in sessions:
+        adapters = {id(a): a for a in session.adapters.values()}.values()
+        for adapter in adapters:
+            pools = getattr(getattr(adapter, "poolmanager", None), "pools", None)
+            if pools is None:
+                continue
+            for key in pools.keys():
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                total_requests += getattr(pool, "num_requests", 0)
+                total_connections += getattr(pool, "num_connections", 0)
+
+    return {
+        "sessions": len(sessions),
+        "requests": total_requests,
+        "connections": total_connections,
+        "reused": max(total_requests - total_connections, 0),
+    }
+
+
+def log_connection_stats() -> None:
+    """Log pooled connection reuse at DEBUG level."""
+    stats = get_connection_stats()
+    if stats["requests"]:
+        logging.debug(
+            f"[PLEX API] HTTP pool: {stats['requests']} requests over "
+            f"{stats['connections']} connections ({stats['reused']} reused, "
+            f"{stats['sessions']} sessions)"
+        )
@@ -0,0 +1,103 @@
+"""JSON encode/decode for PlexCache state files.
+
+Uses orjson when it is installed (several times faster on large tracker
+and cache files) and falls back to the stdlib ``json`` module otherwise.
+Output is interchangeable between the two: files written by one backend
+are read by the other.
+
+Behavior differences handled here:
+
+- orjson only supports 2-space indentation, so ``indent`` is a bool.
+- orjson rejects non-string dict keys and integers beyond 64 bits when
+  encoding, and the ``NaN``/``Infinity`` literals when decoding; those
+  cases fall back to stdlib.
+- orjson writes non-finite floats as ``null`` instead of raising. When its
+  output contains ``null``, the data is checked for NaN/Infinity and, if
+  any are found, encoded with stdlib, which writes ``NaN``/``Infinity``
+  like the files have always had.
+- Decode errors are always ``json.JSONDecodeError`` (orjson's error type
+  subclasses it), so existing ``except json.JSONDecodeError`` handlers
+  keep working.
+"""
+
+import json
+import math
+from typing import IO, Any, Callable, Optional, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+BACKEND = "orjson" if orjson is not None else "json"
+
+
+def loads(data: Union[str, bytes, bytearray]) -> Any:
+    """Decode a JSON document from str or bytes."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # re-parse with stdlib: accepts NaN/Infinity, gives its error message
+    if isinstance(data, (bytes, bytearray)):
+        data = data.decode('utf-8')
+    return json.loads(data)
+
+
+def load(fp: IO) -> Any:
+    """Decode a JSON document from a file opened in text or binary mode."""
+    return loads(fp.read())
+
+
+def _has_non_finite_float(obj: Any) -> bool:
+    """Whether ``obj`` contains a NaN or infinite float anywhere in nested dicts/lists."""
+    stack = [obj]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, float):
+            if not math.isfinite(value):
+                return True
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+    return False
+
+
+def _stdlib_dumps(obj: Any, indent: bool, default: Optional[Callable]) -> str:
+    if indent:
+        return json.dumps(obj, indent=2, default=default, ensure_ascii=False)
+    return json.dumps(obj, separators=(',', ':'), default=default, ensure_ascii=False)
+
+
+def dumps_bytes(obj: Any, indent: bool = False, default: Optional[Callable] = None) -> bytes:
+    """Encode ``obj`` as UTF-8 JSON bytes.
+
+    Args:
+        obj: Data to encode.
+        indent: Pretty-print with 2-space indentation.
+        default: Called for objects that aren't natively serializable.
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        try:
+            encoded = orjson.dumps(obj, default=default, option=option)
+        except (orjson.JSONEncodeError, TypeError):
+            pass  # non-str keys, huge ints, ...: let stdlib handle or raise
+        else:
+            # orjson turns NaN/Infinity into null; keep them as stdlib writes them
+            if b"null" not in encoded or not _has_non_finite_float(obj):
+                return encoded
+    return _stdlib_dumps(obj, indent, default).encode('utf-8')
+
+
+def dumps(obj: Any, indent: bool = False, default: Optional[Callable] = None) -> str:
+    """Encode ``obj`` as a JSON string (compact unless ``indent``)."""
+    if orjson is not None:
+        return dumps_bytes(obj, indent=indent, default=default).decode('utf-8')
+    return _stdlib_dumps(obj, indent, default)
+
+
+def dump(obj: Any, fp: IO[str], indent: bool = False, default: Optional[Callable] = None) -> None:
+    """Encode ``obj`` and write it to a text-mode file."""
+    fp.write(dumps(obj, indent=indent, default=default))
@@ -0,0 +1,277 @@
+"""Persistent external-GUID index of the local Plex library.
+
+Watchlist and RSS items are matched to the library by GUID
+(``imdb://``, ``tmdb://``, ``tvdb://``, ``plex://``). Searching for them
+costs one ``getGuid`` request per library section per item, every run.
+This index maps every GUID of every movie and show to its ratingKey (and,
+for movies, the part files), so each match is a local dict lookup:
+
+- Built from one bulk ``/library/sections/<key>/all?includeGuids=1`` listing
+  per movie/show section and saved to disk between runs.
+- Refreshed incrementally by listing only items updated since the newest
+  one already indexed (new items get ``updatedAt`` too). Plex treats
+  ``updatedAt>>=`` as strictly after, so the listing starts one second
+  earlier to catch items updated in that same second; re-indexing the
+  newest item again is harmless.
+  When a section's item count no longer matches the index (deletions), or
+  the last full listing is older than ``FULL_REFRESH_HOURS``, the section
+  is listed again in full.
+- ``invalidate`` drops an entry whose ratingKey turned out to be gone.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from typing import Dict, List, Optional, Set, Tuple
+
+from core import json_codec
+from core.file_operations import save_json_atomically
+
+INDEX_VERSION = 1
+# Re-list every section in full at least this often (catches deletes the count check misses)
+FULL_REFRESH_HOURS = 24
+INDEXED_SECTION_TYPES = ("movie", "show")
+
+
+class _Part:
+    __slots__ = ("file",)
+
+    def __init__(self, file: str):
+        self.file = file
+
+
+class _Media:
+    __slots__ = ("parts",)
+
+    def __init__(self, parts: List[_Part]):
+        self.parts = parts
+
+
+class _Guid:
+    __slots__ = ("id",)
+
+    def __init__(self, guid: str):
+        self.id = guid
+
+
+class IndexedItem:
+    """A movie or show served from the index.
+
+    Has the attributes the watchlist code reads from plexapi's Movie/Show
+    (``TYPE``, ``title``, ``ratingKey``, ``librarySectionID``, ``guids``,
+    ``media`` parts), and ``episodes()`` fetches a show's episodes by
+    ratingKey the same way ``Show.episodes()`` does.
+    """
+
+    def __init__(self, server, rating_key: str, entry: dict):
+        self._server = server
+        self.ratingKey = int(rating_key)
+        self.TYPE = entry["type"]
+        self.title = entry["title"]
+        self.librarySectionID = entry["section"]
+        self.guids = [_Guid(guid) for guid in entry["guids"]]
+        self.media = [_Media([_Part(file)]) for file in entry.get("files", [])]
+
+    def episodes(self) -> list:
+        return self._server.fetchItems(f"/library/metadata/{self.ratingKey}/allLeaves")
+
+
+class LibraryGuidIndex:
+    """GUID -> ratingKey index of the movie and show sections, persisted as JSON."""
+
+    def __init__(self, cache_file: Optional[str] = None):
+        self._cache_file = cache_file
+        self._lock = threading.Lock()
+        self._machine_id: Optional[str] = None
+        self._sections: Dict[str, dict] = {}  # section key -> {type, updated_at, full_refresh_at}
+        self._items: Dict[str, dict] = {}  # ratingKey -> {type, title, section, guids, files, updated_at}
+        self._by_guid: Dict[str, str] = {}  # guid -> ratingKey
+        self._run_sections: Set[int] = set()  # movie/show sections on the server this run
+        self._fresh_sections: Set[int] = set()  # ...of which refreshed successfully
+        self.hits = 0
+        self.misses = 0
+        if cache_file:
+            self._load_from_disk()
+
+    # ------------------------------------------------------------------
+    # Refresh
+    # ------------------------------------------------------------------
+
+    def refresh(self, server, sections: list) -> None:
+        """Bring the index up to date with ``sections`` (plexapi LibrarySection objects).
+
+        Sections that fail to refresh are left out of this run's lookups.
+        """
+        start = time.perf_counter()
+        machine_id = getattr(server, "machineIdentifier", None)
+        if machine_id != self._machine_id:
+            if self._machine_id is not None:
+                logging.info("[LIBRARY INDEX] Plex server changed — rebuilding index")
+            self._machine_id = machine_id
+            self._sections.clear()
+            self._items.clear()
+
+        wanted = {str(section.key): section for section in sections
+                  if getattr(section, "type", None) in INDEXED_SECTION_TYPES}
+        for key in list(self._sections):
+            if key not in wanted:
+                self._drop_section(key)
+
+        self._run_sections = {int(key) for key in wanted}
+        self._fresh_sections.clear()
+        listed = 0
+        for key, section in wanted.items():
+            try:
+                listed += self._refresh_section(server, key, section.type)
+                self._fresh_sections.add(int(key))
+            except Exception as e:
+                logging.warning(f"[LIBRARY INDEX] Could not refresh section {key}: {e}")
+
+        self._rebuild_guid_map()
+        self._save_to_disk()
+        logging.debug(f"[LIBRARY INDEX] {len(self._items)} items, {len(self._by_guid)} GUIDs "
+                      f"({listed} listed from Plex) in {time.perf_counter() - start:.2f}s")
+
+    def _refresh_section(self, server, key: str, section_type: str) -> int:
+        """Refresh one section; returns how many items Plex listed."""
+        now = time.time()
+        state = self._sections.get(key)
+        if state is None or state.get("type") != section_type \
+                or now - state.get("full_refresh_at", 0) > FULL_REFRESH_HOURS * 3600:
+            return self._list_section_full(server, key, section_type, now)
+
+        changed = server.fetchItems(
+            f"/library/sections/{key}/all?includeGuids=1&updatedAt>>={int(state['updated_at']) - 1}"
+        )
+        for item in changed:
+            self._put(key, section_type, item)
+        state["updated_at"] = max([state["updated_at"]] + [self._updated_at(i) for i in changed])
+
+        # Deletions don't show up in an updatedAt listing
+        indexed = sum(1 for entry in self._items.values() if entry["section"] == int(key))
+        if self._section_size(server, key) != indexed:
+            logging.debug(f"[LIBRARY INDEX] Section {key} item count changed — re-listing")
+            return len(changed) + self._list_section_full(server, key, section_type, now)
+        return len(changed)
+
+    def _list_section_full(self, server, key: str, section_type: str, now: float) -> int:
+        items = server.fetchItems(f"/library/sections/{key}/all?includeGuids=1")
+        self._drop_section(key)
+        for item in items:
+            self._put(key, section_type, item)
+        self._sections[key] = {
+            "type": section_type,
+            "updated_at": max([0] + [self._updated_at(i) for i in items]),
+            "full_refresh_at": now,
+        }
+        return len(items)
+
+    @staticmethod
+    def _section_size(server, key: str) -> int:
+        data = server.query(f"/library/sections/{key}/all",
+                            headers={"X-Plex-Container-Start": "0", "X-Plex-Container-Size": "0"})
+        return int(data.attrib.get("totalSize", data.attrib.get("size", -1)))
+
+    @staticmethod
+    def _updated_at(item) -> int:
+        updated = getattr(item, "updatedAt", None) or getattr(item, "addedAt", None)
+        return int(updated.timestamp()) if updated else 0
+
+    def _put(self, key: str, section_type: str, item) -> None:
+        guids = [g.id for g in getattr(item, "guids", []) or []]
+        if getattr(item, "guid", None) and item.guid not in guids:
+            guids.append(item.guid)
+        files = []
+        if section_type == "movie":
+            files = [part.file for media in item.media for part in media.parts if part.file]
+        self._items[str(item.ratingKey)] = {
+            "type": section_type,
+            "title": item.title,
+            "section": int(key),
+            "guids": guids,
+            "files": files,
+            "updated_at": self._updated_at(item),
+        }
+
+    def _drop_section(self, key: str) -> None:
+        self._sections.pop(key, None)
+        section_id = int(key)
+        for rating_key in [rk for rk, entry in self._items.items() if entry["section"] == section_id]:
+            del self._items[rating_key]
+
+    def _rebuild_guid_map(self) -> None:
+        self._by_guid = {guid: rk for rk, entry in self._items.items() for guid in entry["guids"]}
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+
+    def covers(self, valid_sections: Optional[List[int]]) -> bool:
+        """Whether every section to search was refreshed this run (so a miss means "not in library")."""
+        if not self._fresh_sections:
+            return False
+        sections = self._run_sections
+        if valid_sections:
+            sections = sections & {int(section) for section in valid_sections}
+        return sections <= self._fresh_sections
+
+    def lookup(self, guid: str, valid_sections: Optional[List[int]] = None) -> Optional[Tuple[str, dict]]:
+        """Return ``(ratingKey, entry)`` for ``guid`` within ``valid_sections``, or None."""
+        with self._lock:
+            rating_key = self._by_guid.get(guid)
+            entry = self._items.get(rating_key) if rating_key else None
+            if entry and entry["section"] in self._fresh_sections \
+                    and (not valid_sections or entry["section"] in valid_sections):
+                self.hits += 1
+                return rating_key, entry
+            self.misses += 1
+            return None
+
+    def invalidate(self, rating_key: str) -> None:
+        """Drop an entry whose ratingKey no longer exists on the server."""
+        with self._lock:
+            entry = self._items.pop(str(rating_key), None)
+            if entry is None:
+                return
+            for guid in entry["guids"]:
+                if self._by_guid.get(guid) == str(rating_key):
+                    del self._by_guid[guid]
+            # Force a full listing of the section next run
+            state = self._sections.get(str(entry["section"]))
+            if state is not None:
+                state["full_refresh_at"] = 0
+            logging.debug(f"[LIBRARY INDEX] Invalidated ratingKey {rating_key} ('{entry['title']}')")
+            self._save_to_disk()
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def _load_from_disk(self) -> None:
+        if not self._cache_file or not os.path.exists(self._cache_file):
+            return
+        try:
+            with open(self._cache_file, "rb") as f:
+                data = json_codec.loads(f.read())
+            if data.get("version") != INDEX_VERSION:
+                return
+            self._machine_id = data.get("machine_id")
+            self._sections = data.get("sections", {})
+            self._items = data.get("items", {})
+            self._rebuild_guid_map()
+            logging.debug(f"[LIBRARY INDEX] Loaded {len(self._items)} items from disk")
+        except (json.JSONDecodeError, IOError, AttributeError) as e:
+            logging.warning(f"[LIBRARY INDEX] Could not load index file: {e}")
+            self._sections, self._items, self._by_guid = {}, {}, {}
+
+    def _save_to_disk(self) -> None:
+        if not self._cache_file:
+            return
+        save_json_atomically(self._cache_file, {
+            "version": INDEX_VERSION,
+            "machine_id": self._machine_id,
+            "sections": self._sections,
+            "items": self._items,
+        }, label="library index")
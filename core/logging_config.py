@@ -111,6 +111,14 @@ def get_error_messages():
     return _error_messages.copy()
 
 
+def _cached_size_text(data: dict) -> str:
+    """Cached bytes for summaries, noting how much was reflinked (no data copied)."""
+    text = format_bytes(data['cached_bytes'])
+    if data.get('reflinked_bytes', 0) > 0:
+        text += f", {format_bytes(data['reflinked_bytes'])} reflinked"
+    return text
+
+
 class VerboseMessageFilter(logging.Filter):
     """Filter to downgrade certain verbose messages to DEBUG level.
 
@@ -245,7 +253,7 @@ class UnraidHandler(logging.Handler):
             if data.get('cached_count', 0) > 0:
                 cached_str = f"Cached: {data['cached_count']} file{'s' if data['cached_count'] != 1 else ''}"
                 if data.get('cached_bytes', 0) > 0:
-                    cached_str += f" ({format_bytes(data['cached_bytes'])})"
+                    cached_str += f" ({_cached_size_text(data)})"
                 parts.append(cached_str)
 
             # Restored files
@@ -339,6 +347,7 @@ class WebhookHandler(logging.Handler):
         Expected keys:
             - cached_count: int - Files moved to cache
             - cached_bytes: int - Bytes moved to cache
+            - reflinked_bytes: int - Of cached_bytes, bytes cloned by reflink (optional)
             - restored_count: int - Files restored to array
             - restored_bytes: int - Bytes restored to array
             - already_cached: int - Files already on cache
@@ -447,7 +456,7 @@ class WebhookHandler(logging.Handler):
             if data.get('cached_count', 0) > 0:
                 cached_str = f"{data['cached_count']} file{'s' if data['cached_count'] != 1 else ''}"
                 if data.get('cached_bytes', 0) > 0:
-                    cached_str += f"\n({format_bytes(data['cached_bytes'])})"
+                    cached_str += f"\n({_cached_size_text(data)})"
                 fields.append({
                     "name": "📥 Cached",
                     "value": cached_str,
@@ -589,7 +598,7 @@ class WebhookHandler(logging.Handler):
             fields = []
 
             if data.get('cached_count', 0) > 0:
-                size_str = f" ({format_bytes(data['cached_bytes'])})" if data.get('cached_bytes') else ""
+                size_str = f" ({_cached_size_text(data)})" if data.get('cached_bytes') else ""
                 fields.append({
                     "type": "mrkdwn",
                     "text": f"*Cached:* {data['cached_count']} file{'s' if data['cached_count'] != 1 else ''}{size_str}"
@@ -955,7 +964,7 @@ class LoggingManager:
                          restored_count: int = 0, restored_bytes: int = 0,
                          already_cached: int = 0, duration_seconds: float = 0,
                          had_errors: bool = False, had_warnings: bool = False,
-                         dry_run: bool = False) -> None:
+                         dry_run: bool = False, reflinked_bytes: int = 0) -> None:
         """Set structured summary data for rich webhook formatting.
 
         This data is passed to WebhookHandler to generate rich embeds
@@ -971,10 +980,12 @@ class LoggingManager:
             had_errors: Whether any errors occurred during run
             had_warnings: Whether any warnings occurred during run
             dry_run: Whether this was a dry run (no files actually moved)
+            reflinked_bytes: Bytes cached by reflink (shared extents, no data copied)
         """
         self._summary_data = {
             'cached_count': cached_count,
             'cached_bytes': cached_bytes,
+            'reflinked_bytes': reflinked_bytes,
             'restored_count': restored_count,
             'restored_bytes': restored_bytes,
             'already_cached': already_cached,
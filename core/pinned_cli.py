@@ -14,11 +14,14 @@ from core.pinned_media import (
     resolve_pins_to_paths,
     sum_pinned_bytes_on_disk,
 )
+from core.state_store import create_state_backend
 
 
 def _get_tracker(config_manager: ConfigManager) -> PinnedMediaTracker:
     tracker_file = config_manager.get_pinned_media_file()
-    return PinnedMediaTracker(str(tracker_file))
+    return PinnedMediaTracker(
+        str(tracker_file),
+        backend=create_state_backend(tracker_file, config_manager.performance.state_backend, "pinned_media"))
 
 
 def _preflight_budget(
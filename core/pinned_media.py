@@ -25,10 +25,12 @@ import logging
 import os
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
-from core.file_operations import JSONTracker
+from core import json_codec
+from core.file_operations import JSONTracker, save_json_atomically
 
 # Retry settings for transient local-Plex network errors during pin resolution.
 # Runs inside the audit loop (every ~5 min), so short, bounded retries are
@@ -36,6 +38,13 @@ from core.file_operations import JSONTracker
 _PIN_FETCH_MAX_ATTEMPTS = 3
 _PIN_FETCH_RETRY_WAIT = 2  # seconds between attempts
 
+# Rating keys per /library/metadata/{k1,k2,...} request (keeps the URL short)
+_PIN_BATCH_SIZE = 50
+# Show/season pins expanded concurrently (each expansion is one request per season)
+_PIN_RESOLVE_WORKERS = 4
+# Longest a cached show/season expansion is trusted, even when unchanged
+_PIN_PATH_CACHE_MAX_AGE = 6 * 3600
+
 
 VALID_PIN_TYPES = {"show", "season", "episode", "movie"}
 
@@ -225,13 +234,182 @@ def _resolve_item_to_paths(item: Any, pin_type: str, preference: str) -> List[st
     raise ValueError(f"Unknown pin_type: {pin_type!r}")
 
 
+class PinPathCache:
+    """Resolved file paths of show/season pins, persisted between runs.
+
+    Expanding a show or season pin costs one request per season. The result
+    is reused while the item's fingerprint (``updatedAt``, ``leafCount``,
+    ``childCount`` — episodes added or removed change these) and the
+    resolution preference are unchanged, for at most
+    ``_PIN_PATH_CACHE_MAX_AGE`` seconds so in-place file upgrades (which
+    don't always touch the parent's metadata) are picked up. Stored next to
+    the pin tracker as ``pinned_paths_cache.json``.
+    """
+
+    FILENAME = "pinned_paths_cache.json"
+
+    def __init__(self, cache_file: Optional[str] = None):
+        self._cache_file = cache_file
+        self._lock = threading.Lock()
+        self._data: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        if cache_file and os.path.exists(cache_file):
+            try:
+                with open(cache_file, "rb") as f:
+                    self._data = json_codec.loads(f.read())
+            except (ValueError, IOError) as e:
+                logging.warning(f"Could not load pinned path cache: {e}")
+                self._data = {}
+
+    @classmethod
+    def for_tracker(cls, tracker: "PinnedMediaTracker") -> "PinPathCache":
+        tracker_file = getattr(tracker, "tracker_file", None)
+        if not tracker_file:
+            return cls()
+        return cls(os.path.join(os.path.dirname(tracker_file) or ".", cls.FILENAME))
+
+    def get(self, rating_key: str, fingerprint: Optional[list], preference: str) -> Optional[List[str]]:
+        if fingerprint is None:
+            return None
+        with self._lock:
+            entry = self._data.get(rating_key)
+        if (entry and entry.get("fingerprint") == fingerprint
+                and entry.get("preference") == preference
+                and time.time() - entry.get("resolved_at", 0) < _PIN_PATH_CACHE_MAX_AGE):
+            return list(entry["paths"])
+        return None
+
+    def put(self, rating_key: str, fingerprint: Optional[list], preference: str,
+            paths: List[str]) -> None:
+        if fingerprint is None:
+            return
+        with self._lock:
+            self._data[rating_key] = {
+                "fingerprint": fingerprint,
+                "preference": preference,
+                "paths": list(paths),
+                "resolved_at": time.time(),
+            }
+            self._dirty = True
+
+    def retain(self, rating_keys: Iterable[str]) -> None:
+        """Drop entries for keys that are no longer pinned."""
+        keep = set(rating_keys)
+        with self._lock:
+            for key in [k for k in self._data if k not in keep]:
+                del self._data[key]
+                self._dirty = True
+
+    def save(self) -> None:
+        with self._lock:
+            if not self._dirty or not self._cache_file:
+                return
+            if save_json_atomically(self._cache_file, self._data, label="pinned path cache"):
+                self._dirty = False
+
+
+def _pin_fingerprint(item: Any) -> Optional[list]:
+    """Identity of a show/season's current state, or None if Plex didn't report one."""
+    updated = getattr(item, "updatedAt", None)
+    if not isinstance(updated, datetime):
+        return None
+    return [
+        int(updated.timestamp()),
+        getattr(item, "leafCount", None),
+        getattr(item, "childCount", None),
+    ]
+
+
+def _fetch_pins_batched(plex_server: Any, rating_keys: List[str]) -> Dict[str, Any]:
+    """Fetch pinned items with ``/library/metadata/{k1,k2,...}`` requests.
+
+    Keys missing from the response (deleted items) and every key when the
+    batch request fails are left out; the caller fetches those one by one,
+    which also tells a deleted item apart from a transient error.
+    """
+    items: Dict[str, Any] = {}
+    for start in range(0, len(rating_keys), _PIN_BATCH_SIZE):
+        chunk = rating_keys[start:start + _PIN_BATCH_SIZE]
+        try:
+            fetched = plex_server.fetchItems(f"/library/metadata/{','.join(chunk)}")
+            for item in fetched:
+                key = str(getattr(item, "ratingKey", ""))
+                if key in chunk:
+                    items[key] = item
+        except Exception as e:
+            logging.debug(f"Batched pin fetch failed, fetching pins individually: {type(e).__name__}: {e}")
+    return items
+
+
+def _fetch_pin_item(
+    plex_server: Any, pin: Dict[str, Any], tracker: "PinnedMediaTracker",
+    orphaned: List[str], NotFound: type, TransientNetError: tuple,
+) -> Any:
+    """Fetch a single pin by rating_key, with retries; removes orphaned pins."""
+    rk = pin["rating_key"]
+    title = pin.get("title", rk)
+
+    item = None
+    last_transient_err: Optional[Exception] = None
+    for attempt in range(_PIN_FETCH_MAX_ATTEMPTS):
+        try:
+            # plexapi.fetchItem accepts int or str rating_key
+            item = plex_server.fetchItem(int(rk))
+            break
+        except TransientNetError as e:
+            # Check network errors BEFORE NotFound — some test environments
+            # fall NotFound back to `Exception`, which would otherwise swallow
+            # requests.Timeout/ConnectionError and mark the pin as orphaned.
+            last_transient_err = e
+            if attempt < _PIN_FETCH_MAX_ATTEMPTS - 1:
+                logging.warning(
+                    f"Pinned item fetch attempt {attempt + 1}/{_PIN_FETCH_MAX_ATTEMPTS} "
+                    f"timed out for '{title}' (rating_key={rk}): {e}. "
+                    f"Retrying in {_PIN_FETCH_RETRY_WAIT}s..."
+                )
+                time.sleep(_PIN_FETCH_RETRY_WAIT)
+        except (NotFound, ValueError) as e:
+            logging.warning(
+                f"Pinned item no longer in Plex: '{title}' "
+                f"(rating_key={rk}) — removing pin. ({type(e).__name__}: {e})"
+            )
+            tracker.remove_pin(rk)
+            orphaned.append(rk)
+            item = None
+            last_transient_err = None
+            break
+        except Exception as e:
+            # Non-retriable error (e.g. malformed response, unexpected exception)
+            logging.error(
+                f"Failed to fetch pinned item '{title}' (rating_key={rk}): "
+                f"{type(e).__name__}: {e}. Leaving pin in place."
+            )
+            last_transient_err = None
+            break
+
+    if item is None and last_transient_err is not None:
+        # Don't remove the pin — server might be back up next audit cycle.
+        logging.error(
+            f"Failed to fetch pinned item '{title}' (rating_key={rk}) "
+            f"after {_PIN_FETCH_MAX_ATTEMPTS} attempts: "
+            f"{type(last_transient_err).__name__}: {last_transient_err}. "
+            f"Leaving pin in place."
+        )
+    return item
+
+
 def resolve_pins_to_paths(
     plex_server: Any,
     tracker: "PinnedMediaTracker",
     preference: str = "highest",
+    path_cache: Optional[PinPathCache] = None,
 ) -> Tuple[List[Tuple[str, str, str]], List[str]]:
     """Resolve every pin in the tracker to its file paths.
 
+    All pins are fetched with batched ``/library/metadata/{k1,k2,...}``
+    requests; show and season pins are then expanded to episodes in
+    parallel, or taken from ``path_cache`` when the item is unchanged.
+
     Orphan cleanup: pins whose ``rating_key`` is no longer reachable in Plex
     (item deleted, library removed) are removed from the tracker and returned
     in the ``orphaned`` list for caller-side logging/reporting.
@@ -241,6 +419,8 @@ def resolve_pins_to_paths(
             references plexapi so unit tests can pass a mock.
         tracker: The ``PinnedMediaTracker`` instance.
         preference: Value from ``pinned_preferred_resolution``.
+        path_cache: Resolved show/season paths. Defaults to the
+            ``pinned_paths_cache.json`` next to the tracker file.
 
     Returns:
         ``(resolved, orphaned)`` where:
@@ -273,68 +453,52 @@ def resolve_pins_to_paths(
     resolved: List[Tuple[str, str, str]] = []
     orphaned: List[str] = []
 
-    for pin in tracker.list_pins():
-        rk = pin["rating_key"]
-        pin_type = pin["type"]
-        title = pin.get("title", rk)
+    pins = tracker.list_pins()
+    if not pins:
+        return resolved, orphaned
+    if path_cache is None:
+        path_cache = PinPathCache.for_tracker(tracker)
 
-        item = None
-        last_transient_err: Optional[Exception] = None
-        for attempt in range(_PIN_FETCH_MAX_ATTEMPTS):
-            try:
-                # plexapi.fetchItem accepts int or str rating_key
-                item = plex_server.fetchItem(int(rk))
-                break
-            except TransientNetError as e:
-                # Check network errors BEFORE NotFound — some test environments
-                # fall NotFound back to `Exception`, which would otherwise swallow
-                # requests.Timeout/ConnectionError and mark the pin as orphaned.
-                last_transient_err = e
-                if attempt < _PIN_FETCH_MAX_ATTEMPTS - 1:
-                    logging.warning(
-                        f"Pinned item fetch attempt {attempt + 1}/{_PIN_FETCH_MAX_ATTEMPTS} "
-                        f"timed out for '{title}' (rating_key={rk}): {e}. "
-                        f"Retrying in {_PIN_FETCH_RETRY_WAIT}s..."
-                    )
-                    time.sleep(_PIN_FETCH_RETRY_WAIT)
-            except (NotFound, ValueError) as e:
-                logging.warning(
-                    f"Pinned item no longer in Plex: '{title}' "
-                    f"(rating_key={rk}) — removing pin. ({type(e).__name__}: {e})"
-                )
-                tracker.remove_pin(rk)
-                orphaned.append(rk)
-                item = None
-                last_transient_err = None
-                break
-            except Exception as e:
-                # Non-retriable error (e.g. malformed response, unexpected exception)
-                logging.error(
-                    f"Failed to fetch pinned item '{title}' (rating_key={rk}): "
-                    f"{type(e).__name__}: {e}. Leaving pin in place."
-                )
-                last_transient_err = None
-                break
+    batch = _fetch_pins_batched(plex_server, [pin["rating_key"] for pin in pins])
 
+    # (pin, item, cached paths or None) for every pin that still exists
+    fetched: List[Tuple[Dict[str, Any], Any, Optional[List[str]]]] = []
+    for pin in pins:
+        item = batch.get(pin["rating_key"])
         if item is None:
-            if last_transient_err is not None:
-                # Don't remove the pin — server might be back up next audit cycle.
-                logging.error(
-                    f"Failed to fetch pinned item '{title}' (rating_key={rk}) "
-                    f"after {_PIN_FETCH_MAX_ATTEMPTS} attempts: "
-                    f"{type(last_transient_err).__name__}: {last_transient_err}. "
-                    f"Leaving pin in place."
-                )
-            continue
+            item = _fetch_pin_item(plex_server, pin, tracker, orphaned, NotFound, TransientNetError)
+            if item is None:
+                continue
+        cached = None
+        if pin["type"] in ("show", "season"):
+            cached = path_cache.get(pin["rating_key"], _pin_fingerprint(item), preference)
+        fetched.append((pin, item, cached))
 
+    def expand(pin: Dict[str, Any], item: Any) -> Optional[List[str]]:
         try:
-            paths = _resolve_item_to_paths(item, pin_type, preference)
+            return _resolve_item_to_paths(item, pin["type"], preference)
         except Exception as e:
             logging.error(
-                f"Failed to resolve pinned {pin_type} '{title}' "
-                f"(rating_key={rk}): {type(e).__name__}: {e}"
+                f"Failed to resolve pinned {pin['type']} '{pin.get('title', pin['rating_key'])}' "
+                f"(rating_key={pin['rating_key']}): {type(e).__name__}: {e}"
             )
+            return None
+
+    with ThreadPoolExecutor(max_workers=_PIN_RESOLVE_WORKERS) as executor:
+        futures = [
+            None if cached is not None else executor.submit(expand, pin, item)
+            for pin, item, cached in fetched
+        ]
+
+    for (pin, item, cached), future in zip(fetched, futures):
+        rk = pin["rating_key"]
+        pin_type = pin["type"]
+        title = pin.get("title", rk)
+        paths = cached if future is None else future.result()
+        if paths is None:
             continue
+        if future is not None and pin_type in ("show", "season"):
+            path_cache.put(rk, _pin_fingerprint(item), preference, paths)
 
         if not paths:
             logging.warning(
@@ -347,8 +511,11 @@ def resolve_pins_to_paths(
         logging.info(
             f"Pinned {pin_type} '{title}': resolved to {len(paths)} file(s) "
             f"per preferred_resolution={preference}"
+            + (" (cached)" if future is None else "")
         )
 
+    path_cache.retain(tracker.pinned_rating_keys())
+    path_cache.save()
     return resolved, orphaned
 
 
@@ -375,11 +542,18 @@ class PinnedMediaTracker(JSONTracker):
           "title": "The Office",
           "added_at": "2026-04-11T...",
           "added_by": "web",      # web | cli
+          "display": {...},       # optional, see below
         }
+
+    ``display`` holds the decorated title and grouping fields the web UI
+    shows for the pin (``title``, ``group_rating_key``, ``group_title``,
+    ``group_type``, ``scope_text``, ``sort_key``). It is captured from Plex
+    once, at pin time (or on first display for pins added without it), so
+    listing pins needs no per-pin Plex lookup.
     """
 
-    def __init__(self, tracker_file: str):
-        super().__init__(tracker_file, "pinned_media")
+    def __init__(self, tracker_file: str, backend=None):
+        super().__init__(tracker_file, "pinned_media", backend)
 
     # ------------------------------------------------------------------
     # Public API — all operations are keyed by rating_key (str)
@@ -391,6 +565,7 @@ class PinnedMediaTracker(JSONTracker):
         pin_type: str,
         title: str,
         added_by: str = "web",
+        display: Optional[Dict[str, Any]] = None,
     ) -> bool:
         """Add a pin. Idempotent: returns False if the key was already pinned.
 
@@ -400,6 +575,7 @@ class PinnedMediaTracker(JSONTracker):
             title: Human-readable title for display (can include scope suffix
                 like "The Office — S3" for season pins).
             added_by: ``web`` or ``cli``.
+            display: Optional display metadata (see class docstring).
 
         Returns:
             True if the pin was newly added, False if it already existed.
@@ -419,7 +595,9 @@ class PinnedMediaTracker(JSONTracker):
                 "added_at": datetime.now().isoformat(),
                 "added_by": added_by,
             }
-            self._save()
+            if display:
+                self._data[key]["display"] = dict(display)
+            self._save(key)
             logging.info(f"Pinned {pin_type}: {title} (rating_key={key})")
             return True
 
@@ -430,13 +608,29 @@ class PinnedMediaTracker(JSONTracker):
             if key not in self._data:
                 return False
             entry = self._data.pop(key)
-            self._save()
+            self._save(key)
             logging.info(
                 f"Unpinned {entry.get('type', '?')}: "
                 f"{entry.get('title', '?')} (rating_key={key})"
             )
             return True
 
+    def set_display(self, rating_key: str, display: Dict[str, Any]) -> bool:
+        """Store display metadata on an existing pin. Returns False if not pinned."""
+        key = str(rating_key)
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return False
+            entry["display"] = dict(display)
+            self._save(key)
+            return True
+
+    def reload(self) -> None:
+        """Re-read pins from storage, picking up changes another tracker saved."""
+        with self._lock:
+            self._load()
+
     def get_pin(self, rating_key: str) -> Optional[Dict[str, Any]]:
         """Return a copy of the pin entry, or None."""
         key = str(rating_key)
@@ -3,6 +3,7 @@ Plex API integration for PlexCache.
 Handles Plex server connections and media fetching operations.
 """
 
+import io
 import json
 import logging
 import os
@@ -23,6 +24,11 @@ from plexapi.video import Episode, Movie
 from plexapi.myplex import MyPlexAccount
 from plexapi.exceptions import NotFound
 import requests
+import urllib3
+
+from core.http_sessions import get_plex_session, get_plextv_session
+from core.library_index import IndexedItem, LibraryGuidIndex
+from core.rate_limiter import get_plextv_limiter, is_rate_limited_error
 
 
 @dataclass
@@ -42,9 +48,6 @@ class OnDeckItem:
     rating_key: Optional[str] = None
 
 
-# API delay between plex.tv calls (seconds)
-PLEX_API_DELAY = 1.0
-
 # RSS feed retry and cache settings
 RSS_MAX_RETRIES = 3
 RSS_TIMEOUT = 15  # seconds
@@ -54,17 +57,23 @@ PLEXTV_MAX_RETRIES = 3
 PLEXTV_RETRY_BASE_WAIT = 2  # seconds (exponential: 2s, 4s)
 
 
-def _retry_plextv_call(func, label: str, max_attempts: int = PLEXTV_MAX_RETRIES):
-    """Call a plex.tv function, retrying on transient network errors.
+def _retry_plextv_call(func, label: str, max_attempts: int = PLEXTV_MAX_RETRIES,
+                       endpoint: Optional[str] = None):
+    """Call a plex.tv function, retrying on transient network errors and 429s.
 
-    Retries only `requests.Timeout` and `requests.ConnectionError` — other
-    exceptions (auth failures, parse errors, logic bugs) are raised immediately
-    so callers can distinguish retry-worthy failures from permanent ones.
+    Retries `requests.Timeout`, `requests.ConnectionError` and rate-limit (429)
+    responses — other exceptions (auth failures, parse errors, logic bugs) are
+    raised immediately so callers can distinguish retry-worthy failures from
+    permanent ones. A 429 backs off for the server's `Retry-After` (or an
+    exponential per-endpoint delay) via the shared plex.tv rate limiter, so the
+    wait happens in the calling worker and other endpoints keep flowing.
 
     Args:
         func: Zero-argument callable to invoke (wrap args via lambda).
         label: Short description for log messages (e.g. "watchlist for Brandon").
         max_attempts: Total attempts including the first try.
+        endpoint: Rate-limiter endpoint key (e.g. "watchlist"). When given, a
+            token is taken from the shared limiter before every attempt.
 
     Returns:
         The return value of func() on success.
@@ -73,10 +82,16 @@ def _retry_plextv_call(func, label: str, max_attempts: int = PLEXTV_MAX_RETRIES)
         The underlying exception if all attempts fail, or any non-retriable
         exception on the first hit.
     """
+    limiter = get_plextv_limiter()
+    backoff_key = endpoint or "plex.tv"
     last_error = None
     for attempt in range(max_attempts):
+        if endpoint:
+            limiter.acquire(endpoint)
         try:
-            return func()
+            result = func()
+            limiter.record_success(backoff_key)
+            return result
         except (requests.Timeout, requests.ConnectionError) as e:
             last_error = e
             if attempt < max_attempts - 1:
@@ -86,6 +101,17 @@ def _retry_plextv_call(func, label: str, max_attempts: int = PLEXTV_MAX_RETRIES)
                     f"timed out: {e}. Retrying in {wait_time}s..."
                 )
                 time.sleep(wait_time)
+        except Exception as e:
+            if not is_rate_limited_error(e):
+                raise
+            last_error = e
+            wait_time = limiter.record_rate_limited(backoff_key, limiter.retry_after_for(e))
+            if attempt < max_attempts - 1:
+                logging.warning(
+                    f"plex.tv {label} attempt {attempt + 1}/{max_attempts} "
+                    f"rate limited. Retrying in {wait_time:.0f}s..."
+                )
+                time.sleep(wait_time)
     raise last_error
 
 
@@ -213,20 +239,84 @@ class UserTokenCache:
             logging.warning(f"[TOKEN CACHE] Could not save cache file: {e}")
 
 
+class ShowEpisodeCache:
+    """Per-run cache of episode lists fetched from the Plex server.
+
+    Several users often have the same show OnDeck; without this every one of
+    them re-downloads the show's episode list. Entries are keyed by tuples
+    such as ``("season", season_rating_key)`` and live as long as the
+    PlexManager (one run). Thread-safe for the concurrent OnDeck fetch: when
+    two threads miss on the same key, one fetches and the other waits for it.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: Dict[tuple, list] = {}
+        self._inflight: Dict[tuple, threading.Event] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def peek(self, key: tuple) -> Optional[list]:
+        """Return a cached entry without fetching (counts as a hit when present)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self.hits += 1
+            return entry
+
+    def put(self, key: tuple, value: list) -> None:
+        """Store an entry unless one is already cached."""
+        with self._lock:
+            self._entries.setdefault(key, value)
+
+    def get_or_fetch(self, key: tuple, fetch) -> list:
+        """Return the cached entry for ``key``, calling ``fetch()`` on a miss.
+
+        Exceptions from ``fetch`` propagate and nothing is cached, so a
+        waiting thread retries the fetch itself.
+        """
+        while True:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    self.hits += 1
+                    return entry
+                event = self._inflight.get(key)
+                if event is None:
+                    event = self._inflight[key] = threading.Event()
+                    self.misses += 1
+                    break
+            event.wait()
+
+        try:
+            entry = list(fetch())
+            with self._lock:
+                self._entries[key] = entry
+            return entry
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            event.set()
+
+
 class PlexManager:
     """Manages Plex server connections and operations."""
 
-    def __init__(self, plex_url: str, plex_token: str, retry_limit: int = 3, delay: int = 5,
+    def __init__(self, plex_url: str, plex_token: str,
                  token_cache_file: Optional[str] = None, rss_cache_file: Optional[str] = None,
-                 plex_db_path: str = ""):
+                 plex_db_path: str = "", fetch_engine: str = "threads",
+                 ondeck_source: str = "api", plex_db_snapshot: bool = False,
+                 library_index_file: Optional[str] = None):
         self.plex_url = plex_url
         self.plex_token = plex_token
-        self.retry_limit = retry_limit
-        self.delay = delay
         self.plex = None
         self._token_cache = UserTokenCache(cache_file=token_cache_file, cache_expiry_hours=24)
         self._rss_cache_file = rss_cache_file  # Path to RSS cache file
         self._plex_db_path = plex_db_path  # Path to Plex SQLite DB (fallback for tokenless shared users)
+        self.fetch_engine = fetch_engine  # "threads" or "async" (core/plex_async.py)
+        self.ondeck_source = ondeck_source  # "api", "db" (Plex DB primary) or "verify" (API, diffed against DB)
+        self.plex_db_snapshot = plex_db_snapshot  # Query a per-run copy of the Plex DB (core/plex_db.PlexDBSnapshot)
+        self._db_snapshot = None  # Snapshot for the current OnDeck fetch
         self._user_tokens: Dict[str, str] = {}  # username -> token (populated at startup)
         self._token_lock = threading.Lock()  # Protects _user_tokens dict access
         self._user_id_to_name: Dict[str, str] = {}  # user_id (str) -> username (for RSS author lookup)
@@ -235,17 +325,19 @@ class PlexManager:
         self._resolved_uuids: Set[str] = set()  # UUIDs we've tried to resolve (avoid repeated API calls)
         self._newly_discovered_users: List[dict] = []  # Users found on plex.tv but not in settings
         self._users_loaded = False
-        self._api_lock = threading.Lock()  # For rate limiting plex.tv calls
         self._plex_tv_reachable = True  # Track if plex.tv is accessible
         self._watchlist_data_complete = True  # Track if we got complete watchlist data
         self._ondeck_data_complete = True  # Track if we got complete OnDeck data
+        self._episode_cache = ShowEpisodeCache()  # Show/season episode lists, shared by OnDeck + watchlist
+        # GUID -> ratingKey index for watchlist/RSS matching (core/library_index.py)
+        self._library_index = LibraryGuidIndex(library_index_file) if library_index_file else None
 
     def connect(self) -> None:
         """Connect to the Plex server."""
         logging.debug(f"Connecting to Plex server: {self.plex_url}")
 
         try:
-            self.plex = PlexServer(self.plex_url, self.plex_token)
+            self.plex = PlexServer(self.plex_url, self.plex_token, session=get_plex_session())
             logging.debug(f"Plex server version: {self.plex.version}")
         except Exception as e:
             # Extract the root cause from nested exception chains
@@ -257,10 +349,9 @@ class PlexManager:
             logging.error(f"Cannot connect to Plex server at {self.plex_url}: {reason}")
             raise ConnectionError(f"Cannot connect to Plex server: {reason}") from None
 
-    def _rate_limited_api_call(self) -> None:
-        """Enforce rate limiting for plex.tv API calls."""
-        with self._api_lock:
-            time.sleep(PLEX_API_DELAY)
+    def _rate_limited_api_call(self, endpoint: str = "plex.tv") -> None:
+        """Wait for the shared plex.tv rate limiter before an API call."""
+        get_plextv_limiter().acquire(endpoint)
 
     def _load_tokens_from_settings(self, settings_users: List[dict],
                                     skip_users: List[str], machine_id: str) -> Set[str]:
@@ -570,9 +661,10 @@ class PlexManager:
 
         # Re-query Plex API to find this UUID
         try:
-            self._rate_limited_api_call()
-            account = self.plex.myPlexAccount()
-            users = account.users()
+            account = _retry_plextv_call(
+                self.plex.myPlexAccount, label="account lookup", endpoint="account",
+            )
+            users = _retry_plextv_call(account.users, label="user list", endpoint="users")
 
             for user in users:
                 username = user.title
@@ -629,10 +721,11 @@ class PlexManager:
                         from plexapi.myplex import MyPlexAccount
                         logging.debug(f"[PLEX API] No token for {username}, trying switchHomeUser...")
                         self._rate_limited_api_call()
-                        admin_account = MyPlexAccount(token=self.plex_token)
+                        admin_account = MyPlexAccount(token=self.plex_token, session=get_plextv_session(username))
                         self._rate_limited_api_call()
                         switched = admin_account.switchHomeUser(username)
-                        return username, PlexServer(self.plex_url, switched.authenticationToken)
+                        return username, PlexServer(self.plex_url, switched.authenticationToken,
+                                                    session=get_plex_session())
                     except Exception as e:
                         _log_api_error(f"switchHomeUser for {username}", e)
                         return None, None
@@ -641,7 +734,7 @@ class PlexManager:
                     return None, None
 
             try:
-                return username, PlexServer(self.plex_url, token)
+                return username, PlexServer(self.plex_url, token, session=get_plex_session())
             except Exception as e:
                 _log_api_error(f"create PlexServer for {username}", e)
                 # Invalidate token on auth failure
@@ -654,7 +747,7 @@ class PlexManager:
                 username = self.plex.myPlexAccount().title
             except Exception:
                 username = "main"
-            return username, PlexServer(self.plex_url, self.plex_token)
+            return username, PlexServer(self.plex_url, self.plex_token, session=get_plex_session())
     
     def search_plex(self, title: str, guid: str = None, expected_type: str = None,
                      valid_sections: List[int] = None):
@@ -669,6 +762,11 @@ class PlexManager:
         Returns:
             Matched Plex item or None if not found
         """
+        if guid and getattr(self, '_library_index', None) is not None:
+            resolved, item = self._search_library_index(guid, valid_sections)
+            if resolved:
+                return item
+
         # Try GUID lookup first (most accurate)
         if guid:
             for section in self.plex.library.sections():
@@ -696,6 +794,49 @@ class PlexManager:
         logging.debug(f"No GUID match found for '{title}' (guid={guid}) — item not in library")
         return None
     
+    def _search_library_index(self, guid: str, valid_sections: Optional[List[int]]) -> Tuple[bool, Optional[IndexedItem]]:
+        """Match ``guid`` through the library index.
+
+        Returns:
+            (resolved, item). resolved is False when the index can't answer
+            (sections not indexed this run, or the indexed show is gone) and
+            search_plex should query the server.
+        """
+        index = self._library_index
+        match = index.lookup(guid, valid_sections)
+        if match is None:
+            if index.covers(valid_sections):
+                return True, None
+            return False, None
+
+        rating_key, entry = match
+        item = IndexedItem(self.plex, rating_key, entry)
+        if item.TYPE == 'show':
+            # The watchlist fetches these next anyway; doing it here confirms
+            # the ratingKey still exists
+            try:
+                self.episode_cache.get_or_fetch(("show", str(rating_key)), item.episodes)
+            except NotFound:
+                index.invalidate(rating_key)
+                return False, None
+        logging.debug(f"Library index matched '{item.title}' ({item.TYPE}) for {guid}")
+        return True, item
+
+    def _refresh_library_index(self, sections: list) -> None:
+        """Update the library index before matching watchlist items (no-op without an index file)."""
+        if getattr(self, '_library_index', None) is None:
+            return
+        try:
+            self._library_index.refresh(self.plex, sections)
+        except Exception as e:
+            logging.warning(f"[LIBRARY INDEX] Refresh failed, searching Plex directly: {e}")
+
+    def log_library_index_stats(self) -> None:
+        """Log the library index hit/miss counters for this run."""
+        index = getattr(self, '_library_index', None)
+        if index is not None and (index.hits or index.misses):
+            logging.debug(f"[LIBRARY INDEX] {index.hits} hits, {index.misses} misses")
+
     def get_active_sessions(self) -> List:
         """Get active sessions from Plex."""
         return self.plex.sessions()
@@ -737,36 +878,87 @@ class PlexManager:
                     continue
                 users_to_fetch.append(UserProxy(username))
 
+        # Snapshot is copied lazily, on the first DB query of this fetch
+        self._db_snapshot = self._create_db_snapshot()
+        try:
+            db_items = None
+            if self.ondeck_source in ("db", "verify"):
+                db_items = self._fetch_on_deck_db_primary(
+                    users_to_fetch, valid_sections, days_to_monitor, number_episodes,
+                    users_toggle, skip_ondeck, per_user_days
+                )
+
+            if self.ondeck_source == "db" and db_items is not None:
+                on_deck_files.extend(db_items)
+            else:
+                on_deck_files.extend(self._fetch_on_deck_via_api(
+                    users_to_fetch, valid_sections, days_to_monitor, number_episodes,
+                    users_toggle, skip_ondeck, per_user_days
+                ))
+                if db_items is not None:
+                    self._log_ondeck_verification(db_items, on_deck_files)
+        finally:
+            if self._db_snapshot is not None:
+                self._db_snapshot.close()
+                self._db_snapshot = None
+
+        # Log OnDeck items grouped by user (sequential output after parallel fetch)
+        items_by_user: Dict[str, List[OnDeckItem]] = {}
+        for item in on_deck_files:
+            if item.username not in items_by_user:
+                items_by_user[item.username] = []
+            items_by_user[item.username].append(item)
+
+        for username in sorted(items_by_user.keys()):
+            items = items_by_user[username]
+            for item in items:
+                logging.debug(f"[USER:{username}] OnDeck found: {item.file_path}")
+            logging.debug(f"[USER:{username}] Found {len(items)} OnDeck items")
+
+        return on_deck_files
+
+    
+    def _fetch_on_deck_via_api(self, users_to_fetch: list, valid_sections: List[int],
+                               days_to_monitor: int, number_episodes: int, users_toggle: bool,
+                               skip_ondeck: List[str],
+                               per_user_days: Optional[Dict[str, int]]) -> List[OnDeckItem]:
+        """Fetch OnDeck through the Plex API, plus the DB fallback for tokenless shared users."""
+        on_deck_files: List[OnDeckItem] = []
         logging.debug(f"Fetching OnDeck media for {len(users_to_fetch)} users (using cached tokens)")
 
         # Fetch concurrently
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            futures = {}
-            for user in users_to_fetch:
-                username = user.title if user else "main"
-                user_days = (per_user_days or {}).get(username, days_to_monitor)
-                futures[executor.submit(
-                    self._fetch_user_on_deck_media,
-                    valid_sections, user_days, number_episodes, user
-                )] = username
-
-            for future in as_completed(futures):
-                try:
-                    on_deck_files.extend(future.result())
-                except Exception as e:
-                    logging.error(f"An error occurred while fetching OnDeck media for a user: {e}")
+        if self.fetch_engine == "async":
+            from core.plex_async import AsyncPlexFetcher
+            days_for_user = {
+                (user.title if user else "main"): (per_user_days or {}).get(
+                    user.title if user else "main", days_to_monitor)
+                for user in users_to_fetch
+            }
+            on_deck_files.extend(AsyncPlexFetcher(self).fetch_on_deck(
+                users_to_fetch, valid_sections, days_for_user, number_episodes
+            ))
+        else:
+            with ThreadPoolExecutor(max_workers=10) as executor:
+                futures = {}
+                for user in users_to_fetch:
+                    username = user.title if user else "main"
+                    user_days = (per_user_days or {}).get(username, days_to_monitor)
+                    futures[executor.submit(
+                        self._fetch_user_on_deck_media,
+                        valid_sections, user_days, number_episodes, user
+                    )] = username
+
+                for future in as_completed(futures):
+                    try:
+                        on_deck_files.extend(future.result())
+                    except Exception as e:
+                        logging.error(f"An error occurred while fetching OnDeck media for a user: {e}")
 
         # DB fallback for shared users with no token
         if users_toggle and self._plex_db_path:
             users_with_results = {item.username for item in on_deck_files}
-            db_fallback_users = []
-            for username, is_home in self._user_is_home.items():
-                if is_home or username in users_with_results or username in (skip_ondeck or []):
-                    continue
-                with self._token_lock:
-                    has_token = username in self._user_tokens
-                if not has_token:
-                    db_fallback_users.append(username)
+            db_fallback_users = [u for u in self._tokenless_shared_users(skip_ondeck)
+                                 if u not in users_with_results]
 
             if db_fallback_users:
                 logging.info(f"[DB FALLBACK] Querying Plex DB for {len(db_fallback_users)} shared user(s): {', '.join(db_fallback_users)}")
@@ -779,29 +971,89 @@ class PlexManager:
                         days_to_monitor=days_to_monitor,
                         number_episodes=number_episodes,
                         user_id_map=self._user_account_ids,
-                        per_user_days=per_user_days
+                        per_user_days=per_user_days,
+                        snapshot=self._db_snapshot
                     )
                     on_deck_files.extend(db_items)
                 except Exception as e:
                     logging.error(f"[DB FALLBACK] Failed: {e}")
                     self._ondeck_data_complete = False
 
-        # Log OnDeck items grouped by user (sequential output after parallel fetch)
-        items_by_user: Dict[str, List[OnDeckItem]] = {}
-        for item in on_deck_files:
-            if item.username not in items_by_user:
-                items_by_user[item.username] = []
-            items_by_user[item.username].append(item)
+        return on_deck_files
 
-        for username in sorted(items_by_user.keys()):
-            items = items_by_user[username]
-            for item in items:
-                logging.debug(f"[USER:{username}] OnDeck found: {item.file_path}")
-            logging.debug(f"[USER:{username}] Found {len(items)} OnDeck items")
+    def _create_db_snapshot(self):
+        """PlexDBSnapshot of plex_db_path when plex_db_snapshot is enabled, else None."""
+        if not (self.plex_db_snapshot and self._plex_db_path):
+            return None
+        from core.plex_db import PlexDBSnapshot, resolve_db_file
+        db_file = resolve_db_file(self._plex_db_path, log_prefix="[DB ONDECK]")
+        return PlexDBSnapshot(db_file) if db_file else None
+
+    def _tokenless_shared_users(self, skip_ondeck: List[str]) -> List[str]:
+        """Shared (non-home) users with no token — only reachable through the Plex DB."""
+        users = []
+        for username, is_home in self._user_is_home.items():
+            if is_home or username in (skip_ondeck or []):
+                continue
+            with self._token_lock:
+                has_token = username in self._user_tokens
+            if not has_token:
+                users.append(username)
+        return users
 
-        return on_deck_files
+    def _fetch_on_deck_db_primary(self, users_to_fetch: list, valid_sections: List[int],
+                                  days_to_monitor: int, number_episodes: int, users_toggle: bool,
+                                  skip_ondeck: List[str],
+                                  per_user_days: Optional[Dict[str, int]]) -> Optional[List[OnDeckItem]]:
+        """Compute every user's OnDeck from the Plex database (ondeck_source "db"/"verify").
+
+        Returns:
+            The items, or None when the database is unusable this run (missing,
+            locked, schema mismatch) and the caller should use the API instead.
+        """
+        from core.plex_db import fetch_all_on_deck_from_db, PlexDBUnavailable
+
+        if not self._plex_db_path:
+            logging.warning("[DB ONDECK] ondeck_source requires plex_db_path — using the Plex API")
+            return None
+
+        usernames = [user.title for user in users_to_fetch if user is not None]
+        if users_toggle:
+            usernames += [u for u in self._tokenless_shared_users(skip_ondeck) if u not in usernames]
+
+        start = time.perf_counter()
+        try:
+            items = fetch_all_on_deck_from_db(
+                db_path=self._plex_db_path,
+                usernames=usernames,
+                valid_sections=valid_sections,
+                days_to_monitor=days_to_monitor,
+                number_episodes=number_episodes,
+                user_id_map=self._user_account_ids,
+                per_user_days=per_user_days,
+                snapshot=self._db_snapshot,
+            )
+        except PlexDBUnavailable as e:
+            logging.warning(f"[DB ONDECK] {e} — falling back to the Plex API")
+            return None
+
+        logging.info(f"[DB ONDECK] {len(items)} OnDeck items for {len(usernames) + 1} users "
+                     f"from the Plex database in {time.perf_counter() - start:.2f}s")
+        return items
+
+    def _log_ondeck_verification(self, db_items: List[OnDeckItem], api_items: List[OnDeckItem]) -> None:
+        """Log how the database OnDeck (verify mode) differs from the API result used this run."""
+        db_keys = {(item.username, item.file_path) for item in db_items}
+        api_keys = {(item.username, item.file_path) for item in api_items}
+        only_db = sorted(db_keys - api_keys)
+        only_api = sorted(api_keys - db_keys)
+        logging.info(f"[DB ONDECK] Verify: {len(db_keys & api_keys)} items match, "
+                     f"{len(only_db)} only in DB, {len(only_api)} only in API")
+        for username, file_path in only_db:
+            logging.debug(f"[DB ONDECK] Verify: only in DB [USER:{username}] {file_path}")
+        for username, file_path in only_api:
+            logging.debug(f"[DB ONDECK] Verify: only in API [USER:{username}] {file_path}")
 
-    
     def _fetch_user_on_deck_media(self, valid_sections: List[int], days_to_monitor: int,
                                 number_episodes: int, user=None) -> List[OnDeckItem]:
         """Fetch onDeck media for a specific user using cached tokens.
@@ -819,28 +1071,13 @@ class PlexManager:
             logging.debug(f"[USER:{username}] Fetching onDeck media...")
 
             on_deck_files: List[OnDeckItem] = []
-            # Per-section iteration (not plex_instance.library.onDeck()) so libraries
-            # marked "Exclude from home screen" still surface — the global /library/onDeck
-            # endpoint applies that visibility filter server-side and silently drops them.
-            available_sections = [section.key for section in plex_instance.library.sections()]
-            if valid_sections:
-                sections_to_query = list(set(available_sections) & set(valid_sections))
-            else:
-                sections_to_query = available_sections
-
-            for section_key in sections_to_query:
+            for section_key in self._ondeck_sections_to_query(plex_instance, valid_sections):
                 try:
                     section = plex_instance.library.sectionByID(section_key)
                     for video in section.onDeck():
-                        delta = datetime.now() - video.lastViewedAt
-                        if delta.days > days_to_monitor:
-                            continue
-                        if isinstance(video, Episode):
-                            self._process_episode_ondeck(video, number_episodes, on_deck_files, username)
-                        elif isinstance(video, Movie):
-                            self._process_movie_ondeck(video, on_deck_files, username)
-                        else:
-                            logging.warning(f"Skipping OnDeck item '{video.title}' — unknown type {type(video)}")
+                        on_deck_files.extend(
+                            self._process_ondeck_video(video, days_to_monitor, number_episodes, username)
+                        )
                 except Exception as e:
                     logging.warning(f"[USER:{username}] Failed to fetch onDeck for section {section_key}: {e}")
                     if not user:
@@ -860,6 +1097,34 @@ class PlexManager:
                 logging.warning("OnDeck data incomplete — main account fetch failed")
             return []
     
+    @staticmethod
+    def _ondeck_sections_to_query(plex_instance: PlexServer, valid_sections: List[int]) -> List[int]:
+        """Library section keys to query for a user's OnDeck.
+
+        Per-section iteration (not plex_instance.library.onDeck()) so libraries
+        marked "Exclude from home screen" still surface — the global /library/onDeck
+        endpoint applies that visibility filter server-side and silently drops them.
+        """
+        available_sections = [section.key for section in plex_instance.library.sections()]
+        if valid_sections:
+            return list(set(available_sections) & set(valid_sections))
+        return available_sections
+
+    def _process_ondeck_video(self, video, days_to_monitor: int, number_episodes: int,
+                              username: str) -> List[OnDeckItem]:
+        """Turn one OnDeck entry into OnDeckItems (plus prefetched next episodes)."""
+        on_deck_files: List[OnDeckItem] = []
+        delta = datetime.now() - video.lastViewedAt
+        if delta.days > days_to_monitor:
+            return on_deck_files
+        if isinstance(video, Episode):
+            self._process_episode_ondeck(video, number_episodes, on_deck_files, username)
+        elif isinstance(video, Movie):
+            self._process_movie_ondeck(video, on_deck_files, username)
+        else:
+            logging.warning(f"Skipping OnDeck item '{video.title}' — unknown type {type(video)}")
+        return on_deck_files
+
     def _process_episode_ondeck(self, video: Episode, number_episodes: int, on_deck_files: List[OnDeckItem], username: str = "unknown") -> None:
         """Process an episode from onDeck.
 
@@ -899,9 +1164,7 @@ class PlexManager:
             logging.warning(f"Skipping next episode fetch for '{show}' - missing index data (parentIndex={current_season}, index={current_episode})")
             return
 
-        parent_show = video.show()
-        episodes = list(parent_show.episodes())
-        next_episodes = self._get_next_episodes(episodes, current_season, current_episode, number_episodes)
+        next_episodes = self._fetch_next_episodes(video, current_season, current_episode, number_episodes)
 
         # Add the prefetched next episodes
         for episode in next_episodes:
@@ -940,6 +1203,59 @@ class PlexManager:
                     rating_key=movie_rating_key or None
                 ))
     
+    def _fetch_next_episodes(self, video: Episode, current_season: int,
+                             current_episode: int, number_episodes: int) -> List[Episode]:
+        """Fetch the episodes following ``video``, one season at a time.
+
+        Only the current season (and later ones, while more episodes are
+        needed) is downloaded instead of the show's full episode list. Season
+        lists come from the per-run cache, so users watching the same show
+        share one fetch. A full list already cached by the watchlist pass is
+        reused as is. Only episode metadata (season/index/media parts) is
+        used here, so lists fetched with another user's token are fine.
+        """
+        if number_episodes <= 0:
+            return []
+        show_key = str(getattr(video, 'grandparentRatingKey', '') or '')
+        if not show_key:
+            return self._get_next_episodes(list(video.show().episodes()), current_season,
+                                           current_episode, number_episodes)
+
+        cached_show = self.episode_cache.peek(("show", show_key))
+        if cached_show is not None:
+            return self._get_next_episodes(cached_show, current_season, current_episode, number_episodes)
+
+        seasons = self.episode_cache.get_or_fetch(("seasons", show_key), lambda: video.show().seasons())
+        candidates: List[Episode] = []
+        next_episodes: List[Episode] = []
+        for season in sorted((s for s in seasons if s.index is not None and s.index >= current_season),
+                             key=lambda s: s.index):
+            candidates.extend(self.episode_cache.get_or_fetch(
+                ("season", str(season.ratingKey)), season.episodes))
+            next_episodes = self._get_next_episodes(candidates, current_season, current_episode, number_episodes)
+            if len(next_episodes) >= number_episodes:
+                break
+        return next_episodes
+
+    @property
+    def episode_cache(self) -> ShowEpisodeCache:
+        """Per-run show episode cache.
+
+        Created on demand for partially-initialized instances (test helpers
+        that bypass ``__init__`` via ``__new__``); in production ``__init__``
+        always sets it before the threaded fetch starts.
+        """
+        cache = getattr(self, '_episode_cache', None)
+        if cache is None:
+            cache = self._episode_cache = ShowEpisodeCache()
+        return cache
+
+    def log_episode_cache_stats(self) -> None:
+        """Log the per-run show episode cache hit/miss counters."""
+        cache = self.episode_cache
+        if cache.hits or cache.misses:
+            logging.debug(f"[PLEX API] Show episode cache: {cache.hits} hits, {cache.misses} misses")
+
     def _get_next_episodes(self, episodes: List[Episode], current_season: int,
                           current_episode_index: int, number_episodes: int) -> List[Episode]:
         """Get the next episodes after the current one."""
@@ -963,46 +1279,51 @@ class PlexManager:
     # -------------------- Watchlist Helper Methods --------------------
 
     def _parse_rss_response(self, text: str) -> List[Tuple[str, str, Optional[datetime], str, str]]:
-        """Parse RSS XML response into list of items.
+        """Parse RSS XML text into list of items (see _parse_rss_stream)."""
+        return self._parse_rss_stream(io.BytesIO(text.encode("utf-8")))
+
+    def _parse_rss_stream(self, source) -> List[Tuple[str, str, Optional[datetime], str, str]]:
+        """Parse an RSS XML stream into list of items.
+
+        Items are parsed one <item> at a time with iterparse and discarded
+        afterwards, so large feeds never build a full DOM.
 
         Returns list of tuples: (title, category, pub_date, author_id, guid)
         The guid contains IMDB/TVDB IDs like 'imdb://tt0898367' or 'tvdb://267247'
         """
-        root = ET.fromstring(text)
         items = []
-        for item in root.findall("channel/item"):
-            title = item.find("title").text
-            category_elem = item.find("category")
-            category = category_elem.text if category_elem is not None else ""
+        for _, item in ET.iterparse(source, events=("end",)):
+            if item.tag != "item":
+                continue
+            title = item.findtext("title")
+            category = item.findtext("category") or ""
             # Parse pubDate (RFC 822 format) - this is when item was added to watchlist
             pub_date = None
-            pub_date_elem = item.find("pubDate")
-            if pub_date_elem is not None and pub_date_elem.text:
+            pub_date_text = item.findtext("pubDate")
+            if pub_date_text:
                 try:
-                    pub_date = parsedate_to_datetime(pub_date_elem.text)
+                    pub_date = parsedate_to_datetime(pub_date_text)
                 except (ValueError, TypeError):
                     pass  # Invalid date format, use None
             # Get author ID (Plex user ID who added to watchlist)
-            author_id = ""
-            author_elem = item.find("author")
-            if author_elem is not None and author_elem.text:
-                author_id = author_elem.text
+            author_id = item.findtext("author") or ""
             # Get GUID (IMDB/TVDB ID) for accurate matching
-            guid = ""
-            guid_elem = item.find("guid")
-            if guid_elem is not None and guid_elem.text:
-                guid = guid_elem.text
+            guid = item.findtext("guid") or ""
             items.append((title, category, pub_date, author_id, guid))
+            item.clear()
         return items
 
-    def _save_rss_cache(self, url: str, items: List[Tuple[str, str, Optional[datetime], str, str]]) -> None:
-        """Save RSS items to cache file."""
+    def _save_rss_cache(self, url: str, items: List[Tuple[str, str, Optional[datetime], str, str]],
+                        etag: Optional[str] = None, last_modified: Optional[str] = None) -> None:
+        """Save RSS items and the feed's cache validators to the cache file."""
         if not self._rss_cache_file:
             return
         try:
             cache_data = {
                 'timestamp': datetime.now().isoformat(),
                 'url': url,
+                'etag': etag,
+                'last_modified': last_modified,
                 'items': [
                     (title, category, pub_date.isoformat() if pub_date else None, author_id, guid)
                     for title, category, pub_date, author_id, guid in items
@@ -1014,54 +1335,95 @@ class PlexManager:
         except IOError as e:
             logging.debug(f"Failed to save RSS cache: {e}")
 
-    def _load_rss_cache(self) -> List[Tuple[str, str, Optional[datetime], str, str]]:
-        """Load RSS items from cache file."""
-        if not self._rss_cache_file:
-            return []
+    def _read_rss_cache(self) -> Optional[Dict]:
+        """Read the RSS cache file; items come back as tuples with parsed dates."""
+        if not self._rss_cache_file or not os.path.exists(self._rss_cache_file):
+            return None
         try:
-            if os.path.exists(self._rss_cache_file):
-                with open(self._rss_cache_file, 'r') as f:
-                    cache_data = json.load(f)
-                items = []
-                for item_data in cache_data['items']:
-                    # Handle both old format (4 fields) and new format (5 fields with guid)
-                    if len(item_data) == 4:
-                        title, category, pub_date_str, author_id = item_data
-                        guid = ""
-                    else:
-                        title, category, pub_date_str, author_id, guid = item_data
-                    pub_date = datetime.fromisoformat(pub_date_str) if pub_date_str else None
-                    items.append((title, category, pub_date, author_id, guid))
-                cache_time = datetime.fromisoformat(cache_data['timestamp'])
-                cache_age = datetime.now() - cache_time
-                cache_age_hours = cache_age.total_seconds() / 3600
-                logging.warning(f"Using cached RSS data ({len(items)} items, {cache_age_hours:.1f} hours old)")
-                return items
+            with open(self._rss_cache_file, 'r') as f:
+                cache_data = json.load(f)
+            items = []
+            for item_data in cache_data['items']:
+                # Handle both old format (4 fields) and new format (5 fields with guid)
+                if len(item_data) == 4:
+                    title, category, pub_date_str, author_id = item_data
+                    guid = ""
+                else:
+                    title, category, pub_date_str, author_id, guid = item_data
+                pub_date = datetime.fromisoformat(pub_date_str) if pub_date_str else None
+                items.append((title, category, pub_date, author_id, guid))
+            cache_data['items'] = items
+            return cache_data
         except Exception as e:
             logging.debug(f"Failed to load RSS cache: {e}")
-        return []
+        return None
+
+    def _load_rss_cache(self) -> List[Tuple[str, str, Optional[datetime], str, str]]:
+        """Load RSS items from cache file (fallback when the feed can't be fetched)."""
+        cache_data = self._read_rss_cache()
+        if not cache_data:
+            return []
+        items = cache_data['items']
+        try:
+            cache_age = datetime.now() - datetime.fromisoformat(cache_data['timestamp'])
+            cache_age_hours = cache_age.total_seconds() / 3600
+            logging.warning(f"Using cached RSS data ({len(items)} items, {cache_age_hours:.1f} hours old)")
+        except (KeyError, TypeError, ValueError):
+            logging.warning(f"Using cached RSS data ({len(items)} items)")
+        return items
 
     def _fetch_rss_titles(self, url: str) -> List[Tuple[str, str, Optional[datetime], str, str]]:
         """Fetch titles, categories, pubDate, author ID, and GUID from a Plex RSS feed.
 
-        Retries up to RSS_MAX_RETRIES times with exponential backoff.
+        Sends the ETag/Last-Modified saved from the previous fetch; on a 304
+        the cached items are reused and the cache file is left alone.
+        Retries up to RSS_MAX_RETRIES times with exponential backoff, or for
+        the feed's Retry-After when plex.tv rate limits it.
         Falls back to cached data if all retries fail.
 
         Returns list of tuples: (title, category, pub_date, author_id, guid)
         """
+        cached = self._read_rss_cache()
+        if cached and cached.get('url') != url:
+            cached = None
+        headers = {}
+        if cached and cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached and cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+
+        limiter = get_plextv_limiter()
         # Retry loop with exponential backoff
         last_error = None
         for attempt in range(RSS_MAX_RETRIES):
+            limiter.acquire("rss")
             try:
-                resp = requests.get(url, timeout=RSS_TIMEOUT)
-                resp.raise_for_status()
-                items = self._parse_rss_response(resp.text)
-                self._save_rss_cache(url, items)  # Cache successful result
+                with get_plextv_session().get(url, timeout=RSS_TIMEOUT, headers=headers, stream=True) as resp:
+                    resp.raise_for_status()
+                    limiter.record_success("rss")
+                    if resp.status_code == 304 and cached:
+                        logging.debug(f"RSS feed unchanged (304) — reusing {len(cached['items'])} cached items")
+                        return cached['items']
+                    resp.raw.decode_content = True
+                    items = self._parse_rss_stream(resp.raw)
+                    etag = resp.headers.get('ETag')
+                    last_modified = resp.headers.get('Last-Modified')
+                if cached and items == cached['items'] and etag == cached.get('etag') \
+                        and last_modified == cached.get('last_modified'):
+                    logging.debug("RSS feed content unchanged — cache not rewritten")
+                else:
+                    self._save_rss_cache(url, items, etag, last_modified)  # Cache successful result
                 return items
-            except (requests.RequestException, ET.ParseError) as e:
+            except (requests.RequestException, urllib3.exceptions.HTTPError, ET.ParseError) as e:
+                # The body is parsed straight from resp.raw, so a drop or timeout
+                # mid-body surfaces as a urllib3 error (ProtocolError, ReadTimeoutError,
+                # DecodeError) rather than a requests one
                 last_error = e
                 if attempt < RSS_MAX_RETRIES - 1:
-                    wait_time = 2 ** attempt  # 1s, 2s, 4s
+                    if is_rate_limited_error(e):
+                        wait_time = limiter.record_rate_limited("rss", limiter.retry_after_for(e))
+                    else:
+                        wait_time = 2 ** attempt  # 1s, 2s, 4s
                     logging.warning(f"RSS fetch attempt {attempt + 1}/{RSS_MAX_RETRIES} failed: {e}. Retrying in {wait_time}s...")
                     time.sleep(wait_time)
 
@@ -1081,7 +1443,14 @@ class PlexManager:
         Iterates all media versions and parts per episode (e.g., 4K + 1080p),
         matching the OnDeck discovery pattern.
         """
-        episodes = file.episodes()
+        # Same show watchlisted by several users (or via RSS): fetch its episodes once
+        # per run. Always fetched through the main server connection (search_plex),
+        # so isPlayed reflects the same account as before.
+        show_key = str(getattr(file, 'ratingKey', '') or '')
+        if show_key:
+            episodes = self.episode_cache.get_or_fetch(("show", show_key), file.episodes)
+        else:
+            episodes = file.episodes()
         episodes_to_process = episodes[:watchlist_episodes]
         logging.debug(f"Processing show {file.title} with {len(episodes)} episodes (limit: {watchlist_episodes})")
 
@@ -1135,13 +1504,15 @@ class PlexManager:
                 logging.debug(f"[USER:{username}] Watchlist found: {file_path}")
                 yield (file_path, username, watchlisted_at, None, movie_rating_key or None, "movie")
 
-    def _fetch_user_watchlist(self, user, valid_sections: List[int], watchlist_episodes: int,
-                               skip_watchlist: List[str], rss_url: Optional[str],
-                               filtered_sections: List[int]) -> Generator[Tuple[str, str, Optional[datetime], Optional[Dict], Optional[str], str], None, None]:
-        """Fetch watchlist media for a user, yielding file paths with metadata.
+    def _get_watchlist_account(self, user, skip_watchlist: List[str]) -> Tuple[str, Optional['MyPlexAccount']]:
+        """Resolve a user's display name and a fresh MyPlexAccount for watchlist access.
 
         Uses separate MyPlexAccount instances per user to avoid session state contamination.
         See: https://github.com/StudioNirin/PlexCache-D/issues/20
+
+        Returns:
+            (username, account). account is None when the user is skipped or
+            the account could not be obtained (watchlist then marked incomplete).
         """
         current_username = user.title if user else "main"
 
@@ -1165,33 +1536,101 @@ class PlexManager:
                 token = self._user_tokens.get(current_username)
             if current_username in skip_watchlist or (token and token in skip_watchlist):
                 logging.info(f"[USER:{current_username}] Skipping — in watchlist skip list")
-                return
+                return current_username, None
             # No token is OK for home users — switchHomeUser path below handles auth
 
         # --- Obtain Plex account instance ---
         try:
-            fresh_session = requests.Session()
+            # Per-user pooled session: accounts never share one, but each reuses
+            # its own keep-alive connections to plex.tv across runs
+            account_session = get_plextv_session(None if user is None else current_username)
 
             if user is None:
-                # Main account - use the main token with a fresh session
-                self._rate_limited_api_call()
-                account = MyPlexAccount(token=self.plex_token, session=fresh_session)
+                # Main account - use the main token
+                account = _retry_plextv_call(
+                    lambda: MyPlexAccount(token=self.plex_token, session=account_session),
+                    label=f"account for {current_username}", endpoint="account",
+                )
                 logging.debug(f"[USER:{current_username}] Created fresh MyPlexAccount (main user)")
             else:
                 # Home/managed user - create fresh admin account then switch to home user
                 try:
-                    self._rate_limited_api_call()
-                    fresh_admin_account = MyPlexAccount(token=self.plex_token, session=fresh_session)
-                    self._rate_limited_api_call()
-                    account = fresh_admin_account.switchHomeUser(current_username)
+                    fresh_admin_account = _retry_plextv_call(
+                        lambda: MyPlexAccount(token=self.plex_token, session=account_session),
+                        label=f"admin account for {current_username}", endpoint="account",
+                    )
+                    account = _retry_plextv_call(
+                        lambda: fresh_admin_account.switchHomeUser(current_username),
+                        label=f"switchHomeUser for {current_username}", endpoint="switch_home",
+                    )
                     logging.debug(f"[USER:{current_username}] Switched to home user via fresh admin account")
                 except Exception as e:
                     _log_api_error(f"switch to home user {current_username}", e)
                     self.mark_watchlist_incomplete()
-                    return
+                    return current_username, None
         except Exception as e:
             _log_api_error(f"get Plex account for {current_username}", e)
             self.mark_watchlist_incomplete()
+            return current_username, None
+
+        return current_username, account
+
+    def _fetch_account_watchlist(self, account: 'MyPlexAccount', username: str) -> list:
+        """Fetch a user's released watchlist items from plex.tv, newest first."""
+        watchlist = _retry_plextv_call(
+            lambda: account.watchlist(filter='released', sort='watchlistedAt:desc'),
+            label=f"watchlist for {username}", endpoint="watchlist",
+        )
+        logging.debug(f"[USER:{username}] Found {len(watchlist)} watchlist items")
+        return watchlist
+
+    def _process_watchlist_item(self, account: 'MyPlexAccount', item, username: str,
+                                filtered_sections: List[int], watchlist_episodes: int
+                                ) -> Generator[Tuple[str, str, Optional[datetime], Optional[Dict], Optional[str], str], None, None]:
+        """Match one plex.tv watchlist item to the library and yield its files."""
+        watchlisted_at = None
+        try:
+            user_state = _retry_plextv_call(
+                lambda: account.userState(item),
+                label=f"userState for '{item.title}'", endpoint="user_state",
+            )
+            watchlisted_at = getattr(user_state, 'watchlistedAt', None)
+        except Exception as e:
+            logging.debug(f"Could not get userState for {item.title}: {e}")
+
+        # Extract GUID for accurate matching (prefer IMDB, then TVDB)
+        guid = None
+        item_guids = getattr(item, 'guids', [])
+        for g in item_guids:
+            gid = getattr(g, 'id', str(g))
+            if gid.startswith('imdb://') or gid.startswith('tvdb://'):
+                guid = gid
+                break
+
+        # Determine expected type from watchlist item
+        expected_type = getattr(item, 'type', None)
+
+        file = self.search_plex(item.title, guid=guid, expected_type=expected_type,
+                               valid_sections=filtered_sections)
+        if file and (not filtered_sections or file.librarySectionID in filtered_sections):
+            try:
+                if file.TYPE == 'show':
+                    yield from self._process_watchlist_show(file, watchlist_episodes, username, watchlisted_at)
+                elif file.TYPE == 'movie':
+                    yield from self._process_watchlist_movie(file, username, watchlisted_at)
+                else:
+                    logging.debug(f"Ignoring item '{file.title}' of type '{file.TYPE}'")
+            except Exception as e:
+                logging.warning(f"Error processing '{file.title}': {e}")
+        elif file:
+            logging.debug(f"Skipping watchlist item '{file.title}' — section {file.librarySectionID} not in valid_sections {filtered_sections}")
+
+    def _fetch_user_watchlist(self, user, valid_sections: List[int], watchlist_episodes: int,
+                               skip_watchlist: List[str], rss_url: Optional[str],
+                               filtered_sections: List[int]) -> Generator[Tuple[str, str, Optional[datetime], Optional[Dict], Optional[str], str], None, None]:
+        """Fetch watchlist media for a user, yielding file paths with metadata."""
+        current_username, account = self._get_watchlist_account(user, skip_watchlist)
+        if account is None:
             return
 
         # --- RSS feed processing ---
@@ -1201,49 +1640,9 @@ class PlexManager:
 
         # --- Local Plex watchlist processing ---
         try:
-            self._rate_limited_api_call()
-            watchlist = _retry_plextv_call(
-                lambda: account.watchlist(filter='released', sort='watchlistedAt:desc'),
-                label=f"watchlist for {current_username}",
-            )
-            logging.debug(f"[USER:{current_username}] Found {len(watchlist)} watchlist items")
-            for item in watchlist:
-                watchlisted_at = None
-                try:
-                    user_state = _retry_plextv_call(
-                        lambda: account.userState(item),
-                        label=f"userState for '{item.title}'",
-                    )
-                    watchlisted_at = getattr(user_state, 'watchlistedAt', None)
-                except Exception as e:
-                    logging.debug(f"Could not get userState for {item.title}: {e}")
-
-                # Extract GUID for accurate matching (prefer IMDB, then TVDB)
-                guid = None
-                item_guids = getattr(item, 'guids', [])
-                for g in item_guids:
-                    gid = getattr(g, 'id', str(g))
-                    if gid.startswith('imdb://') or gid.startswith('tvdb://'):
-                        guid = gid
-                        break
-
-                # Determine expected type from watchlist item
-                expected_type = getattr(item, 'type', None)
-
-                file = self.search_plex(item.title, guid=guid, expected_type=expected_type,
-                                       valid_sections=filtered_sections)
-                if file and (not filtered_sections or file.librarySectionID in filtered_sections):
-                    try:
-                        if file.TYPE == 'show':
-                            yield from self._process_watchlist_show(file, watchlist_episodes, current_username, watchlisted_at)
-                        elif file.TYPE == 'movie':
-                            yield from self._process_watchlist_movie(file, current_username, watchlisted_at)
-                        else:
-                            logging.debug(f"Ignoring item '{file.title}' of type '{file.TYPE}'")
-                    except Exception as e:
-                        logging.warning(f"Error processing '{file.title}': {e}")
-                elif file:
-                    logging.debug(f"Skipping watchlist item '{file.title}' — section {file.librarySectionID} not in valid_sections {filtered_sections}")
+            for item in self._fetch_account_watchlist(account, current_username):
+                yield from self._process_watchlist_item(account, item, current_username,
+                                                        filtered_sections, watchlist_episodes)
         except Exception as e:
             logging.error(f"[USER:{current_username}] Error fetching watchlist: {e}")
             self.mark_watchlist_incomplete()
@@ -1263,6 +1662,8 @@ class PlexManager:
         unknown_user_ids = set()
         rss_not_found = []
         rss_skipped_users = {}  # username -> count of skipped items
+        # The same item shows up once per friend who watchlisted it; match it once
+        resolved: Dict[Tuple[str, str], object] = {}
 
         for title, category, pub_date, author_id, guid in rss_items:
             # Look up username from author ID
@@ -1284,9 +1685,14 @@ class PlexManager:
                 rss_skipped_users[rss_username] = rss_skipped_users.get(rss_username, 0) + 1
                 continue
 
-            cleaned_title = self.clean_rss_title(title)
-            file = self.search_plex(cleaned_title, guid=guid, expected_type=category,
-                                   valid_sections=filtered_sections)
+            resolve_key = (guid, "") if guid else (title, category)
+            if resolve_key in resolved:
+                file = resolved[resolve_key]
+            else:
+                cleaned_title = self.clean_rss_title(title)
+                file = resolved[resolve_key] = self.search_plex(
+                    cleaned_title, guid=guid, expected_type=category, valid_sections=filtered_sections
+                )
             if file:
                 logging.debug(f"RSS title '{title}' matched Plex item '{file.title}' ({file.TYPE})")
                 try:
@@ -1344,8 +1750,10 @@ class PlexManager:
             home_users = []
 
         # Build filtered sections list
-        available_sections = [section.key for section in self.plex.library.sections()]
+        sections = self.plex.library.sections()
+        available_sections = [section.key for section in sections]
         filtered_sections = list(set(available_sections) & set(valid_sections))
+        self._refresh_library_index(sections)
 
         # Prepare users to fetch
         users_to_fetch = [None]  # always include the main local account
@@ -1374,27 +1782,29 @@ class PlexManager:
 
         logging.debug(f"Processing {len(users_to_fetch)} users for watchlist (main + {len(users_to_fetch)-1} home users)")
 
-        # Fetch concurrently using extracted helper methods
+        if self.fetch_engine == "async":
+            from core.plex_async import AsyncPlexFetcher
+            yield from AsyncPlexFetcher(self).fetch_watchlist(
+                users_to_fetch, watchlist_episodes, skip_watchlist, rss_url, filtered_sections
+            )
+            return
+
+        # Fetch concurrently. Each worker drains its user's generator so the
+        # plex.tv calls (and any 429 backoff) run in the worker, not here.
         with ThreadPoolExecutor(max_workers=10) as executor:
             futures = {
                 executor.submit(
-                    self._fetch_user_watchlist, user, valid_sections, watchlist_episodes,
-                    skip_watchlist, rss_url, filtered_sections
+                    lambda user: list(self._fetch_user_watchlist(
+                        user, valid_sections, watchlist_episodes,
+                        skip_watchlist, rss_url, filtered_sections
+                    )),
+                    user
                 )
                 for user in users_to_fetch
             }
             for future in as_completed(futures):
-                retries = 0
-                while retries < self.retry_limit:
-                    try:
-                        yield from future.result()
-                        break
-                    except Exception as e:
-                        error_str = str(e)
-                        if "429" in error_str or "Too Many Requests" in error_str:
-                            logging.warning(f"[PLEX API] Rate limited. Retrying in {self.delay} seconds...")
-                            time.sleep(self.delay)
-                            retries += 1
-                        else:
-                            _log_api_error("fetch watchlist media", e)
-                            break
+                try:
+                    yield from future.result()
+                except Exception as e:
+                    _log_api_error("fetch watchlist media", e)
+                    self.mark_watchlist_incomplete()
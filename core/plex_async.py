@@ -0,0 +1,226 @@
+"""asyncio fetch engine for OnDeck and watchlist collection.
+
+The default ("threads") engine gives each user one worker thread, and that
+worker walks its libraries, OnDeck entries and watchlist items one request at
+a time. This engine fans the same work out per user, per section and per
+item/show so independent round-trips overlap:
+
+- Requests still go through plexapi (and its XML parsing) on the pooled
+  sessions from core/http_sessions.py; each blocking call runs on a worker
+  thread via ``run_in_executor``.
+- A global semaphore bounds total in-flight requests and a per-host semaphore
+  keeps each host within its connection pool ("plex" = the local server,
+  "plex.tv" = account/watchlist calls, which also pass the shared plex.tv
+  rate limiter).
+- Results come back in the same shapes as the threaded engine: a list of
+  OnDeckItem, and watchlist tuples.
+
+Selected with ``plex_fetch_engine: "async"`` in settings.
+"""
+
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
+
+from core.http_sessions import POOL_MAXSIZE
+
+if TYPE_CHECKING:
+    from core.plex_api import OnDeckItem, PlexManager
+
+FETCH_ENGINES = ("threads", "async")
+DEFAULT_FETCH_ENGINE = "threads"
+
+# Total requests in flight across all users
+GLOBAL_CONCURRENCY = 24
+# Per-host caps: the local server gets its pool size, plex.tv stays gentle
+HOST_CONCURRENCY = {
+    "plex": POOL_MAXSIZE,
+    "plex.tv": 4,
+}
+
+
+def normalize_fetch_engine(value) -> str:
+    """Return a valid fetch engine name, falling back to the default on bad input."""
+    engine = str(value or DEFAULT_FETCH_ENGINE).strip().lower()
+    if engine not in FETCH_ENGINES:
+        logging.warning(f"Invalid plex_fetch_engine '{value}', using '{DEFAULT_FETCH_ENGINE}'")
+        return DEFAULT_FETCH_ENGINE
+    return engine
+
+
+class AsyncPlexFetcher:
+    """Concurrent OnDeck/watchlist collection for a PlexManager.
+
+    Create one per fetch; ``fetch_on_deck`` and ``fetch_watchlist`` each run
+    their own event loop, so they are called from ordinary synchronous code.
+    """
+
+    def __init__(self, manager: 'PlexManager', global_limit: int = GLOBAL_CONCURRENCY,
+                 host_limits: Optional[Dict[str, int]] = None):
+        self.manager = manager
+        self.global_limit = global_limit
+        self.host_limits = dict(HOST_CONCURRENCY if host_limits is None else host_limits)
+        self._global: Optional[asyncio.Semaphore] = None
+        self._hosts: Dict[str, asyncio.Semaphore] = {}
+
+    # ------------------------------------------------------------------
+    # Plumbing
+    # ------------------------------------------------------------------
+
+    def _run(self, coro):
+        """Run ``coro`` on a fresh loop with an executor sized to the global limit."""
+        async def main():
+            self._global = asyncio.Semaphore(self.global_limit)
+            self._hosts = {host: asyncio.Semaphore(limit) for host, limit in self.host_limits.items()}
+            return await coro
+
+        loop = asyncio.new_event_loop()
+        executor = ThreadPoolExecutor(max_workers=self.global_limit, thread_name_prefix="plex-async")
+        loop.set_default_executor(executor)
+        try:
+            return loop.run_until_complete(main())
+        finally:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
+            executor.shutdown(wait=True)
+
+    async def _call(self, host: str, func: Callable, *args):
+        """Run one blocking Plex call under the global and per-host semaphores."""
+        host_sem = self._hosts.get(host)
+        async with self._global:
+            if host_sem is None:
+                return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+            async with host_sem:
+                return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+    # ------------------------------------------------------------------
+    # OnDeck
+    # ------------------------------------------------------------------
+
+    def fetch_on_deck(self, users: list, valid_sections: List[int],
+                      days_for_user: Dict[str, int], number_episodes: int) -> List['OnDeckItem']:
+        """Collect OnDeck items for ``users`` (None = main account).
+
+        Args:
+            days_for_user: days_to_monitor per username ("main" for the main account).
+        """
+        async def gather_users():
+            results = await asyncio.gather(*(
+                self._user_on_deck(user, valid_sections, days_for_user, number_episodes)
+                for user in users
+            ), return_exceptions=True)
+            items: List['OnDeckItem'] = []
+            for result in results:
+                if isinstance(result, BaseException):
+                    logging.error(f"An error occurred while fetching OnDeck media for a user: {result}")
+                else:
+                    items.extend(result)
+            return items
+
+        return self._run(gather_users())
+
+    async def _user_on_deck(self, user, valid_sections: List[int],
+                            days_for_user: Dict[str, int], number_episodes: int) -> List['OnDeckItem']:
+        from core.plex_api import _log_api_error
+
+        manager = self.manager
+        username = user.title if user else "main"
+        days_to_monitor = days_for_user.get(username)
+        try:
+            username, plex_instance = await self._call("plex", manager.get_plex_instance, user)
+            if not plex_instance:
+                logging.info(f"[USER:{username}] Skipping OnDeck fetch — no Plex instance available")
+                return []
+
+            logging.debug(f"[USER:{username}] Fetching onDeck media...")
+            section_keys = await self._call(
+                "plex", manager._ondeck_sections_to_query, plex_instance, valid_sections
+            )
+            sections = await asyncio.gather(*(
+                self._section_on_deck(plex_instance, key, user, username,
+                                      days_to_monitor, number_episodes)
+                for key in section_keys
+            ))
+            return [item for section_items in sections for item in section_items]
+
+        except Exception as e:
+            _log_api_error(f"fetch OnDeck for {username}", e)
+            if "401" in str(e) or "Unauthorized" in str(e):
+                manager.invalidate_user_token(username)
+            if not user:
+                manager._ondeck_data_complete = False
+                logging.warning("OnDeck data incomplete — main account fetch failed")
+            return []
+
+    async def _section_on_deck(self, plex_instance, section_key: int, user, username: str,
+                               days_to_monitor: int, number_episodes: int) -> List['OnDeckItem']:
+        manager = self.manager
+        try:
+            videos = await self._call(
+                "plex", lambda: plex_instance.library.sectionByID(section_key).onDeck()
+            )
+            per_video = await asyncio.gather(*(
+                self._call("plex", manager._process_ondeck_video,
+                           video, days_to_monitor, number_episodes, username)
+                for video in videos
+            ))
+        except Exception as e:
+            logging.warning(f"[USER:{username}] Failed to fetch onDeck for section {section_key}: {e}")
+            if not user:
+                manager._ondeck_data_complete = False
+            return []
+        return [item for video_items in per_video for item in video_items]
+
+    # ------------------------------------------------------------------
+    # Watchlist
+    # ------------------------------------------------------------------
+
+    def fetch_watchlist(self, users: list, watchlist_episodes: int, skip_watchlist: List[str],
+                        rss_url: Optional[str], filtered_sections: List[int]) -> List[Tuple]:
+        """Collect watchlist tuples for ``users`` (None = main account)."""
+        async def gather_users():
+            results = await asyncio.gather(*(
+                self._user_watchlist(user, watchlist_episodes, skip_watchlist,
+                                     rss_url, filtered_sections)
+                for user in users
+            ), return_exceptions=True)
+            items: List[Tuple] = []
+            for result in results:
+                if isinstance(result, BaseException):
+                    from core.plex_api import _log_api_error
+                    _log_api_error("fetch watchlist media", result)
+                    self.manager.mark_watchlist_incomplete()
+                else:
+                    items.extend(result)
+            return items
+
+        return self._run(gather_users())
+
+    async def _user_watchlist(self, user, watchlist_episodes: int, skip_watchlist: List[str],
+                              rss_url: Optional[str], filtered_sections: List[int]) -> List[Tuple]:
+        manager = self.manager
+        username, account = await self._call(
+            "plex.tv", manager._get_watchlist_account, user, skip_watchlist
+        )
+        if account is None:
+            return []
+
+        if rss_url:
+            return await self._call("plex.tv", lambda: list(manager._process_rss_watchlist(
+                rss_url, username, filtered_sections, watchlist_episodes, skip_watchlist
+            )))
+
+        try:
+            watchlist = await self._call("plex.tv", manager._fetch_account_watchlist, account, username)
+            per_item = await asyncio.gather(*(
+                self._call("plex", lambda item=item: list(manager._process_watchlist_item(
+                    account, item, username, filtered_sections, watchlist_episodes
+                )))
+                for item in watchlist
+            ))
+        except Exception as e:
+            logging.error(f"[USER:{username}] Error fetching watchlist: {e}")
+            manager.mark_watchlist_incomplete()
+            return []
+        return [entry for item_entries in per_item for entry in item_entries]
@@ -1,14 +1,24 @@
 """
 Plex Database direct read for PlexCache.
-Fallback for shared users without tokens — queries the Plex Media Server
-SQLite database to reconstruct OnDeck items.
+Queries the Plex Media Server SQLite database to reconstruct OnDeck items —
+as a fallback for shared users without tokens, or (ondeck_source "db") as
+the primary OnDeck source for every user including the server owner.
+
+The live database is opened read-only with a busy timeout. With
+``plex_db_snapshot`` enabled, it is instead copied once per run to a local
+temp file via the SQLite online backup API (a consistent point-in-time copy
+even while Plex writes), and every query for every user runs on a single
+immutable connection to that copy, whose statement cache reuses each
+prepared query across users.
 """
 
 import logging
 import os
 import sqlite3
+import tempfile
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from urllib.parse import quote
+from typing import Dict, List, Optional
 
 from core.plex_api import OnDeckItem
 
@@ -16,6 +26,101 @@ from core.plex_api import OnDeckItem
 # SQLite busy timeout (ms) — how long to wait if Plex has the DB locked
 DB_BUSY_TIMEOUT_MS = 5000
 
+# The Plex server owner is always account 1 in the accounts table
+MAIN_ACCOUNT_ID = 1
+
+PLEX_DB_FILENAME = "com.plexapp.plugins.library.db"
+
+
+class PlexDBUnavailable(Exception):
+    """The Plex database can't serve OnDeck this run (missing, locked, or unexpected schema)."""
+
+
+class PlexDBSnapshot:
+    """Point-in-time local copy of the Plex database, shared by a whole run.
+
+    The copy is taken lazily on the first ``connection()`` call. Close it
+    (or use it as a context manager) to release the connection and delete
+    the temp file.
+    """
+
+    def __init__(self, db_path: str, temp_dir: Optional[str] = None):
+        self.db_path = db_path
+        self.temp_dir = temp_dir
+        self._copy_path: Optional[str] = None
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def connection(self) -> sqlite3.Connection:
+        """Return the snapshot connection, taking the snapshot if needed.
+
+        Raises:
+            sqlite3.Error, OSError: The live database couldn't be copied.
+        """
+        if self._conn is None:
+            self._take()
+        return self._conn
+
+    def _take(self) -> None:
+        fd, copy_path = tempfile.mkstemp(prefix="plexcache-plexdb-", suffix=".db", dir=self.temp_dir)
+        os.close(fd)
+        self._copy_path = copy_path
+        try:
+            source = _connect(self.db_path)
+            try:
+                target = sqlite3.connect(copy_path)
+                try:
+                    # One step inside a single read transaction: under WAL,
+                    # Plex keeps writing while we copy a consistent version
+                    source.backup(target)
+                finally:
+                    target.close()
+            finally:
+                source.close()
+            self._conn = _connect(copy_path, immutable=True)
+        except Exception:
+            self.close()
+            raise
+        logging.debug(f"[DB ONDECK] Snapshot of {self.db_path} taken "
+                      f"({os.path.getsize(copy_path) / 1024 / 1024:.1f} MB)")
+
+    def close(self) -> None:
+        """Close the snapshot connection and delete the temp copy."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        if self._copy_path:
+            try:
+                os.remove(self._copy_path)
+            except FileNotFoundError:
+                pass
+            self._copy_path = None
+
+    def __enter__(self) -> "PlexDBSnapshot":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def resolve_db_file(db_path: str, log_prefix: str = "[DB FALLBACK]") -> Optional[str]:
+    """Return the Plex database file for ``db_path`` (file or containing directory), or None."""
+    if not db_path:
+        return None
+
+    # If pointed at a directory, look for the Plex database file inside it
+    if os.path.isdir(db_path):
+        candidate = os.path.join(db_path, PLEX_DB_FILENAME)
+        if os.path.isfile(candidate):
+            logging.debug(f"{log_prefix} Auto-detected database: {candidate}")
+            return candidate
+        logging.warning(f"{log_prefix} Directory given but {PLEX_DB_FILENAME} not found in: {db_path}")
+        return None
+
+    if not os.path.isfile(db_path):
+        logging.warning(f"{log_prefix} Plex database not found: {db_path}")
+        return None
+    return db_path
+
 
 def fetch_on_deck_from_db(
     db_path: str,
@@ -24,7 +129,8 @@ def fetch_on_deck_from_db(
     days_to_monitor: int,
     number_episodes: int,
     user_id_map: Dict[str, int],
-    per_user_days: Optional[Dict[str, int]] = None
+    per_user_days: Optional[Dict[str, int]] = None,
+    snapshot: Optional[PlexDBSnapshot] = None
 ) -> List[OnDeckItem]:
     """Fetch OnDeck items for shared users by querying the Plex SQLite database.
 
@@ -39,32 +145,21 @@ def fetch_on_deck_from_db(
         days_to_monitor: Only include items viewed within this many days.
         number_episodes: Number of next episodes to prefetch per show.
         user_id_map: Pre-mapped {username: plex_account_id} from settings.
+        snapshot: Run-wide snapshot to query instead of the live database.
 
     Returns:
         List of OnDeckItem objects, same format as the API-based fetch.
     """
-    if not db_path:
-        return []
-
-    # If pointed at a directory, look for the Plex database file inside it
-    if os.path.isdir(db_path):
-        candidate = os.path.join(db_path, "com.plexapp.plugins.library.db")
-        if os.path.isfile(candidate):
-            logging.debug(f"[DB FALLBACK] Auto-detected database: {candidate}")
-            db_path = candidate
-        else:
-            logging.warning(f"[DB FALLBACK] Directory given but com.plexapp.plugins.library.db not found in: {db_path}")
+    if snapshot is None:
+        db_path = resolve_db_file(db_path)
+        if not db_path:
             return []
 
-    if not os.path.isfile(db_path):
-        logging.warning(f"[DB FALLBACK] Plex database not found: {db_path}")
-        return []
-
     results: List[OnDeckItem] = []
 
     try:
-        conn = _connect(db_path)
-    except sqlite3.Error as e:
+        conn = _open(db_path, snapshot)
+    except (sqlite3.Error, OSError) as e:
         logging.warning(f"[DB FALLBACK] Failed to open Plex database: {e}")
         return []
 
@@ -92,19 +187,115 @@ def fetch_on_deck_from_db(
             except Exception as e:
                 logging.error(f"[DB FALLBACK] Unexpected error for {username}: {e}")
     finally:
-        conn.close()
+        if snapshot is None:
+            conn.close()
 
     return results
 
 
-def _connect(db_path: str) -> sqlite3.Connection:
-    """Open the Plex database read-only with busy timeout."""
-    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+def fetch_all_on_deck_from_db(
+    db_path: str,
+    usernames: List[str],
+    valid_sections: List[int],
+    days_to_monitor: int,
+    number_episodes: int,
+    user_id_map: Dict[str, int],
+    per_user_days: Optional[Dict[str, int]] = None,
+    include_main: bool = True,
+    snapshot: Optional[PlexDBSnapshot] = None
+) -> List[OnDeckItem]:
+    """Fetch OnDeck items for every user straight from the Plex database.
+
+    Primary-source variant of fetch_on_deck_from_db: also covers the server
+    owner (account 1), treats empty ``valid_sections`` as "all libraries"
+    like the API path, and raises instead of returning partial results so
+    the caller can fall back to the API as a whole.
+
+    Args:
+        usernames: Non-main users to fetch OnDeck for.
+        include_main: Also fetch the server owner's OnDeck.
+        snapshot: Run-wide snapshot to query instead of the live database.
+        (other args as for fetch_on_deck_from_db)
+
+    Returns:
+        List of OnDeckItem objects. The owner's items carry their account
+        name from the database ("main" if unnamed).
+
+    Raises:
+        PlexDBUnavailable: Database missing, locked past the busy timeout,
+            or not shaped the way these queries expect.
+    """
+    resolved_path = None
+    if snapshot is None:
+        resolved_path = resolve_db_file(db_path, log_prefix="[DB ONDECK]")
+        if not resolved_path:
+            raise PlexDBUnavailable(f"Plex database not found: {db_path}")
+
+    try:
+        conn = _open(resolved_path, snapshot)
+    except (sqlite3.Error, OSError) as e:
+        raise PlexDBUnavailable(f"Failed to open Plex database: {e}") from e
+
+    results: List[OnDeckItem] = []
+    try:
+        sections = list(valid_sections) or [
+            row["id"] for row in conn.execute("SELECT id FROM library_sections")
+        ]
+
+        main_username = "main"
+        account_ids = _resolve_account_ids(conn, usernames, user_id_map)
+        if include_main:
+            row = conn.execute("SELECT name FROM accounts WHERE id = ?", [MAIN_ACCOUNT_ID]).fetchone()
+            if row and row["name"]:
+                main_username = row["name"]
+            account_ids[main_username] = MAIN_ACCOUNT_ID
+
+        users = ([main_username] if include_main else []) + [u for u in usernames if u != main_username]
+        for username in users:
+            account_id = account_ids.get(username)
+            if account_id is None:
+                logging.warning(f"[DB ONDECK] Could not resolve account ID for {username} — skipping")
+                continue
+            user_days = (per_user_days or {}).get(username, days_to_monitor)
+            cutoff = datetime.now() - timedelta(days=user_days)
+            tv_items = _fetch_tv_on_deck(conn, account_id, username, sections, cutoff, number_episodes)
+            movie_items = _fetch_movie_on_deck(conn, account_id, username, sections, cutoff)
+            results.extend(tv_items)
+            results.extend(movie_items)
+            logging.debug(f"[DB ONDECK] [USER:{username}] Found {len(tv_items)} TV + {len(movie_items)} movie OnDeck items")
+    except sqlite3.Error as e:
+        # Lock held past busy_timeout, or a Plex update changed the schema
+        raise PlexDBUnavailable(f"Plex database query failed: {e}") from e
+    finally:
+        if snapshot is None:
+            conn.close()
+
+    return results
+
+
+def _connect(db_path: str, immutable: bool = False) -> sqlite3.Connection:
+    """Open a Plex database read-only with busy timeout.
+
+    ``immutable`` skips locking and WAL handling entirely, so it is only
+    used for snapshot copies — on the live database Plex is writing it
+    would read stale or torn pages.
+    """
+    uri = f"file:{quote(os.path.abspath(db_path))}?mode=ro"
+    if immutable:
+        uri += "&immutable=1"
+    conn = sqlite3.connect(uri, uri=True)
     conn.row_factory = sqlite3.Row
     conn.execute(f"PRAGMA busy_timeout = {DB_BUSY_TIMEOUT_MS}")
     return conn
 
 
+def _open(db_path: Optional[str], snapshot: Optional[PlexDBSnapshot]) -> sqlite3.Connection:
+    """Connection for one fetch: the run's snapshot if given, else the live database."""
+    if snapshot is not None:
+        return snapshot.connection()
+    return _connect(db_path)
+
+
 def _resolve_account_ids(
     conn: sqlite3.Connection,
     usernames: List[str],
@@ -147,129 +338,90 @@ def _fetch_tv_on_deck(
     cutoff: datetime,
     number_episodes: int
 ) -> List[OnDeckItem]:
-    """Find next unwatched episodes for recently watched shows."""
+    """Find next unwatched episodes for recently watched shows.
+
+    One set-based query covers every show: the most recent view per show,
+    the episodes after it (ROW_NUMBER over season/episode order, handling
+    season boundaries), and each episode's first media part.
+    """
     items: List[OnDeckItem] = []
 
-    # Step 1: Get most recently watched episode per show
+    if not valid_sections:
+        return items
+
     cutoff_str = cutoff.strftime("%Y-%m-%d %H:%M:%S")
-    recent_shows = _get_recent_watched_shows(conn, account_id, valid_sections, cutoff_str)
+    placeholders = ",".join("?" for _ in valid_sections)
+    # number_episodes is how many to prefetch AFTER the OnDeck episode
+    limit = number_episodes + 1
 
-    # Step 2: For each show, find the next unwatched episode
-    for show_title, last_season, last_episode, library_section_id in recent_shows:
-        next_episodes = _find_next_episodes(
-            conn, show_title, last_season, last_episode,
-            library_section_id, number_episodes
+    query = f"""
+        WITH recent AS (
+            SELECT grandparent_title AS show_title, parent_index AS last_season,
+                   "index" AS last_episode, library_section_id,
+                   MAX(viewed_at) AS last_viewed
+            FROM metadata_item_views
+            WHERE account_id = ?
+              AND grandparent_title IS NOT NULL
+              AND grandparent_title != ''
+              AND parent_index IS NOT NULL
+              AND "index" IS NOT NULL
+              AND viewed_at >= ?
+              AND library_section_id IN ({placeholders})
+            GROUP BY grandparent_title
+        ),
+        upcoming AS (
+            SELECT r.show_title, mi.id, season."index" AS season_index, mi."index" AS episode_index,
+                   ROW_NUMBER() OVER (
+                       PARTITION BY r.show_title ORDER BY season."index", mi."index"
+                   ) AS position
+            FROM recent r
+            -- CROSS JOIN pins the join order: start from the handful of recent
+            -- shows rather than letting the planner scan every episode
+            CROSS JOIN metadata_items show ON show.title = r.show_title
+                                          AND show.metadata_type = 2
+                                          AND show.library_section_id = r.library_section_id
+            CROSS JOIN metadata_items season ON season.parent_id = show.id
+            CROSS JOIN metadata_items mi ON mi.parent_id = season.id AND mi.metadata_type = 4
+            WHERE season."index" > r.last_season
+               OR (season."index" = r.last_season AND mi."index" > r.last_episode)
         )
+        SELECT r.show_title, u.id, u.season_index, u.episode_index, u.position,
+               (SELECT mp.file
+                FROM media_items mai
+                JOIN media_parts mp ON mp.media_item_id = mai.id
+                WHERE mai.metadata_item_id = u.id
+                LIMIT 1) AS file
+        FROM recent r
+        LEFT JOIN upcoming u ON u.show_title = r.show_title AND u.position <= ?
+        ORDER BY r.last_viewed DESC, r.show_title, u.position
+    """
+    params = [account_id, cutoff_str] + list(valid_sections) + [limit]
 
-        if not next_episodes:
+    for row in conn.execute(query, params).fetchall():
+        show_title = row["show_title"]
+        if row["id"] is None:
             logging.debug(f"[DB FALLBACK] [USER:{username}] {show_title} — caught up, no next episode")
             continue
 
-        for i, (metadata_id, ep_title, season_idx, ep_idx, rating_key) in enumerate(next_episodes):
-            file_path = _resolve_file_path(conn, metadata_id)
-            if not file_path:
-                logging.debug(f"[DB FALLBACK] No file path for metadata_id={metadata_id} ({show_title} S{season_idx:02d}E{ep_idx:02d})")
-                continue
-
-            items.append(OnDeckItem(
-                file_path=file_path,
-                username=username,
-                episode_info={
-                    'show': show_title,
-                    'season': season_idx,
-                    'episode': ep_idx
-                },
-                is_current_ondeck=(i == 0),
-                rating_key=str(rating_key) if rating_key else None
-            ))
-
-    return items
-
-
-def _get_recent_watched_shows(
-    conn: sqlite3.Connection,
-    account_id: int,
-    valid_sections: List[int],
-    cutoff_str: str
-) -> List[Tuple[str, int, int, int]]:
-    """Get the most recently watched episode per show for a user.
-
-    Returns list of (show_title, last_season_index, last_episode_index, library_section_id).
-    """
-    if not valid_sections:
-        return []
+        season_idx = int(row["season_index"])
+        ep_idx = int(row["episode_index"])
+        if not row["file"]:
+            logging.debug(f"[DB FALLBACK] No file path for metadata_id={row['id']} ({show_title} S{season_idx:02d}E{ep_idx:02d})")
+            continue
 
-    placeholders = ",".join("?" for _ in valid_sections)
-    query = f"""
-        SELECT grandparent_title, parent_index, "index", library_section_id,
-               MAX(viewed_at) as last_viewed
-        FROM metadata_item_views
-        WHERE account_id = ?
-          AND grandparent_title IS NOT NULL
-          AND grandparent_title != ''
-          AND parent_index IS NOT NULL
-          AND "index" IS NOT NULL
-          AND viewed_at >= ?
-          AND library_section_id IN ({placeholders})
-        GROUP BY grandparent_title
-        ORDER BY last_viewed DESC
-    """
-    params = [account_id, cutoff_str] + list(valid_sections)
-    cursor = conn.execute(query, params)
-    rows = cursor.fetchall()
-
-    results = []
-    for row in rows:
-        results.append((
-            row["grandparent_title"],
-            int(row["parent_index"]),
-            int(row["index"]),
-            int(row["library_section_id"])
+        items.append(OnDeckItem(
+            file_path=row["file"],
+            username=username,
+            episode_info={
+                'show': show_title,
+                'season': season_idx,
+                'episode': ep_idx
+            },
+            is_current_ondeck=(row["position"] == 1),
+            rating_key=str(row["id"])
         ))
 
-    return results
-
-
-def _find_next_episodes(
-    conn: sqlite3.Connection,
-    show_title: str,
-    last_season: int,
-    last_episode: int,
-    library_section_id: int,
-    number_episodes: int
-) -> List[Tuple[int, str, int, int, int]]:
-    """Find the next unwatched episodes after a given season/episode position.
-
-    Handles season boundaries naturally (S01 last ep -> S02E01).
-
-    Returns list of (metadata_item_id, episode_title, season_index, episode_index, rating_key).
-    """
-    # number_episodes is how many to prefetch AFTER the OnDeck episode
-    limit = number_episodes + 1
-
-    query = """
-        SELECT mi.id, mi.title, season."index" as season_index, mi."index" as episode_index,
-               mi.id as rating_key
-        FROM metadata_items mi
-        JOIN metadata_items season ON mi.parent_id = season.id
-        JOIN metadata_items show ON season.parent_id = show.id
-        WHERE show.title = ?
-          AND show.metadata_type = 2
-          AND show.library_section_id = ?
-          AND mi.metadata_type = 4
-          AND (season."index" > ?
-               OR (season."index" = ? AND mi."index" > ?))
-        ORDER BY season."index" ASC, mi."index" ASC
-        LIMIT ?
-    """
-    params = [show_title, library_section_id, last_season, last_season, last_episode, limit]
-    cursor = conn.execute(query, params)
-    rows = cursor.fetchall()
-
-    return [
-        (row["id"], row["title"], int(row["season_index"]), int(row["episode_index"]), row["rating_key"])
-        for row in rows
-    ]
+    return items
 
 
 def _fetch_movie_on_deck(
@@ -289,7 +441,12 @@ def _fetch_movie_on_deck(
     placeholders = ",".join("?" for _ in valid_sections)
 
     query = f"""
-        SELECT mi.id, mi.title, mi.id as rating_key
+        SELECT mi.id, mi.title, mi.id as rating_key,
+               (SELECT mp.file
+                FROM media_items mai
+                JOIN media_parts mp ON mp.media_item_id = mai.id
+                WHERE mai.metadata_item_id = mi.id
+                LIMIT 1) AS file
         FROM metadata_item_settings mis
         JOIN metadata_items mi ON mi.guid = mis.guid
         WHERE mis.account_id = ?
@@ -303,7 +460,7 @@ def _fetch_movie_on_deck(
     cursor = conn.execute(query, params)
 
     for row in cursor.fetchall():
-        file_path = _resolve_file_path(conn, row["id"])
+        file_path = row["file"]
         if not file_path:
             logging.debug(f"[DB FALLBACK] No file path for movie metadata_id={row['id']} ({row['title']})")
             continue
@@ -317,17 +474,3 @@ def _fetch_movie_on_deck(
         ))
 
     return items
-
-
-def _resolve_file_path(conn: sqlite3.Connection, metadata_item_id: int) -> Optional[str]:
-    """Resolve a metadata item ID to its file path via media_items -> media_parts."""
-    query = """
-        SELECT mp.file
-        FROM media_items mai
-        JOIN media_parts mp ON mp.media_item_id = mai.id
-        WHERE mai.metadata_item_id = ?
-        LIMIT 1
-    """
-    cursor = conn.execute(query, [metadata_item_id])
-    row = cursor.fetchone()
-    return row["file"] if row else None
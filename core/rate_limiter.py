@@ -0,0 +1,210 @@
+"""Adaptive token-bucket rate limiting for plex.tv calls.
+
+One ``PlexTvRateLimiter`` is shared by every plex.tv caller in the process
+(token loading, watchlist fetches, UUID resolution, the RSS feed):
+
+- A token bucket caps the overall request rate. The rate halves whenever
+  plex.tv answers 429 and creeps back up towards the ceiling on success.
+- Each endpoint (``"watchlist"``, ``"account"``, ``"rss"``, ...) has its own
+  backoff window, so a 429 on one endpoint only holds back callers of that
+  endpoint. ``Retry-After`` is honoured when plex.tv sends it; otherwise the
+  window grows exponentially per consecutive 429.
+
+plexapi raises a plain ``BadRequest`` on 429 without the response object, so
+``observe_response`` is installed as a response hook on the plex.tv sessions
+(see core/http_sessions.py) to capture ``Retry-After`` for the calling thread.
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+
+# Steady-state ceiling (requests/second) — matches the old fixed 1s delay
+DEFAULT_RATE = 1.0
+# Floor the rate can be cut to after repeated 429s
+MIN_RATE = 0.1
+# Requests allowed back-to-back before the rate applies
+DEFAULT_BURST = 3
+# Rate regained per successful call after a cut
+RATE_RECOVERY_STEP = 0.05
+# Per-endpoint backoff when no Retry-After is sent (2s, 4s, 8s, ... capped)
+BACKOFF_BASE = 2.0
+MAX_BACKOFF = 60.0
+
+
+@dataclass
+class _EndpointState:
+    blocked_until: float = 0.0
+    consecutive_429: int = 0
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a ``Retry-After`` header (delta-seconds or HTTP-date) to seconds."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+def is_rate_limited_error(error: Exception) -> bool:
+    """Whether an exception from plexapi/requests is an HTTP 429."""
+    response = getattr(error, "response", None)
+    if getattr(response, "status_code", None) == 429:
+        return True
+    error_str = str(error)
+    return "(429)" in error_str or "Too Many Requests" in error_str or "too_many_requests" in error_str
+
+
+class PlexTvRateLimiter:
+    """Thread-safe token bucket with per-endpoint 429 backoff."""
+
+    def __init__(self, rate: float = DEFAULT_RATE, burst: int = DEFAULT_BURST,
+                 min_rate: float = MIN_RATE):
+        self.max_rate = rate
+        self.min_rate = min(min_rate, rate)
+        self.burst = burst
+        self._rate = rate
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._endpoints: Dict[str, _EndpointState] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        # Counters since the last reset_stats()
+        self._calls = 0
+        self._throttled = 0
+        self._wait_seconds = 0.0
+
+    @property
+    def rate(self) -> float:
+        """Current allowed request rate (requests/second)."""
+        with self._lock:
+            return self._rate
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    def acquire(self, endpoint: str = "plex.tv") -> float:
+        """Block until a request to ``endpoint`` may be sent.
+
+        Returns:
+            Seconds spent waiting.
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                state = self._endpoints.get(endpoint)
+                wait = max(state.blocked_until - now, 0.0) if state else 0.0
+                if wait <= 0:
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        self._calls += 1
+                        self._wait_seconds += waited
+                        return waited
+                    wait = (1 - self._tokens) / self._rate
+            time.sleep(wait)
+            waited += wait
+
+    def record_rate_limited(self, endpoint: str = "plex.tv",
+                            retry_after: Optional[float] = None) -> float:
+        """Register a 429 from ``endpoint`` and return how long to back off.
+
+        Halves the shared rate and blocks the endpoint for ``retry_after``
+        seconds, or an exponential backoff when the server didn't say.
+        """
+        with self._lock:
+            state = self._endpoints.setdefault(endpoint, _EndpointState())
+            state.consecutive_429 += 1
+            if retry_after is None:
+                retry_after = min(BACKOFF_BASE ** state.consecutive_429, MAX_BACKOFF)
+            now = time.monotonic()
+            state.blocked_until = max(state.blocked_until, now + retry_after)
+            self._refill(now)
+            self._rate = max(self._rate / 2, self.min_rate)
+            self._throttled += 1
+            return retry_after
+
+    def record_success(self, endpoint: str = "plex.tv") -> None:
+        """Clear ``endpoint``'s backoff and recover some of the shared rate."""
+        with self._lock:
+            state = self._endpoints.get(endpoint)
+            if state is not None:
+                state.consecutive_429 = 0
+            if self._rate < self.max_rate:
+                self._refill(time.monotonic())
+                self._rate = min(self._rate + RATE_RECOVERY_STEP, self.max_rate)
+
+    def observe_response(self, response, *args, **kwargs) -> None:
+        """requests response hook: remember ``Retry-After`` on a 429."""
+        if response.status_code == 429:
+            self._local.retry_after = parse_retry_after(response.headers.get("Retry-After"))
+
+    def retry_after_for(self, error: Exception) -> Optional[float]:
+        """``Retry-After`` for a 429 error raised on the current thread.
+
+        Reads the header off the exception's response when it has one (plain
+        requests errors), otherwise the value captured by ``observe_response``
+        (plexapi errors). The captured value is consumed.
+        """
+        captured = getattr(self._local, "retry_after", None)
+        self._local.retry_after = None
+        response = getattr(error, "response", None)
+        if response is not None and getattr(response, "headers", None) is not None:
+            return parse_retry_after(response.headers.get("Retry-After"))
+        return captured
+
+    def get_stats(self) -> Dict[str, float]:
+        """Current rate plus call/throttle/wait counters since the last reset."""
+        with self._lock:
+            return {
+                "rate": self._rate,
+                "calls": self._calls,
+                "throttled": self._throttled,
+                "wait_seconds": self._wait_seconds,
+            }
+
+    def reset_stats(self) -> None:
+        """Zero the counters (the current rate and backoff windows are kept)."""
+        with self._lock:
+            self._calls = 0
+            self._throttled = 0
+            self._wait_seconds = 0.0
+
+
+_limiter = PlexTvRateLimiter()
+
+
+def get_plextv_limiter() -> PlexTvRateLimiter:
+    """Return the process-wide plex.tv rate limiter."""
+    return _limiter
+
+
+def log_rate_limit_stats() -> None:
+    """Log the plex.tv limiter's rate and wait time, then reset its counters.
+
+    Logged at INFO when plex.tv throttled this run, DEBUG otherwise.
+    """
+    stats = _limiter.get_stats()
+    _limiter.reset_stats()
+    if not stats["calls"]:
+        return
+    message = (
+        f"[PLEX API] plex.tv rate limiter: {stats['calls']} calls, "
+        f"{stats['wait_seconds']:.1f}s waiting, current rate {stats['rate']:.2f}/s"
+    )
+    if stats["throttled"]:
+        logging.info(f"{message}, {stats['throttled']} rate-limited (429) responses")
+    else:
+        logging.debug(message)
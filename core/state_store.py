@@ -0,0 +1,622 @@
+"""Pluggable storage backends for PlexCache's tracker state.
+
+The trackers (timestamps, OnDeck, watchlist, pinned media) keep their working
+set in a dict keyed by path or rating_key. A backend persists that dict:
+
+- ``JSONStateBackend`` rewrites the whole JSON file on every save. This is the
+  historical behavior and remains the default.
+- ``SQLiteStateBackend`` stores one row per key in a single WAL-mode database
+  (``data/plexcache_state.db``) shared by every tracker. A mutation that
+  touches one key is one indexed upsert instead of a full reserialization.
+
+Switching is controlled by the ``state_backend`` setting (``json`` or
+``sqlite``). Both directions migrate automatically on first load:
+
+- json → sqlite: the namespace is empty in the database, so the existing JSON
+  file is imported in one transaction. The JSON file is left in place.
+- sqlite → json: the database still holds the namespace, so its rows are
+  exported back to the JSON file and dropped from the database. Without this,
+  switching back would silently resume from the JSON as it was at migration.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple
+
+from core import json_codec
+
+# Accepted values for the ``state_backend`` setting
+STATE_BACKENDS = ("json", "sqlite")
+DEFAULT_STATE_BACKEND = "json"
+
+# Shared database file, created next to the JSON tracker files
+STATE_DB_FILENAME = "plexcache_state.db"
+
+# How long a writer waits on a lock held by another process (web UI vs CLI run)
+_SQLITE_BUSY_TIMEOUT = 30  # seconds
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS state_entries ("
+    " namespace TEXT NOT NULL,"
+    " key TEXT NOT NULL,"
+    " value TEXT NOT NULL,"
+    " PRIMARY KEY (namespace, key)"
+    ") WITHOUT ROWID",
+    "CREATE TABLE IF NOT EXISTS state_meta ("
+    " namespace TEXT PRIMARY KEY,"
+    " migrated_from TEXT,"
+    " migrated_at TEXT NOT NULL"
+    ")",
+)
+
+# One connection per database file, shared by every backend in the process.
+# Each tracker already serializes its own mutations; this lock serializes
+# access to the shared connection across trackers and threads.
+_connections: Dict[str, sqlite3.Connection] = {}
+_connections_lock = threading.RLock()
+
+
+def normalize_state_backend(value: Any) -> str:
+    """Return a valid backend name, falling back to the default on bad input."""
+    backend = str(value or DEFAULT_STATE_BACKEND).strip().lower()
+    if backend not in STATE_BACKENDS:
+        logging.warning(f"Invalid state_backend '{value}', using '{DEFAULT_STATE_BACKEND}'")
+        return DEFAULT_STATE_BACKEND
+    return backend
+
+
+def namespace_for(json_path: str) -> str:
+    """Derive a tracker's namespace from its JSON file name (``timestamps.json`` → ``timestamps``)."""
+    return os.path.splitext(os.path.basename(str(json_path)))[0]
+
+
+def state_db_path_for(json_path: str) -> str:
+    """Return the shared state database path for a tracker file's directory."""
+    return os.path.join(os.path.dirname(str(json_path)) or '.', STATE_DB_FILENAME)
+
+
+def _get_connection(db_path: str) -> sqlite3.Connection:
+    """Return the process-wide connection for ``db_path``, creating it on first use.
+
+    Must be called with ``_connections_lock`` held.
+    """
+    conn = _connections.get(db_path)
+    if conn is None:
+        os.makedirs(os.path.dirname(db_path) or '.', exist_ok=True)
+        # isolation_level=None: transactions are managed explicitly by _transaction()
+        conn = sqlite3.connect(db_path, timeout=_SQLITE_BUSY_TIMEOUT,
+                               check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        for statement in _SCHEMA:
+            conn.execute(statement)
+        _connections[db_path] = conn
+    return conn
+
+
+@contextmanager
+def _transaction(db_path: str):
+    """Yield the shared connection inside an immediate (write-locked) transaction."""
+    with _connections_lock:
+        conn = _get_connection(db_path)
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+
+def close_state_connections() -> None:
+    """Close every cached database connection (end of run, tests)."""
+    with _connections_lock:
+        for conn in _connections.values():
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+        _connections.clear()
+
+
+def _namespace_in_db(db_path: str, namespace: str) -> bool:
+    """Check whether the state database holds (or has migrated) ``namespace``."""
+    if not os.path.exists(db_path):
+        return False
+    with _connections_lock:
+        conn = _get_connection(db_path)
+        row = conn.execute(
+            "SELECT 1 FROM state_meta WHERE namespace = ?", (namespace,)
+        ).fetchone()
+    return row is not None
+
+
+def _read_json_file(json_path: str) -> Dict[str, Any]:
+    """Read a tracker JSON file, returning {} when it doesn't exist."""
+    try:
+        with open(json_path, 'rb') as f:
+            return json_codec.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+class JSONStateBackend:
+    """Whole-file JSON persistence (the original tracker behavior)."""
+
+    name = "json"
+
+    def __init__(self, json_path: str, label: str = "data"):
+        """Initialize the backend.
+
+        Args:
+            json_path: Path to the tracker's JSON file.
+            label: Human-readable label for log and error messages.
+        """
+        self.json_path = str(json_path)
+        self.label = label
+
+    def load(self) -> Dict[str, Any]:
+        """Load all entries, exporting them back from the state DB if they live there.
+
+        Raises:
+            json.JSONDecodeError, IOError: If the JSON file is unreadable.
+        """
+        db_path = state_db_path_for(self.json_path)
+        namespace = namespace_for(self.json_path)
+        try:
+            if _namespace_in_db(db_path, namespace):
+                return self._export_from_db(db_path, namespace)
+        except sqlite3.Error as e:
+            logging.warning(f"Could not check state database for {self.label}: {type(e).__name__}: {e}")
+        return _read_json_file(self.json_path)
+
+    def save(self, data: Dict[str, Any], keys: Optional[Iterable[str]] = None) -> bool:
+        """Rewrite the whole file. ``keys`` is accepted for interface parity and ignored.
+
+        Returns:
+            True if the data was persisted (failures are logged).
+        """
+        from core.file_operations import save_json_atomically
+        return save_json_atomically(self.json_path, data, self.label)
+
+    def _export_from_db(self, db_path: str, namespace: str) -> Dict[str, Any]:
+        """One-time sqlite → json migration after the backend setting is switched back."""
+        with _transaction(db_path) as conn:
+            rows = conn.execute(
+                "SELECT key, value FROM state_entries WHERE namespace = ?", (namespace,)
+            ).fetchall()
+            data = {key: json_codec.loads(value) for key, value in rows}
+            self.save(data)
+            conn.execute("DELETE FROM state_entries WHERE namespace = ?", (namespace,))
+            conn.execute("DELETE FROM state_meta WHERE namespace = ?", (namespace,))
+        logging.info(f"[MIGRATION] Exported {len(data)} {self.label} entries from {STATE_DB_FILENAME} back to {os.path.basename(self.json_path)}")
+        return data
+
+
+class SQLiteStateBackend:
+    """Row-per-key persistence in the shared WAL-mode state database."""
+
+    name = "sqlite"
+
+    def __init__(self, json_path: str, label: str = "data", db_path: Optional[str] = None):
+        """Initialize the backend.
+
+        Args:
+            json_path: Path to the tracker's legacy JSON file. Determines the
+                namespace and is the one-time migration source.
+            label: Human-readable label for log and error messages.
+            db_path: State database path. Defaults to ``plexcache_state.db``
+                in the JSON file's directory.
+        """
+        self.json_path = str(json_path)
+        self.label = label
+        self.namespace = namespace_for(self.json_path)
+        self.db_path = db_path or state_db_path_for(self.json_path)
+
+    def load(self) -> Dict[str, Any]:
+        """Load all entries, importing the legacy JSON file on first use.
+
+        Raises:
+            sqlite3.Error: If the database can't be opened or read.
+            json.JSONDecodeError, IOError: If the legacy JSON file is unreadable.
+        """
+        self._migrate_from_json()
+        with _connections_lock:
+            conn = _get_connection(self.db_path)
+            rows = conn.execute(
+                "SELECT key, value FROM state_entries WHERE namespace = ?", (self.namespace,)
+            ).fetchall()
+        return {key: json_codec.loads(value) for key, value in rows}
+
+    def save(self, data: Dict[str, Any], keys: Optional[Iterable[str]] = None) -> bool:
+        """Persist changes.
+
+        Args:
+            data: The tracker's full dataset.
+            keys: Keys that changed. Each is upserted from ``data`` or deleted
+                if no longer present. ``None`` replaces the whole namespace
+                (migrations, bulk cleanups).
+
+        Returns:
+            True if the data was persisted (failures are logged).
+        """
+        try:
+            with _transaction(self.db_path) as conn:
+                if keys is None:
+                    conn.execute("DELETE FROM state_entries WHERE namespace = ?", (self.namespace,))
+                    conn.executemany(
+                        "INSERT INTO state_entries (namespace, key, value) VALUES (?, ?, ?)",
+                        [(self.namespace, k, json_codec.dumps(v)) for k, v in data.items()],
+                    )
+                    return True
+                upserts = []
+                deletes = []
+                for key in set(keys):
+                    if key in data:
+                        upserts.append((self.namespace, key, json_codec.dumps(data[key])))
+                    else:
+                        deletes.append((self.namespace, key))
+                if upserts:
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO state_entries (namespace, key, value) VALUES (?, ?, ?)",
+                        upserts,
+                    )
+                if deletes:
+                    conn.executemany(
+                        "DELETE FROM state_entries WHERE namespace = ? AND key = ?", deletes
+                    )
+        except sqlite3.Error as e:
+            logging.error(f"Could not save {self.label} state: {type(e).__name__}: {e}")
+            return False
+        return True
+
+    def _migrate_from_json(self) -> None:
+        """Import the legacy JSON file the first time this namespace is opened."""
+        if _namespace_in_db(self.db_path, self.namespace):
+            return
+        with _transaction(self.db_path) as conn:
+            # Re-check under the write lock: another process may have migrated meanwhile
+            if conn.execute(
+                "SELECT 1 FROM state_meta WHERE namespace = ?", (self.namespace,)
+            ).fetchone():
+                return
+            data = _read_json_file(self.json_path)
+            conn.executemany(
+                "INSERT OR REPLACE INTO state_entries (namespace, key, value) VALUES (?, ?, ?)",
+                [(self.namespace, k, json_codec.dumps(v)) for k, v in data.items()],
+            )
+            migrated_from = self.json_path if os.path.exists(self.json_path) else None
+            conn.execute(
+                "INSERT INTO state_meta (namespace, migrated_from, migrated_at) VALUES (?, ?, ?)",
+                (self.namespace, migrated_from, datetime.now().isoformat()),
+            )
+        if data:
+            logging.info(f"[MIGRATION] Imported {len(data)} {self.label} entries from {os.path.basename(self.json_path)} into {STATE_DB_FILENAME}")
+
+
+# Write-behind journal for high-churn trackers (see JournaledStateBackend)
+JOURNAL_SUFFIX = ".journal"
+DEFAULT_JOURNAL_COMPACT_BYTES = 8 * 1024 * 1024  # compact into the snapshot past 8 MB
+DEFAULT_JOURNAL_FSYNC_BATCH = 64  # fsync after this many appended records...
+DEFAULT_JOURNAL_FSYNC_INTERVAL = 2.0  # ...or this many seconds, whichever comes first
+
+
+def journal_path_for(json_path: str) -> str:
+    """Return the write-behind journal path for a tracker file."""
+    return str(json_path) + JOURNAL_SUFFIX
+
+
+def _replay_journal(journal_path: str, data: Dict[str, Any]) -> set:
+    """Apply journal records to ``data`` in place.
+
+    Each line is ``{"k": key, "v": value}`` (upsert) or ``{"k": key}``
+    (delete). A torn or corrupt line - typically the last one, after a crash
+    mid-write - is skipped.
+
+    Returns:
+        The set of keys touched by the replayed records.
+    """
+    touched = set()
+    try:
+        with open(journal_path, 'r', encoding='utf-8') as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json_codec.loads(line)
+                    key = record["k"]
+                except (ValueError, KeyError, TypeError):
+                    logging.warning(f"Skipping corrupt journal record at {os.path.basename(journal_path)}:{line_number}")
+                    continue
+                if "v" in record:
+                    data[key] = record["v"]
+                else:
+                    data.pop(key, None)
+                touched.add(key)
+    except FileNotFoundError:
+        pass
+    return touched
+
+
+class JournaledStateBackend:
+    """Write-behind wrapper: per-key changes go to an append-only journal.
+
+    ``save(data, keys)`` appends one line per key instead of persisting the
+    snapshot, so a mutation costs a small buffered write rather than a full
+    rewrite. The journal is fsynced in batches and folded into the wrapped
+    backend by ``compact()`` - at end of run, or automatically once it grows
+    past ``compact_bytes``. Full saves (``keys=None``) go straight through and
+    reset the journal.
+
+    ``load()`` replays a leftover journal (crash recovery) and compacts it.
+    """
+
+    def __init__(self, inner, journal_path: Optional[str] = None,
+                 compact_bytes: int = DEFAULT_JOURNAL_COMPACT_BYTES,
+                 fsync_batch: int = DEFAULT_JOURNAL_FSYNC_BATCH,
+                 fsync_interval: float = DEFAULT_JOURNAL_FSYNC_INTERVAL):
+        """Initialize the wrapper.
+
+        Args:
+            inner: Backend holding the snapshot (JSON or SQLite).
+            journal_path: Journal file. Defaults to ``<json_path>.journal``.
+            compact_bytes: Journal size that triggers compaction.
+            fsync_batch: Appended records between fsyncs.
+            fsync_interval: Maximum seconds between fsyncs while appending.
+        """
+        self.inner = inner
+        self.label = inner.label
+        self.journal_path = journal_path or journal_path_for(inner.json_path)
+        self.compact_bytes = compact_bytes
+        self.fsync_batch = fsync_batch
+        self.fsync_interval = fsync_interval
+        self._lock = threading.Lock()
+        self._handle = None
+        self._dirty: set = set()
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        self.records_written = 0
+        self.compactions = 0
+
+    @property
+    def name(self) -> str:
+        return f"{self.inner.name}+journal"
+
+    @property
+    def json_path(self) -> str:
+        return self.inner.json_path
+
+    def load(self) -> Dict[str, Any]:
+        """Load the snapshot and replay any journal left by an interrupted run."""
+        data = self.inner.load()
+        with self._lock:
+            touched = _replay_journal(self.journal_path, data)
+            if touched:
+                logging.info(f"[RECOVERY] Replayed {len(touched)} journaled {self.label} change(s) from {os.path.basename(self.journal_path)}")
+                if self.inner.save(data, touched):
+                    self._reset_journal()
+                else:
+                    # Keep the journal: it is still the only durable copy
+                    self._dirty.update(touched)
+            else:
+                self._reset_journal()
+        return data
+
+    def save(self, data: Dict[str, Any], keys: Optional[Iterable[str]] = None) -> bool:
+        """Journal changed keys, or write the full snapshot when ``keys`` is None."""
+        with self._lock:
+            if keys is None:
+                if not self.inner.save(data, None):
+                    return False
+                self._reset_journal()
+                return True
+            try:
+                handle = self._open_journal()
+                for key in keys:
+                    if key in data:
+                        record = {"k": key, "v": data[key]}
+                    else:
+                        record = {"k": key}
+                    handle.write(json_codec.dumps(record) + "\n")
+                    self._dirty.add(key)
+                    self._unsynced += 1
+                    self.records_written += 1
+                # Flush to the OS on every save so a process crash loses nothing;
+                # fsync (power-loss durability) is batched.
+                handle.flush()
+                if (self._unsynced >= self.fsync_batch
+                        or time.monotonic() - self._last_sync >= self.fsync_interval):
+                    self._sync()
+                needs_compact = handle.tell() >= self.compact_bytes
+            except OSError as e:
+                # Journal unusable - fall back to persisting the snapshot directly
+                logging.warning(f"Could not append to {self.label} journal, saving snapshot: {e}")
+                if not self.inner.save(data, None):
+                    return False
+                self._reset_journal()
+                return True
+            if needs_compact:
+                self._compact(data)
+            return True
+
+    def compact(self, data: Dict[str, Any]) -> bool:
+        """Fold journaled changes into the snapshot and delete the journal.
+
+        Returns:
+            True if there was nothing to do or the snapshot was written.
+            On failure the journal is kept for replay on the next load.
+        """
+        with self._lock:
+            return self._compact(data)
+
+    def _compact(self, data: Dict[str, Any]) -> bool:
+        if not self._dirty and self._handle is None:
+            return True
+        if self._dirty:
+            if not self.inner.save(data, set(self._dirty)):
+                return False
+            self.compactions += 1
+            logging.debug(f"Compacted {len(self._dirty)} journaled {self.label} change(s) into snapshot")
+        # Snapshot is durable (atomic replace / committed transaction); a crash
+        # before the journal is removed just replays idempotent records next load.
+        self._reset_journal()
+        return True
+
+    def _open_journal(self):
+        if self._handle is None:
+            self._handle = open(self.journal_path, 'a', encoding='utf-8')
+            self._last_sync = time.monotonic()
+        return self._handle
+
+    def _sync(self) -> None:
+        if self._handle is not None and self._unsynced:
+            os.fsync(self._handle.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def _reset_journal(self) -> None:
+        """Close and delete the journal, discarding pending-change bookkeeping."""
+        if self._handle is not None:
+            try:
+                self._handle.close()
+            except OSError:
+                pass
+            self._handle = None
+        try:
+            os.remove(self.journal_path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logging.warning(f"Could not remove {self.label} journal: {e}")
+        self._dirty.clear()
+        self._unsynced = 0
+
+
+def create_state_backend(json_path, backend: str = DEFAULT_STATE_BACKEND, label: str = "data"):
+    """Build the backend for a tracker file.
+
+    Args:
+        json_path: Path to the tracker's JSON file (str or Path).
+        backend: ``json`` or ``sqlite``.
+        label: Human-readable label for log and error messages.
+
+    Returns:
+        A ``JSONStateBackend`` or ``SQLiteStateBackend``.
+    """
+    if normalize_state_backend(backend) == "sqlite":
+        return SQLiteStateBackend(str(json_path), label)
+    return JSONStateBackend(str(json_path), label)
+
+
+def load_state(json_path, backend: str = DEFAULT_STATE_BACKEND) -> Dict[str, Any]:
+    """Read a tracker's entries for read-only consumers (web UI).
+
+    Returns {} when the state is missing or unreadable, matching how the web
+    services have always treated a missing JSON file.
+    """
+    try:
+        data = create_state_backend(json_path, backend, namespace_for(json_path)).load()
+    except (ValueError, OSError, sqlite3.Error) as e:
+        logging.debug(f"Could not load state for {json_path}: {type(e).__name__}: {e}")
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    # Overlay changes a running CLI has journaled but not yet compacted.
+    # Read-only: the journal belongs to the writer and is left untouched.
+    _replay_journal(journal_path_for(json_path), data)
+    return data
+
+
+def replace_state(json_path, data: Dict[str, Any], backend: str = DEFAULT_STATE_BACKEND) -> bool:
+    """Replace all of a tracker's entries (settings import, CLI data import).
+
+    Opens the namespace first so a pending JSON ↔ sqlite migration runs now
+    rather than later over the imported data, and drops any write-behind
+    journal so it can't replay older changes on top.
+
+    Returns:
+        True if the data was persisted (failures are logged).
+    """
+    store = create_state_backend(json_path, backend, namespace_for(json_path))
+    try:
+        store.load()
+    except (ValueError, OSError, sqlite3.Error) as e:
+        logging.debug(f"Replacing unreadable state for {json_path}: {type(e).__name__}: {e}")
+    try:
+        os.remove(journal_path_for(json_path))
+    except FileNotFoundError:
+        pass
+    return store.save(data, None)
+
+
+# ---------------------------------------------------------------------------
+# Shared read-only snapshots (web process)
+# ---------------------------------------------------------------------------
+
+# A file modified this close to when it was read can change again without a
+# visible (mtime_ns, size) difference on filesystems with coarse timestamps,
+# so such a snapshot is not cached and the next read parses the file again.
+_SNAPSHOT_RACY_NS = 2_000_000_000
+
+# (abspath, backend) -> (signature, read-only view)
+_snapshots: Dict[Tuple[str, str], Tuple[tuple, Mapping[str, Any]]] = {}
+_snapshots_lock = threading.Lock()
+
+
+def _file_signature(path: str) -> Optional[Tuple[int, int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def _snapshot_signature(json_path: str, backend: str) -> tuple:
+    """(path, mtime_ns, size, ino) of every file a load of this tracker reads."""
+    paths = [str(json_path), journal_path_for(json_path)]
+    if backend == "sqlite":
+        db_path = state_db_path_for(json_path)
+        paths += [db_path, db_path + "-wal"]
+    return tuple((path, _file_signature(path)) for path in paths)
+
+
+def load_state_snapshot(json_path, backend: str = DEFAULT_STATE_BACKEND) -> Mapping[str, Any]:
+    """Return a shared, read-only view of a tracker's entries.
+
+    Each version of the state files is parsed once per process; later calls
+    return the same view until the tracker file, its journal or (for sqlite)
+    the database changes on disk. The view and its nested values are shared
+    between callers and must not be modified. Use ``load_state()`` to get a
+    private copy to edit and save.
+    """
+    key = (os.path.abspath(str(json_path)), backend)
+    signature = _snapshot_signature(json_path, backend)
+    with _snapshots_lock:
+        cached = _snapshots.get(key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+    read_started_ns = time.time_ns()
+    view = MappingProxyType(load_state(json_path, backend))
+    racy = any(
+        file_sig is not None and file_sig[0] + _SNAPSHOT_RACY_NS > read_started_ns
+        for _, file_sig in signature
+    )
+    with _snapshots_lock:
+        if racy:
+            _snapshots.pop(key, None)
+        else:
+            _snapshots[key] = (signature, view)
+    return view
+
+
+def clear_state_snapshots() -> None:
+    """Drop all cached snapshots (tests, or after an external restore)."""
+    with _snapshots_lock:
+        _snapshots.clear()
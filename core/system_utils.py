@@ -8,11 +8,17 @@ import platform
 import posixpath
 import shutil
 import subprocess
+import sqlite3
 import atexit
+import errno
 import fcntl
-from typing import List, Tuple, Optional, NamedTuple, Callable, Set
+import threading
+import time
+from typing import Dict, List, Tuple, Optional, NamedTuple, Callable, Set, Union
 import logging
 
+from core import json_codec
+
 
 # ============================================================================
 # Disk Usage Types
@@ -310,6 +316,42 @@ def translate_host_to_container_path(path: str, path_mappings: list) -> str:
     return path
 
 
+def write_text_atomically(file_path, content: Union[str, bytes]) -> None:
+    """Replace a text file atomically (write temp file in same dir, then rename).
+
+    Readers (e.g. the Unraid mover) never see a partially written file, and
+    the existing file's permission bits are kept.
+
+    Args:
+        file_path: Target file (str or Path).
+        content: Full new file content; bytes are written as-is (already UTF-8).
+
+    Raises:
+        OSError: If the file can't be written. The original is left intact.
+    """
+    import tempfile
+    file_path = str(file_path)
+    dir_name = os.path.dirname(file_path) or '.'
+    fd, tmp_path = tempfile.mkstemp(dir=dir_name, prefix='.' + os.path.basename(file_path) + '.', suffix='.tmp')
+    try:
+        if isinstance(content, bytes):
+            with os.fdopen(fd, 'wb') as f:
+                f.write(content)
+        else:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(content)
+        if os.path.exists(file_path):
+            # mkstemp creates 0600; keep the mode other readers expect
+            shutil.copymode(file_path, tmp_path)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
 def remove_from_exclude_file(exclude_file_path, cache_path: str, path_mappings: list) -> None:
     """Remove a path from the Unraid mover exclude file.
 
@@ -319,44 +361,58 @@ def remove_from_exclude_file(exclude_file_path, cache_path: str, path_mappings:
         path_mappings: Path mapping dicts for host/container translation.
     """
     from pathlib import Path
+    # Lazy import: core.exclude_list imports this module
+    from core.exclude_list import get_exclude_list
     exclude_file = Path(exclude_file_path) if not isinstance(exclude_file_path, Path) else exclude_file_path
     if not exclude_file.exists():
         return
 
     try:
-        with open(exclude_file, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-
         host_path = translate_container_to_host_path(cache_path, path_mappings)
-        new_lines = [line for line in lines if line.strip() != host_path]
-
-        with open(exclude_file, 'w', encoding='utf-8') as f:
-            f.writelines(new_lines)
+        get_exclude_list(exclude_file).remove(host_path)
     except IOError as e:
         logging.warning(f"Could not update exclude file: {e}")
 
 
-def remove_from_timestamps_file(timestamps_file_path, cache_path: str) -> None:
+def remove_from_timestamps_file(timestamps_file_path, cache_path: str, backend: str = "json") -> None:
     """Remove a path from the timestamps JSON file.
 
     Args:
         timestamps_file_path: Path to timestamps.json (str or Path).
         cache_path: Cache path key to remove.
+        backend: Tracker state backend ("json" or "sqlite"). With sqlite the
+            row is deleted from the state database instead.
     """
     import json
     from pathlib import Path
+    if backend == "sqlite":
+        # Lazy import: core.state_store -> core.file_operations -> core.system_utils
+        from core.state_store import create_state_backend
+        state = create_state_backend(timestamps_file_path, backend, "timestamps")
+        try:
+            timestamps = state.load()
+        except (ValueError, OSError, sqlite3.Error) as e:
+            logging.warning(f"Could not update timestamps state: {e}")
+            return
+        if cache_path in timestamps:
+            del timestamps[cache_path]
+            state.save(timestamps, [cache_path])
+        else:
+            logging.debug(f"Path not found in timestamps (may already be removed): {cache_path}")
+        return
+
     ts_file = Path(timestamps_file_path) if not isinstance(timestamps_file_path, Path) else timestamps_file_path
     if not ts_file.exists():
         return
 
     try:
-        with open(ts_file, 'r', encoding='utf-8') as f:
-            timestamps = json.load(f)
+        with open(ts_file, 'rb') as f:
+            timestamps = json_codec.load(f)
 
         if cache_path in timestamps:
             del timestamps[cache_path]
             with open(ts_file, 'w', encoding='utf-8') as f:
-                json.dump(timestamps, f, indent=2)
+                json_codec.dump(timestamps, f, indent=True)
         else:
             logging.debug(f"Path not found in timestamps (may already be removed): {cache_path}")
     except (IOError, json.JSONDecodeError) as e:
@@ -506,6 +562,379 @@ def get_disk_number_from_path(disk_path: str) -> Optional[str]:
     return None
 
 
+def get_physical_disk(path: str) -> str:
+    """Identify the physical disk holding an array path, for I/O scheduling.
+
+    On Unraid, user share paths are resolved through /mnt/user0/ to the
+    /mnt/diskX/ that actually holds the file (or, for a file that does not
+    exist yet, its nearest existing parent directory). Elsewhere, the device
+    ID of the nearest existing path identifies the filesystem.
+
+    Args:
+        path: A file path on the array (/mnt/user/, /mnt/user0/, /mnt/diskX/ or any other mount).
+
+    Returns:
+        A disk label such as "disk6", or "dev:<st_dev>" when the path is not on
+        an Unraid array disk. "unknown" if nothing along the path exists.
+    """
+    direct = get_array_direct_path(path)
+    probe = direct
+    while probe.startswith('/mnt/user0/'):
+        disk_path = resolve_user0_to_disk(probe)
+        if disk_path:
+            return get_disk_number_from_path(disk_path)
+        probe = os.path.dirname(probe)
+
+    disk = get_disk_number_from_path(direct)
+    if disk:
+        return disk
+
+    probe = direct
+    while probe and not os.path.exists(probe):
+        parent = os.path.dirname(probe)
+        if parent == probe:
+            break
+        probe = parent
+    try:
+        return f"dev:{os.stat(probe).st_dev}"
+    except OSError:
+        return "unknown"
+
+
+# ============================================================================
+# Copy Engines
+# ============================================================================
+
+# Ways to move file data, fastest first. The kernel engines copy between file
+# descriptors without passing the data through Python buffers. A reflink
+# (FICLONE) is tried before any of them: on btrfs/XFS it shares the source's
+# extents instead of copying, when source and destination are on one filesystem.
+COPY_ENGINE_REFLINK = "reflink"
+COPY_ENGINE_COPY_FILE_RANGE = "copy_file_range"
+COPY_ENGINE_SENDFILE = "sendfile"
+COPY_ENGINE_READ_WRITE = "read_write"
+COPY_ENGINES = (COPY_ENGINE_COPY_FILE_RANGE, COPY_ENGINE_SENDFILE, COPY_ENGINE_READ_WRITE)
+
+# errnos meaning "this engine can't do this filesystem pair" (e.g. EXDEV for
+# cross-filesystem copy_file_range, ENOSYS/EOPNOTSUPP on FUSE shares)
+_COPY_ENGINE_UNSUPPORTED_ERRNOS = {
+    errno.EXDEV, errno.ENOSYS, errno.EOPNOTSUPP, errno.ENOTSUP, errno.EINVAL,
+}
+
+# (source st_dev, destination st_dev) -> engine that works for that pair
+_copy_engine_by_device: Dict[Tuple[int, int], str] = {}
+# Device pairs where FICLONE failed — not tried again this process
+_reflink_unsupported_devices: Set[Tuple[int, int]] = set()
+_copy_engine_lock = threading.Lock()
+
+# _IOW(0x94, 9, int) from linux/fs.h
+FICLONE = 0x40049409
+
+# With drop_cache, the destination is flushed and its pages dropped every this many bytes
+DROP_CACHE_WINDOW = 256 * 1024 * 1024
+
+
+def available_copy_engines() -> List[str]:
+    """Return the copy engines this platform supports, fastest first."""
+    engines = []
+    if hasattr(os, "copy_file_range"):
+        engines.append(COPY_ENGINE_COPY_FILE_RANGE)
+    if hasattr(os, "sendfile"):
+        engines.append(COPY_ENGINE_SENDFILE)
+    engines.append(COPY_ENGINE_READ_WRITE)
+    return engines
+
+
+def _copy_engine_for(device_pair: Tuple[int, int]) -> str:
+    with _copy_engine_lock:
+        engine = _copy_engine_by_device.get(device_pair)
+    return engine or available_copy_engines()[0]
+
+
+def _remember_copy_engine(device_pair: Tuple[int, int], engine: str) -> None:
+    with _copy_engine_lock:
+        _copy_engine_by_device[device_pair] = engine
+
+
+def _next_copy_engine(engine: str) -> str:
+    engines = available_copy_engines()
+    return engines[engines.index(engine) + 1] if engine in engines[:-1] else COPY_ENGINE_READ_WRITE
+
+
+def try_reflink(src_fd: int, dst_fd: int, file_size: int) -> bool:
+    """Clone ``src_fd`` into the empty ``dst_fd`` with the FICLONE ioctl.
+
+    Returns True when the destination now shares the source's data. Failures
+    (different filesystems, no reflink support) return False and are
+    remembered per device pair so they cost one ioctl per filesystem pair.
+    """
+    if file_size <= 0:
+        return False
+    device_pair = (os.fstat(src_fd).st_dev, os.fstat(dst_fd).st_dev)
+    with _copy_engine_lock:
+        if device_pair in _reflink_unsupported_devices:
+            return False
+    try:
+        fcntl.ioctl(dst_fd, FICLONE, src_fd)
+        # A clone leaves the destination exactly as large as the source
+        cloned = os.fstat(dst_fd).st_size == file_size
+    except OSError as e:
+        logging.debug(f"[COPY] reflink unavailable for devices {device_pair} "
+                      f"({errno.errorcode.get(e.errno, e.errno)})")
+        cloned = False
+    if not cloned:
+        with _copy_engine_lock:
+            _reflink_unsupported_devices.add(device_pair)
+        os.ftruncate(dst_fd, 0)
+    return cloned
+
+
+def preallocate_file(dst_fd: int, size: int) -> None:
+    """Reserve ``size`` bytes for the destination before any data is written.
+
+    The filesystem can then lay the file out in few extents instead of
+    growing it chunk by chunk, and a full disk fails here with ENOSPC rather
+    than after a partial multi-GB write. Filesystems without fallocate
+    support are skipped; ENOSPC and other errors propagate.
+    """
+    if size <= 0 or not hasattr(os, "posix_fallocate"):
+        return
+    try:
+        os.posix_fallocate(dst_fd, 0, size)
+    except OSError as e:
+        if e.errno == errno.ENOSPC or e.errno not in _COPY_ENGINE_UNSUPPORTED_ERRNOS:
+            raise
+        logging.debug(f"[COPY] Preallocation not supported ({errno.errorcode.get(e.errno, e.errno)})")
+
+
+def _fadvise(fd: int, offset: int, length: int, advice_name: str) -> None:
+    """posix_fadvise that is a no-op where unsupported (hints only)."""
+    advice = getattr(os, advice_name, None)
+    if advice is None or not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        os.posix_fadvise(fd, offset, length, advice)
+    except OSError:
+        pass
+
+
+def _copy_chunk(engine: str, src_fd: int, dst_fd: int, offset: int, count: int) -> int:
+    """Copy up to ``count`` bytes at ``offset``; returns bytes copied (0 at EOF)."""
+    if engine == COPY_ENGINE_COPY_FILE_RANGE:
+        return os.copy_file_range(src_fd, dst_fd, count, offset, offset)
+    if engine == COPY_ENGINE_SENDFILE:
+        # sendfile writes at the destination's file position
+        os.lseek(dst_fd, offset, os.SEEK_SET)
+        return os.sendfile(dst_fd, src_fd, offset, count)
+    data = os.pread(src_fd, count, offset)
+    view = memoryview(data)
+    written = 0
+    while written < len(view):
+        written += os.pwrite(dst_fd, view[written:], offset + written)
+    return len(data)
+
+
+def copy_file_data(
+    src_fd: int,
+    dst_fd: int,
+    file_size: int,
+    chunk_size: int,
+    stop_check: Optional[Callable[[], bool]] = None,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+    engine: Optional[str] = None,
+    preallocate: bool = False,
+    drop_cache: bool = False,
+    start_offset: int = 0,
+) -> str:
+    """Copy all data from ``src_fd`` to ``dst_fd`` in chunks of ``chunk_size``.
+
+    First tries a reflink (see ``try_reflink``), which copies no data. Then
+    uses ``os.copy_file_range`` where the kernel supports it for the
+    filesystem pair, then ``os.sendfile``, then a pread/pwrite loop. The
+    engine that worked is remembered per (source, destination) device so
+    later copies between the same filesystems start with it. Copying stays
+    chunked so ``stop_check`` and ``progress_callback`` run between chunks.
+
+    Args:
+        engine: Force a starting engine (benchmarks/tests); it still falls back.
+            A forced engine other than ``reflink`` skips the reflink attempt.
+        preallocate: Reserve the full size up front (see ``preallocate_file``).
+        drop_cache: Keep the copy from evicting other programs' page cache:
+            read the source with SEQUENTIAL advice and drop each copied range
+            (DONTNEED) from the cache as the copy advances; the destination
+            is flushed and dropped every ``DROP_CACHE_WINDOW`` bytes.
+        start_offset: Continue a partial copy: the bytes before this offset are
+            already in place in ``dst_fd`` (no reflink attempt).
+
+    Returns:
+        The engine that finished the copy (``reflink`` when cloned).
+
+    Raises:
+        InterruptedError: If ``stop_check`` returns True.
+        OSError: On I/O errors other than an unsupported engine.
+    """
+    if engine in (None, COPY_ENGINE_REFLINK) and not start_offset \
+            and try_reflink(src_fd, dst_fd, file_size):
+        if progress_callback:
+            progress_callback(file_size, file_size)
+        return COPY_ENGINE_REFLINK
+    if engine == COPY_ENGINE_REFLINK:
+        engine = None
+
+    # After the reflink attempt: FICLONE needs an empty destination
+    if preallocate:
+        preallocate_file(dst_fd, file_size)
+    if drop_cache:
+        _fadvise(src_fd, 0, 0, "POSIX_FADV_SEQUENTIAL")
+
+    device_pair = (os.fstat(src_fd).st_dev, os.fstat(dst_fd).st_dev)
+    auto = engine is None
+    if auto:
+        engine = _copy_engine_for(device_pair)
+    fell_back = False
+    offset = start_offset
+    dropped = start_offset  # destination bytes flushed and dropped from the page cache
+    while True:
+        if stop_check and stop_check():
+            raise InterruptedError("Copy cancelled by user request")
+        try:
+            copied = _copy_chunk(engine, src_fd, dst_fd, offset, chunk_size)
+        except OSError as e:
+            if engine == COPY_ENGINE_READ_WRITE or e.errno not in _COPY_ENGINE_UNSUPPORTED_ERRNOS:
+                raise
+            logging.debug(f"[COPY] {engine} unsupported for devices {device_pair} "
+                          f"({errno.errorcode.get(e.errno, e.errno)}), falling back")
+            engine, fell_back = _next_copy_engine(engine), True
+            continue
+        if not copied:
+            if offset < file_size and engine != COPY_ENGINE_READ_WRITE:
+                # Some filesystems (FUSE, procfs-like) report 0 instead of an error
+                logging.debug(f"[COPY] {engine} copied nothing for devices {device_pair}, falling back")
+                engine, fell_back = _next_copy_engine(engine), True
+                continue
+            break
+        if drop_cache:
+            _fadvise(src_fd, offset, copied, "POSIX_FADV_DONTNEED")
+            if offset + copied - dropped >= DROP_CACHE_WINDOW:
+                os.fdatasync(dst_fd)
+                _fadvise(dst_fd, dropped, offset + copied - dropped, "POSIX_FADV_DONTNEED")
+                dropped = offset + copied
+        offset += copied
+        if progress_callback:
+            progress_callback(offset, file_size)
+
+    if preallocate and offset < file_size:
+        # Source shrank while copying — don't leave preallocated zeros behind
+        os.ftruncate(dst_fd, offset)
+    if drop_cache and offset > dropped:
+        os.fdatasync(dst_fd)
+        _fadvise(dst_fd, dropped, offset - dropped, "POSIX_FADV_DONTNEED")
+
+    if auto and (fell_back or device_pair not in _copy_engine_by_device):
+        if fell_back:
+            logging.debug(f"[COPY] Using {engine} for devices {device_pair}")
+        _remember_copy_engine(device_pair, engine)
+    return engine
+
+
+# Resumable copies (FileUtils.copy_file_with_permissions(resumable=True)) write
+# to a hidden partial file next to the destination, renamed into place only when
+# complete. A JSON sidecar records the source identity and the last offset known
+# to be on disk, so an interrupted copy continues from there on the next run.
+PARTIAL_COPY_SUFFIX = ".plexcache-partial"
+RESUME_RECORD_SUFFIX = ".plexcache-resume"
+RESUMABLE_MIN_SIZE = 1024 ** 3  # smaller files just start over
+RESUME_CHECKPOINT_BYTES = 1024 ** 3  # fdatasync + sidecar rewrite interval
+RESUME_VERIFY_BYTES = 64 * 1024 * 1024  # copied bytes compared with the source before resuming
+PARTIAL_COPY_MAX_AGE_HOURS = 72  # partials not resumed within this window are removed
+
+
+def partial_copy_paths(dest: str) -> Tuple[str, str]:
+    """Return ``(partial_file, resume_record)`` paths for a resumable copy to ``dest``.
+
+    Both are dot-files with a non-media extension, so Plex does not scan them.
+    """
+    directory, name = os.path.split(dest)
+    base = os.path.join(directory, f".{name}")
+    return base + PARTIAL_COPY_SUFFIX, base + RESUME_RECORD_SUFFIX
+
+
+def discard_partial_copy(dest: str) -> None:
+    """Remove the partial file and resume record of a copy to ``dest``, if any."""
+    for path in partial_copy_paths(dest):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logging.debug(f"Could not remove {path}: {e}")
+
+
+def _source_identity(stat_info: os.stat_result) -> Dict[str, int]:
+    return {"size": stat_info.st_size, "mtime_ns": stat_info.st_mtime_ns, "inode": stat_info.st_ino}
+
+
+def _load_resume_offset(record_path: str, src: str, identity: Dict[str, int]) -> int:
+    """Offset recorded for ``src``, or 0 if there is no record or the source changed."""
+    try:
+        with open(record_path, 'rb') as f:
+            record = json_codec.loads(f.read())
+    except (OSError, ValueError):
+        return 0
+    if not isinstance(record, dict) or record.get("source") != src or record.get("identity") != identity:
+        return 0
+    offset = record.get("offset")
+    return offset if isinstance(offset, int) and 0 < offset <= identity["size"] else 0
+
+
+def _save_resume_record(record_path: str, src: str, identity: Dict[str, int], offset: int) -> None:
+    tmp_path = record_path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json_codec.dump({"source": src, "identity": identity, "offset": offset,
+                         "updated_at": time.time()}, f)
+    os.replace(tmp_path, record_path)
+
+
+def _copied_prefix_matches(src_fd: int, dst_fd: int, offset: int) -> bool:
+    """Compare the first block and the last ``RESUME_VERIFY_BYTES`` before ``offset`` with the source."""
+    if os.fstat(dst_fd).st_size < offset:
+        return False
+    block = 1024 * 1024
+    for start, end in ((0, min(block, offset)), (max(0, offset - RESUME_VERIFY_BYTES), offset)):
+        position = start
+        while position < end:
+            count = min(block, end - position)
+            if os.pread(src_fd, count, position) != os.pread(dst_fd, count, position):
+                return False
+            position += count
+    return True
+
+
+def remove_stale_partial_copies(root: str, max_age_hours: float = PARTIAL_COPY_MAX_AGE_HOURS) -> int:
+    """Remove partial copies under ``root`` whose resume record is older than ``max_age_hours``.
+
+    Covers files that dropped out of OnDeck/watchlist before their copy was
+    resumed. Returns the number of partial copies removed.
+    """
+    cutoff = time.time() - max_age_hours * 3600
+    removed = 0
+    for directory, _dirs, files in os.walk(root):
+        for name in files:
+            if not name.endswith(PARTIAL_COPY_SUFFIX) and not name.endswith(RESUME_RECORD_SUFFIX):
+                continue
+            path = os.path.join(directory, name)
+            try:
+                if os.path.getmtime(path) >= cutoff:
+                    continue
+                os.remove(path)
+            except OSError:
+                continue
+            if name.endswith(PARTIAL_COPY_SUFFIX):
+                removed += 1
+                logging.debug(f"Removed stale partial copy: {path}")
+    return removed
+
+
 class SingleInstanceLock:
     """
     Prevent multiple instances of PlexCache from running simultaneously.
@@ -697,6 +1126,15 @@ class FileUtils:
         self.permissions = permissions
         self.is_docker = is_docker
 
+        # Copy modes (see copy_file_data); set from the performance settings
+        self.copy_preallocate = False
+        self.copy_drop_page_cache = False
+
+        # Files/bytes copied as reflinks (no data copied) — reported in the run summary
+        self._reflink_lock = threading.Lock()
+        self.reflinked_files = 0
+        self.reflinked_bytes = 0
+
         # Check for PUID/PGID environment variables (Docker user/group override)
         self.puid = None
         self.pgid = None
@@ -811,7 +1249,8 @@ class FileUtils:
         display_dest: str = None,
         stop_check: Callable[[], bool] = None,
         chunk_size: int = 10 * 1024 * 1024,  # 10MB chunks for stop checks
-        progress_callback: Optional[Callable[[int, int], None]] = None
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        resumable: bool = False
     ) -> int:
         """Copy a file preserving original ownership and permissions (Linux only).
 
@@ -826,6 +1265,9 @@ class FileUtils:
             chunk_size: Size of chunks for copy (default 10MB). Smaller = more responsive
                         to stop requests but slightly slower copy speed.
             progress_callback: Optional callback(bytes_copied, file_total) called after each chunk.
+            resumable: Copy through a partial file that an interrupted copy leaves
+                        behind, and continue an earlier partial copy of the same
+                        source (see ``partial_copy_paths``). Linux only.
 
         If PUID/PGID environment variables are set, those values are used for ownership.
         Otherwise, the source file's ownership is preserved.
@@ -851,25 +1293,30 @@ class FileUtils:
                 target_uid = self.puid if self.puid is not None else src_uid
                 target_gid = self.pgid if self.pgid is not None else src_gid
 
-                # Chunked copy with stop check and progress callback support
-                # This allows cancelling mid-copy for large files
+                # Chunked kernel-side copy with stop check and progress callback
+                # support. This allows cancelling mid-copy for large files
                 file_size = stat_info.st_size
-                bytes_copied = 0
-                with open(src, 'rb') as fsrc:
-                    with open(dest, 'wb') as fdest:
-                        while True:
-                            # Check for stop request between chunks
-                            if stop_check and stop_check():
+                if resumable:
+                    engine = self._copy_resumable(src, dest, stat_info, chunk_size,
+                                                  stop_check, progress_callback, log_dest)
+                else:
+                    with open(src, 'rb') as fsrc:
+                        with open(dest, 'wb') as fdest:
+                            try:
+                                engine = copy_file_data(
+                                    fsrc.fileno(), fdest.fileno(), file_size, chunk_size,
+                                    stop_check=stop_check, progress_callback=progress_callback,
+                                    preallocate=self.copy_preallocate,
+                                    drop_cache=self.copy_drop_page_cache,
+                                )
+                            except InterruptedError:
                                 logging.debug(f"Copy cancelled by stop request: {log_dest}")
-                                raise InterruptedError("Copy cancelled by user request")
-
-                            chunk = fsrc.read(chunk_size)
-                            if not chunk:
-                                break
-                            fdest.write(chunk)
-                            bytes_copied += len(chunk)
-                            if progress_callback:
-                                progress_callback(bytes_copied, file_size)
+                                raise
+                logging.debug(f"Copied {file_size} bytes with {engine}: {log_dest}")
+                if engine == COPY_ENGINE_REFLINK:
+                    with self._reflink_lock:
+                        self.reflinked_files += 1
+                        self.reflinked_bytes += file_size
 
                 # Copy metadata (timestamps, etc.) - equivalent to what copy2 does
                 shutil.copystat(src, dest)
@@ -926,6 +1373,71 @@ class FileUtils:
             logging.error(f"Error copying file from {log_src} to {log_dest}: {str(e)}")
             raise RuntimeError(f"Error copying file: {str(e)}")
 
+    def _copy_resumable(self, src: str, dest: str, stat_info: os.stat_result, chunk_size: int,
+                        stop_check: Optional[Callable[[], bool]],
+                        progress_callback: Optional[Callable[[int, int], None]],
+                        log_dest: str) -> str:
+        """Copy ``src`` to ``dest`` through a partial file, resuming an earlier partial copy.
+
+        The resume record is rewritten (after fdatasync) every
+        ``RESUME_CHECKPOINT_BYTES`` and when the copy is stopped. A recorded
+        offset is only used if the source is unchanged and the copied prefix
+        matches it (``_copied_prefix_matches``); otherwise the copy starts over.
+        The partial file is renamed to ``dest`` once complete.
+        """
+        partial_path, record_path = partial_copy_paths(dest)
+        identity = _source_identity(stat_info)
+        file_size = stat_info.st_size
+        name = os.path.basename(dest)
+
+        with open(src, 'rb') as fsrc:
+            dst_fd = os.open(partial_path, os.O_RDWR | os.O_CREAT, 0o666)
+            try:
+                start = _load_resume_offset(record_path, src, identity)
+                if start and not _copied_prefix_matches(fsrc.fileno(), dst_fd, start):
+                    logging.warning(f"[COPY] Partial copy of {name} does not match the source, starting over")
+                    start = 0
+                if start:
+                    logging.info(f"[COPY] Resuming {name} at {format_bytes(start)} of {format_bytes(file_size)}")
+                else:
+                    os.ftruncate(dst_fd, 0)
+
+                progress = {"copied": start, "saved": start}
+
+                def checkpoint(copied: int, total: int) -> None:
+                    progress["copied"] = copied
+                    if copied - progress["saved"] >= RESUME_CHECKPOINT_BYTES:
+                        os.fdatasync(dst_fd)
+                        _save_resume_record(record_path, src, identity, copied)
+                        progress["saved"] = copied
+                    if progress_callback:
+                        progress_callback(copied, total)
+
+                try:
+                    engine = copy_file_data(
+                        fsrc.fileno(), dst_fd, file_size, chunk_size,
+                        stop_check=stop_check, progress_callback=checkpoint,
+                        preallocate=self.copy_preallocate,
+                        drop_cache=self.copy_drop_page_cache,
+                        start_offset=start,
+                    )
+                except InterruptedError:
+                    if progress["copied"] > progress["saved"]:
+                        os.fdatasync(dst_fd)
+                        _save_resume_record(record_path, src, identity, progress["copied"])
+                    logging.debug(f"Copy stopped at {format_bytes(progress['copied'])}, "
+                                  f"partial kept for resume: {log_dest}")
+                    raise
+            finally:
+                os.close(dst_fd)
+
+        os.rename(partial_path, dest)
+        try:
+            os.remove(record_path)
+        except FileNotFoundError:
+            pass
+        return engine
+
     def create_directory_with_permissions(self, path: str, src_file_for_permissions: str) -> None:
         """Create directory with proper permissions.
 
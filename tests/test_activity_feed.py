@@ -381,17 +381,13 @@ class TestMergePattern:
 # ============================================================================
 
 class TestSaveActivityAtomicity:
-    """Verify OperationRunner._save_activity() uses unlocked helpers under a single lock
-    acquisition to prevent race conditions with MaintenanceRunner."""
+    """Verify OperationRunner._save_activity() appends instead of rewriting, so
+    entries written concurrently by MaintenanceRunner are never overwritten."""
 
-    def test_save_activity_uses_unlocked_helpers(self, tmp_path):
-        """_save_activity(new_entry) must call _load_activity_unlocked and
-        _save_activity_unlocked (not the locking versions)."""
+    def test_save_activity_appends_new_entry(self, tmp_path):
+        """_save_activity(new_entry) must append, not load-insert-save."""
         from web.services.operation_runner import OperationRunner
 
-        activity_file = tmp_path / "recent_activity.json"
-        activity_file.write_text("[]", encoding="utf-8")
-
         entry = FileActivity(
             timestamp=datetime.now(),
             action="Cached",
@@ -399,19 +395,14 @@ class TestSaveActivityAtomicity:
             size_bytes=100,
         )
 
-        with patch('core.activity.ACTIVITY_FILE', activity_file), \
-             patch('web.services.operation_runner._load_activity_unlocked', return_value=[]) as mock_load, \
+        with patch('web.services.operation_runner.append_activity') as mock_append, \
              patch('web.services.operation_runner._save_activity_unlocked') as mock_save, \
              patch('web.services.operation_runner.load_activity', return_value=[]):
             runner = OperationRunner()
             runner._save_activity(new_entry=entry)
 
-        # Must use unlocked helpers (caller holds the lock)
-        mock_load.assert_called_once()
-        mock_save.assert_called_once()
-        # Verify the entry was inserted
-        saved_activities = mock_save.call_args[0][0]
-        assert saved_activities[0] is entry
+        mock_append.assert_called_once_with(entry)
+        mock_save.assert_not_called()
 
     def test_save_activity_without_entry_uses_public_save(self, tmp_path):
         """_save_activity() without new_entry uses the public save_activity()."""
@@ -0,0 +1,122 @@
+"""Tests for the append-only activity log.
+
+Source: core/activity.py — JSONL segments, size-based rotation, snapshot
+compaction in save_activity(), and the in-memory ring used by readers.
+"""
+
+import json
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+# conftest.py handles fcntl/apscheduler mocking and path setup
+import core.activity as activity
+from core.activity import (
+    FileActivity,
+    load_activity,
+    save_activity,
+    record_file_activity,
+)
+
+
+def _patched(tmp_path, **overrides):
+    """Point the activity module at tmp_path with a generous retention window."""
+    f = tmp_path / "recent_activity.json"
+    patches = [
+        patch('core.activity.ACTIVITY_FILE', f),
+        patch('core.activity._get_activity_retention_hours', return_value=24),
+    ]
+    for name, value in overrides.items():
+        patches.append(patch(f'core.activity.{name}', value))
+    return patches
+
+
+class _Patches:
+    def __init__(self, patches):
+        self.patches = patches
+
+    def __enter__(self):
+        for p in self.patches:
+            p.start()
+
+    def __exit__(self, *exc):
+        for p in reversed(self.patches):
+            p.stop()
+
+
+class TestSegmentRotation:
+    """The active segment rotates by size and old data ages out."""
+
+    def test_rotates_when_segment_is_full(self, tmp_path):
+        with _Patches(_patched(tmp_path, ACTIVITY_SEGMENT_MAX_BYTES=300)):
+            for i in range(6):
+                record_file_activity("Cached", f"f{i}.mkv")
+            names = [a.filename for a in load_activity()]
+
+        assert (tmp_path / "recent_activity.jsonl.1").exists()
+        assert names[0] == "f5.mkv"
+        assert names == sorted(names, reverse=True)
+
+    def test_dropping_oldest_segment_removes_snapshot(self, tmp_path):
+        with _Patches(_patched(tmp_path, ACTIVITY_SEGMENT_MAX_BYTES=1, ACTIVITY_SEGMENTS_KEPT=1)):
+            save_activity([FileActivity(timestamp=datetime.now(), action="Cached", filename="snap.mkv")])
+            record_file_activity("Cached", "a.mkv")  # active -> .1
+            assert (tmp_path / "recent_activity.json").exists()
+            record_file_activity("Cached", "b.mkv")  # .1 dropped, snapshot too
+            names = [a.filename for a in load_activity()]
+
+        assert not (tmp_path / "recent_activity.json").exists()
+        assert names == ["b.mkv"]
+
+
+class TestCompaction:
+    """save_activity() rewrites the snapshot and clears the segments."""
+
+    def test_save_compacts_segments_into_snapshot(self, tmp_path):
+        with _Patches(_patched(tmp_path)):
+            record_file_activity("Cached", "a.mkv")
+            record_file_activity("Cached", "b.mkv")
+            save_activity(load_activity())
+            names = [a.filename for a in load_activity()]
+
+        assert not (tmp_path / "recent_activity.jsonl").exists()
+        snapshot = json.loads((tmp_path / "recent_activity.json").read_text())
+        assert [e['filename'] for e in snapshot] == ["b.mkv", "a.mkv"]
+        assert names == ["b.mkv", "a.mkv"]
+
+
+class TestActivityRing:
+    """Readers are served from memory until the files change on disk."""
+
+    def test_repeat_loads_do_not_reread_files(self, tmp_path):
+        with _Patches(_patched(tmp_path)):
+            record_file_activity("Cached", "a.mkv")
+            load_activity()
+            with patch('core.activity._read_segment', wraps=activity._read_segment) as read:
+                record_file_activity("Cached", "b.mkv")
+                names = [a.filename for a in load_activity()]
+
+        read.assert_not_called()
+        assert names == ["b.mkv", "a.mkv"]
+
+    def test_external_append_is_picked_up(self, tmp_path):
+        with _Patches(_patched(tmp_path)):
+            record_file_activity("Cached", "a.mkv")
+            load_activity()
+            # Another process (e.g. the CLI) appends to the same segment
+            with open(tmp_path / "recent_activity.jsonl", "a", encoding="utf-8") as f:
+                f.write(json.dumps({
+                    "timestamp": (datetime.now() + timedelta(seconds=1)).isoformat(),
+                    "action": "Restored", "filename": "external.mkv",
+                }) + "\n")
+            names = [a.filename for a in load_activity()]
+
+        assert names == ["external.mkv", "a.mkv"]
+
+    def test_partial_line_is_skipped(self, tmp_path):
+        with _Patches(_patched(tmp_path)):
+            record_file_activity("Cached", "a.mkv")
+            with open(tmp_path / "recent_activity.jsonl", "a", encoding="utf-8") as f:
+                f.write('{"timestamp": "2025-01-')
+            names = [a.filename for a in load_activity()]
+
+        assert names == ["a.mkv"]
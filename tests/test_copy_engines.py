@@ -0,0 +1,369 @@
+"""Tests for the chunked copy engines behind FileUtils.copy_file_with_permissions.
+
+Source: core/system_utils.py — copy_file_data (copy_file_range / sendfile /
+pread-pwrite engines), per-device engine selection, fallback on
+EXDEV/ENOSYS, the FICLONE reflink fast path, the preallocate /
+drop-page-cache copy modes, and resumable copies.
+"""
+
+import errno
+import json
+import os
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# conftest.py handles fcntl/apscheduler mocking and path setup
+from core import system_utils
+from core.system_utils import (
+    COPY_ENGINE_COPY_FILE_RANGE,
+    COPY_ENGINE_READ_WRITE,
+    COPY_ENGINE_REFLINK,
+    COPY_ENGINE_SENDFILE,
+    FileUtils,
+    available_copy_engines,
+    copy_file_data,
+    partial_copy_paths,
+    remove_stale_partial_copies,
+)
+
+CHUNK = 64 * 1024
+
+
+@pytest.fixture(autouse=True)
+def clear_engine_cache():
+    system_utils._copy_engine_by_device.clear()
+    system_utils._reflink_unsupported_devices.clear()
+    yield
+    system_utils._copy_engine_by_device.clear()
+    system_utils._reflink_unsupported_devices.clear()
+
+
+@pytest.fixture
+def src_file(tmp_path):
+    path = tmp_path / "src.mkv"
+    path.write_bytes(os.urandom(CHUNK * 5 + 123))
+    return path
+
+
+def _copy(src, dest, **kwargs):
+    with open(src, "rb") as fsrc, open(dest, "wb") as fdest:
+        return copy_file_data(fsrc.fileno(), fdest.fileno(), os.path.getsize(src), CHUNK, **kwargs)
+
+
+class TestEngines:
+
+    @pytest.mark.parametrize("engine", available_copy_engines())
+    def test_each_engine_copies_exact_bytes(self, src_file, tmp_path, engine):
+        dest = tmp_path / "dest.mkv"
+        progress = []
+        used = _copy(src_file, dest, engine=engine,
+                     progress_callback=lambda done, total: progress.append((done, total)))
+
+        assert dest.read_bytes() == src_file.read_bytes()
+        assert used == engine
+        assert progress[-1] == (src_file.stat().st_size, src_file.stat().st_size)
+        assert [p[0] for p in progress] == sorted(p[0] for p in progress)
+
+    def test_empty_file(self, tmp_path):
+        src = tmp_path / "empty.srt"
+        src.write_bytes(b"")
+        dest = tmp_path / "out.srt"
+        _copy(src, dest)
+        assert dest.read_bytes() == b""
+
+    def test_stop_check_interrupts_between_chunks(self, src_file, tmp_path):
+        calls = []
+
+        def stop():
+            calls.append(1)
+            return len(calls) > 2
+
+        with pytest.raises(InterruptedError):
+            _copy(src_file, tmp_path / "dest.mkv", stop_check=stop)
+        assert os.path.getsize(tmp_path / "dest.mkv") == 2 * CHUNK
+
+
+class TestFallback:
+
+    def _unsupported(self, err):
+        def fail(*args):
+            raise OSError(err, os.strerror(err))
+        return fail
+
+    @pytest.mark.parametrize("err", [errno.EXDEV, errno.ENOSYS])
+    def test_copy_file_range_falls_back_and_is_remembered(self, src_file, tmp_path, err):
+        if COPY_ENGINE_COPY_FILE_RANGE not in available_copy_engines():
+            pytest.skip("os.copy_file_range not available")
+        with patch("core.system_utils.os.copy_file_range", self._unsupported(err)):
+            used = _copy(src_file, tmp_path / "dest.mkv")
+        assert used == COPY_ENGINE_SENDFILE
+        assert (tmp_path / "dest.mkv").read_bytes() == src_file.read_bytes()
+        assert list(system_utils._copy_engine_by_device.values()) == [COPY_ENGINE_SENDFILE]
+
+    def test_falls_back_to_read_write(self, src_file, tmp_path):
+        with patch("core.system_utils.os.copy_file_range", self._unsupported(errno.EXDEV), create=True), \
+                patch("core.system_utils.os.sendfile", self._unsupported(errno.EINVAL), create=True):
+            used = _copy(src_file, tmp_path / "dest.mkv")
+        assert used == COPY_ENGINE_READ_WRITE
+        assert (tmp_path / "dest.mkv").read_bytes() == src_file.read_bytes()
+
+    def test_zero_byte_kernel_copy_falls_back(self, src_file, tmp_path):
+        if COPY_ENGINE_COPY_FILE_RANGE not in available_copy_engines():
+            pytest.skip("os.copy_file_range not available")
+        with patch("core.system_utils.os.copy_file_range", lambda *a: 0):
+            used = _copy(src_file, tmp_path / "dest.mkv")
+        assert used == COPY_ENGINE_SENDFILE
+        assert (tmp_path / "dest.mkv").read_bytes() == src_file.read_bytes()
+
+    def test_real_io_errors_propagate(self, src_file, tmp_path):
+        with patch("core.system_utils._copy_chunk", self._unsupported(errno.ENOSPC)):
+            with pytest.raises(OSError) as exc:
+                _copy(src_file, tmp_path / "dest.mkv")
+        assert exc.value.errno == errno.ENOSPC
+
+    def test_remembered_engine_used_first(self, src_file, tmp_path):
+        with open(src_file, "rb") as f, open(tmp_path / "probe", "wb") as d:
+            pair = (os.fstat(f.fileno()).st_dev, os.fstat(d.fileno()).st_dev)
+        system_utils._copy_engine_by_device[pair] = COPY_ENGINE_READ_WRITE
+        assert _copy(src_file, tmp_path / "dest.mkv") == COPY_ENGINE_READ_WRITE
+
+
+class TestCopyFileWithPermissions:
+
+    def test_copies_data_and_mode(self, src_file, tmp_path):
+        os.chmod(src_file, 0o640)
+        dest = tmp_path / "dest.mkv"
+        progress = []
+        FileUtils(is_linux=True).copy_file_with_permissions(
+            str(src_file), str(dest), chunk_size=CHUNK,
+            progress_callback=lambda done, total: progress.append(done))
+
+        assert dest.read_bytes() == src_file.read_bytes()
+        assert oct(dest.stat().st_mode & 0o777) == oct(0o640)
+        assert progress[-1] == src_file.stat().st_size
+
+    def test_stop_check_raises_interrupted(self, src_file, tmp_path):
+        with pytest.raises(InterruptedError):
+            FileUtils(is_linux=True).copy_file_with_permissions(
+                str(src_file), str(tmp_path / "dest.mkv"), chunk_size=CHUNK,
+                stop_check=lambda: True)
+
+
+def _fake_clone(dst_fd, request, src_fd):
+    """Stand-in for a working FICLONE: give the destination the source's data."""
+    assert request == system_utils.FICLONE
+    size = os.fstat(src_fd).st_size
+    os.pwrite(dst_fd, os.pread(src_fd, size, 0), 0)
+
+
+class TestReflink:
+
+    def test_clone_skips_data_copy(self, src_file, tmp_path):
+        progress = []
+        with patch("core.system_utils.fcntl.ioctl", side_effect=_fake_clone), \
+                patch("core.system_utils._copy_chunk") as copy_chunk:
+            used = _copy(src_file, tmp_path / "dest.mkv",
+                         progress_callback=lambda done, total: progress.append(done))
+        assert used == COPY_ENGINE_REFLINK
+        copy_chunk.assert_not_called()
+        assert (tmp_path / "dest.mkv").read_bytes() == src_file.read_bytes()
+        assert progress == [src_file.stat().st_size]
+
+    def test_failed_clone_falls_back_and_is_not_retried(self, src_file, tmp_path):
+        ioctl = MagicMock(side_effect=OSError(errno.EXDEV, "cross-device"))
+        with patch("core.system_utils.fcntl.ioctl", ioctl):
+            assert _copy(src_file, tmp_path / "a.mkv") != COPY_ENGINE_REFLINK
+            assert _copy(src_file, tmp_path / "b.mkv") != COPY_ENGINE_REFLINK
+        assert ioctl.call_count == 1
+        assert (tmp_path / "b.mkv").read_bytes() == src_file.read_bytes()
+
+    def test_clone_that_leaves_destination_empty_is_not_trusted(self, src_file, tmp_path):
+        with patch("core.system_utils.fcntl.ioctl", return_value=0):
+            used = _copy(src_file, tmp_path / "dest.mkv")
+        assert used != COPY_ENGINE_REFLINK
+        assert (tmp_path / "dest.mkv").read_bytes() == src_file.read_bytes()
+
+    def test_file_utils_counts_reflinked_bytes(self, src_file, tmp_path):
+        file_utils = FileUtils(is_linux=True)
+        with patch("core.system_utils.fcntl.ioctl", side_effect=_fake_clone):
+            file_utils.copy_file_with_permissions(str(src_file), str(tmp_path / "dest.mkv"))
+        assert file_utils.reflinked_files == 1
+        assert file_utils.reflinked_bytes == src_file.stat().st_size
+
+    def test_maintenance_copy_reports_reflinked_bytes(self, src_file, tmp_path):
+        from web.services.maintenance_service import MaintenanceService
+        svc = MaintenanceService.__new__(MaintenanceService)
+        svc._settings = {"copy_preallocate": True}
+        with patch("core.system_utils.fcntl.ioctl", side_effect=_fake_clone):
+            svc._copy_with_progress(str(src_file), str(tmp_path / "dest.mkv"))
+        assert (tmp_path / "dest.mkv").read_bytes() == src_file.read_bytes()
+        assert svc._with_reflink_note("Cached 1 pinned file(s)").endswith("reflinked)")
+
+    def test_summary_notes_reflinked_bytes(self):
+        from core.logging_config import _cached_size_text
+        assert _cached_size_text({"cached_bytes": 2 * 1024 ** 3}) == "2.00 GB"
+        assert _cached_size_text({"cached_bytes": 2 * 1024 ** 3, "reflinked_bytes": 1024 ** 3}) \
+            == "2.00 GB, 1.00 GB reflinked"
+
+
+class TestCopyModes:
+
+    def test_preallocate_reserves_full_size_before_copy(self, src_file, tmp_path):
+        sizes = []
+        real_chunk = system_utils._copy_chunk
+
+        def chunk(engine, src_fd, dst_fd, offset, count):
+            sizes.append(os.fstat(dst_fd).st_size)
+            return real_chunk(engine, src_fd, dst_fd, offset, count)
+
+        with patch("core.system_utils._copy_chunk", chunk):
+            _copy(src_file, tmp_path / "dest.mkv", preallocate=True)
+        assert sizes[0] == src_file.stat().st_size
+        assert (tmp_path / "dest.mkv").read_bytes() == src_file.read_bytes()
+
+    def test_enospc_surfaces_before_any_data_is_written(self, src_file, tmp_path):
+        def full(*args):
+            raise OSError(errno.ENOSPC, "No space left on device")
+
+        with patch("core.system_utils.os.posix_fallocate", full), \
+                patch("core.system_utils._copy_chunk") as copy_chunk:
+            with pytest.raises(OSError) as exc:
+                _copy(src_file, tmp_path / "dest.mkv", preallocate=True)
+        assert exc.value.errno == errno.ENOSPC
+        copy_chunk.assert_not_called()
+
+    def test_unsupported_preallocation_is_skipped(self, src_file, tmp_path):
+        def unsupported(*args):
+            raise OSError(errno.EOPNOTSUPP, "Operation not supported")
+
+        with patch("core.system_utils.os.posix_fallocate", unsupported):
+            _copy(src_file, tmp_path / "dest.mkv", preallocate=True)
+        assert (tmp_path / "dest.mkv").read_bytes() == src_file.read_bytes()
+
+    def test_shrunk_source_does_not_leave_preallocated_tail(self, src_file, tmp_path):
+        with open(src_file, "rb") as fsrc, open(tmp_path / "dest.mkv", "wb") as fdest:
+            copy_file_data(fsrc.fileno(), fdest.fileno(), src_file.stat().st_size + CHUNK, CHUNK,
+                           preallocate=True)
+        assert (tmp_path / "dest.mkv").read_bytes() == src_file.read_bytes()
+
+    def test_drop_cache_advises_copied_ranges(self, src_file, tmp_path):
+        advice = []
+        with patch("core.system_utils.os.posix_fadvise",
+                   lambda fd, offset, length, adv: advice.append((fd, offset, length, adv))), \
+                patch("core.system_utils.DROP_CACHE_WINDOW", 2 * CHUNK):
+            with open(src_file, "rb") as fsrc, open(tmp_path / "dest.mkv", "wb") as fdest:
+                copy_file_data(fsrc.fileno(), fdest.fileno(), src_file.stat().st_size, CHUNK,
+                               drop_cache=True)
+                src_fd, dst_fd = fsrc.fileno(), fdest.fileno()
+
+        size = src_file.stat().st_size
+        assert advice[0] == (src_fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        src_dropped = [(o, n) for fd, o, n, a in advice if fd == src_fd and a == os.POSIX_FADV_DONTNEED]
+        dst_dropped = [(o, n) for fd, o, n, a in advice if fd == dst_fd and a == os.POSIX_FADV_DONTNEED]
+        assert sum(n for _, n in src_dropped) == size
+        assert dst_dropped[0] == (0, 2 * CHUNK)
+        assert sum(n for _, n in dst_dropped) == size
+        assert (tmp_path / "dest.mkv").read_bytes() == src_file.read_bytes()
+
+    def test_file_utils_passes_configured_modes(self, src_file, tmp_path):
+        file_utils = FileUtils(is_linux=True)
+        file_utils.copy_preallocate = True
+        file_utils.copy_drop_page_cache = True
+        with patch("core.system_utils.copy_file_data", return_value=COPY_ENGINE_READ_WRITE) as copy:
+            file_utils.copy_file_with_permissions(str(src_file), str(tmp_path / "dest.mkv"))
+        assert copy.call_args.kwargs["preallocate"] is True
+        assert copy.call_args.kwargs["drop_cache"] is True
+
+
+def _stop_after(chunks):
+    calls = [0]
+
+    def stop_check():
+        calls[0] += 1
+        return calls[0] > chunks
+    return stop_check
+
+
+class TestResumableCopy:
+
+    def _copy(self, src, dest, **kwargs):
+        progress = []
+        FileUtils(is_linux=True).copy_file_with_permissions(
+            str(src), str(dest), chunk_size=CHUNK, resumable=True,
+            progress_callback=lambda done, total: progress.append(done), **kwargs)
+        return progress
+
+    def _interrupt(self, src, dest, chunks=2):
+        with pytest.raises(InterruptedError):
+            self._copy(src, dest, stop_check=_stop_after(chunks))
+
+    def test_stop_keeps_partial_and_records_offset(self, src_file, tmp_path):
+        dest = tmp_path / "dest.mkv"
+        self._interrupt(src_file, dest)
+
+        partial, record = partial_copy_paths(str(dest))
+        assert not dest.exists()
+        assert os.path.basename(partial).startswith(".dest.mkv")
+        with open(record) as f:
+            assert json.load(f)["offset"] == 2 * CHUNK
+        with open(partial, "rb") as f:
+            assert f.read() == src_file.read_bytes()[:2 * CHUNK]
+
+    def test_next_copy_resumes_from_recorded_offset(self, src_file, tmp_path):
+        dest = tmp_path / "dest.mkv"
+        self._interrupt(src_file, dest)
+
+        progress = self._copy(src_file, dest)
+
+        assert progress[0] == 3 * CHUNK
+        assert dest.read_bytes() == src_file.read_bytes()
+        assert not any(os.path.exists(p) for p in partial_copy_paths(str(dest)))
+
+    def test_changed_source_starts_over(self, src_file, tmp_path):
+        dest = tmp_path / "dest.mkv"
+        self._interrupt(src_file, dest)
+        os.utime(src_file, ns=(time.time_ns(), time.time_ns() + 10**9))
+
+        assert self._copy(src_file, dest)[0] == CHUNK
+        assert dest.read_bytes() == src_file.read_bytes()
+
+    def test_mismatched_prefix_starts_over(self, src_file, tmp_path):
+        dest = tmp_path / "dest.mkv"
+        self._interrupt(src_file, dest)
+        partial, _ = partial_copy_paths(str(dest))
+        with open(partial, "r+b") as f:
+            f.seek(CHUNK + 7)
+            f.write(b"X")
+
+        assert self._copy(src_file, dest)[0] == CHUNK
+        assert dest.read_bytes() == src_file.read_bytes()
+
+    def test_checkpoint_survives_crash(self, src_file, tmp_path):
+        dest = tmp_path / "dest.mkv"
+
+        def crash(done, total):
+            if done >= 3 * CHUNK:
+                raise RuntimeError("killed")
+
+        with patch("core.system_utils.RESUME_CHECKPOINT_BYTES", 2 * CHUNK), pytest.raises(RuntimeError):
+            FileUtils(is_linux=True).copy_file_with_permissions(
+                str(src_file), str(dest), chunk_size=CHUNK, resumable=True, progress_callback=crash)
+
+        with open(partial_copy_paths(str(dest))[1]) as f:
+            assert json.load(f)["offset"] == 2 * CHUNK
+        assert self._copy(src_file, dest)[0] == 3 * CHUNK
+        assert dest.read_bytes() == src_file.read_bytes()
+
+    def test_stale_partials_are_removed(self, src_file, tmp_path):
+        fresh, old = tmp_path / "fresh.mkv", tmp_path / "old.mkv"
+        self._interrupt(src_file, fresh)
+        self._interrupt(src_file, old)
+        past = time.time() - 100 * 3600
+        for path in partial_copy_paths(str(old)):
+            os.utime(path, (past, past))
+
+        assert remove_stale_partial_copies(str(tmp_path)) == 1
+        assert all(os.path.exists(p) for p in partial_copy_paths(str(fresh)))
+        assert not any(os.path.exists(p) for p in partial_copy_paths(str(old)))
@@ -300,11 +300,12 @@ class TestRecordFileActivity:
             with patch('core.activity._get_activity_retention_hours', return_value=24):
                 record_file_activity("Cached", "movie.mkv", size_bytes=1024)
 
-        data = json.loads(f.read_text())
-        assert len(data) == 1
-        assert data[0]['action'] == "Cached"
-        assert data[0]['filename'] == "movie.mkv"
-        assert data[0]['size_bytes'] == 1024
+        lines = (tmp_path / "activity.jsonl").read_text().splitlines()
+        assert len(lines) == 1
+        data = json.loads(lines[0])
+        assert data['action'] == "Cached"
+        assert data['filename'] == "movie.mkv"
+        assert data['size_bytes'] == 1024
 
     def test_merges_with_existing(self, tmp_path):
         f = tmp_path / "activity.json"
@@ -315,12 +316,14 @@ class TestRecordFileActivity:
         with patch('core.activity.ACTIVITY_FILE', f):
             with patch('core.activity._get_activity_retention_hours', return_value=24):
                 record_file_activity("Cached", "new.mkv", size_bytes=500)
+                data = load_activity()
 
-        data = json.loads(f.read_text())
         assert len(data) == 2
-        filenames = {e['filename'] for e in data}
+        filenames = {e.filename for e in data}
         assert "old.mkv" in filenames
         assert "new.mkv" in filenames
+        # The existing snapshot is not rewritten
+        assert json.loads(f.read_text()) == existing
 
     def test_newest_first(self, tmp_path):
         f = tmp_path / "activity.json"
@@ -329,10 +332,10 @@ class TestRecordFileActivity:
             with patch('core.activity._get_activity_retention_hours', return_value=24):
                 record_file_activity("Cached", "first.mkv")
                 record_file_activity("Cached", "second.mkv")
+                data = load_activity()
 
-        data = json.loads(f.read_text())
-        assert data[0]['filename'] == "second.mkv"
-        assert data[1]['filename'] == "first.mkv"
+        assert data[0].filename == "second.mkv"
+        assert data[1].filename == "first.mkv"
 
     def test_capped_at_max(self, tmp_path):
         f = tmp_path / "activity.json"
@@ -346,9 +349,10 @@ class TestRecordFileActivity:
         with patch('core.activity.ACTIVITY_FILE', f):
             with patch('core.activity._get_activity_retention_hours', return_value=9999):
                 record_file_activity("Cached", "overflow.mkv")
+                data = load_activity()
 
-        data = json.loads(f.read_text())
         assert len(data) == MAX_RECENT_ACTIVITY
+        assert data[0].filename == "overflow.mkv"
 
     def test_with_users_and_associated(self, tmp_path):
         f = tmp_path / "activity.json"
@@ -361,10 +365,10 @@ class TestRecordFileActivity:
                     users=["alice"],
                     associated_files=[{"filename": "subs.srt", "size": "50 KB"}],
                 )
+                data = load_activity()
 
-        data = json.loads(f.read_text())
-        assert data[0]['users'] == ["alice"]
-        assert data[0]['associated_files'] == [{"filename": "subs.srt", "size": "50 KB"}]
+        assert data[0].users == ["alice"]
+        assert data[0].associated_files == [{"filename": "subs.srt", "size": "50 KB"}]
 
 
 # ============================================================================
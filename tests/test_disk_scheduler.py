@@ -0,0 +1,137 @@
+"""Tests for per-disk scheduling of array <-> cache moves.
+
+Source: core/file_operations.py — _DiskMoveScheduler round-robin dispatch,
+FileMover._execute_move_commands per-disk limits and throughput stats;
+core/system_utils.py — get_physical_disk.
+"""
+
+import os
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+# conftest.py handles fcntl/apscheduler mocking and path setup
+from core.file_operations import FileMover, _DiskMoveScheduler
+from core.system_utils import get_physical_disk
+
+
+def _drain(scheduler):
+    order = []
+    while True:
+        ready = scheduler.next_ready()
+        if ready is None:
+            return order
+        order.append(ready)
+
+
+class TestDiskMoveScheduler:
+
+    def test_round_robin_across_disks(self):
+        scheduler = _DiskMoveScheduler(per_disk_limit=3)
+        for disk, item in [("disk1", "a1"), ("disk1", "a2"), ("disk1", "a3"),
+                           ("disk2", "b1"), ("disk3", "c1"), ("disk2", "b2")]:
+            scheduler.add(disk, item)
+
+        assert [item for _, item in _drain(scheduler)] == ["a1", "b1", "c1", "a2", "b2", "a3"]
+
+    def test_per_disk_limit_holds_back_busy_disk(self):
+        scheduler = _DiskMoveScheduler(per_disk_limit=1)
+        for item in ("a1", "a2"):
+            scheduler.add("disk1", item)
+        scheduler.add("disk2", "b1")
+
+        assert _drain(scheduler) == [("disk1", "a1"), ("disk2", "b1")]
+        assert scheduler.has_queued()
+
+        scheduler.release("disk1")
+        assert scheduler.next_ready() == ("disk1", "a2")
+        assert not scheduler.has_queued()
+
+    def test_unresolved_disks_are_not_limited(self):
+        scheduler = _DiskMoveScheduler(per_disk_limit=1)
+        for item in ("a1", "a2", "a3"):
+            scheduler.add("dev:2049", item)
+        scheduler.add("unknown", "u1")
+
+        assert [item for _, item in _drain(scheduler)] == ["a1", "u1", "a2", "a3"]
+
+
+class TestGetPhysicalDisk:
+
+    def test_user_share_resolves_to_array_disk(self):
+        on_disk = {"/mnt/disk4/TV/Show/S01E01.mkv"}
+        with patch("core.system_utils.os.path.exists", side_effect=lambda p: p in on_disk):
+            assert get_physical_disk("/mnt/user/TV/Show/S01E01.mkv") == "disk4"
+
+    def test_missing_file_uses_parent_directory(self):
+        on_disk = {"/mnt/disk2/TV/Show"}
+        with patch("core.system_utils.os.path.exists", side_effect=lambda p: p in on_disk):
+            assert get_physical_disk("/mnt/user0/TV/Show/S01E02.mkv") == "disk2"
+
+    def test_non_unraid_path_uses_device_id(self, tmp_path):
+        expected = f"dev:{os.stat(tmp_path).st_dev}"
+        assert get_physical_disk(str(tmp_path / "missing" / "file.mkv")) == expected
+
+
+class TestExecuteMoveCommands:
+
+    def _mover(self, tmp_path, per_disk):
+        return FileMover(
+            real_source=str(tmp_path / "storage"),
+            cache_dir=str(tmp_path / "cache"),
+            is_unraid=True,
+            file_utils=MagicMock(),
+            mover_cache_exclude_file=str(tmp_path / "exclude.txt"),
+            max_concurrent_moves_per_disk=per_disk,
+        )
+
+    def _commands(self, disks):
+        return [((f"/mnt/user0/{disk}/{i}.mkv", "/mnt/cache"), f"/mnt/cache/{disk}/{i}.mkv", 1024 ** 2,
+                 f"/mnt/user/{disk}/{i}.mkv")
+                for i, disk in enumerate(disks)]
+
+    def _run(self, mover, commands, max_workers, resolve=True):
+        lock = threading.Lock()
+        active, peak, started = {}, {}, []
+
+        def fake_move(move_cmd, destination):
+            disk = move_cmd[0][0].split("/")[3]
+            with lock:
+                started.append(disk)
+                active[disk] = active.get(disk, 0) + 1
+                peak[disk] = max(peak.get(disk, 0), active[disk])
+            time.sleep(0.02)
+            with lock:
+                active[disk] -= 1
+            return 0
+
+        mover._move_file = fake_move
+        if resolve:
+            mover._move_disk = lambda move_cmd, destination: move_cmd[0][0].split("/")[3]
+        mover._execute_move_commands(commands, 2, max_workers, "cache", sum(c[2] for c in commands))
+        return peak, started
+
+    def test_one_move_per_disk_by_default(self, tmp_path):
+        mover = self._mover(tmp_path, per_disk=1)
+        peak, started = self._run(mover, self._commands(["disk1"] * 4 + ["disk2"] * 2), max_workers=5)
+
+        assert peak == {"disk1": 1, "disk2": 1}
+        assert started[:2] == ["disk1", "disk2"]
+
+    def test_same_device_keeps_global_concurrency(self, tmp_path):
+        mover = self._mover(tmp_path, per_disk=1)
+        commands = self._commands(["disk1"] * 6)
+        with patch("core.file_operations.get_physical_disk", return_value="dev:2049"):
+            peak, _ = self._run(mover, commands, max_workers=5, resolve=False)
+
+        assert peak["disk1"] == 5
+
+    def test_global_cap_and_stats(self, tmp_path):
+        mover = self._mover(tmp_path, per_disk=2)
+        peak, _ = self._run(mover, self._commands(["disk1"] * 4 + ["disk2"] * 4), max_workers=3)
+
+        assert max(peak.values()) == 2
+        stats = mover.disk_move_stats[("cache", "disk1")]
+        assert stats["files"] == 4 and stats["bytes"] == 4 * 1024 ** 2 and stats["seconds"] > 0
+        lines = mover.disk_throughput_lines("cache")
+        assert len(lines) == 2 and lines[0].startswith("disk1 -> cache: 4 files, 4.00 MB in ")
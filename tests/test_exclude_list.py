@@ -0,0 +1,137 @@
+"""Tests for the shared in-memory exclude list.
+
+Source: core/exclude_list.py — ExcludeList append/remove/batch semantics,
+external-change detection, and the get_exclude_list() registry.
+"""
+
+import os
+import stat
+from unittest.mock import patch
+
+# conftest.py handles fcntl/apscheduler mocking and path setup
+from core.exclude_list import ExcludeList, get_exclude_list
+
+
+def _lines(path):
+    return path.read_text(encoding="utf-8").splitlines()
+
+
+class TestExcludeListBasics:
+    """Adds append, duplicates are ignored, removals rewrite once."""
+
+    def test_missing_file_is_empty(self, tmp_path):
+        excl = ExcludeList(tmp_path / "cached.txt")
+        assert excl.entries() == []
+        assert not excl.exists()
+
+    def test_loads_and_dedupes_existing_file(self, tmp_path):
+        path = tmp_path / "cached.txt"
+        path.write_text("/a\n\n/b\n/a\n", encoding="utf-8")
+        assert ExcludeList(path).entries() == ["/a", "/b"]
+
+    def test_add_appends_without_rewriting(self, tmp_path):
+        path = tmp_path / "cached.txt"
+        path.write_text("/a\n", encoding="utf-8")
+        excl = ExcludeList(path)
+
+        assert excl.add("/b") is True
+        assert excl.add("/a") is False
+        assert _lines(path) == ["/a", "/b"]
+
+    def test_add_after_file_without_trailing_newline(self, tmp_path):
+        path = tmp_path / "cached.txt"
+        path.write_text("/a", encoding="utf-8")
+        ExcludeList(path).add("/b")
+        assert _lines(path) == ["/a", "/b"]
+
+    def test_add_many_single_open(self, tmp_path):
+        path = tmp_path / "cached.txt"
+        excl = ExcludeList(path)
+        assert excl.add_many(["/a", "/b", "/a", " "]) == 2
+        assert _lines(path) == ["/a", "/b"]
+
+    def test_remove_rewrites_immediately_outside_batch(self, tmp_path):
+        path = tmp_path / "cached.txt"
+        path.write_text("/a\n/b\n/c\n", encoding="utf-8")
+        excl = ExcludeList(path)
+
+        assert excl.remove("/b") is True
+        assert excl.remove("/missing") is False
+        assert _lines(path) == ["/a", "/c"]
+
+    def test_rewrite_preserves_file_mode(self, tmp_path):
+        path = tmp_path / "cached.txt"
+        path.write_text("/a\n/b\n", encoding="utf-8")
+        os.chmod(path, 0o644)
+        ExcludeList(path).remove("/a")
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o644
+
+
+class TestExcludeListBatch:
+    """Removals inside batch() are written once when the batch ends."""
+
+    def test_removals_deferred_until_batch_end(self, tmp_path):
+        path = tmp_path / "cached.txt"
+        path.write_text("/a\n/b\n/c\n", encoding="utf-8")
+        excl = ExcludeList(path)
+
+        with patch.object(excl, "_write_atomically", wraps=excl._write_atomically) as write:
+            with excl.batch():
+                excl.remove("/a")
+                excl.remove("/b")
+                excl.add("/d")
+                # In-memory view is already updated; the file isn't rewritten yet
+                assert excl.entries() == ["/c", "/d"]
+                assert "/a" in _lines(path)
+            assert write.call_count == 1
+
+        assert _lines(path) == ["/c", "/d"]
+
+    def test_nested_batches_flush_once(self, tmp_path):
+        path = tmp_path / "cached.txt"
+        path.write_text("/a\n/b\n", encoding="utf-8")
+        excl = ExcludeList(path)
+
+        with excl.batch():
+            with excl.batch():
+                excl.remove("/a")
+            assert "/a" in _lines(path)
+        assert _lines(path) == ["/b"]
+
+
+class TestExcludeListExternalChanges:
+    """Edits made by another process are picked up on next access."""
+
+    def test_external_append_is_seen(self, tmp_path):
+        path = tmp_path / "cached.txt"
+        path.write_text("/a\n", encoding="utf-8")
+        excl = ExcludeList(path)
+        assert excl.entries() == ["/a"]
+
+        with open(path, "a", encoding="utf-8") as f:
+            f.write("/external\n")
+
+        assert "/external" in excl
+        assert excl.add("/external") is False
+
+    def test_pending_removal_survives_external_change(self, tmp_path):
+        path = tmp_path / "cached.txt"
+        path.write_text("/a\n/b\n", encoding="utf-8")
+        excl = ExcludeList(path)
+
+        with excl.batch():
+            excl.remove("/a")
+            with open(path, "a", encoding="utf-8") as f:
+                f.write("/external\n")
+            assert excl.entries() == ["/b", "/external"]
+
+        assert _lines(path) == ["/b", "/external"]
+
+
+class TestGetExcludeList:
+    """get_exclude_list() returns one shared instance per file."""
+
+    def test_same_instance_for_same_path(self, tmp_path):
+        path = tmp_path / "cached.txt"
+        assert get_exclude_list(path) is get_exclude_list(str(path))
+        assert get_exclude_list(path) is not get_exclude_list(tmp_path / "other.txt")
@@ -0,0 +1,80 @@
+"""Tests for the pooled Plex/plex.tv HTTP sessions.
+
+Source: core/http_sessions.py — session sharing and per-account isolation,
+pool sizing, and the connection reuse counters.
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+# conftest.py handles fcntl/apscheduler mocking and path setup
+from core import http_sessions
+
+
+@pytest.fixture(autouse=True)
+def fresh_sessions():
+    http_sessions.close_sessions()
+    yield
+    http_sessions.close_sessions()
+
+
+class _OkHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def local_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _OkHandler)
+    server.daemon_threads = True  # keep-alive handlers must not block shutdown
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    http_sessions.close_sessions()
+    server.shutdown()
+    server.server_close()
+
+
+class TestSessionFactory:
+
+    def test_plex_session_is_shared(self):
+        assert http_sessions.get_plex_session() is http_sessions.get_plex_session()
+
+    def test_plextv_sessions_isolated_per_account(self):
+        alice = http_sessions.get_plextv_session("alice")
+        assert http_sessions.get_plextv_session("alice") is alice
+        assert http_sessions.get_plextv_session("bob") is not alice
+        assert http_sessions.get_plextv_session(None) is not alice
+        assert http_sessions.get_plextv_session(None) is not http_sessions.get_plex_session()
+
+    def test_pool_sized_to_executor_width(self):
+        adapter = http_sessions.get_plex_session().get_adapter("https://plex.tv")
+        assert adapter._pool_maxsize == http_sessions.POOL_MAXSIZE
+
+
+class TestConnectionStats:
+
+    def test_keep_alive_connections_are_reused(self, local_server):
+        session = http_sessions.get_plex_session()
+        for _ in range(5):
+            assert session.get(local_server, timeout=5).text == "ok"
+
+        stats = http_sessions.get_connection_stats()
+        assert stats["requests"] == 5
+        assert stats["connections"] == 1
+        assert stats["reused"] == 4
+
+    def test_empty_stats(self):
+        assert http_sessions.get_connection_stats() == {
+            "sessions": 0, "requests": 0, "connections": 0, "reused": 0,
+        }
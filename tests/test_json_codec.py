@@ -0,0 +1,78 @@
+"""Tests for the JSON codec used by state files.
+
+Source: core/json_codec.py — orjson/stdlib selection, fallbacks for inputs
+orjson rejects, and save_json_atomically() output.
+"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+# conftest.py handles fcntl/apscheduler mocking and path setup
+from core import json_codec
+from core.file_operations import save_json_atomically
+
+
+@pytest.fixture(params=["default", "stdlib"])
+def codec_backend(request):
+    """Run each test with the detected backend and with stdlib forced."""
+    if request.param == "stdlib":
+        with patch.object(json_codec, "orjson", None):
+            yield request.param
+    else:
+        yield request.param
+
+
+class TestRoundTrip:
+
+    def test_round_trip(self, codec_backend):
+        data = {"/mnt/cache/Film é.mkv": {"cached_at": "2025-01-01T00:00:00", "n": [1, 2.5, None, True]}}
+        assert json_codec.loads(json_codec.dumps(data)) == data
+        assert json_codec.loads(json_codec.dumps_bytes(data, indent=True)) == data
+
+    def test_compact_and_indented_output(self, codec_backend):
+        assert json_codec.dumps({"a": [1, 2]}) == '{"a":[1,2]}'
+        assert json_codec.dumps({"a": 1}, indent=True) == '{\n  "a": 1\n}'
+
+    def test_default_hook(self, codec_backend):
+        class Custom:
+            def __str__(self):
+                return "custom"
+        assert json_codec.loads(json_codec.dumps({"x": Custom()}, default=str)) == {"x": "custom"}
+
+
+class TestFallbacks:
+    """Inputs orjson rejects still work through stdlib."""
+
+    def test_non_string_keys(self):
+        assert json_codec.loads(json_codec.dumps({1: "a"})) == {"1": "a"}
+
+    def test_nan_literal_is_readable(self):
+        assert json_codec.loads('{"a": NaN}')["a"] != json_codec.loads('{"a": NaN}')["a"]
+
+    @pytest.mark.parametrize("value, literal", [(float("nan"), "NaN"), (float("inf"), "Infinity"),
+                                                (float("-inf"), "-Infinity")])
+    def test_non_finite_floats_written_like_stdlib(self, codec_backend, value, literal):
+        data = {"a": [1, {"b": value}], "c": None}
+        assert json_codec.dumps(data) == json.dumps(data, separators=(",", ":"))
+        assert f'"b":{literal}' in json_codec.dumps_bytes(data).decode()
+
+    def test_null_without_non_finite_floats_stays_null(self, codec_backend):
+        assert json_codec.dumps({"a": None, "b": 1.5}) == '{"a":null,"b":1.5}'
+
+    def test_decode_error_type(self, codec_backend):
+        with pytest.raises(json.JSONDecodeError):
+            json_codec.loads(b"{not json")
+
+
+class TestSaveJsonAtomically:
+
+    def test_output_is_indented_and_stdlib_readable(self, tmp_path, codec_backend):
+        path = tmp_path / "timestamps.json"
+        data = {"/mnt/cache/a.mkv": {"source": "ondeck"}}
+        assert save_json_atomically(str(path), data, label="timestamps") is True
+
+        content = path.read_text(encoding="utf-8")
+        assert json.loads(content) == data
+        assert '\n  "' in content
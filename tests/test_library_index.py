@@ -0,0 +1,223 @@
+"""Tests for the persistent library GUID index.
+
+Source: core/library_index.py — bulk build, incremental updatedAt refresh,
+deletion detection, persistence, and PlexManager.search_plex using the
+index instead of per-section getGuid searches.
+"""
+
+import time
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# conftest.py handles fcntl/apscheduler mocking and path setup
+from core.library_index import FULL_REFRESH_HOURS, IndexedItem, LibraryGuidIndex
+
+
+def _movie(rating_key, title, guids, files, updated=1_700_000_000):
+    return SimpleNamespace(
+        ratingKey=rating_key, title=title, guid=f"plex://movie/{rating_key}",
+        guids=[SimpleNamespace(id=g) for g in guids],
+        media=[SimpleNamespace(parts=[SimpleNamespace(file=f)]) for f in files],
+        updatedAt=datetime.fromtimestamp(updated), addedAt=None,
+    )
+
+
+def _show(rating_key, title, guids, updated=1_700_000_000):
+    return SimpleNamespace(
+        ratingKey=rating_key, title=title, guid=f"plex://show/{rating_key}",
+        guids=[SimpleNamespace(id=g) for g in guids], media=[],
+        updatedAt=datetime.fromtimestamp(updated), addedAt=None,
+    )
+
+
+class FakeServer:
+    """Serves section listings; records every request path."""
+
+    machineIdentifier = "machine-1"
+
+    def __init__(self, sections):
+        self.sections = sections  # key -> list of items
+        self.requests = []
+
+    def fetchItems(self, key):
+        self.requests.append(key)
+        section_key = int(key.split("/")[3])
+        items = self.sections[section_key]
+        if "updatedAt>>=" in key:
+            # Plex's ">>=" filter is strictly "after"
+            since = int(key.rsplit("=", 1)[1])
+            items = [i for i in items if i.updatedAt.timestamp() > since]
+        return list(items)
+
+    def query(self, key, headers=None):
+        self.requests.append(f"size:{key}")
+        return SimpleNamespace(attrib={"totalSize": str(len(self.sections[int(key.split("/")[3])]))})
+
+
+def _sections():
+    return [SimpleNamespace(key=1, type="movie"), SimpleNamespace(key=2, type="show"),
+            SimpleNamespace(key=3, type="artist")]
+
+
+@pytest.fixture
+def server():
+    return FakeServer({
+        1: [_movie(10, "Heat", ["imdb://tt0113277", "tmdb://949"], ["/movies/Heat.mkv", "/movies/Heat 4K.mkv"])],
+        2: [_show(20, "Severance", ["tvdb://371980"])],
+    })
+
+
+class TestBuildAndLookup:
+
+    def test_bulk_build_indexes_all_guids(self, server):
+        index = LibraryGuidIndex()
+        index.refresh(server, _sections())
+
+        assert index.lookup("imdb://tt0113277")[0] == "10"
+        assert index.lookup("tmdb://949")[0] == "10"
+        assert index.lookup("plex://movie/10")[0] == "10"
+        assert index.lookup("tvdb://371980")[1]["type"] == "show"
+        assert index.lookup("imdb://tt9999999") is None
+        # One listing per movie/show section; music sections are skipped
+        assert server.requests == ["/library/sections/1/all?includeGuids=1",
+                                   "/library/sections/2/all?includeGuids=1"]
+
+    def test_lookup_respects_valid_sections(self, server):
+        index = LibraryGuidIndex()
+        index.refresh(server, _sections())
+        assert index.lookup("imdb://tt0113277", [2]) is None
+        assert index.lookup("imdb://tt0113277", [1]) is not None
+
+    def test_indexed_movie_exposes_part_files(self, server):
+        index = LibraryGuidIndex()
+        index.refresh(server, _sections())
+        item = IndexedItem(server, *index.lookup("imdb://tt0113277"))
+        assert item.TYPE == "movie" and item.ratingKey == 10 and item.librarySectionID == 1
+        assert [p.file for m in item.media for p in m.parts] == ["/movies/Heat.mkv", "/movies/Heat 4K.mkv"]
+
+    def test_covers_only_refreshed_sections(self, server):
+        index = LibraryGuidIndex()
+        assert not index.covers([1])
+        server.sections[2] = None  # listing blows up
+        index.refresh(server, _sections())
+        assert index.covers([1])
+        assert not index.covers([1, 2])
+        assert not index.covers(None)
+
+
+class TestIncrementalRefresh:
+
+    def test_second_run_lists_only_updated_items(self, server, tmp_path):
+        cache_file = str(tmp_path / "library_index.json")
+        LibraryGuidIndex(cache_file).refresh(server, _sections())
+        server.sections[1].append(_movie(11, "Ronin", ["imdb://tt0122690"], ["/movies/Ronin.mkv"],
+                                         updated=1_700_000_500))
+        server.requests.clear()
+
+        index = LibraryGuidIndex(cache_file)
+        index.refresh(server, _sections())
+
+        assert index.lookup("imdb://tt0122690")[0] == "11"
+        assert index.lookup("imdb://tt0113277")[0] == "10"
+        assert "/library/sections/1/all?includeGuids=1&updatedAt>>=1699999999" in server.requests
+        assert "/library/sections/1/all?includeGuids=1" not in server.requests
+
+    def test_item_updated_in_same_second_is_picked_up(self, server, tmp_path):
+        cache_file = str(tmp_path / "library_index.json")
+        LibraryGuidIndex(cache_file).refresh(server, _sections())
+        # Same updatedAt as the newest indexed item; item count unchanged, so no full relist
+        server.sections[1] = [_movie(10, "Heat", ["imdb://tt0113277"], ["/movies/Heat (1995).mkv"])]
+        server.requests.clear()
+
+        index = LibraryGuidIndex(cache_file)
+        index.refresh(server, _sections())
+
+        item = IndexedItem(server, *index.lookup("imdb://tt0113277"))
+        assert [p.file for m in item.media for p in m.parts] == ["/movies/Heat (1995).mkv"]
+        assert "/library/sections/1/all?includeGuids=1" not in server.requests
+
+    def test_deletion_triggers_full_relist(self, server, tmp_path):
+        cache_file = str(tmp_path / "library_index.json")
+        LibraryGuidIndex(cache_file).refresh(server, _sections())
+        server.sections[1] = []
+
+        index = LibraryGuidIndex(cache_file)
+        index.refresh(server, _sections())
+        assert index.lookup("imdb://tt0113277") is None
+
+    def test_stale_full_listing_is_redone(self, server, tmp_path):
+        cache_file = str(tmp_path / "library_index.json")
+        LibraryGuidIndex(cache_file).refresh(server, _sections())
+        server.requests.clear()
+
+        later = time.time() + FULL_REFRESH_HOURS * 3600 + 60
+        with patch("core.library_index.time.time", return_value=later):
+            LibraryGuidIndex(cache_file).refresh(server, _sections())
+        assert "/library/sections/1/all?includeGuids=1" in server.requests
+
+    def test_other_server_rebuilds(self, server, tmp_path):
+        cache_file = str(tmp_path / "library_index.json")
+        LibraryGuidIndex(cache_file).refresh(server, _sections())
+        other = FakeServer({1: [], 2: []})
+        other.machineIdentifier = "machine-2"
+
+        index = LibraryGuidIndex(cache_file)
+        index.refresh(other, _sections())
+        assert index.lookup("imdb://tt0113277") is None
+
+    def test_invalidate_drops_entry_and_forces_relist(self, server, tmp_path):
+        cache_file = str(tmp_path / "library_index.json")
+        index = LibraryGuidIndex(cache_file)
+        index.refresh(server, _sections())
+        index.invalidate("20")
+        assert index.lookup("tvdb://371980") is None
+
+        server.requests.clear()
+        reloaded = LibraryGuidIndex(cache_file)
+        reloaded.refresh(server, _sections())
+        assert "/library/sections/2/all?includeGuids=1" in server.requests
+        assert reloaded.lookup("tvdb://371980")[0] == "20"
+
+
+class TestSearchPlexWithIndex:
+
+    def _manager(self, server):
+        from core.plex_api import PlexManager, ShowEpisodeCache
+        api = PlexManager.__new__(PlexManager)
+        api.plex = server
+        api.plex.library = MagicMock()
+        api._episode_cache = ShowEpisodeCache()
+        api._library_index = LibraryGuidIndex()
+        api._library_index.refresh(server, _sections())
+        return api
+
+    def test_hit_and_miss_skip_section_searches(self, server):
+        api = self._manager(server)
+        movie = api.search_plex("Heat", guid="imdb://tt0113277", valid_sections=[1, 2])
+        assert movie.title == "Heat"
+        assert api.search_plex("Nope", guid="imdb://tt0000001", valid_sections=[1, 2]) is None
+        api.plex.library.sections.assert_not_called()
+
+    def test_show_hit_prefetches_episodes(self, server):
+        api = self._manager(server)
+        episodes = [SimpleNamespace(title="Good News About Hell")]
+        server.fetchItems = MagicMock(return_value=episodes)
+        show = api.search_plex("Severance", guid="tvdb://371980", valid_sections=[2])
+        assert show.TYPE == "show"
+        assert api.episode_cache.peek(("show", "20")) == episodes
+        server.fetchItems.assert_called_once_with("/library/metadata/20/allLeaves")
+
+    def test_missing_rating_key_invalidates_and_searches(self, server):
+        class NotFound(Exception):
+            pass
+
+        api = self._manager(server)
+        server.fetchItems = MagicMock(side_effect=NotFound("404"))
+        api.plex.library.sections.return_value = []
+        with patch("core.plex_api.NotFound", NotFound):
+            assert api.search_plex("Severance", guid="tvdb://371980", valid_sections=[2]) is None
+        api.plex.library.sections.assert_called_once()
+        assert api._library_index.lookup("tvdb://371980") is None
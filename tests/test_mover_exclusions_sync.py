@@ -0,0 +1,80 @@
+"""Tests for the incremental Unraid mover-exclusions sync.
+
+Source: core/app.py — PlexCacheApp._update_unraid_mover_exclusions()
+rewrites only when the PlexCache section changes, writes atomically, and
+reports the number of changed entries.
+"""
+
+import os
+import sys
+from unittest.mock import MagicMock, patch
+
+# Mock plexapi + requests before importing core.app (not installed in test env)
+for _mod in ['plexapi', 'plexapi.server', 'plexapi.myplex', 'plexapi.library',
+             'plexapi.video', 'plexapi.exceptions', 'plexapi.settings',
+             'requests', 'requests.exceptions']:
+    sys.modules.setdefault(_mod, MagicMock())
+
+TAG = "### Plexcache exclusions below this line"
+
+
+def _make_app(tmp_path):
+    from core.app import PlexCacheApp
+    app = PlexCacheApp.__new__(PlexCacheApp)
+    app.mover_exclusions_changed = None
+    app.config_manager = MagicMock()
+    app.config_manager.get_unraid_mover_exclusions_file.return_value = tmp_path / "unraid_mover_exclusions.txt"
+    app.config_manager.get_cached_files_file.return_value = tmp_path / "plexcache_cached_files.txt"
+    return app
+
+
+class TestUpdateUnraidMoverExclusions:
+
+    def test_creates_file_with_tag_and_entries(self, tmp_path):
+        app = _make_app(tmp_path)
+        (tmp_path / "plexcache_cached_files.txt").write_text("/mnt/cache/a.mkv\n", encoding="utf-8")
+
+        assert app._update_unraid_mover_exclusions() == 1
+
+        content = (tmp_path / "unraid_mover_exclusions.txt").read_text(encoding="utf-8")
+        assert content == f"{TAG}\n/mnt/cache/a.mkv\n"
+        assert app.mover_exclusions_changed == 1
+
+    def test_preserves_user_section_and_counts_changes(self, tmp_path):
+        app = _make_app(tmp_path)
+        (tmp_path / "unraid_mover_exclusions.txt").write_text(
+            f"/mnt/user/keep\n\n{TAG}\n/mnt/cache/old.mkv\n/mnt/cache/a.mkv\n", encoding="utf-8"
+        )
+        (tmp_path / "plexcache_cached_files.txt").write_text(
+            "/mnt/cache/a.mkv\n/mnt/cache/new.mkv\n", encoding="utf-8"
+        )
+
+        assert app._update_unraid_mover_exclusions() == 2  # +new, -old
+
+        content = (tmp_path / "unraid_mover_exclusions.txt").read_text(encoding="utf-8")
+        assert content == f"/mnt/user/keep\n\n{TAG}\n/mnt/cache/a.mkv\n/mnt/cache/new.mkv\n"
+
+    def test_unchanged_section_skips_write(self, tmp_path):
+        app = _make_app(tmp_path)
+        exclusions = tmp_path / "unraid_mover_exclusions.txt"
+        exclusions.write_text(f"{TAG}\n/mnt/cache/a.mkv\n", encoding="utf-8")
+        (tmp_path / "plexcache_cached_files.txt").write_text("/mnt/cache/a.mkv\n", encoding="utf-8")
+
+        with patch("core.app.write_text_atomically") as mock_write:
+            assert app._update_unraid_mover_exclusions() == 0
+        mock_write.assert_not_called()
+
+    def test_write_is_atomic_and_keeps_mode(self, tmp_path):
+        app = _make_app(tmp_path)
+        exclusions = tmp_path / "unraid_mover_exclusions.txt"
+        exclusions.write_text(f"{TAG}\n", encoding="utf-8")
+        os.chmod(exclusions, 0o644)
+        inode_before = os.stat(exclusions).st_ino
+        (tmp_path / "plexcache_cached_files.txt").write_text("/mnt/cache/a.mkv\n", encoding="utf-8")
+
+        app._update_unraid_mover_exclusions()
+
+        st = os.stat(exclusions)
+        assert st.st_ino != inode_before  # replaced via rename, not rewritten in place
+        assert st.st_mode & 0o777 == 0o644
+        assert not [p for p in os.listdir(tmp_path) if p.endswith(".tmp")]
@@ -187,6 +187,52 @@ class TestImportRestoresPins:
             _teardown(patches)
 
 
+class TestSqliteStateBackend:
+    """With state_backend=sqlite the pins live in the state DB, not pinned_media.json."""
+
+    def _use_sqlite(self, settings_file):
+        settings = json.loads(settings_file.read_text(encoding="utf-8"))
+        settings["state_backend"] = "sqlite"
+        settings_file.write_text(json.dumps(settings), encoding="utf-8")
+
+    def test_export_reads_pins_from_state_db(self, tmp_path):
+        from core.state_store import SQLiteStateBackend
+        svc, settings_file, data_dir, patches = _build_service(tmp_path)
+        try:
+            self._use_sqlite(settings_file)
+            tracker = _write_pinned_tracker(data_dir, {"999": {"rating_key": "999", "title": "Stale"}})
+            store = SQLiteStateBackend(str(tracker), "pinned_media")
+            store.load()  # migrates the JSON file; it is ignored from now on
+            store.save({"100": {"rating_key": "100", "title": "Matrix"}}, None)
+
+            export = svc.export_settings()
+            assert set(export["pinned_media"]) == {"100"}
+        finally:
+            _teardown(patches)
+
+    def test_import_writes_pins_to_state_db(self, tmp_path):
+        from core.state_store import load_state
+        svc, settings_file, data_dir, patches = _build_service(tmp_path)
+        try:
+            self._use_sqlite(settings_file)
+            tracker = _write_pinned_tracker(data_dir, {"999": {"rating_key": "999", "title": "Old"}})
+            assert set(load_state(tracker, "sqlite")) == {"999"}
+
+            payload = {
+                "PLEX_URL": "http://plex.local:32400",
+                "state_backend": "sqlite",
+                "pinned_media": {"100": {"rating_key": "100", "title": "Matrix"}},
+            }
+            assert svc.import_settings(payload, merge=False)["success"] is True
+            assert set(load_state(tracker, "sqlite")) == {"100"}
+
+            svc.import_settings({"pinned_media": {"200": {"rating_key": "200"}}}, merge=True)
+            assert set(load_state(tracker, "sqlite")) == {"100", "200"}
+            assert set(svc.export_settings()["pinned_media"]) == {"100", "200"}
+        finally:
+            _teardown(patches)
+
+
 class TestValidateImportRecognisesPinnedKey:
     def test_pinned_media_key_is_not_flagged_as_unknown(self, tmp_path):
         svc, _, _, patches = _build_service(tmp_path)
@@ -22,6 +22,7 @@ def _make_config_manager(tmp_path):
     cm.plex.plex_url = "http://localhost:32400"
     cm.plex.plex_token = "test-token"
     cm.plex.pinned_preferred_resolution = "highest"
+    cm.performance.state_backend = "json"
     return cm
 
 
@@ -205,6 +206,28 @@ class TestHandleUnpin:
         assert "Not pinned" in capsys.readouterr().out
 
 
+class TestSqliteStateBackend:
+    def test_pin_round_trip_keeps_db_namespace(self, tmp_path, capsys):
+        from core.pinned_cli import handle_pin, handle_unpin
+        from core.state_store import SQLiteStateBackend, _namespace_in_db, state_db_path_for
+        cm = _make_config_manager(tmp_path)
+        cm.performance.state_backend = "sqlite"
+        pinned_file = str(cm.get_pinned_media_file())
+        web_tracker = PinnedMediaTracker(pinned_file, backend=SQLiteStateBackend(pinned_file, "pinned_media"))
+        web_tracker.add_pin("100", "movie", "Matrix")
+
+        mock_plex = MagicMock()
+        mock_plex.fetchItem.return_value = _make_plex_item("200", "Heat")
+        with patch("core.pinned_cli._connect_plex", return_value=mock_plex):
+            handle_pin(cm, "200")
+        handle_unpin(cm, "100")
+
+        assert _namespace_in_db(state_db_path_for(pinned_file), "pinned_media")
+        assert not os.path.exists(pinned_file)
+        reloaded = PinnedMediaTracker(pinned_file, backend=SQLiteStateBackend(pinned_file, "pinned_media"))
+        assert reloaded.pinned_rating_keys() == {"200"}
+
+
 # ---------------------------------------------------------------------------
 # handle_pin_by_title
 # ---------------------------------------------------------------------------
@@ -668,3 +668,155 @@ class TestListPinsGrouped:
             next(gen)
         except StopIteration:
             pass
+
+
+# ---------------------------------------------------------------------------
+# Cached pin map + stored display metadata
+# ---------------------------------------------------------------------------
+
+
+class CountingServer(FakePlexServer):
+    def __init__(self, items=None):
+        super().__init__(items=items)
+        self.fetches = []
+
+    def fetchItem(self, key):
+        self.fetches.append(int(key))
+        return super().fetchItem(key)
+
+
+def _counting_service(tmp_path):
+    matrix = FakeMovie(100, "Matrix", [FakeMedia("1080", ("/plex/movies/Matrix.mkv",))])
+    other = FakeMovie(999, "Other", [FakeMedia("1080", ("/plex/movies/Other.mkv",))])
+    ep = MagicMock()
+    ep.ratingKey = 77
+    ep.grandparentRatingKey = "500"
+    ep.grandparentTitle = "The Office"
+    ep.grandparentYear = 2005
+    ep.parentIndex = 3
+    ep.index = 12
+    ep.title = "Prison Mike"
+    ep.media = [FakeMedia("1080", ("/plex/movies/Office.S03E12.mkv",))]
+    server = CountingServer(items={100: matrix, 999: other, 77: ep})
+    return server, _make_service(tmp_path, plex_server=server)
+
+
+class TestPinMapCache:
+    def test_repeated_resolves_reuse_map(self, tmp_path):
+        server, gen = _counting_service(tmp_path)
+        svc = next(gen)
+        svc._tracker.add_pin("100", "movie", "Matrix")
+        first = svc.resolve_all_to_cache_path_map()
+        calls = len(server.fetches)
+        assert svc.resolve_all_to_cache_path_map() == first
+        assert svc.resolve_all_to_cache_paths() == set(first)
+        assert len(server.fetches) == calls
+
+    def test_unpin_updates_map_without_resolving(self, tmp_path):
+        server, gen = _counting_service(tmp_path)
+        svc = next(gen)
+        svc._tracker.add_pin("100", "movie", "Matrix")
+        svc._tracker.add_pin("999", "movie", "Other")
+        svc.resolve_all_to_cache_paths()
+        server.fetches.clear()
+
+        result = svc.toggle_pin("100", "movie", "Matrix")
+
+        assert result["evict_paths"] == ["/mnt/cache/media/Movies/Matrix.mkv"]
+        assert svc.resolve_all_to_cache_paths() == {"/mnt/cache/media/Movies/Other.mkv"}
+        assert server.fetches == []
+
+    def test_pin_set_change_rebuilds_map(self, tmp_path):
+        server, gen = _counting_service(tmp_path)
+        svc = next(gen)
+        svc._tracker.add_pin("100", "movie", "Matrix")
+        svc.resolve_all_to_cache_paths()
+        svc._tracker.add_pin("999", "movie", "Other")
+        assert "/mnt/cache/media/Movies/Other.mkv" in svc.resolve_all_to_cache_paths()
+
+    def test_ttl_expiry_and_invalidate_rebuild(self, tmp_path):
+        server, gen = _counting_service(tmp_path)
+        svc = next(gen)
+        svc._tracker.add_pin("100", "movie", "Matrix")
+        svc.resolve_all_to_cache_paths()
+
+        svc.invalidate_pin_map()
+        server.fetches.clear()
+        svc.resolve_all_to_cache_paths()
+        assert server.fetches
+
+        from web.services import pinned_service
+        later = pinned_service.time.monotonic() + pinned_service.PIN_MAP_TTL_SECONDS + 1
+        server.fetches.clear()
+        with patch("web.services.pinned_service.time.monotonic", return_value=later):
+            svc.resolve_all_to_cache_paths()
+        assert server.fetches
+
+    def test_background_refresh_rereads_tracker(self, tmp_path):
+        server, gen = _counting_service(tmp_path)
+        svc = next(gen)
+        svc._tracker.add_pin("100", "movie", "Matrix")
+        svc.resolve_all_to_cache_paths()
+
+        # A run's own tracker removes the pin on disk
+        from core.pinned_media import PinnedMediaTracker
+        PinnedMediaTracker(svc._tracker.tracker_file).remove_pin("100")
+
+        with patch("web.services.pinned_service.threading.Thread"):
+            svc.refresh_pin_map_in_background()
+        assert not svc._tracker.is_pinned("100")
+        assert svc.resolve_all_to_cache_paths() == set()
+
+    def test_pin_added_during_resolve_is_not_cached_as_resolved(self, tmp_path):
+        server, gen = _counting_service(tmp_path)
+        svc = next(gen)
+        svc._tracker.add_pin("100", "movie", "Matrix")
+
+        from web.services import pinned_service
+        real_resolve = pinned_service.resolve_pins_to_paths
+
+        def resolve_then_concurrent_pin(*args, **kwargs):
+            result = real_resolve(*args, **kwargs)
+            svc._tracker.add_pin("999", "movie", "Other")  # lands after the resolver read the pins
+            return result
+
+        with patch("web.services.pinned_service.resolve_pins_to_paths", resolve_then_concurrent_pin):
+            svc.resolve_all_to_cache_paths()
+        assert "/mnt/cache/media/Movies/Other.mkv" in svc.resolve_all_to_cache_paths()
+
+class TestStoredDisplay:
+    def test_toggle_stores_display_metadata(self, tmp_path):
+        server, gen = _counting_service(tmp_path)
+        svc = next(gen)
+        svc.toggle_pin("77", "episode", "Prison Mike")
+
+        display = svc._tracker.get_pin("77")["display"]
+        assert display["title"] == "The Office (2005) — S03E12 — Prison Mike"
+        assert display["group_rating_key"] == "500"
+        assert display["scope_text"] == "S03E12 — Prison Mike"
+        assert display["sort_key"] == [2, 3, 12]
+
+    def test_listing_uses_stored_display_without_plex(self, tmp_path):
+        server, gen = _counting_service(tmp_path)
+        svc = next(gen)
+        svc.toggle_pin("77", "episode", "Prison Mike")
+        svc._get_plex_server = MagicMock(side_effect=AssertionError("no Plex call expected"))
+
+        groups = svc.list_pins_grouped()
+
+        assert groups[0]["group_title"] == "The Office (2005)"
+        assert groups[0]["pins"][0]["title"] == "The Office (2005) — S03E12 — Prison Mike"
+        assert groups[0]["pins"][0]["sort_key"] == (2, 3, 12)
+
+    def test_legacy_pin_backfilled_once(self, tmp_path):
+        server, gen = _counting_service(tmp_path)
+        svc = next(gen)
+        svc._tracker.add_pin("77", "episode", "Prison Mike", added_by="cli")
+        assert "display" not in svc._tracker.get_pin("77")
+
+        assert svc.list_pins_with_metadata()[0]["title"] == "The Office (2005) — S03E12 — Prison Mike"
+        assert svc._tracker.get_pin("77")["display"]["group_rating_key"] == "500"
+
+        server.fetches.clear()
+        svc.list_pins_grouped()
+        assert server.fetches == []
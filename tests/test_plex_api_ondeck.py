@@ -4,10 +4,14 @@ Verifies that `_fetch_user_on_deck_media` queries each configured library's
 `/library/sections/{key}/onDeck` endpoint rather than the global
 `/library/onDeck` endpoint, which applies Plex's "Include in home screen"
 visibility filter server-side and silently drops hidden libraries.
+
+Also covers the per-run ShowEpisodeCache used for next-episode lookups.
 """
 
 import os
 import sys
+import threading
+import time
 from datetime import datetime, timedelta
 from unittest.mock import MagicMock, patch
 
@@ -25,7 +29,7 @@ for _mod in [
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from core.plex_api import PlexManager
+from core.plex_api import PlexManager, ShowEpisodeCache
 
 
 def _make_video(section_key, last_viewed_days_ago=0):
@@ -216,3 +220,115 @@ class TestPerSectionOnDeckFetch:
             )
         called_keys = [c.args[0] for c in plex.library.sectionByID.call_args_list]
         assert sorted(called_keys) == [2, 4, 5]
+
+
+def _episode(season, index, rating_key=None):
+    ep = MagicMock()
+    ep.parentIndex = season
+    ep.index = index
+    ep.ratingKey = rating_key or f"{season}{index:02d}"
+    part = MagicMock()
+    part.file = f"/data/TV/Show/S{season:02d}E{index:02d}.mkv"
+    media = MagicMock()
+    media.parts = [part]
+    ep.media = [media]
+    return ep
+
+
+def _show(seasons_episodes):
+    """Mock show whose seasons() return seasons with the given episode counts."""
+    show = MagicMock()
+    seasons = []
+    for season_index, count in seasons_episodes.items():
+        season = MagicMock()
+        season.index = season_index
+        season.ratingKey = f"season-{season_index}"
+        season.episodes.return_value = [_episode(season_index, i) for i in range(1, count + 1)]
+        seasons.append(season)
+    show.seasons.return_value = seasons
+    return show
+
+
+def _ondeck_video(show, season, index):
+    video = _episode(season, index)
+    video.grandparentTitle = "Show"
+    video.grandparentRatingKey = "show-1"
+    video.show.return_value = show
+    return video
+
+
+class TestShowEpisodeCache:
+    """Next-episode lookups fetch one season at a time and share fetches."""
+
+    def test_only_needed_seasons_fetched(self):
+        api = _bare_api()
+        show = _show({1: 10, 2: 10, 3: 10})
+        files = []
+        api._process_episode_ondeck(_ondeck_video(show, 1, 9), 3, files, "alice")
+
+        assert [os.path.basename(f.file_path) for f in files] == [
+            "S01E09.mkv", "S01E10.mkv", "S02E01.mkv", "S02E02.mkv",
+        ]
+        season1, season2, season3 = show.seasons.return_value
+        season1.episodes.assert_called_once()
+        season2.episodes.assert_called_once()
+        season3.episodes.assert_not_called()
+        show.episodes.assert_not_called()
+
+    def test_users_on_same_show_share_fetches(self):
+        api = _bare_api()
+        show = _show({1: 20})
+        for user in ("alice", "bob", "carol"):
+            api._process_episode_ondeck(_ondeck_video(show, 1, 2), 2, [], user)
+
+        show.seasons.assert_called_once()
+        show.seasons.return_value[0].episodes.assert_called_once()
+        assert api.episode_cache.misses == 2  # seasons + season 1
+        assert api.episode_cache.hits == 4
+
+    def test_watchlist_list_reused_by_ondeck(self):
+        api = _bare_api()
+        show = _show({1: 5})
+        show.ratingKey = "show-1"
+        show.title = "Show"
+        show.episodes.return_value = [_episode(1, i) for i in range(1, 6)]
+        for ep in show.episodes.return_value:
+            ep.isPlayed = False
+        list(api._process_watchlist_show(show, 2, "alice", None))
+
+        files = []
+        api._process_episode_ondeck(_ondeck_video(show, 1, 1), 1, files, "bob")
+
+        assert [os.path.basename(f.file_path) for f in files] == ["S01E01.mkv", "S01E02.mkv"]
+        show.episodes.assert_called_once()
+        show.seasons.assert_not_called()
+
+    def test_concurrent_misses_fetch_once(self):
+        cache = ShowEpisodeCache()
+        calls = []
+
+        def slow_fetch():
+            calls.append(1)
+            time.sleep(0.05)
+            return [1, 2, 3]
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(cache.get_or_fetch(("k",), slow_fetch)))
+                   for _ in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(calls) == 1
+        assert results == [[1, 2, 3]] * 5
+
+    def test_failed_fetch_is_not_cached(self):
+        cache = ShowEpisodeCache()
+
+        def failing():
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            cache.get_or_fetch(("k",), failing)
+        assert cache.get_or_fetch(("k",), lambda: [1]) == [1]
@@ -88,3 +88,15 @@ class TestRetryPlexTvCall:
             _retry_plextv_call(func, label="watchlist for Brandon")
         assert any("watchlist for Brandon" in rec.message for rec in caplog.records)
         assert any("1/3" in rec.message for rec in caplog.records)
+
+    def test_retries_rate_limited_call_after_backoff(self):
+        """A 429 is retried after the limiter's per-endpoint backoff."""
+        from core.plex_api import get_plextv_limiter
+        func = MagicMock(side_effect=[Exception("(429) too_many_requests"), "ok"])
+        with patch.object(get_plextv_limiter(), 'record_rate_limited', return_value=5) as mock_backoff, \
+                patch('core.plex_api.time.sleep') as mock_sleep:
+            result = _retry_plextv_call(func, label="test")
+        assert result == "ok"
+        mock_backoff.assert_called_once()
+        assert mock_backoff.call_args.args[0] == "plex.tv"
+        mock_sleep.assert_called_once_with(5)
@@ -0,0 +1,153 @@
+"""Tests for the asyncio Plex fetch engine.
+
+Source: core/plex_async.py — results must match the threaded engine in
+PlexManager.get_on_deck_media / get_watchlist_media, and concurrency must
+stay within the per-host limits.
+"""
+
+import os
+import sys
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+sys.modules['fcntl'] = MagicMock()
+for _mod in [
+    'apscheduler', 'apscheduler.schedulers',
+    'apscheduler.schedulers.background', 'apscheduler.triggers',
+    'apscheduler.triggers.cron', 'apscheduler.triggers.interval',
+    'plexapi', 'plexapi.server', 'plexapi.video', 'plexapi.myplex',
+    'plexapi.library', 'plexapi.exceptions',
+]:
+    sys.modules.setdefault(_mod, MagicMock())
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.plex_api import PlexManager, OnDeckItem, UserProxy
+from core.plex_async import AsyncPlexFetcher, normalize_fetch_engine
+
+
+def _manager(engine):
+    api = PlexManager.__new__(PlexManager)
+    api.plex_token = "main-token"
+    api.fetch_engine = engine
+    api.ondeck_source = "api"
+    api.plex_db_snapshot = False
+    api._token_lock = threading.Lock()
+    api._user_tokens = {"alice": "t-alice", "bob": "t-bob"}
+    api._user_is_home = {}
+    api._plex_db_path = ""
+    api._ondeck_data_complete = True
+    api._watchlist_data_complete = True
+    return api
+
+
+def _plex_instance(section_keys):
+    plex = MagicMock()
+    plex.library.sections.return_value = [MagicMock(key=k) for k in section_keys]
+
+    def section_by_id(key):
+        section = MagicMock()
+        section.onDeck.return_value = [f"video-{key}-{i}" for i in range(3)]
+        return section
+
+    plex.library.sectionByID.side_effect = section_by_id
+    return plex
+
+
+def _ondeck(engine, **kwargs):
+    api = _manager(engine)
+    plex = _plex_instance([1, 2, 3])
+
+    def process(video, days, number_episodes, username):
+        return [OnDeckItem(file_path=f"/{username}/{video}/{days}", username=username)]
+
+    with patch.object(api, 'get_plex_instance',
+                      side_effect=lambda user=None: (user.title if user else "main", plex)), \
+            patch.object(api, '_process_ondeck_video', side_effect=process):
+        return api, api.get_on_deck_media([1, 2], 30, 3, True, [], **kwargs)
+
+
+class TestOnDeckEngine:
+
+    def test_matches_threaded_engine(self):
+        _, threaded = _ondeck("threads", per_user_days={"bob": 7})
+        _, concurrent = _ondeck("async", per_user_days={"bob": 7})
+        assert sorted(i.file_path for i in concurrent) == sorted(i.file_path for i in threaded)
+        assert len(concurrent) == 3 * 2 * 3  # users x sections x videos
+        assert "/bob/video-1-0/7" in {i.file_path for i in concurrent}
+
+    def test_section_failure_marks_main_incomplete(self):
+        api = _manager("async")
+        plex = _plex_instance([1])
+        plex.library.sectionByID.side_effect = RuntimeError("boom")
+        with patch.object(api, 'get_plex_instance', return_value=("main", plex)):
+            items = AsyncPlexFetcher(api).fetch_on_deck([None], [1], {"main": 30}, 3)
+        assert items == []
+        assert api.is_ondeck_data_complete() is False
+
+
+class TestWatchlistEngine:
+
+    def _fetch(self, engine):
+        api = _manager(engine)
+        api.plex = MagicMock()
+        api.plex.library.sections.return_value = [MagicMock(key=1)]
+        account = MagicMock()
+
+        def get_account(user, skip):
+            return (user.title if user else "main"), account
+
+        def process_item(acct, item, username, sections, episodes):
+            yield (f"/{username}/{item}", username, None, None, None, "movie")
+
+        with patch.object(api, '_get_watchlist_account', side_effect=get_account), \
+                patch.object(api, '_fetch_account_watchlist', return_value=["a", "b"]), \
+                patch.object(api, '_process_watchlist_item', side_effect=process_item):
+            return list(api.get_watchlist_media([1], 3, True, [], home_users=["alice"]))
+
+    def test_matches_threaded_engine(self):
+        threaded = self._fetch("threads")
+        concurrent = self._fetch("async")
+        assert sorted(concurrent) == sorted(threaded)
+        assert {t[0] for t in concurrent} == {"/main/a", "/main/b", "/alice/a", "/alice/b"}
+
+    def test_skipped_user_yields_nothing(self):
+        api = _manager("async")
+        with patch.object(api, '_get_watchlist_account', return_value=("bob", None)):
+            assert AsyncPlexFetcher(api).fetch_watchlist([UserProxy("bob")], 3, ["bob"], None, [1]) == []
+
+
+class TestConcurrencyLimits:
+
+    def test_host_limit_bounds_in_flight_calls(self):
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def slow_call():
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+
+        fetcher = AsyncPlexFetcher(MagicMock(), global_limit=8, host_limits={"plex": 3})
+
+        async def run_many():
+            import asyncio
+            await asyncio.gather(*(fetcher._call("plex", slow_call) for _ in range(12)))
+
+        fetcher._run(run_many())
+        assert peak == 3
+
+
+@pytest.mark.parametrize("value,expected", [
+    ("async", "async"), ("THREADS", "threads"), (None, "threads"), ("bogus", "threads"),
+])
+def test_normalize_fetch_engine(value, expected):
+    assert normalize_fetch_engine(value) == expected
@@ -28,11 +28,13 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from core.plex_db import (
     fetch_on_deck_from_db,
+    fetch_all_on_deck_from_db,
+    PlexDBUnavailable,
+    PlexDBSnapshot,
     _connect,
     _resolve_account_ids,
     _fetch_tv_on_deck,
     _fetch_movie_on_deck,
-    _resolve_file_path,
 )
 
 
@@ -300,6 +302,40 @@ class TestTvOnDeck:
         items = _fetch_tv_on_deck(db_conn, 100, "SharedUser", [], cutoff, 3)
         assert len(items) == 0
 
+    def test_single_query_for_all_shows(self, db_conn):
+        """Every show and its file paths resolve in one statement (no per-show N+1)."""
+        db_conn.execute("INSERT INTO metadata_items (id, metadata_type, title, parent_id, \"index\", guid, library_section_id) VALUES (2, 2, 'Other Show', NULL, NULL, 'plex://show/2', 1)")
+        db_conn.execute("INSERT INTO metadata_items (id, metadata_type, title, parent_id, \"index\", guid, library_section_id) VALUES (30, 3, 'Season 1', 2, 1, 'plex://season/30', 1)")
+        for ep in range(1, 4):
+            db_conn.execute(
+                "INSERT INTO metadata_items (id, metadata_type, title, parent_id, \"index\", guid, library_section_id) VALUES (?, 4, ?, 30, ?, ?, 1)",
+                (300 + ep, f"S01E{ep:02d}", ep, f"plex://episode/{300 + ep}")
+            )
+            db_conn.execute("INSERT INTO media_items (id, metadata_item_id) VALUES (?, ?)", (1300 + ep, 300 + ep))
+            db_conn.execute("INSERT INTO media_parts (id, media_item_id, file) VALUES (?, ?, ?)",
+                            (2300 + ep, 1300 + ep, f"/data/TV/Other Show/S01E{ep:02d}.mkv"))
+        now = datetime.now()
+        for title, episode, minutes_ago in (('Test Show', 3, 5), ('Other Show', 1, 1)):
+            db_conn.execute(
+                "INSERT INTO metadata_item_views (account_id, grandparent_title, parent_index, \"index\", title, viewed_at, library_section_id) VALUES (100, ?, 1, ?, 'ep', ?, 1)",
+                (title, episode, (now - timedelta(minutes=minutes_ago)).strftime("%Y-%m-%d %H:%M:%S"))
+            )
+        db_conn.commit()
+
+        statements = []
+        db_conn.set_trace_callback(statements.append)
+        items = _fetch_tv_on_deck(db_conn, 100, "SharedUser", [1], now - timedelta(days=30), 5)
+        db_conn.set_trace_callback(None)
+
+        assert len(statements) == 1
+        # Most recently watched show first; Other Show runs out after S01E03
+        assert [i.file_path for i in items][:3] == [
+            "/data/TV/Other Show/S01E02.mkv", "/data/TV/Other Show/S01E03.mkv",
+            "/data/TV/Test Show/Season 1/S01E04.mkv",
+        ]
+        assert [i.is_current_ondeck for i in items].count(True) == 2
+        assert len(items) == 2 + 6
+
 
 class TestMovieOnDeck:
     """Test partially watched movie detection from the database."""
@@ -331,20 +367,6 @@ class TestMovieOnDeck:
         assert len(items) == 0
 
 
-class TestFilePathResolution:
-    """Test metadata_item_id → file path resolution."""
-
-    def test_resolve_existing(self, db_conn):
-        """Resolve a known metadata item to its file path."""
-        path = _resolve_file_path(db_conn, 101)  # S01E01
-        assert path == "/data/TV/Test Show/Season 1/S01E01.mkv"
-
-    def test_resolve_nonexistent(self, db_conn):
-        """Non-existent metadata item returns None."""
-        path = _resolve_file_path(db_conn, 99999)
-        assert path is None
-
-
 class TestFetchOnDeckFromDb:
     """Integration tests for the main public function."""
 
@@ -471,3 +493,212 @@ class TestFetchOnDeckFromDb:
         # rating_key should be the metadata_item_id as string
         assert items[0].rating_key is not None
         assert items[0].rating_key == "102"  # S01E02 metadata_item_id
+
+
+def _add_view(db_path, account_id, season, episode):
+    now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        "INSERT INTO metadata_item_views (account_id, grandparent_title, parent_index, \"index\", title, viewed_at, library_section_id) VALUES (?, 'Test Show', ?, ?, 'ep', ?, 1)",
+        (account_id, season, episode, now)
+    )
+    conn.commit()
+    conn.close()
+
+
+class TestFetchAllOnDeckFromDb:
+    """DB-primary OnDeck: every user including the server owner, strict errors."""
+
+    def test_includes_server_owner(self, db_path):
+        conn = sqlite3.connect(db_path)
+        conn.execute("INSERT INTO accounts (id, name) VALUES (1, 'Owner')")
+        conn.commit()
+        conn.close()
+        _add_view(db_path, 1, 1, 2)
+        _add_view(db_path, 100, 2, 1)
+
+        items = fetch_all_on_deck_from_db(
+            db_path=db_path, usernames=["SharedUser"], valid_sections=[1],
+            days_to_monitor=30, number_episodes=0, user_id_map={},
+        )
+
+        paths = {(i.username, i.file_path) for i in items}
+        assert ("Owner", "/data/TV/Test Show/Season 1/S01E03.mkv") in paths
+        assert ("SharedUser", "/data/TV/Test Show/Season 2/S02E02.mkv") in paths
+
+    def test_empty_valid_sections_means_all_libraries(self, db_path):
+        conn = sqlite3.connect(db_path)
+        conn.execute("CREATE TABLE library_sections (id INTEGER PRIMARY KEY, name TEXT)")
+        conn.execute("INSERT INTO library_sections (id, name) VALUES (1, 'TV'), (2, 'Movies')")
+        conn.commit()
+        conn.close()
+        _add_view(db_path, 100, 1, 1)
+
+        items = fetch_all_on_deck_from_db(
+            db_path=db_path, usernames=["SharedUser"], valid_sections=[],
+            days_to_monitor=30, number_episodes=0, user_id_map={"SharedUser": 100},
+            include_main=False,
+        )
+        assert {i.file_path for i in items} == {
+            "/data/TV/Test Show/Season 1/S01E02.mkv", "/data/Movies/Movie 500.mkv",
+        }
+
+    def test_schema_mismatch_raises(self, db_path):
+        conn = sqlite3.connect(db_path)
+        conn.execute("DROP TABLE metadata_item_views")
+        conn.commit()
+        conn.close()
+        with pytest.raises(PlexDBUnavailable):
+            fetch_all_on_deck_from_db(
+                db_path=db_path, usernames=[], valid_sections=[1],
+                days_to_monitor=30, number_episodes=1, user_id_map={},
+            )
+
+    def test_missing_db_raises(self):
+        with pytest.raises(PlexDBUnavailable):
+            fetch_all_on_deck_from_db(
+                db_path="/nonexistent/db.sqlite", usernames=[], valid_sections=[1],
+                days_to_monitor=30, number_episodes=1, user_id_map={},
+            )
+
+
+class TestDbPrimaryOnDeckMode:
+    """PlexManager.get_on_deck_media with ondeck_source "db" / "verify"."""
+
+    def _manager(self, source, db_path):
+        import threading
+        from core.plex_api import PlexManager
+        api = PlexManager.__new__(PlexManager)
+        api.plex_token = "main-token"
+        api.fetch_engine = "threads"
+        api.ondeck_source = source
+        api._plex_db_path = db_path
+        api.plex_db_snapshot = False
+        api._db_snapshot = None
+        api._token_lock = threading.Lock()
+        api._user_tokens = {}
+        api._user_is_home = {"SharedUser": False}
+        api._user_account_ids = {"SharedUser": 100}
+        api._ondeck_data_complete = True
+        return api
+
+    def test_db_mode_skips_api(self, db_path):
+        from unittest.mock import patch
+        _add_view(db_path, 100, 1, 1)
+        api = self._manager("db", db_path)
+        with patch.object(api, '_fetch_on_deck_via_api') as mock_api:
+            items = api.get_on_deck_media([1, 2], 30, 0, True, [])
+        mock_api.assert_not_called()
+        assert {i.username for i in items} == {"SharedUser"}
+
+    def test_db_mode_falls_back_to_api_on_db_error(self, db_path):
+        from unittest.mock import patch
+        from core.plex_api import OnDeckItem
+        conn = sqlite3.connect(db_path)
+        conn.execute("DROP TABLE metadata_item_settings")
+        conn.commit()
+        conn.close()
+        api = self._manager("db", db_path)
+        api_items = [OnDeckItem(file_path="/api/file.mkv", username="main")]
+        with patch.object(api, '_fetch_on_deck_via_api', return_value=api_items):
+            items = api.get_on_deck_media([1, 2], 30, 0, True, [])
+        assert items == api_items
+
+    def test_verify_mode_uses_api_and_logs_diff(self, db_path, caplog):
+        import logging
+        from unittest.mock import patch
+        from core.plex_api import OnDeckItem
+        _add_view(db_path, 100, 1, 1)
+        api = self._manager("verify", db_path)
+        api_items = [
+            OnDeckItem(file_path="/data/TV/Test Show/Season 1/S01E02.mkv", username="SharedUser"),
+            OnDeckItem(file_path="/api/only.mkv", username="SharedUser"),
+        ]
+        with patch.object(api, '_fetch_on_deck_via_api', return_value=api_items), \
+                caplog.at_level(logging.INFO):
+            items = api.get_on_deck_media([1, 2], 30, 0, True, [])
+        assert items == api_items
+        assert any("1 items match, 1 only in DB, 1 only in API" in r.message for r in caplog.records)
+
+    def test_snapshot_mode_queries_copy_and_cleans_up(self, db_path, tmp_path):
+        from unittest.mock import patch
+        _add_view(db_path, 100, 1, 1)
+        api = self._manager("db", db_path)
+        api.plex_db_snapshot = True
+        mkstemp = tempfile.mkstemp
+        with patch("core.plex_db.tempfile.mkstemp",
+                   side_effect=lambda **kw: mkstemp(prefix="snap-", dir=str(tmp_path))), \
+                patch.object(PlexDBSnapshot, "_take", autospec=True,
+                             side_effect=PlexDBSnapshot._take) as mock_take:
+            items = api.get_on_deck_media([1, 2], 30, 0, True, [])
+        assert mock_take.call_count == 1
+        assert {i.username for i in items} == {"SharedUser"}
+        assert api._db_snapshot is None
+        assert not list(tmp_path.glob("snap-*"))
+
+
+class TestReadOnlyConnections:
+    """Live read-only connections and per-run snapshots."""
+
+    def test_live_connection_is_read_only(self, db_path):
+        conn = _connect(db_path)
+        try:
+            with pytest.raises(sqlite3.OperationalError):
+                conn.execute("DELETE FROM accounts")
+            assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+        finally:
+            conn.close()
+
+    def test_path_needing_uri_escaping(self, tmp_path):
+        path = tmp_path / "Plex Media Server?#" / "library.db"
+        path.parent.mkdir()
+        sqlite3.connect(str(path)).close()
+        conn = _connect(str(path))
+        try:
+            assert conn.execute("SELECT 1").fetchone()[0] == 1
+        finally:
+            conn.close()
+
+    def test_snapshot_is_point_in_time_copy(self, db_path, tmp_path):
+        with PlexDBSnapshot(db_path, temp_dir=str(tmp_path)) as snapshot:
+            conn = snapshot.connection()
+            assert snapshot.connection() is conn
+            copy_path = snapshot._copy_path
+            assert copy_path != db_path and os.path.isfile(copy_path)
+
+            # Writes to the live database after the snapshot aren't visible
+            live = sqlite3.connect(db_path)
+            live.execute("INSERT INTO accounts (id, name) VALUES (999, 'Later')")
+            live.commit()
+            live.close()
+            names = {row["name"] for row in conn.execute("SELECT name FROM accounts")}
+            assert "Later" not in names
+            assert "SharedUser" in names
+        assert not os.path.exists(copy_path)
+
+    def test_snapshot_shared_across_users_and_calls(self, db_path, tmp_path):
+        _add_view(db_path, 100, 1, 1)
+        _add_view(db_path, 200, 2, 1)
+        with PlexDBSnapshot(db_path, temp_dir=str(tmp_path)) as snapshot:
+            first = fetch_on_deck_from_db(
+                db_path=db_path, usernames=["SharedUser", "AnotherUser"], valid_sections=[1],
+                days_to_monitor=30, number_episodes=0,
+                user_id_map={"SharedUser": 100, "AnotherUser": 200}, snapshot=snapshot,
+            )
+            # The fetch didn't close the run's connection
+            second = fetch_all_on_deck_from_db(
+                db_path=db_path, usernames=["SharedUser"], valid_sections=[1],
+                days_to_monitor=30, number_episodes=0,
+                user_id_map={"SharedUser": 100}, include_main=False, snapshot=snapshot,
+            )
+        assert {i.username for i in first} == {"SharedUser", "AnotherUser"}
+        assert [i.file_path for i in second] == ["/data/TV/Test Show/Season 1/S01E02.mkv"]
+
+    def test_snapshot_failure_raises_unavailable(self, tmp_path):
+        snapshot = PlexDBSnapshot(str(tmp_path / "missing.db"), temp_dir=str(tmp_path))
+        with pytest.raises(PlexDBUnavailable):
+            fetch_all_on_deck_from_db(
+                db_path="", usernames=[], valid_sections=[1],
+                days_to_monitor=30, number_episodes=1, user_id_map={}, snapshot=snapshot,
+            )
+        assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,104 @@
+"""Tests for the shared plex.tv rate limiter.
+
+Source: core/rate_limiter.py — token bucket pacing, per-endpoint 429
+backoff, Retry-After parsing, and adaptive rate recovery.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+# conftest.py handles fcntl/apscheduler mocking and path setup
+from core.rate_limiter import (
+    PlexTvRateLimiter, parse_retry_after, is_rate_limited_error, MIN_RATE,
+)
+
+
+class FakeClock:
+    """Drives time.monotonic/time.sleep so waits are instant and observable."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    fake = FakeClock()
+    with patch('core.rate_limiter.time.monotonic', fake.monotonic), \
+            patch('core.rate_limiter.time.sleep', fake.sleep):
+        yield fake
+
+
+class TestTokenBucket:
+
+    def test_burst_passes_without_waiting(self, clock):
+        limiter = PlexTvRateLimiter(rate=1.0, burst=3)
+        for _ in range(3):
+            assert limiter.acquire() == 0
+        assert clock.sleeps == []
+
+    def test_paces_after_burst(self, clock):
+        limiter = PlexTvRateLimiter(rate=2.0, burst=1)
+        limiter.acquire()
+        assert limiter.acquire() == pytest.approx(0.5)
+        assert limiter.get_stats()["wait_seconds"] == pytest.approx(0.5)
+
+
+class TestEndpointBackoff:
+
+    def test_retry_after_blocks_only_that_endpoint(self, clock):
+        limiter = PlexTvRateLimiter(rate=10.0, burst=10)
+        assert limiter.record_rate_limited("watchlist", retry_after=30) == 30
+
+        assert limiter.acquire("rss") == 0
+        assert limiter.acquire("watchlist") == pytest.approx(30)
+
+    def test_exponential_backoff_without_retry_after(self, clock):
+        limiter = PlexTvRateLimiter()
+        assert limiter.record_rate_limited("watchlist") == 2
+        assert limiter.record_rate_limited("watchlist") == 4
+        limiter.record_success("watchlist")
+        assert limiter.record_rate_limited("watchlist") == 2
+
+    def test_rate_halves_on_429_and_recovers(self, clock):
+        limiter = PlexTvRateLimiter(rate=1.0)
+        for _ in range(10):
+            limiter.record_rate_limited("account", retry_after=0)
+        assert limiter.rate == MIN_RATE
+
+        for _ in range(100):
+            limiter.record_success("account")
+        assert limiter.rate == 1.0
+
+
+class TestRetryAfter:
+
+    def test_parses_seconds_and_http_date(self):
+        assert parse_retry_after("12") == 12
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after(None) is None
+
+    def test_captured_from_hook_for_plexapi_errors(self):
+        limiter = PlexTvRateLimiter()
+        limiter.observe_response(SimpleNamespace(status_code=429, headers={"Retry-After": "7"}))
+        error = Exception("(429) too_many_requests; https://plex.tv/api")
+        assert is_rate_limited_error(error)
+        assert limiter.retry_after_for(error) == 7
+        assert limiter.retry_after_for(error) is None  # consumed
+
+    def test_read_from_requests_error_response(self):
+        limiter = PlexTvRateLimiter()
+        error = Exception("rate limited")
+        error.response = SimpleNamespace(status_code=429, headers={"Retry-After": "3"})
+        assert is_rate_limited_error(error)
+        assert limiter.retry_after_for(error) == 3
@@ -455,3 +455,109 @@ class TestFetchItemRetryOnTimeout:
         # retry logic under test.
         assert calls["n"] == 1
         assert resolved == []
+
+
+class BatchPlexServer(FakePlexServer):
+    """FakePlexServer plus the comma-separated /library/metadata/{k1,k2} form."""
+
+    def __init__(self, items):
+        super().__init__(items)
+        self.batch_keys = []
+        self.single_keys = []
+
+    def fetchItems(self, ekey):
+        keys = ekey.rsplit("/", 1)[1].split(",")
+        self.batch_keys.append(keys)
+        found = []
+        for key in keys:
+            item = self._items.get(int(key))
+            if item is not None:
+                item.ratingKey = int(key)
+                found.append(item)
+        return found
+
+    def fetchItem(self, key):
+        self.single_keys.append(key)
+        return super().fetchItem(key)
+
+
+class CountingShow(FakeShow):
+    def __init__(self, title, seasons, updated, leaf_count):
+        super().__init__(title, seasons)
+        self.updatedAt = updated
+        self.leafCount = leaf_count
+        self.childCount = len(seasons)
+        self.season_calls = 0
+
+    def seasons(self):
+        self.season_calls += 1
+        return super().seasons()
+
+
+class TestBatchedFetchAndPathCache:
+
+    def _show(self, leaf_count=1, updated=None):
+        from datetime import datetime
+        return CountingShow(
+            "Severance",
+            [FakeSeason("S1", [FakeEpisode("E1", [FakeMedia("1080", "/plex/Sev/S01E01.mkv")])])],
+            updated or datetime(2026, 1, 1), leaf_count,
+        )
+
+    def test_pins_fetched_in_one_batch_in_pin_order(self, tracker):
+        movie = FakeMovie("Heat", [FakeMedia("1080", "/plex/Heat.mkv")])
+        show = self._show()
+        server = BatchPlexServer({100: movie, 200: show})
+        tracker.add_pin("100", "movie", "Heat")
+        tracker.add_pin("200", "show", "Severance")
+
+        resolved, orphaned = resolve_pins_to_paths(server, tracker, "highest")
+
+        assert server.batch_keys == [["100", "200"]]
+        assert server.single_keys == []
+        assert [r[0] for r in resolved] == ["/plex/Heat.mkv", "/plex/Sev/S01E01.mkv"]
+        assert orphaned == []
+
+    def test_item_missing_from_batch_is_confirmed_and_orphaned(self, tracker, monkeypatch):
+        import plexapi.exceptions
+        monkeypatch.setattr(plexapi.exceptions, "NotFound", FakeNotFound)
+        server = BatchPlexServer({100: FakeMovie("Heat", [FakeMedia("1080", "/plex/Heat.mkv")])})
+        tracker.add_pin("100", "movie", "Heat")
+        tracker.add_pin("999", "movie", "Gone")
+
+        resolved, orphaned = resolve_pins_to_paths(server, tracker, "highest")
+
+        assert server.single_keys == [999]
+        assert orphaned == ["999"]
+        assert len(resolved) == 1
+
+    def test_unchanged_show_reuses_cached_paths(self, tracker):
+        show = self._show()
+        server = BatchPlexServer({200: show})
+        tracker.add_pin("200", "show", "Severance")
+
+        first, _ = resolve_pins_to_paths(server, tracker, "highest")
+        second, _ = resolve_pins_to_paths(server, tracker, "highest")
+
+        assert first == second
+        assert show.season_calls == 1
+
+    def test_cache_persists_and_invalidates_on_change(self, tracker):
+        from core.pinned_media import PinPathCache
+        show = self._show()
+        server = BatchPlexServer({200: show})
+        tracker.add_pin("200", "show", "Severance")
+        resolve_pins_to_paths(server, tracker, "highest")
+
+        # New process: cache comes back from disk
+        resolve_pins_to_paths(server, tracker, "highest", PinPathCache.for_tracker(tracker))
+        assert show.season_calls == 1
+
+        # Episode added -> leafCount changes -> re-expanded
+        show.leafCount = 2
+        resolve_pins_to_paths(server, tracker, "highest")
+        assert show.season_calls == 2
+
+        # Different preference -> re-expanded
+        resolve_pins_to_paths(server, tracker, "lowest")
+        assert show.season_calls == 3
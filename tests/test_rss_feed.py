@@ -0,0 +1,173 @@
+"""Tests for the remote-watchlist RSS feed fetch.
+
+Source: core/plex_api.py — PlexManager._fetch_rss_titles conditional GET
+(ETag/Last-Modified, 304 reuse), streaming parse, and cache rewrites.
+"""
+
+import gzip
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# conftest.py handles fcntl/apscheduler mocking and path setup
+from core import http_sessions
+from core.plex_api import PlexManager
+from core.rate_limiter import PlexTvRateLimiter
+
+FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"><channel><title>Watchlist</title>
+<item><title>Heat (1995)</title><category>movie</category>
+<pubDate>Mon, 06 Jan 2025 10:00:00 +0000</pubDate><author>abc123</author>
+<guid>imdb://tt0113277</guid></item>
+<item><title>Severance</title><category>show</category><guid>tvdb://371980</guid></item>
+</channel></rss>"""
+
+
+class _FeedHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    etag = '"v1"'
+    gzip = False
+    truncate = 0  # number of upcoming responses to cut off mid-body
+    requests = []
+
+    def do_GET(self):
+        type(self).requests.append(dict(self.headers))
+        if self.headers.get("If-None-Match") == self.etag:
+            self.send_response(304)
+            self.send_header("ETag", self.etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = gzip.compress(FEED) if self.gzip else FEED
+        self.send_response(200)
+        self.send_header("ETag", self.etag)
+        self.send_header("Last-Modified", "Mon, 06 Jan 2025 10:00:00 GMT")
+        if self.gzip:
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if type(self).truncate:
+            type(self).truncate -= 1
+            self.wfile.write(body[:len(body) // 2])
+            self.wfile.flush()
+            self.close_connection = True
+            return
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def unthrottled():
+    limiter = PlexTvRateLimiter(rate=1000, burst=1000)
+    with patch("core.plex_api.get_plextv_limiter", return_value=limiter):
+        yield
+
+
+@pytest.fixture
+def feed_url():
+    _FeedHandler.requests = []
+    _FeedHandler.etag = '"v1"'
+    _FeedHandler.gzip = False
+    _FeedHandler.truncate = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FeedHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/rss"
+    http_sessions.close_sessions()
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def manager(tmp_path):
+    api = PlexManager.__new__(PlexManager)
+    api._rss_cache_file = str(tmp_path / "rss_cache.json")
+    return api
+
+
+class TestConditionalGet:
+
+    def test_first_fetch_parses_and_stores_validators(self, manager, feed_url):
+        items = manager._fetch_rss_titles(feed_url)
+
+        assert [(t, c, a, g) for t, c, _, a, g in items] == [
+            ("Heat (1995)", "movie", "abc123", "imdb://tt0113277"),
+            ("Severance", "show", "", "tvdb://371980"),
+        ]
+        assert items[0][2].year == 2025 and items[1][2] is None
+        with open(manager._rss_cache_file) as f:
+            cache = json.load(f)
+        assert cache["etag"] == '"v1"'
+        assert cache["last_modified"] == "Mon, 06 Jan 2025 10:00:00 GMT"
+        assert "If-None-Match" not in _FeedHandler.requests[0]
+
+    def test_not_modified_reuses_cache_without_rewrite(self, manager, feed_url):
+        first = manager._fetch_rss_titles(feed_url)
+        mtime = os.stat(manager._rss_cache_file).st_mtime_ns
+
+        second = manager._fetch_rss_titles(feed_url)
+
+        assert second == first
+        assert _FeedHandler.requests[1]["If-None-Match"] == '"v1"'
+        assert _FeedHandler.requests[1]["If-Modified-Since"] == "Mon, 06 Jan 2025 10:00:00 GMT"
+        assert os.stat(manager._rss_cache_file).st_mtime_ns == mtime
+
+    def test_changed_feed_is_refetched(self, manager, feed_url):
+        manager._fetch_rss_titles(feed_url)
+        _FeedHandler.etag = '"v2"'
+        items = manager._fetch_rss_titles(feed_url)
+        assert len(items) == 2
+        with open(manager._rss_cache_file) as f:
+            assert json.load(f)["etag"] == '"v2"'
+
+    def test_validators_ignored_for_other_url(self, manager, feed_url):
+        manager._fetch_rss_titles(feed_url)
+        manager._fetch_rss_titles(feed_url + "?other")
+        assert "If-None-Match" not in _FeedHandler.requests[1]
+
+    def test_gzip_body_is_streamed(self, manager, feed_url):
+        _FeedHandler.gzip = True
+        assert len(manager._fetch_rss_titles(feed_url)) == 2
+
+
+class TestInterruptedBody:
+
+    def test_body_cut_off_is_retried(self, manager, feed_url):
+        _FeedHandler.truncate = 1
+        with patch("core.plex_api.time.sleep"):
+            items = manager._fetch_rss_titles(feed_url)
+        assert len(items) == 2
+        assert len(_FeedHandler.requests) == 2
+
+    def test_repeated_cut_off_falls_back_to_cache(self, manager, feed_url):
+        first = manager._fetch_rss_titles(feed_url)
+        _FeedHandler.etag = '"v2"'
+        _FeedHandler.truncate = 10
+        with patch("core.plex_api.time.sleep"):
+            assert manager._fetch_rss_titles(feed_url) == first
+
+
+class TestRssResolution:
+
+    def test_duplicate_guids_resolved_once(self, manager):
+        manager._user_id_to_name = {"a": "alice", "b": "bob"}
+        manager._fetch_rss_titles = MagicMock(return_value=[
+            ("Heat", "movie", None, "a", "imdb://tt0113277"),
+            ("Heat", "movie", None, "b", "imdb://tt0113277"),
+        ])
+        movie = MagicMock(TYPE="movie", title="Heat", ratingKey=10)
+        movie.media = [MagicMock(parts=[MagicMock(file="/movies/Heat.mkv")])]
+        manager.search_plex = MagicMock(return_value=movie)
+
+        results = list(manager._process_rss_watchlist("http://feed", "main", [1], 3))
+
+        manager.search_plex.assert_called_once()
+        assert [(r[0], r[1]) for r in results] == [("/movies/Heat.mkv", "alice"),
+                                                   ("/movies/Heat.mkv", "bob")]
@@ -0,0 +1,350 @@
+"""Tests for the pluggable tracker state store.
+
+Source: core/state_store.py — JSON/SQLite backends, migration in both
+directions, per-key upserts, the read-only load_state() helper and the
+shared load_state_snapshot() cache.
+"""
+
+import json
+import os
+import sqlite3
+import time
+from unittest.mock import patch
+
+import pytest
+
+# conftest.py handles fcntl/apscheduler mocking and path setup
+from core.state_store import (
+    JournaledStateBackend,
+    JSONStateBackend,
+    SQLiteStateBackend,
+    STATE_DB_FILENAME,
+    clear_state_snapshots,
+    close_state_connections,
+    create_state_backend,
+    load_state,
+    load_state_snapshot,
+    normalize_state_backend,
+)
+from core.file_operations import CacheTimestampTracker, OnDeckTracker
+
+
+@pytest.fixture(autouse=True)
+def _close_connections():
+    """Drop cached sqlite connections so each test gets a fresh database."""
+    yield
+    close_state_connections()
+
+
+def _db_rows(db_path, namespace):
+    conn = sqlite3.connect(str(db_path))
+    try:
+        rows = conn.execute(
+            "SELECT key, value FROM state_entries WHERE namespace = ?", (namespace,)
+        ).fetchall()
+    finally:
+        conn.close()
+    return {k: json.loads(v) for k, v in rows}
+
+
+# ============================================================================
+# TestNormalizeStateBackend
+# ============================================================================
+
+class TestNormalizeStateBackend:
+    """Tests for normalize_state_backend() setting validation."""
+
+    def test_valid_values(self):
+        assert normalize_state_backend("json") == "json"
+        assert normalize_state_backend(" SQLite ") == "sqlite"
+
+    def test_invalid_falls_back_to_json(self):
+        assert normalize_state_backend("redis") == "json"
+        assert normalize_state_backend(None) == "json"
+
+    def test_factory_returns_matching_backend(self, tmp_path):
+        assert isinstance(create_state_backend(tmp_path / "a.json", "json"), JSONStateBackend)
+        assert isinstance(create_state_backend(tmp_path / "a.json", "sqlite"), SQLiteStateBackend)
+
+
+# ============================================================================
+# TestSQLiteStateBackend
+# ============================================================================
+
+class TestSQLiteStateBackend:
+    """Tests for row-per-key persistence and JSON migration."""
+
+    def test_imports_existing_json_once(self, tmp_path):
+        """First load imports the JSON file; the JSON file is left in place."""
+        json_file = tmp_path / "timestamps.json"
+        json_file.write_text(json.dumps({"/a.mkv": {"cached_at": "x"}}), encoding="utf-8")
+
+        backend = SQLiteStateBackend(str(json_file), "timestamp")
+        assert backend.load() == {"/a.mkv": {"cached_at": "x"}}
+        assert json_file.exists()
+
+        # Later edits to the JSON file are not re-imported
+        json_file.write_text(json.dumps({"/b.mkv": {}}), encoding="utf-8")
+        assert backend.load() == {"/a.mkv": {"cached_at": "x"}}
+
+    def test_missing_json_starts_empty(self, tmp_path):
+        backend = SQLiteStateBackend(str(tmp_path / "ondeck_tracker.json"), "OnDeck")
+        assert backend.load() == {}
+        assert (tmp_path / STATE_DB_FILENAME).exists()
+
+    def test_per_key_upsert_and_delete(self, tmp_path):
+        """Only the listed keys are written; keys missing from data are deleted."""
+        backend = SQLiteStateBackend(str(tmp_path / "timestamps.json"), "timestamp")
+        backend.load()
+        backend.save({"/a": 1, "/b": 2})
+
+        # "/b" changed in memory but is not listed, so the DB keeps the old value
+        backend.save({"/b": 99, "/c": 3}, ["/a", "/c"])
+
+        assert _db_rows(tmp_path / STATE_DB_FILENAME, "timestamps") == {"/b": 2, "/c": 3}
+
+    def test_full_save_replaces_namespace(self, tmp_path):
+        backend = SQLiteStateBackend(str(tmp_path / "timestamps.json"), "timestamp")
+        backend.load()
+        backend.save({"/a": 1, "/b": 2})
+        backend.save({"/c": 3})
+        assert backend.load() == {"/c": 3}
+
+    def test_namespaces_are_isolated(self, tmp_path):
+        ts = SQLiteStateBackend(str(tmp_path / "timestamps.json"), "timestamp")
+        od = SQLiteStateBackend(str(tmp_path / "ondeck_tracker.json"), "OnDeck")
+        ts.load()
+        od.load()
+        ts.save({"/a": 1})
+        od.save({"/b": 2})
+        assert ts.load() == {"/a": 1}
+        assert od.load() == {"/b": 2}
+
+
+# ============================================================================
+# TestReverseMigration
+# ============================================================================
+
+class TestReverseMigration:
+    """Switching back to json exports the database rows to the JSON file."""
+
+    def test_json_backend_exports_db_state(self, tmp_path):
+        json_file = tmp_path / "timestamps.json"
+        json_file.write_text(json.dumps({"/old.mkv": {}}), encoding="utf-8")
+
+        sqlite_backend = SQLiteStateBackend(str(json_file), "timestamp")
+        data = sqlite_backend.load()
+        data["/new.mkv"] = {"cached_at": "y"}
+        sqlite_backend.save(data, ["/new.mkv"])
+
+        json_backend = JSONStateBackend(str(json_file), "timestamp")
+        expected = {"/old.mkv": {}, "/new.mkv": {"cached_at": "y"}}
+        assert json_backend.load() == expected
+        assert json.loads(json_file.read_text(encoding="utf-8")) == expected
+        assert _db_rows(tmp_path / STATE_DB_FILENAME, "timestamps") == {}
+
+        # A later switch to sqlite imports the JSON file again
+        assert SQLiteStateBackend(str(json_file), "timestamp").load() == expected
+
+
+# ============================================================================
+# TestTrackersWithSQLiteBackend
+# ============================================================================
+
+class TestTrackersWithSQLiteBackend:
+    """Trackers round-trip through the sqlite backend."""
+
+    def test_timestamp_tracker_round_trip(self, tmp_path):
+        ts_file = str(tmp_path / "timestamps.json")
+        tracker = CacheTimestampTracker(ts_file, backend=create_state_backend(ts_file, "sqlite", "timestamp"))
+        tracker.record_cache_time("/mnt/cache/Movies/A.mkv", source="ondeck")
+        tracker.record_cache_time("/mnt/cache/Movies/B.mkv", source="watchlist")
+        tracker.remove_entry("/mnt/cache/Movies/A.mkv")
+
+        reloaded = CacheTimestampTracker(ts_file, backend=create_state_backend(ts_file, "sqlite", "timestamp"))
+        assert reloaded.get_source("/mnt/cache/Movies/B.mkv") == "watchlist"
+        assert "/mnt/cache/Movies/A.mkv" not in _db_rows(tmp_path / STATE_DB_FILENAME, "timestamps")
+        assert not (tmp_path / "timestamps.json").exists()
+
+    def test_ondeck_tracker_round_trip(self, tmp_path):
+        od_file = str(tmp_path / "ondeck_tracker.json")
+        tracker = OnDeckTracker(od_file, backend=create_state_backend(od_file, "sqlite", "OnDeck"))
+        tracker.update_entry("/data/TV/Show/S01E01.mkv", "alice", episode_info={"show": "Show"})
+
+        reloaded = OnDeckTracker(od_file, backend=create_state_backend(od_file, "sqlite", "OnDeck"))
+        assert reloaded.get_entry("/data/TV/Show/S01E01.mkv")["users"] == ["alice"]
+
+
+# ============================================================================
+# TestLoadState
+# ============================================================================
+
+class TestLoadState:
+    """Tests for the read-only load_state() helper used by the web UI."""
+
+    def test_missing_file_returns_empty(self, tmp_path):
+        assert load_state(tmp_path / "timestamps.json") == {}
+
+    def test_corrupt_json_returns_empty(self, tmp_path):
+        json_file = tmp_path / "timestamps.json"
+        json_file.write_text("{not json", encoding="utf-8")
+        assert load_state(json_file) == {}
+
+    def test_reads_sqlite_state(self, tmp_path):
+        json_file = tmp_path / "watchlist_tracker.json"
+        backend = SQLiteStateBackend(str(json_file), "watchlist")
+        backend.load()
+        backend.save({"/data/a.mkv": {"users": ["bob"]}})
+        assert load_state(json_file, "sqlite") == {"/data/a.mkv": {"users": ["bob"]}}
+
+
+# ============================================================================
+# TestJournaledStateBackend
+# ============================================================================
+
+class TestJournaledStateBackend:
+    """Write-behind journal: append on save, compact on demand, replay on load."""
+
+    def _make(self, tmp_path, **kwargs):
+        inner = JSONStateBackend(str(tmp_path / "timestamps.json"), "timestamp")
+        return JournaledStateBackend(inner, **kwargs)
+
+    def test_per_key_saves_go_to_journal(self, tmp_path):
+        backend = self._make(tmp_path)
+        backend.load()
+        data = {"/a": {"source": "ondeck"}}
+        backend.save(data, ["/a"])
+
+        assert not (tmp_path / "timestamps.json").exists()
+        lines = (tmp_path / "timestamps.json.journal").read_text(encoding="utf-8").splitlines()
+        assert [json.loads(l) for l in lines] == [{"k": "/a", "v": {"source": "ondeck"}}]
+
+    def test_compact_writes_snapshot_and_removes_journal(self, tmp_path):
+        backend = self._make(tmp_path)
+        backend.load()
+        data = {"/a": 1, "/b": 2}
+        backend.save(data, ["/a", "/b"])
+        del data["/a"]
+        backend.save(data, ["/a"])
+
+        assert backend.compact(data) is True
+        assert json.loads((tmp_path / "timestamps.json").read_text(encoding="utf-8")) == {"/b": 2}
+        assert not (tmp_path / "timestamps.json.journal").exists()
+        assert backend.compactions == 1
+
+    def test_size_threshold_triggers_compaction(self, tmp_path):
+        backend = self._make(tmp_path, compact_bytes=64)
+        backend.load()
+        data = {}
+        for i in range(10):
+            data[f"/file{i}.mkv"] = {"cached_at": "2025-01-01T00:00:00"}
+            backend.save(data, [f"/file{i}.mkv"])
+
+        assert backend.compactions >= 1
+        snapshot = json.loads((tmp_path / "timestamps.json").read_text(encoding="utf-8"))
+        assert len(snapshot) >= 1
+
+    def test_load_replays_leftover_journal(self, tmp_path):
+        """A journal left by a crashed run is applied and folded into the snapshot."""
+        (tmp_path / "timestamps.json").write_text(json.dumps({"/a": 1, "/b": 2}), encoding="utf-8")
+        (tmp_path / "timestamps.json.journal").write_text(
+            '{"k":"/c","v":3}\n{"k":"/a"}\n{"k":"/b","v":', encoding="utf-8"  # torn last line
+        )
+
+        assert self._make(tmp_path).load() == {"/b": 2, "/c": 3}
+        assert json.loads((tmp_path / "timestamps.json").read_text(encoding="utf-8")) == {"/b": 2, "/c": 3}
+        assert not (tmp_path / "timestamps.json.journal").exists()
+
+    def test_failed_compaction_keeps_journal(self, tmp_path):
+        backend = self._make(tmp_path)
+        backend.load()
+        data = {"/a": 1}
+        backend.save(data, ["/a"])
+        with patch.object(backend.inner, "save", return_value=False):
+            assert backend.compact(data) is False
+        assert (tmp_path / "timestamps.json.journal").exists()
+
+    def test_load_state_overlays_journal(self, tmp_path):
+        """Web readers see journaled changes without consuming the journal."""
+        backend = self._make(tmp_path)
+        backend.load()
+        backend.save({"/a": 1}, None)
+        backend.save({"/a": 1, "/b": 2}, ["/b"])
+
+        assert load_state(tmp_path / "timestamps.json") == {"/a": 1, "/b": 2}
+        assert (tmp_path / "timestamps.json.journal").exists()
+
+    def test_tracker_flush_compacts(self, tmp_path):
+        ts_file = str(tmp_path / "timestamps.json")
+        backend = JournaledStateBackend(create_state_backend(ts_file, "json", "timestamp"))
+        tracker = CacheTimestampTracker(ts_file, backend=backend)
+        tracker.record_cache_time("/mnt/cache/Movies/A.mkv", source="ondeck")
+        assert not (tmp_path / "timestamps.json").exists()
+
+        tracker.flush()
+
+        snapshot = json.loads((tmp_path / "timestamps.json").read_text(encoding="utf-8"))
+        assert snapshot["/mnt/cache/Movies/A.mkv"]["source"] == "ondeck"
+        assert CacheTimestampTracker(ts_file).get_source("/mnt/cache/Movies/A.mkv") == "ondeck"
+
+
+def _write_old(path, data):
+    """Write JSON and backdate its mtime so the snapshot is cacheable."""
+    path.write_text(json.dumps(data), encoding="utf-8")
+    past = time.time() - 60
+    os.utime(path, (past, past))
+
+
+class TestLoadStateSnapshot:
+    """Each file version is parsed once and shared as a read-only view."""
+
+    @pytest.fixture(autouse=True)
+    def _clear(self):
+        clear_state_snapshots()
+        yield
+        clear_state_snapshots()
+
+    def test_parsed_once_until_file_changes(self, tmp_path):
+        path = tmp_path / "timestamps.json"
+        _write_old(path, {"/a": 1})
+
+        with patch("core.state_store.load_state", wraps=load_state) as load:
+            first = load_state_snapshot(str(path))
+            second = load_state_snapshot(str(path))
+            assert first is second
+            assert load.call_count == 1
+
+            _write_old(path, {"/a": 1, "/b": 2})
+            assert dict(load_state_snapshot(str(path))) == {"/a": 1, "/b": 2}
+            assert load.call_count == 2
+
+    def test_view_is_read_only(self, tmp_path):
+        path = tmp_path / "timestamps.json"
+        _write_old(path, {"/a": 1})
+        view = load_state_snapshot(str(path))
+        with pytest.raises(TypeError):
+            view["/b"] = 2
+
+    def test_recently_modified_file_is_not_cached(self, tmp_path):
+        path = tmp_path / "timestamps.json"
+        path.write_text(json.dumps({"/a": 1}), encoding="utf-8")
+
+        with patch("core.state_store.load_state", wraps=load_state) as load:
+            load_state_snapshot(str(path))
+            load_state_snapshot(str(path))
+        assert load.call_count == 2
+
+    def test_journal_change_invalidates(self, tmp_path):
+        path = tmp_path / "timestamps.json"
+        _write_old(path, {"/a": 1})
+        assert dict(load_state_snapshot(str(path))) == {"/a": 1}
+
+        journal = tmp_path / "timestamps.json.journal"
+        journal.write_text(json.dumps({"k": "/b", "v": 2}) + "\n", encoding="utf-8")
+        past = time.time() - 60
+        os.utime(journal, (past, past))
+
+        assert dict(load_state_snapshot(str(path))) == {"/a": 1, "/b": 2}
+
+    def test_missing_file_is_empty(self, tmp_path):
+        assert dict(load_state_snapshot(str(tmp_path / "missing.json"))) == {}
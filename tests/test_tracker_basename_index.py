@@ -0,0 +1,105 @@
+"""Tests for the JSONTracker basename index used by filename-fallback lookups.
+
+Source: core/file_operations.py — JSONTracker._find_entry_by_filename and
+the index maintenance in _load, update_entry, remove_entry, mark_cached
+and the cleanup methods.
+"""
+
+import json
+import time
+from datetime import datetime, timedelta
+
+# conftest.py handles fcntl/apscheduler mocking and path setup
+from core.file_operations import OnDeckTracker, WatchlistTracker
+
+
+def _write(path, data):
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+
+class TestBasenameIndex:
+    """Filename fallback resolves through the index and stays consistent."""
+
+    def test_load_builds_index(self, tmp_path):
+        tracker_file = tmp_path / "ondeck_tracker.json"
+        _write(tracker_file, {"/data/TV/Show/S01E01.mkv": {"users": ["alice"]}})
+        tracker = OnDeckTracker(str(tracker_file))
+
+        entry = tracker.get_entry("/mnt/cache/TV/Show/S01E01.mkv")
+        assert entry == {"users": ["alice"]}
+
+    def test_first_inserted_path_wins(self, tmp_path):
+        """Duplicate basenames resolve to the earliest entry, like the old scan."""
+        tracker_file = tmp_path / "ondeck_tracker.json"
+        _write(tracker_file, {
+            "/data/A/movie.mkv": {"users": ["first"]},
+            "/data/B/movie.mkv": {"users": ["second"]},
+        })
+        tracker = OnDeckTracker(str(tracker_file))
+
+        assert tracker.get_entry("/mnt/cache/movie.mkv")["users"] == ["first"]
+        tracker.remove_entry("/data/A/movie.mkv")
+        assert tracker.get_entry("/mnt/cache/movie.mkv")["users"] == ["second"]
+
+    def test_update_entry_indexes_new_paths(self, tmp_path):
+        tracker = WatchlistTracker(str(tmp_path / "watchlist_tracker.json"))
+        tracker.update_entry("/data/Movies/Film.mkv", "bob", datetime.now())
+
+        assert tracker.get_entry("/mnt/cache/Movies/Film.mkv")["users"] == ["bob"]
+
+    def test_mark_cached_uses_fallback(self, tmp_path):
+        tracker = OnDeckTracker(str(tmp_path / "ondeck_tracker.json"))
+        tracker.update_entry("/data/Movies/Film.mkv", "bob")
+        tracker.mark_cached("/mnt/cache/Movies/Film.mkv", "ondeck")
+
+        assert tracker.get_entry("/data/Movies/Film.mkv")["is_cached"] is True
+
+    def test_remove_entry_unindexes(self, tmp_path):
+        tracker = WatchlistTracker(str(tmp_path / "watchlist_tracker.json"))
+        tracker.update_entry("/data/Movies/Film.mkv", "bob", datetime.now())
+        tracker.remove_entry("/data/Movies/Film.mkv")
+
+        assert tracker.get_entry("/mnt/cache/Movies/Film.mkv") is None
+        assert tracker._basename_index == {}
+
+    def test_cleanup_stale_entries_unindexes(self, tmp_path):
+        tracker_file = tmp_path / "ondeck_tracker.json"
+        old = (datetime.now() - timedelta(days=30)).isoformat()
+        _write(tracker_file, {"/data/old.mkv": {"users": ["a"], "last_seen": old}})
+        tracker = OnDeckTracker(str(tracker_file))
+
+        assert tracker.cleanup_stale_entries() == 1
+        assert tracker.get_entry("/mnt/cache/old.mkv") is None
+
+    def test_cleanup_unseen_unindexes(self, tmp_path):
+        tracker_file = tmp_path / "ondeck_tracker.json"
+        _write(tracker_file, {"/data/gone.mkv": {"users": ["a"]}})
+        tracker = OnDeckTracker(str(tracker_file))
+        tracker.prepare_for_run()
+
+        assert tracker.cleanup_unseen() == 1
+        assert tracker.get_entry("/mnt/cache/gone.mkv") is None
+
+
+class TestBasenameIndexScale:
+    """Fallback lookups stay O(1) on a large tracker."""
+
+    def test_50k_entry_fallback_lookups(self, tmp_path):
+        tracker_file = tmp_path / "ondeck_tracker.json"
+        _write(tracker_file, {
+            f"/data/TV/Show {i // 100}/Show {i // 100} - S01E{i % 100:02d}.mkv": {"users": ["u"]}
+            for i in range(50000)
+        })
+        tracker = OnDeckTracker(str(tracker_file))
+
+        probes = [f"/mnt/cache/TV/Show {i}/Show {i} - S01E50.mkv" for i in range(0, 500, 5)]
+        probes.append("/mnt/cache/TV/missing.mkv")
+
+        start = time.perf_counter()
+        results = [tracker.get_entry(p) for p in probes]
+        elapsed = time.perf_counter() - start
+
+        assert all(r is not None for r in results[:-1])
+        assert results[-1] is None
+        # A linear scan needs seconds here; the index needs well under a millisecond
+        assert elapsed < 0.5
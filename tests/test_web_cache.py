@@ -0,0 +1,95 @@
+"""Tests for WebCacheService disk persistence.
+
+Source: web/services/web_cache.py — per-key cache files, lazy loading on
+first access, the persist size cap, and migration of the legacy
+single-file cache.
+"""
+
+import json
+from datetime import datetime
+from unittest.mock import patch
+
+# conftest.py handles fcntl/apscheduler mocking and path setup
+from web.services.web_cache import WebCacheService
+
+
+class TestPerKeyPersistence:
+    """set() writes only the changed key, compactly."""
+
+    def test_set_writes_only_that_key(self, tmp_path):
+        cache_dir = tmp_path / "web_ui_cache"
+        service = WebCacheService(cache_dir=cache_dir)
+        service.set("dashboard_stats", {"cache_files": 3})
+
+        with patch("web.services.web_cache.write_text_atomically") as write:
+            service.set("maintenance_health", {"status": "ok"})
+        assert write.call_count == 1
+        assert write.call_args[0][0].endswith("maintenance_health.json")
+
+        content = (cache_dir / "dashboard_stats.json").read_text(encoding="utf-8")
+        assert "\n" not in content and ": " not in content  # no indentation
+        assert json.loads(content)["data"] == {"cache_files": 3}
+
+    def test_payload_over_cap_is_not_persisted(self, tmp_path):
+        cache_dir = tmp_path / "web_ui_cache"
+        service = WebCacheService(cache_dir=cache_dir, max_persist_bytes=100)
+        service.set("maintenance_audit", {"files": ["x" * 50] * 10})
+
+        assert not (cache_dir / "maintenance_audit.json").exists()
+        assert service.get("maintenance_audit") == {"files": ["x" * 50] * 10}
+
+    def test_cap_counts_encoded_bytes(self, tmp_path):
+        cache_dir = tmp_path / "web_ui_cache"
+        service = WebCacheService(cache_dir=cache_dir, max_persist_bytes=150)
+        # ~115 characters but ~165 UTF-8 bytes
+        service.set("maintenance_audit", {"title": "é" * 50})
+
+        assert not (cache_dir / "maintenance_audit.json").exists()
+        service.set("dashboard_stats", {"title": "é" * 10})
+        content = (cache_dir / "dashboard_stats.json").read_text(encoding="utf-8")
+        assert json.loads(content)["data"] == {"title": "é" * 10}
+
+    def test_invalidate_removes_file(self, tmp_path):
+        cache_dir = tmp_path / "web_ui_cache"
+        service = WebCacheService(cache_dir=cache_dir)
+        service.set("dashboard_stats", {"a": 1})
+        service.invalidate("dashboard_stats")
+
+        assert not (cache_dir / "dashboard_stats.json").exists()
+        assert WebCacheService(cache_dir=cache_dir).get("dashboard_stats") is None
+
+
+class TestLazyLoading:
+    """Keys are read from disk on first access, not at startup."""
+
+    def test_key_loaded_on_first_get(self, tmp_path):
+        cache_dir = tmp_path / "web_ui_cache"
+        WebCacheService(cache_dir=cache_dir).set("dashboard_stats", {"a": 1})
+
+        service = WebCacheService(cache_dir=cache_dir)
+        assert service._cache == {}
+        with patch.object(service, "_load_key_from_disk", wraps=service._load_key_from_disk) as load:
+            assert service.get("dashboard_stats") == {"a": 1}
+            data, updated_at = service.get_with_age("dashboard_stats")
+            assert service.get("missing") is None
+            assert service.get("missing") is None
+        assert data == {"a": 1} and isinstance(updated_at, datetime)
+        assert load.call_count == 2  # one read per key, misses included
+
+
+class TestLegacyMigration:
+    """The old web_ui_cache.json is split into per-key files once."""
+
+    def test_legacy_file_migrated(self, tmp_path):
+        cache_dir = tmp_path / "web_ui_cache"
+        legacy = tmp_path / "web_ui_cache.json"
+        legacy.write_text(json.dumps({
+            "dashboard_stats": {"data": {"a": 1}, "updated_at": datetime.now().isoformat()},
+            "broken": {"data": 1},
+        }), encoding="utf-8")
+
+        service = WebCacheService(cache_dir=cache_dir)
+
+        assert not legacy.exists()
+        assert (cache_dir / "dashboard_stats.json").exists()
+        assert service.get("dashboard_stats") == {"a": 1}
@@ -0,0 +1,603 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmarks for PlexCache hot paths.
+
+Each benchmark builds synthetic data in a temporary directory, so no
+settings file, Plex server or real media is needed.
+
+Usage:
+    python tools/benchmark.py --list
+    python tools/benchmark.py tracker-lookup
+    python tools/benchmark.py tracker-lookup --entries 50000 --lookups 2000
+    python tools/benchmark.py json-codec --entries 10000 100000
+    python tools/benchmark.py plex-fetch --users 40 --sections 12 --latency-ms 20
+    python tools/benchmark.py plex-db-ondeck --episodes 100000 --active-shows 80
+    python tools/benchmark.py copy-engines --size-mb 1024 --dir /dev/shm --dest-dir /mnt/cache
+    python tools/benchmark.py copy-modes --size-mb 2048 --dir /mnt/user0 --dest-dir /mnt/cache
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(SCRIPT_DIR) if os.path.basename(SCRIPT_DIR) == 'tools' else SCRIPT_DIR
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def best_of(func, repeat: int = 3) -> float:
+    """Run ``func`` ``repeat`` times and return the fastest wall time in seconds."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def print_result(label: str, seconds: float, ops: int = 0) -> None:
+    """Print one aligned result line, with per-op cost when ``ops`` is given."""
+    line = f"  {label:<40} {seconds * 1000:10.2f} ms"
+    if ops:
+        line += f"  ({seconds / ops * 1e6:8.2f} us/op)"
+    print(line)
+
+
+# ---------------------------------------------------------------------------
+# tracker-lookup: JSONTracker filename fallback
+# ---------------------------------------------------------------------------
+
+def bench_tracker_lookup(args) -> None:
+    """Filename-fallback lookups on a large OnDeck tracker (index vs. linear scan)."""
+    from core.file_operations import OnDeckTracker
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tracker_file = os.path.join(tmp, "ondeck_tracker.json")
+        data = {
+            f"/data/TV/Show {i // 100}/Season 1/Show {i // 100} - S01E{i % 100:02d}.mkv": {
+                "users": ["user"], "first_seen": "2025-01-01T00:00:00", "last_seen": "2025-01-01T00:00:00",
+            }
+            for i in range(args.entries)
+        }
+        with open(tracker_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+
+        start = time.perf_counter()
+        tracker = OnDeckTracker(tracker_file)
+        load_seconds = time.perf_counter() - start
+
+        # Cache-side paths never match the stored Plex paths exactly, so every
+        # lookup takes the filename fallback (the CachePriorityManager case).
+        stored = list(data)
+        step = max(1, len(stored) // args.lookups)
+        probes = [p.replace("/data/", "/mnt/cache/media/", 1) for p in stored[::step]][:args.lookups]
+        probes[-1] = "/mnt/cache/media/TV/Missing/missing.mkv"  # worst case for a scan
+
+        def indexed():
+            for p in probes:
+                tracker.get_entry(p)
+
+        def linear_scan():
+            for p in probes:
+                name = os.path.basename(p)
+                for stored_path in tracker._data:
+                    if os.path.basename(stored_path) == name:
+                        break
+
+        print(f"tracker-lookup: {args.entries} entries, {len(probes)} fallback lookups")
+        print_result("load + build index", load_seconds)
+        print_result("basename index", best_of(indexed, args.repeat), len(probes))
+        if not args.skip_scan:
+            print_result("linear scan (previous behavior)", best_of(linear_scan, 1), len(probes))
+
+
+# ---------------------------------------------------------------------------
+# json-codec: timestamps.json load/save
+# ---------------------------------------------------------------------------
+
+def bench_json_codec(args) -> None:
+    """Load/save of timestamps.json with stdlib json vs. core.json_codec."""
+    from core import json_codec
+    from core.file_operations import save_json_atomically
+
+    print(f"json-codec: backend = {json_codec.BACKEND}")
+    for entries in args.entries:
+        data = {
+            f"/mnt/cache/media/TV/Show {i // 100}/Season 1/Show {i // 100} - S01E{i % 100:02d}.mkv": {
+                "cached_at": "2025-12-02T14:26:27.156439",
+                "source": "ondeck" if i % 2 else "watchlist",
+                "associated_files": [f"/mnt/cache/media/TV/Show {i // 100}/Season 1/S01E{i % 100:02d}.en.srt"],
+            }
+            for i in range(entries)
+        }
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "timestamps.json")
+
+            def stdlib_save():
+                with open(path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=2)
+
+            def stdlib_load():
+                with open(path, 'r', encoding='utf-8') as f:
+                    json.load(f)
+
+            def codec_save():
+                save_json_atomically(path, data, label="timestamps")
+
+            def codec_load():
+                with open(path, 'rb') as f:
+                    json_codec.load(f)
+
+            print(f"\n  {entries} entries")
+            print_result("stdlib json save (indent=2)", best_of(stdlib_save, args.repeat))
+            print_result("stdlib json load", best_of(stdlib_load, args.repeat))
+            print_result("save_json_atomically", best_of(codec_save, args.repeat))
+            print(f"  {'file size':<40} {os.path.getsize(path) / 1e6:10.2f} MB")
+            print_result("json_codec.load", best_of(codec_load, args.repeat))
+
+
+# ---------------------------------------------------------------------------
+# plex-fetch: OnDeck collection, threads vs. async engine
+# ---------------------------------------------------------------------------
+
+class _FakePlexHandler(BaseHTTPRequestHandler):
+    """Just enough of the Plex XML API for PlexManager's OnDeck path.
+
+    Every section has ``shows_per_section`` shows OnDeck (episode S01E01,
+    two seasons of ten episodes); odd sections are movie libraries instead.
+    Each response is delayed by ``latency`` seconds to model a round-trip.
+    """
+    protocol_version = "HTTP/1.1"
+    sections = 12
+    shows_per_section = 3
+    latency = 0.02
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, body: str) -> None:
+        time.sleep(self.latency)
+        data = f'<?xml version="1.0" encoding="UTF-8"?>\n{body}'.encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/xml")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        path = self.path.split("?", 1)[0]
+        now = int(time.time())
+        if path == "/":
+            self._send('<MediaContainer size="0" friendlyName="bench" machineIdentifier="bench" version="1.40.0.0"/>')
+        elif path == "/library":
+            self._send('<MediaContainer size="0" title1="Plex Library"/>')
+        elif path == "/library/sections":
+            dirs = "".join(
+                f'<Directory key="{k}" type="{"movie" if k % 2 else "show"}" title="Library {k}" '
+                f'agent="tv.plex.agents.none" scanner="Plex Video Files" language="en" uuid="s{k}"/>'
+                for k in range(1, self.sections + 1)
+            )
+            self._send(f'<MediaContainer size="{self.sections}">{dirs}</MediaContainer>')
+        elif re.fullmatch(r"/library/sections/\d+/onDeck", path):
+            k = int(path.split("/")[3])
+            videos = []
+            for i in range(self.shows_per_section):
+                show = k * 1000 + i
+                if k % 2:
+                    videos.append(
+                        f'<Video type="movie" ratingKey="{show}" key="/library/metadata/{show}" '
+                        f'title="Movie {show}" librarySectionID="{k}" lastViewedAt="{now}">'
+                        f'<Media id="{show}"><Part id="{show}" file="/data/Movies/Movie {show}.mkv"/></Media></Video>'
+                    )
+                else:
+                    videos.append(
+                        f'<Video type="episode" ratingKey="{show}0101" key="/library/metadata/{show}0101" '
+                        f'title="Pilot" grandparentTitle="Show {show}" grandparentRatingKey="{show}" '
+                        f'grandparentKey="/library/metadata/{show}" parentIndex="1" index="1" '
+                        f'librarySectionID="{k}" lastViewedAt="{now}">'
+                        f'<Media id="{show}0101"><Part id="{show}0101" file="/data/TV/Show {show}/S01E01.mkv"/></Media></Video>'
+                    )
+            self._send(f'<MediaContainer size="{len(videos)}">{"".join(videos)}</MediaContainer>')
+        elif re.fullmatch(r"/library/metadata/\d+/children", path):
+            key = path.split("/")[3]
+            if len(key) <= 5:  # show -> seasons
+                seasons = "".join(
+                    f'<Directory type="season" ratingKey="{key}{n:02d}" key="/library/metadata/{key}{n:02d}/children" '
+                    f'parentRatingKey="{key}" index="{n}" title="Season {n}"/>'
+                    for n in (1, 2)
+                )
+                self._send(f'<MediaContainer size="2">{seasons}</MediaContainer>')
+            else:  # season -> episodes
+                show, season = key[:-2], int(key[-2:])
+                episodes = "".join(
+                    f'<Video type="episode" ratingKey="{key}{e:02d}" key="/library/metadata/{key}{e:02d}" '
+                    f'grandparentRatingKey="{show}" parentIndex="{season}" index="{e}" title="E{e}">'
+                    f'<Media id="{key}{e:02d}"><Part id="{key}{e:02d}" '
+                    f'file="/data/TV/Show {show}/S{season:02d}E{e:02d}.mkv"/></Media></Video>'
+                    for e in range(1, 11)
+                )
+                self._send(f'<MediaContainer size="10">{episodes}</MediaContainer>')
+        elif re.fullmatch(r"/library/metadata/\d+", path):
+            key = path.split("/")[3]
+            self._send(
+                f'<MediaContainer size="1"><Directory type="show" ratingKey="{key}" '
+                f'key="/library/metadata/{key}/children" title="Show {key}"/></MediaContainer>'
+            )
+        else:
+            self.send_error(404)
+
+
+def bench_plex_fetch(args) -> None:
+    """OnDeck collection against a local fake Plex server: threads vs. async engine."""
+    from types import SimpleNamespace
+    from plexapi.server import PlexServer
+    from core.plex_api import PlexManager
+    from core.http_sessions import get_plex_session, close_sessions
+
+    _FakePlexHandler.sections = args.sections
+    _FakePlexHandler.latency = args.latency_ms / 1000
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FakePlexHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    def run(engine: str) -> int:
+        manager = PlexManager(url, "main-token", fetch_engine=engine)
+        manager.plex = PlexServer(url, "main-token", session=get_plex_session())
+        manager.plex.myPlexAccount = lambda: SimpleNamespace(title="main")  # no plex.tv
+        manager._user_tokens = {f"user{i}": f"token{i}" for i in range(args.users - 1)}
+        items = manager.get_on_deck_media([], 30, args.episodes, True, [])
+        return len(items)
+
+    print(f"plex-fetch: {args.users} users x {args.sections} sections, "
+          f"{args.latency_ms} ms per request")
+    try:
+        for engine in ("threads", "async"):
+            counts = []
+            seconds = best_of(lambda: counts.append(run(engine)), args.repeat)
+            print_result(f"{engine} engine ({counts[-1]} OnDeck items)", seconds)
+    finally:
+        server.shutdown()
+        server.server_close()
+        close_sessions()
+
+
+# ---------------------------------------------------------------------------
+# plex-db-ondeck: set-based next-episode query vs. per-show queries
+# ---------------------------------------------------------------------------
+
+def _build_plex_db(path: str, episodes: int, active_shows: int) -> None:
+    """Synthetic Plex library DB: shows of 5 seasons x 10 episodes, one user watching."""
+    import sqlite3
+    from datetime import datetime, timedelta
+
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+        CREATE TABLE accounts (id INTEGER PRIMARY KEY, name TEXT NOT NULL);
+        CREATE TABLE metadata_items (
+            id INTEGER PRIMARY KEY, metadata_type INTEGER NOT NULL, title TEXT NOT NULL,
+            parent_id INTEGER, "index" INTEGER, guid TEXT, library_section_id INTEGER);
+        CREATE TABLE metadata_item_views (
+            id INTEGER PRIMARY KEY, account_id INTEGER NOT NULL, grandparent_title TEXT,
+            parent_index INTEGER, "index" INTEGER, title TEXT, viewed_at TEXT, library_section_id INTEGER);
+        CREATE TABLE metadata_item_settings (
+            id INTEGER PRIMARY KEY, account_id INTEGER NOT NULL, guid TEXT,
+            view_offset INTEGER DEFAULT 0, view_count INTEGER DEFAULT 0, last_viewed_at TEXT);
+        CREATE TABLE media_items (id INTEGER PRIMARY KEY, metadata_item_id INTEGER NOT NULL);
+        CREATE TABLE media_parts (id INTEGER PRIMARY KEY, media_item_id INTEGER NOT NULL, file TEXT NOT NULL);
+        CREATE INDEX index_metadata_items_on_parent_id ON metadata_items (parent_id);
+        CREATE INDEX index_metadata_items_on_title ON metadata_items (title);
+        CREATE INDEX index_metadata_item_views_on_account_id ON metadata_item_views (account_id);
+        CREATE INDEX index_media_items_on_metadata_item_id ON media_items (metadata_item_id);
+        CREATE INDEX index_media_parts_on_media_item_id ON media_parts (media_item_id);
+        INSERT INTO accounts (id, name) VALUES (1, 'Owner');
+    """)
+    shows = max(1, episodes // 50)
+    next_id = 1
+    items, media, parts = [], [], []
+    for show in range(shows):
+        show_id = next_id
+        next_id += 1
+        items.append((show_id, 2, f"Show {show}", None, None, 1))
+        for season in range(1, 6):
+            season_id = next_id
+            next_id += 1
+            items.append((season_id, 3, f"Season {season}", show_id, season, 1))
+            for ep in range(1, 11):
+                ep_id = next_id
+                next_id += 1
+                items.append((ep_id, 4, f"S{season:02d}E{ep:02d}", season_id, ep, 1))
+                media.append((ep_id, ep_id))
+                parts.append((ep_id, ep_id, f"/data/TV/Show {show}/Season {season}/S{season:02d}E{ep:02d}.mkv"))
+    conn.executemany('INSERT INTO metadata_items (id, metadata_type, title, parent_id, "index", library_section_id) '
+                     'VALUES (?, ?, ?, ?, ?, ?)', items)
+    conn.executemany("INSERT INTO media_items (id, metadata_item_id) VALUES (?, ?)", media)
+    conn.executemany("INSERT INTO media_parts (id, media_item_id, file) VALUES (?, ?, ?)", parts)
+
+    now = datetime.now()
+    views = [
+        (1, f"Show {show}", 1 + show % 5, 1 + show % 10,
+         (now - timedelta(hours=show)).strftime("%Y-%m-%d %H:%M:%S"), 1)
+        for show in range(0, shows, max(1, shows // active_shows))
+    ][:active_shows]
+    conn.executemany('INSERT INTO metadata_item_views (account_id, grandparent_title, parent_index, "index", '
+                     'viewed_at, library_section_id) VALUES (?, ?, ?, ?, ?, ?)', views)
+    conn.commit()
+    conn.close()
+
+
+def _per_show_tv_on_deck(conn, account_id, sections, cutoff_str, number_episodes) -> int:
+    """Previous behavior: recent-shows query, then one query per show and per episode."""
+    placeholders = ",".join("?" for _ in sections)
+    shows = conn.execute(f"""
+        SELECT grandparent_title, parent_index, "index", library_section_id, MAX(viewed_at) as last_viewed
+        FROM metadata_item_views
+        WHERE account_id = ? AND grandparent_title IS NOT NULL AND grandparent_title != ''
+          AND parent_index IS NOT NULL AND "index" IS NOT NULL AND viewed_at >= ?
+          AND library_section_id IN ({placeholders})
+        GROUP BY grandparent_title ORDER BY last_viewed DESC
+    """, [account_id, cutoff_str] + list(sections)).fetchall()
+    found = 0
+    for title, last_season, last_episode, section_id, _ in shows:
+        episodes = conn.execute("""
+            SELECT mi.id FROM metadata_items mi
+            JOIN metadata_items season ON mi.parent_id = season.id
+            JOIN metadata_items show ON season.parent_id = show.id
+            WHERE show.title = ? AND show.metadata_type = 2 AND show.library_section_id = ?
+              AND mi.metadata_type = 4
+              AND (season."index" > ? OR (season."index" = ? AND mi."index" > ?))
+            ORDER BY season."index" ASC, mi."index" ASC LIMIT ?
+        """, [title, section_id, last_season, last_season, last_episode, number_episodes + 1]).fetchall()
+        for (metadata_id,) in episodes:
+            row = conn.execute("""
+                SELECT mp.file FROM media_items mai JOIN media_parts mp ON mp.media_item_id = mai.id
+                WHERE mai.metadata_item_id = ? LIMIT 1
+            """, [metadata_id]).fetchone()
+            found += bool(row)
+    return found
+
+
+def bench_plex_db_ondeck(args) -> None:
+    """DB OnDeck next-episode lookup: one set-based query vs. per-show N+1 queries."""
+    from datetime import datetime, timedelta
+    from core.plex_db import _connect, _fetch_tv_on_deck
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "com.plexapp.plugins.library.db")
+        start = time.perf_counter()
+        _build_plex_db(path, args.episodes, args.active_shows)
+        build_seconds = time.perf_counter() - start
+
+        conn = _connect(path)
+        cutoff = datetime.now() - timedelta(days=30)
+        cutoff_str = cutoff.strftime("%Y-%m-%d %H:%M:%S")
+        results = {}
+
+        def set_based():
+            results['set'] = len(_fetch_tv_on_deck(conn, 1, "Owner", [1], cutoff, args.prefetch))
+
+        def per_show():
+            results['per_show'] = _per_show_tv_on_deck(conn, 1, [1], cutoff_str, args.prefetch)
+
+        print(f"plex-db-ondeck: {args.episodes} episodes, {args.active_shows} active shows, "
+              f"{args.prefetch} prefetch episodes")
+        print_result("build synthetic database", build_seconds)
+        set_seconds = best_of(set_based, args.repeat)
+        per_show_seconds = best_of(per_show, args.repeat)
+        print_result(f"set-based query ({results['set']} items)", set_seconds)
+        print_result(f"per-show queries ({results['per_show']} items)", per_show_seconds)
+        conn.close()
+
+
+# ---------------------------------------------------------------------------
+# copy-engines: FileUtils.copy_file_with_permissions data path
+# ---------------------------------------------------------------------------
+
+def _buffered_copy(src: str, dest: str, chunk_size: int) -> None:
+    """The previous copy loop: read chunks into Python bytes and write them back."""
+    with open(src, 'rb') as fsrc, open(dest, 'wb') as fdest:
+        while True:
+            chunk = fsrc.read(chunk_size)
+            if not chunk:
+                break
+            fdest.write(chunk)
+
+
+def bench_copy_engines(args) -> None:
+    """Large-file copy throughput and CPU time per copy engine vs. the buffered loop."""
+    from core.system_utils import COPY_ENGINE_REFLINK, available_copy_engines, copy_file_data
+
+    size = args.size_mb * 1024 * 1024
+    chunk_size = args.chunk_mb * 1024 * 1024
+    with tempfile.TemporaryDirectory(dir=args.dir) as src_dir, \
+            tempfile.TemporaryDirectory(dir=args.dest_dir or args.dir) as dest_dir:
+        src = os.path.join(src_dir, "source.mkv")
+        dest = os.path.join(dest_dir, "dest.mkv")
+        block = os.urandom(1024 * 1024)
+        with open(src, 'wb') as f:
+            for _ in range(args.size_mb):
+                f.write(block)
+
+        def run(copy):
+            best_wall, best_cpu = float('inf'), float('inf')
+            for _ in range(args.repeat):
+                if os.path.exists(dest):
+                    os.remove(dest)
+                wall, cpu = time.perf_counter(), time.process_time()
+                copy()
+                best_wall = min(best_wall, time.perf_counter() - wall)
+                best_cpu = min(best_cpu, time.process_time() - cpu)
+            return best_wall, best_cpu
+
+        used = {}
+
+        def engine_copy(engine):
+            def copy():
+                with open(src, 'rb') as fsrc, open(dest, 'wb') as fdest:
+                    used[engine] = copy_file_data(fsrc.fileno(), fdest.fileno(), size, chunk_size,
+                                                  engine=engine)
+            return copy
+
+        print(f"copy-engines: {args.size_mb} MB file, {args.chunk_mb} MB chunks, "
+              f"{src_dir} -> {dest_dir}")
+        candidates = [("buffered loop (previous)", lambda: _buffered_copy(src, dest, chunk_size))]
+        candidates += [(engine, engine_copy(engine))
+                       for engine in [COPY_ENGINE_REFLINK] + available_copy_engines()]
+        for label, copy in candidates:
+            wall, cpu = run(copy)
+            if used.get(label, label) != label:
+                label = f"{label} -> {used[label]}"
+            print(f"  {label:<28} {wall * 1000:10.1f} ms  {size / wall / 1e6:8.0f} MB/s"
+                  f"  cpu {cpu * 1000:8.1f} ms")
+
+
+# ---------------------------------------------------------------------------
+# copy-modes: preallocation and page-cache dropping
+# ---------------------------------------------------------------------------
+
+def _page_cache_bytes() -> int:
+    """Current page cache size from /proc/meminfo (0 where unavailable)."""
+    try:
+        with open('/proc/meminfo') as f:
+            for line in f:
+                if line.startswith('Cached:'):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return 0
+
+
+def _extent_count(path: str) -> str:
+    """Extent count reported by filefrag, or '-' when it isn't available."""
+    import shutil
+    import subprocess
+    if not shutil.which('filefrag'):
+        return '-'
+    try:
+        out = subprocess.run(['filefrag', path], capture_output=True, text=True, timeout=30).stdout
+        match = re.search(r'(\d+) extents? found', out)
+        return match.group(1) if match else '-'
+    except (OSError, subprocess.SubprocessError):
+        return '-'
+
+
+def bench_copy_modes(args) -> None:
+    """Large-file copy with/without preallocation and page-cache dropping (time, cache growth, extents)."""
+    from core.system_utils import copy_file_data
+
+    size = args.size_mb * 1024 * 1024
+    chunk_size = args.chunk_mb * 1024 * 1024
+    with tempfile.TemporaryDirectory(dir=args.dir) as src_dir, \
+            tempfile.TemporaryDirectory(dir=args.dest_dir or args.dir) as dest_dir:
+        src = os.path.join(src_dir, "source.mkv")
+        block = os.urandom(1024 * 1024)
+        with open(src, 'wb') as f:
+            for _ in range(args.size_mb):
+                f.write(block)
+
+        print(f"copy-modes: {args.size_mb} MB file, {args.chunk_mb} MB chunks, {src_dir} -> {dest_dir}")
+        print(f"  {'mode':<28} {'time':>10}     {'page cache growth':>18}  extents")
+        modes = [
+            ("default", False, False),
+            ("preallocate", True, False),
+            ("drop page cache", False, True),
+            ("preallocate + drop cache", True, True),
+        ]
+        for label, preallocate, drop_cache in modes:
+            dest = os.path.join(dest_dir, f"{label.replace(' ', '_')}.mkv")
+            before = _page_cache_bytes()
+            start = time.perf_counter()
+            with open(src, 'rb') as fsrc, open(dest, 'wb') as fdest:
+                copy_file_data(fsrc.fileno(), fdest.fileno(), size, chunk_size,
+                               engine=args.engine, preallocate=preallocate, drop_cache=drop_cache)
+                os.fsync(fdest.fileno())
+            seconds = time.perf_counter() - start
+            growth = (_page_cache_bytes() - before) / (1024 * 1024)
+            print(f"  {label:<28} {seconds * 1000:10.1f} ms  {growth:+14.0f} MB  {_extent_count(dest):>7}")
+            os.remove(dest)
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Micro-benchmarks for PlexCache hot paths.",
+    )
+    parser.add_argument('--list', action='store_true', help="List available benchmarks")
+    subparsers = parser.add_subparsers(dest='benchmark')
+
+    p = subparsers.add_parser('tracker-lookup', help=bench_tracker_lookup.__doc__,
+                              description=bench_tracker_lookup.__doc__)
+    p.add_argument('--entries', type=int, default=50000, help="Tracker entries (default: 50000)")
+    p.add_argument('--lookups', type=int, default=1000, help="Fallback lookups (default: 1000)")
+    p.add_argument('--repeat', type=int, default=3, help="Repetitions, best time reported (default: 3)")
+    p.add_argument('--skip-scan', action='store_true', help="Skip the slow linear-scan baseline")
+    p.set_defaults(func=bench_tracker_lookup)
+
+    p = subparsers.add_parser('json-codec', help=bench_json_codec.__doc__,
+                              description=bench_json_codec.__doc__)
+    p.add_argument('--entries', type=int, nargs='+', default=[10000, 100000],
+                   help="Tracker sizes to test (default: 10000 100000)")
+    p.add_argument('--repeat', type=int, default=3, help="Repetitions, best time reported (default: 3)")
+    p.set_defaults(func=bench_json_codec)
+
+    p = subparsers.add_parser('plex-fetch', help=bench_plex_fetch.__doc__,
+                              description=bench_plex_fetch.__doc__)
+    p.add_argument('--users', type=int, default=10, help="Users including main (default: 10)")
+    p.add_argument('--sections', type=int, default=6, help="Library sections (default: 6)")
+    p.add_argument('--episodes', type=int, default=5, help="Next episodes per show (default: 5)")
+    p.add_argument('--latency-ms', type=float, default=20, help="Per-request latency (default: 20)")
+    p.add_argument('--repeat', type=int, default=1, help="Repetitions, best time reported (default: 1)")
+    p.set_defaults(func=bench_plex_fetch)
+
+    p = subparsers.add_parser('plex-db-ondeck', help=bench_plex_db_ondeck.__doc__,
+                              description=bench_plex_db_ondeck.__doc__)
+    p.add_argument('--episodes', type=int, default=100000, help="Episodes in the library (default: 100000)")
+    p.add_argument('--active-shows', type=int, default=80, help="Recently watched shows (default: 80)")
+    p.add_argument('--prefetch', type=int, default=5, help="Next episodes per show (default: 5)")
+    p.add_argument('--repeat', type=int, default=5, help="Repetitions, best time reported (default: 5)")
+    p.set_defaults(func=bench_plex_db_ondeck)
+
+    p = subparsers.add_parser('copy-engines', help=bench_copy_engines.__doc__,
+                              description=bench_copy_engines.__doc__)
+    p.add_argument('--size-mb', type=int, default=512, help="Test file size in MB (default: 512)")
+    p.add_argument('--chunk-mb', type=int, default=10, help="Copy chunk size in MB (default: 10)")
+    p.add_argument('--dir', default=None, help="Source directory, e.g. /dev/shm for tmpfs (default: system temp)")
+    p.add_argument('--dest-dir', default=None, help="Destination directory (default: same as --dir)")
+    p.add_argument('--repeat', type=int, default=3, help="Repetitions, best time reported (default: 3)")
+    p.set_defaults(func=bench_copy_engines)
+
+    p = subparsers.add_parser('copy-modes', help=bench_copy_modes.__doc__,
+                              description=bench_copy_modes.__doc__)
+    p.add_argument('--size-mb', type=int, default=1024, help="Test file size in MB (default: 1024)")
+    p.add_argument('--chunk-mb', type=int, default=10, help="Copy chunk size in MB (default: 10)")
+    p.add_argument('--dir', default=None, help="Source directory (default: system temp)")
+    p.add_argument('--dest-dir', default=None, help="Destination directory (default: same as --dir)")
+    p.add_argument('--engine', default='copy_file_range',
+                   help="Copy engine, as in copy-engines (default: copy_file_range)")
+    p.set_defaults(func=bench_copy_modes)
+
+    args = parser.parse_args()
+    if args.list or not args.benchmark:
+        for name, sub in subparsers.choices.items():
+            print(f"  {name:<20} {sub.description or ''}")
+        return
+    args.func(args)
+
+
+if __name__ == '__main__':
+    main()
@@ -84,6 +84,19 @@ def get_time_format() -> str:
     return "24h"
 
 
+def get_state_backend() -> str:
+    """Read state_backend from settings JSON. Returns 'json' (default) or 'sqlite'."""
+    from core.state_store import DEFAULT_STATE_BACKEND, normalize_state_backend
+    try:
+        if SETTINGS_FILE.exists():
+            with open(SETTINGS_FILE, 'r', encoding='utf-8') as f:
+                settings = json.load(f)
+            return normalize_state_backend(settings.get("state_backend", DEFAULT_STATE_BACKEND))
+    except (json.JSONDecodeError, IOError):
+        pass
+    return DEFAULT_STATE_BACKEND
+
+
 def format_time(value, include_seconds=True):
     """Jinja2 filter: format a datetime based on user's time_format preference."""
     if not isinstance(value, datetime):
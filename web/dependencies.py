@@ -13,7 +13,7 @@ PROJECT_ROOT = Path(__file__).parent.parent
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
-from web.config import SETTINGS_FILE, DATA_DIR, LOGS_DIR
+from web.config import SETTINGS_FILE, DATA_DIR, LOGS_DIR, get_state_backend
 
 
 async def parse_form(request: Request) -> ImmutableMultiDict:
@@ -63,29 +63,41 @@ def get_config_manager():
 def get_timestamp_tracker():
     """Get CacheTimestampTracker instance"""
     from core.file_operations import CacheTimestampTracker
+    from core.state_store import create_state_backend
     timestamp_file = DATA_DIR / "timestamps.json"
-    return CacheTimestampTracker(str(timestamp_file))
+    return CacheTimestampTracker(
+        str(timestamp_file),
+        backend=create_state_backend(timestamp_file, get_state_backend(), "timestamp"))
 
 
 def get_watchlist_tracker():
     """Get WatchlistTracker instance"""
     from core.file_operations import WatchlistTracker
+    from core.state_store import create_state_backend
     tracker_file = DATA_DIR / "watchlist_tracker.json"
-    return WatchlistTracker(str(tracker_file))
+    return WatchlistTracker(
+        str(tracker_file),
+        backend=create_state_backend(tracker_file, get_state_backend(), "watchlist"))
 
 
 def get_ondeck_tracker():
     """Get OnDeckTracker instance"""
     from core.file_operations import OnDeckTracker
+    from core.state_store import create_state_backend
     tracker_file = DATA_DIR / "ondeck_tracker.json"
-    return OnDeckTracker(str(tracker_file))
+    return OnDeckTracker(
+        str(tracker_file),
+        backend=create_state_backend(tracker_file, get_state_backend(), "OnDeck"))
 
 
 def get_pinned_tracker():
     """Get PinnedMediaTracker instance"""
     from core.pinned_media import PinnedMediaTracker
+    from core.state_store import create_state_backend
     tracker_file = DATA_DIR / "pinned_media.json"
-    return PinnedMediaTracker(str(tracker_file))
+    return PinnedMediaTracker(
+        str(tracker_file),
+        backend=create_state_backend(tracker_file, get_state_backend(), "pinned_media"))
 
 
 def get_priority_manager():
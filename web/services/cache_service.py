@@ -7,12 +7,15 @@ import re
 import threading
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Mapping, Optional, Tuple, Any
 from dataclasses import dataclass
 
-from web.config import DATA_DIR, CONFIG_DIR, SETTINGS_FILE
+from web.config import DATA_DIR, CONFIG_DIR, SETTINGS_FILE, get_state_backend
+from core import json_codec
 from core.system_utils import get_disk_usage, detect_zfs, get_array_direct_path, parse_size_bytes, format_bytes, translate_container_to_host_path, translate_host_to_container_path, remove_from_exclude_file, remove_from_timestamps_file
 from core.file_operations import get_media_identity, find_matching_plexcached, save_json_atomically, SUBTITLE_EXTENSIONS, is_video_file
+from core.state_store import create_state_backend, load_state, load_state_snapshot
+from core.exclude_list import get_exclude_list
 
 
 def cached_files_to_dicts(files: List["CachedFile"]) -> List[Dict[str, Any]]:
@@ -96,8 +99,8 @@ class CacheService:
         if not path.exists():
             return {}
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(path, 'rb') as f:
+                return json_codec.load(f)
         except (json.JSONDecodeError, IOError):
             return {}
 
@@ -105,6 +108,25 @@ class CacheService:
         """Load settings file"""
         return self._load_json_file(self.settings_file)
 
+    def _load_state(self, path: Path) -> Dict:
+        """Load a private, mutable copy of tracker state ({} if not found)"""
+        return load_state(path, get_state_backend())
+
+    def _load_state_snapshot(self, path: Path) -> Mapping:
+        """Shared read-only view of tracker state, re-parsed only when the file changes"""
+        return load_state_snapshot(path, get_state_backend())
+
+    def _save_state(self, path: Path, data: Dict, label: str, *keys: str) -> None:
+        """Persist tracker state to the configured backend.
+
+        JSON rewrites the whole file atomically; sqlite upserts only ``keys``.
+        """
+        backend = get_state_backend()
+        if backend == "sqlite":
+            create_state_backend(path, backend, label).save(data, keys or None)
+        else:
+            save_json_atomically(str(path), data, label=label)
+
     def get_user_types(self, settings: Dict = None) -> Dict[str, str]:
         """Build {username: 'admin'|'home'|'shared'} map from _cached_users.
 
@@ -246,18 +268,13 @@ class CacheService:
         if not self.exclude_file.exists():
             return []
 
-        try:
-            with open(self.exclude_file, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-            # Translate host paths to container paths for file operations inside Docker
-            paths = [line.strip() for line in lines if line.strip()]
-            return [self._translate_host_to_container_path(p) for p in paths]
-        except IOError:
-            return []
+        # Translate host paths to container paths for file operations inside Docker
+        paths = get_exclude_list(self.exclude_file).entries()
+        return [self._translate_host_to_container_path(p) for p in paths]
 
     def get_timestamps(self) -> Dict[str, Dict]:
-        """Load timestamps data"""
-        data = self._load_json_file(self.timestamps_file)
+        """Load timestamps data (entry dicts are shared, treat as read-only)"""
+        data = self._load_state_snapshot(self.timestamps_file)
         # Handle old format (plain timestamps) vs new format (dict with cached_at, source)
         normalized = {}
         for path, value in data.items():
@@ -271,13 +288,13 @@ class CacheService:
                 }
         return normalized
 
-    def get_ondeck_tracker(self) -> Dict:
-        """Load OnDeck tracker data"""
-        return self._load_json_file(self.ondeck_file)
+    def get_ondeck_tracker(self) -> Mapping:
+        """Load OnDeck tracker data (shared read-only view)"""
+        return self._load_state_snapshot(self.ondeck_file)
 
-    def get_watchlist_tracker(self) -> Dict:
-        """Load Watchlist tracker data"""
-        return self._load_json_file(self.watchlist_file)
+    def get_watchlist_tracker(self) -> Mapping:
+        """Load Watchlist tracker data (shared read-only view)"""
+        return self._load_state_snapshot(self.watchlist_file)
 
     def calculate_priority(
         self,
@@ -1829,18 +1846,7 @@ class CacheService:
         """Add a cache path to the exclude file (with host path translation and dedup)."""
         settings = self._load_settings()
         host_path = translate_container_to_host_path(cache_path, settings.get('path_mappings', []))
-
-        existing = set()
-        if self.exclude_file.exists():
-            try:
-                with open(self.exclude_file, 'r', encoding='utf-8') as f:
-                    existing = {line.strip() for line in f if line.strip()}
-            except IOError:
-                pass
-
-        if host_path not in existing:
-            with open(self.exclude_file, 'a', encoding='utf-8') as f:
-                f.write(host_path + '\n')
+        get_exclude_list(self.exclude_file).add(host_path)
 
     def check_for_upgrades(self, stale_exclude_entries: List[str]) -> Dict[str, Any]:
         """Check if stale exclude entries are actually media upgrades (Sonarr/Radarr swaps).
@@ -1892,7 +1898,8 @@ class CacheService:
 
         try:
             from plexapi.server import PlexServer
-            plex = PlexServer(plex_url, plex_token, timeout=10)
+            from core.http_sessions import get_plex_session
+            plex = PlexServer(plex_url, plex_token, session=get_plex_session(), timeout=10)
         except Exception as e:
             logger.warning(f"Upgrade check: could not connect to Plex: {e}")
             return result
@@ -1995,35 +2002,29 @@ class CacheService:
             timestamps = self.get_timestamps()
             old_ts = timestamps.get(old_cache_path, {})
             old_source = old_ts.get('source', 'unknown') if isinstance(old_ts, dict) else 'unknown'
-            remove_from_timestamps_file(self.timestamps_file, old_cache_path)
+            remove_from_timestamps_file(self.timestamps_file, old_cache_path, get_state_backend())
 
             # Add new timestamp entry
-            ts_data = {}
-            if self.timestamps_file.exists():
-                try:
-                    with open(self.timestamps_file, 'r', encoding='utf-8') as f:
-                        ts_data = json.load(f)
-                except (json.JSONDecodeError, IOError):
-                    pass
+            ts_data = self._load_state(self.timestamps_file)
             ts_data[new_cache_path] = {
                 "cached_at": datetime.now().isoformat(),
                 "source": old_source,
             }
-            save_json_atomically(str(self.timestamps_file), ts_data, label="timestamps")
+            self._save_state(self.timestamps_file, ts_data, "timestamps", new_cache_path)
 
             # 3. OnDeck tracker: remove old entry (new entry created on next operation run)
             # OnDeck tracker keys are real paths (/mnt/user/...)
-            ondeck_data = self.get_ondeck_tracker()
+            ondeck_data = self._load_state(self.ondeck_file)
             if old_real_path in ondeck_data:
                 del ondeck_data[old_real_path]
-                save_json_atomically(str(self.ondeck_file), ondeck_data, label="ondeck tracker")
+                self._save_state(self.ondeck_file, ondeck_data, "ondeck tracker", old_real_path)
 
             # 4. Watchlist tracker: transfer entry if exists
             # Watchlist tracker keys are plex paths (/data/...)
-            watchlist_data = self.get_watchlist_tracker()
+            watchlist_data = self._load_state(self.watchlist_file)
             if old_plex_path and old_plex_path in watchlist_data:
                 watchlist_data[new_plex_path] = watchlist_data.pop(old_plex_path)
-                save_json_atomically(str(self.watchlist_file), watchlist_data, label="watchlist tracker")
+                self._save_state(self.watchlist_file, watchlist_data, "watchlist tracker", old_plex_path, new_plex_path)
 
             # 5. Handle .plexcached backups
             self._handle_upgrade_plexcached(
@@ -2109,7 +2110,7 @@ class CacheService:
 
     def _remove_from_timestamps(self, cache_path: str):
         """Remove a path from the timestamps file"""
-        remove_from_timestamps_file(self.timestamps_file, cache_path)
+        remove_from_timestamps_file(self.timestamps_file, cache_path, get_state_backend())
 
     def _get_pinned_cache_paths(self) -> set:
         """Return the current set of pinned cache-form paths.
@@ -16,6 +16,7 @@ from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from typing import Callable, Dict, List, Optional
 
+from core import json_codec
 from core.file_operations import save_json_atomically
 from core.system_utils import format_bytes
 from web.services.maintenance_service import ActionResult
@@ -240,7 +241,8 @@ class DuplicateService:
                 progress_callback(0, 0, "Connecting to Plex...")
 
             from plexapi.server import PlexServer
-            plex = PlexServer(plex_url, plex_token, timeout=30)
+            from core.http_sessions import get_plex_session
+            plex = PlexServer(plex_url, plex_token, session=get_plex_session(), timeout=30)
             logger.info(f"Connected to Plex: {plex.friendlyName}")
 
             # Get library sections
@@ -470,8 +472,8 @@ class DuplicateService:
         try:
             if not os.path.exists(SCAN_RESULTS_FILE):
                 return None
-            with open(SCAN_RESULTS_FILE, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(SCAN_RESULTS_FILE, 'rb') as f:
+                data = json_codec.load(f)
             return _dict_to_results(data)
         except (json.JSONDecodeError, IOError, KeyError) as e:
             logger.warning(f"Failed to load duplicate scan results: {e}")
@@ -491,8 +493,8 @@ class DuplicateService:
         try:
             if not os.path.exists(IGNORE_FILE):
                 return {}
-            with open(IGNORE_FILE, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(IGNORE_FILE, 'rb') as f:
+                return json_codec.load(f)
         except (json.JSONDecodeError, IOError) as e:
             logger.warning(f"Failed to load duplicate ignores: {e}")
             return {}
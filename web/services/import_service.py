@@ -7,7 +7,8 @@ from pathlib import Path
 from typing import Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 
-from web.config import CONFIG_DIR, DATA_DIR
+from core.state_store import replace_state
+from web.config import CONFIG_DIR, DATA_DIR, get_state_backend
 
 
 @dataclass
@@ -255,10 +256,9 @@ class ImportService:
                         cli_timestamps, cli_cache_prefix, docker_cache_prefix
                     )
 
-                    # Write to data dir
-                    target_file = DATA_DIR / "timestamps.json"
-                    with open(target_file, 'w') as f:
-                        json.dump(converted, f, indent=2)
+                    # Write through the configured state backend (JSON file or state DB)
+                    if not replace_state(DATA_DIR / "timestamps.json", converted, get_state_backend()):
+                        raise IOError("could not save timestamps")
 
                     results["timestamps_imported"] = len(converted)
                 except Exception as e:
@@ -268,10 +268,11 @@ class ImportService:
             ondeck_file = self.import_data_dir / "ondeck_tracker.json"
             if ondeck_file.exists():
                 try:
-                    target_file = DATA_DIR / "ondeck_tracker.json"
-                    shutil.copy2(ondeck_file, target_file)
                     with open(ondeck_file, 'r') as f:
-                        results["ondeck_imported"] = len(json.load(f))
+                        ondeck_data = json.load(f)
+                    if not replace_state(DATA_DIR / "ondeck_tracker.json", ondeck_data, get_state_backend()):
+                        raise IOError("could not save OnDeck tracker")
+                    results["ondeck_imported"] = len(ondeck_data)
                 except Exception as e:
                     results["errors"].append(f"OnDeck import failed: {e}")
 
@@ -279,10 +280,11 @@ class ImportService:
             watchlist_file = self.import_data_dir / "watchlist_tracker.json"
             if watchlist_file.exists():
                 try:
-                    target_file = DATA_DIR / "watchlist_tracker.json"
-                    shutil.copy2(watchlist_file, target_file)
                     with open(watchlist_file, 'r') as f:
-                        results["watchlist_imported"] = len(json.load(f))
+                        watchlist_data = json.load(f)
+                    if not replace_state(DATA_DIR / "watchlist_tracker.json", watchlist_data, get_state_backend()):
+                        raise IOError("could not save watchlist tracker")
+                    results["watchlist_imported"] = len(watchlist_data)
                 except Exception as e:
                     results["errors"].append(f"Watchlist import failed: {e}")
 
@@ -13,6 +13,7 @@ from typing import Optional, Callable, Any, List
 from dataclasses import dataclass, field
 
 from web.services.maintenance_service import ActionResult
+from core import json_codec
 from core.system_utils import format_bytes, format_duration
 
 # Backward-compatible aliases for any external imports
@@ -162,8 +163,8 @@ class MaintenanceHistory:
         """Load entries from disk. Returns empty list on error."""
         try:
             if self._file.exists():
-                with open(self._file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
+                with open(self._file, "rb") as f:
+                    data = json_codec.load(f)
                 if isinstance(data, list):
                     return data
         except (json.JSONDecodeError, IOError, OSError) as e:
@@ -178,8 +179,8 @@ class MaintenanceHistory:
                 dir=str(self._file.parent), suffix=".tmp"
             )
             try:
-                with os.fdopen(fd, "w", encoding="utf-8") as f:
-                    json.dump(entries, f, indent=2)
+                with os.fdopen(fd, "wb") as f:
+                    f.write(json_codec.dumps_bytes(entries, indent=True))
                 os.replace(tmp_path, str(self._file))
             except OSError:
                 # Clean up temp file on failure
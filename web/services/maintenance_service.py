@@ -13,9 +13,13 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Callable, Dict, List, Optional, Set, Any, Tuple
 
-from web.config import DATA_DIR, CONFIG_DIR, SETTINGS_FILE
+from web.config import DATA_DIR, CONFIG_DIR, SETTINGS_FILE, get_state_backend
+from core import json_codec
 from core.system_utils import get_array_direct_path, format_bytes, translate_container_to_host_path, translate_host_to_container_path, remove_from_exclude_file, remove_from_timestamps_file
-from core.file_operations import PLEXCACHED_EXTENSION, VIDEO_EXTENSIONS, SUBTITLE_EXTENSIONS, MEDIA_EXTENSIONS
+from core.system_utils import COPY_ENGINE_REFLINK, copy_file_data
+from core.file_operations import PLEXCACHED_EXTENSION, VIDEO_EXTENSIONS, SUBTITLE_EXTENSIONS, MEDIA_EXTENSIONS, save_json_atomically
+from core.state_store import create_state_backend, load_state, load_state_snapshot
+from core.exclude_list import get_exclude_list
 
 
 def _strip_plexcached(path: str) -> str:
@@ -192,6 +196,10 @@ class MaintenanceService:
     # Chunk size for copy progress reporting (4 MB)
     _COPY_CHUNK_SIZE = 4 * 1024 * 1024
 
+    # Bytes the current action copied as reflinks (shared extents, no data copied)
+    _reflinked_bytes = 0
+    _reflink_lock = threading.Lock()
+
     def __init__(self):
         # Use CONFIG_DIR and DATA_DIR for Docker compatibility
         self.settings_file = SETTINGS_FILE
@@ -210,8 +218,8 @@ class MaintenanceService:
             return {}
 
         try:
-            with open(self.settings_file, 'r', encoding='utf-8') as f:
-                self._settings = json.load(f)
+            with open(self.settings_file, 'rb') as f:
+                self._settings = json_codec.load(f)
             return self._settings
         except (json.JSONDecodeError, IOError):
             return {}
@@ -299,25 +307,34 @@ class MaintenanceService:
 
     def _copy_with_progress(self, src: str, dst: str,
                              bytes_progress_callback: Optional[Callable] = None) -> None:
-        """Copy file with chunked progress reporting, preserving metadata like shutil.copy2."""
+        """Copy file with chunked progress reporting, preserving metadata like shutil.copy2.
+
+        Reflinks when source and destination share a btrfs/XFS filesystem,
+        otherwise copies kernel-side (see ``core.system_utils.copy_file_data``).
+        """
         file_size = os.path.getsize(src)
         if bytes_progress_callback:
             bytes_progress_callback(0, file_size)
 
-        copied = 0
+        settings = self._load_settings()
         with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
-            while True:
-                chunk = fsrc.read(self._COPY_CHUNK_SIZE)
-                if not chunk:
-                    break
-                fdst.write(chunk)
-                copied += len(chunk)
-                if bytes_progress_callback:
-                    bytes_progress_callback(copied, file_size)
+            engine = copy_file_data(fsrc.fileno(), fdst.fileno(), file_size, self._COPY_CHUNK_SIZE,
+                                    progress_callback=bytes_progress_callback,
+                                    preallocate=bool(settings.get('copy_preallocate', False)),
+                                    drop_cache=bool(settings.get('copy_drop_page_cache', False)))
+        if engine == COPY_ENGINE_REFLINK:
+            with self._reflink_lock:
+                self._reflinked_bytes += file_size
 
         # Preserve file metadata (timestamps, permissions) like copy2
         shutil.copystat(src, dst)
 
+    def _with_reflink_note(self, message: str) -> str:
+        """Append the reflinked byte count of the current action to a result message."""
+        if self._reflinked_bytes:
+            return f"{message} ({format_bytes(self._reflinked_bytes)} reflinked)"
+        return message
+
     def _run_parallel(
         self,
         items: list,
@@ -446,31 +463,27 @@ class MaintenanceService:
 
     def get_exclude_files(self) -> Set[str]:
         """Get all files in exclude list (translated to container paths for comparison)"""
-        exclude_files = set()
-        if self.exclude_file.exists():
-            try:
-                with open(self.exclude_file, 'r', encoding='utf-8') as f:
-                    for line in f:
-                        line = line.strip()
-                        if line:
-                            # Translate host paths back to container paths for comparison
-                            container_path = self._translate_host_to_container_path(line)
-                            exclude_files.add(container_path)
-            except IOError:
-                pass
-        return exclude_files
+        # Translate host paths back to container paths for comparison
+        return {
+            self._translate_host_to_container_path(line)
+            for line in get_exclude_list(self.exclude_file).entries()
+        }
 
     def get_timestamp_files(self) -> Set[str]:
         """Get all files in timestamps"""
-        timestamp_files = set()
-        if self.timestamps_file.exists():
-            try:
-                with open(self.timestamps_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    timestamp_files = set(data.keys())
-            except (json.JSONDecodeError, IOError):
-                pass
-        return timestamp_files
+        return set(load_state_snapshot(self.timestamps_file, get_state_backend()))
+
+    def _load_timestamps(self) -> Dict:
+        """Load timestamps from the configured state backend ({} if missing or unreadable)"""
+        return load_state(self.timestamps_file, get_state_backend())
+
+    def _save_timestamps(self, timestamps: Dict, *keys: str):
+        """Persist timestamps. JSON rewrites the file; sqlite upserts/deletes only ``keys``."""
+        backend = get_state_backend()
+        if backend == "sqlite":
+            create_state_backend(self.timestamps_file, backend, "timestamps").save(timestamps, keys or None)
+            return
+        save_json_atomically(str(self.timestamps_file), timestamps, label="timestamps")
 
     def _cache_to_array_path(self, cache_file: str) -> Optional[str]:
         """Convert a cache file path to its corresponding array path"""
@@ -1486,6 +1499,7 @@ class MaintenanceService:
         """
         if not paths:
             return ActionResult(success=False, message="No paths provided")
+        self._reflinked_bytes = 0
 
         # --- Parallel path ---
         if max_workers > 1 and not dry_run:
@@ -1564,7 +1578,7 @@ class MaintenanceService:
 
             return ActionResult(
                 success=len(successful_paths) > 0,
-                message=f"Moved {len(successful_paths)} file(s) to array",
+                message=self._with_reflink_note(f"Moved {len(successful_paths)} file(s) to array"),
                 affected_count=len(successful_paths),
                 errors=errors,
                 affected_paths=successful_paths,
@@ -1653,7 +1667,7 @@ class MaintenanceService:
         action = "Would move" if dry_run else "Moved"
         return ActionResult(
             success=len(errors) == 0,
-            message=f"{action} {affected} file(s) to array",
+            message=self._with_reflink_note(f"{action} {affected} file(s) to array"),
             affected_count=affected,
             errors=errors,
             affected_paths=affected_paths
@@ -1710,11 +1724,10 @@ class MaintenanceService:
             )
 
         try:
-            with open(self.exclude_file, 'a', encoding='utf-8') as f:
-                for path in paths:
-                    # Translate container paths to host paths for Unraid mover
-                    host_path = self._translate_container_to_host_path(path)
-                    f.write(host_path + '\n')
+            # Translate container paths to host paths for Unraid mover
+            get_exclude_list(self.exclude_file).add_many(
+                self._translate_container_to_host_path(path) for path in paths
+            )
 
             return ActionResult(
                 success=True,
@@ -1874,8 +1887,7 @@ class MaintenanceService:
 
                     # Add to exclude list (translate to host path for Unraid mover)
                     host_path = self._translate_container_to_host_path(cache_path)
-                    with open(self.exclude_file, 'a', encoding='utf-8') as f:
-                        f.write(host_path + '\n')
+                    get_exclude_list(self.exclude_file).add(host_path)
 
                     # Add to timestamps.json
                     self._add_to_timestamps(cache_path)
@@ -1917,6 +1929,7 @@ class MaintenanceService:
         ``affected_paths`` on the result are the cache paths that were newly
         cached — the runner uses this to write "Cached" activity entries.
         """
+        self._reflinked_bytes = 0
         pinned_cache_paths = self._get_pinned_cache_paths()
         if not pinned_cache_paths:
             return ActionResult(
@@ -2031,7 +2044,7 @@ class MaintenanceService:
             logging.info(f"cache_pinned complete: Cached {len(successful_paths)} file(s), {len(errors)} errors")
             return ActionResult(
                 success=len(errors) == 0,
-                message=f"Cached {len(successful_paths)} pinned file(s)",
+                message=self._with_reflink_note(f"Cached {len(successful_paths)} pinned file(s)"),
                 affected_count=len(successful_paths),
                 errors=errors,
                 affected_paths=successful_paths,
@@ -2112,7 +2125,7 @@ class MaintenanceService:
         logging.info(f"cache_pinned complete: Cached {len(affected_paths)} file(s), {len(errors)} errors")
         return ActionResult(
             success=len(errors) == 0,
-            message=f"Cached {len(affected_paths)} pinned file(s)",
+            message=self._with_reflink_note(f"Cached {len(affected_paths)} pinned file(s)"),
             affected_count=len(affected_paths),
             errors=errors,
             affected_paths=affected_paths,
@@ -2120,45 +2133,25 @@ class MaintenanceService:
 
     def _add_to_timestamps(self, cache_path: str):
         """Add a file to timestamps.json with current time"""
-        import json
-        from datetime import datetime
-
-        timestamps = {}
-        if self.timestamps_file.exists():
-            try:
-                with open(self.timestamps_file, 'r', encoding='utf-8') as f:
-                    timestamps = json.load(f)
-            except (json.JSONDecodeError, IOError):
-                pass
-
+        timestamps = self._load_timestamps()
         timestamps[cache_path] = datetime.now().isoformat()
-
-        with open(self.timestamps_file, 'w', encoding='utf-8') as f:
-            json.dump(timestamps, f, indent=2)
+        self._save_timestamps(timestamps, cache_path)
 
     def _batch_add_to_timestamps(self, paths: List[str]):
         """Add multiple files to timestamps.json in one read-merge-write."""
-        timestamps = {}
-        if self.timestamps_file.exists():
-            try:
-                with open(self.timestamps_file, 'r', encoding='utf-8') as f:
-                    timestamps = json.load(f)
-            except (json.JSONDecodeError, IOError):
-                pass
+        timestamps = self._load_timestamps()
 
         now = datetime.now().isoformat()
         for path in paths:
             timestamps[path] = now
 
-        with open(self.timestamps_file, 'w', encoding='utf-8') as f:
-            json.dump(timestamps, f, indent=2)
+        self._save_timestamps(timestamps, *paths)
 
     def _batch_add_to_exclude(self, paths: List[str]):
         """Add multiple files to exclude list in one file open."""
-        with open(self.exclude_file, 'a', encoding='utf-8') as f:
-            for path in paths:
-                host_path = self._translate_container_to_host_path(path)
-                f.write(host_path + '\n')
+        get_exclude_list(self.exclude_file).add_many(
+            self._translate_container_to_host_path(path) for path in paths
+        )
 
     def clean_exclude(self, dry_run: bool = True) -> ActionResult:
         """Remove stale entries from exclude list"""
@@ -2185,13 +2178,10 @@ class MaintenanceService:
             )
 
         try:
-            # Keep only entries that still exist on cache
-            valid_entries = exclude_files & cache_files
-            with open(self.exclude_file, 'w', encoding='utf-8') as f:
-                for path in sorted(valid_entries):
-                    # Translate container paths back to host paths for Unraid mover
-                    host_path = self._translate_container_to_host_path(path)
-                    f.write(host_path + '\n')
+            # Drop stale entries in one atomic rewrite (file order is preserved)
+            get_exclude_list(self.exclude_file).remove_many(
+                self._translate_container_to_host_path(path) for path in stale
+            )
 
             return ActionResult(
                 success=True,
@@ -2228,15 +2218,13 @@ class MaintenanceService:
             )
 
         try:
-            with open(self.timestamps_file, 'r', encoding='utf-8') as f:
-                timestamps_data = json.load(f)
+            timestamps_data = self._load_timestamps()
 
             for stale_path in stale:
                 if stale_path in timestamps_data:
                     del timestamps_data[stale_path]
 
-            with open(self.timestamps_file, 'w', encoding='utf-8') as f:
-                json.dump(timestamps_data, f, indent=2)
+            self._save_timestamps(timestamps_data, *stale)
 
             return ActionResult(
                 success=True,
@@ -2361,7 +2349,7 @@ class MaintenanceService:
 
     def _remove_from_timestamps(self, cache_path: str):
         """Remove a path from the timestamps file"""
-        remove_from_timestamps_file(self.timestamps_file, cache_path)
+        remove_from_timestamps_file(self.timestamps_file, cache_path, get_state_backend())
 
 
 # Singleton instance
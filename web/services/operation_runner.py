@@ -10,12 +10,13 @@ import time
 from datetime import datetime, timedelta
 from enum import Enum
 from pathlib import Path
-from typing import Optional, List, Dict, Callable
+from typing import Optional, List, Dict, Mapping, Callable
 from dataclasses import dataclass, field
 
-from web.config import PROJECT_ROOT, DATA_DIR, LOGS_DIR, SETTINGS_FILE as CONFIG_SETTINGS_FILE, get_time_format
+from web.config import PROJECT_ROOT, DATA_DIR, LOGS_DIR, SETTINGS_FILE as CONFIG_SETTINGS_FILE, get_time_format, get_state_backend
 from core.system_utils import format_bytes, format_duration, get_log_time_datefmt
 from core.file_operations import save_json_atomically
+from core.state_store import load_state_snapshot
 
 # Shared activity module — canonical implementations live in core/activity.py.
 # Re-exported here for backward compatibility with existing consumers.
@@ -23,6 +24,7 @@ from core.activity import (
     FileActivity,
     load_activity,
     save_activity,
+    append_activity,
     save_last_run_time,
     load_last_run_summary,
     save_run_summary,
@@ -135,8 +137,8 @@ class OperationRunner:
         # Copy-start log: "  [Copying] filename (size)" — used to derive active files for external runs
         self._copying_entry = re.compile(r'^  \[Copying\]\s+(.+?)(?:\s+\(([^)]+)\))?$')
         # Tracker data for user lookups (loaded on operation start)
-        self._ondeck_tracker: Dict = {}
-        self._watchlist_tracker: Dict = {}
+        self._ondeck_tracker: Mapping = {}
+        self._watchlist_tracker: Mapping = {}
         # External CLI process detection
         self._lock_file = PROJECT_ROOT / "plexcache.lock"
         self._log_file = LOGS_DIR / "plexcache_log_latest.log"
@@ -541,56 +543,30 @@ class OperationRunner:
         """Load OnDeck and Watchlist trackers for user lookups"""
         ondeck_file = DATA_DIR / "ondeck_tracker.json"
         watchlist_file = DATA_DIR / "watchlist_tracker.json"
+        backend = get_state_backend()
 
-        try:
-            if ondeck_file.exists():
-                with open(ondeck_file, 'r', encoding='utf-8') as f:
-                    self._ondeck_tracker = json.load(f)
-                logging.debug(f"Loaded OnDeck tracker: {len(self._ondeck_tracker)} entries")
-            else:
-                logging.debug(f"OnDeck tracker file not found: {ondeck_file}")
-        except (json.JSONDecodeError, IOError) as e:
-            logging.debug(f"Failed to load OnDeck tracker: {e}")
-            self._ondeck_tracker = {}
+        # Shared read-only views, {} for missing/unreadable state
+        self._ondeck_tracker = load_state_snapshot(ondeck_file, backend)
+        logging.debug(f"Loaded OnDeck tracker: {len(self._ondeck_tracker)} entries")
 
-        try:
-            if watchlist_file.exists():
-                with open(watchlist_file, 'r', encoding='utf-8') as f:
-                    self._watchlist_tracker = json.load(f)
-                logging.debug(f"Loaded Watchlist tracker: {len(self._watchlist_tracker)} entries")
-            else:
-                logging.debug(f"Watchlist tracker file not found: {watchlist_file}")
-        except (json.JSONDecodeError, IOError) as e:
-            logging.debug(f"Failed to load Watchlist tracker: {e}")
-            self._watchlist_tracker = {}
+        self._watchlist_tracker = load_state_snapshot(watchlist_file, backend)
+        logging.debug(f"Loaded Watchlist tracker: {len(self._watchlist_tracker)} entries")
 
     def _get_users_for_file(self, filename: str) -> List[str]:
         """Look up users associated with a file from trackers.
 
-        Reads fresh data from disk since PlexCacheApp updates trackers during operation.
+        Uses the shared tracker snapshots, which are re-read whenever
+        PlexCacheApp updates the tracker files during an operation.
         """
         users = set()
 
-        # Load fresh tracker data (PlexCacheApp updates these during the run)
+        # Current tracker data (PlexCacheApp updates these during the run)
         ondeck_file = DATA_DIR / "ondeck_tracker.json"
         watchlist_file = DATA_DIR / "watchlist_tracker.json"
 
-        ondeck_data = {}
-        watchlist_data = {}
-
-        try:
-            if ondeck_file.exists():
-                with open(ondeck_file, 'r', encoding='utf-8') as f:
-                    ondeck_data = json.load(f)
-        except (json.JSONDecodeError, IOError):
-            pass
-
-        try:
-            if watchlist_file.exists():
-                with open(watchlist_file, 'r', encoding='utf-8') as f:
-                    watchlist_data = json.load(f)
-        except (json.JSONDecodeError, IOError):
-            pass
+        backend = get_state_backend()
+        ondeck_data = load_state_snapshot(ondeck_file, backend)
+        watchlist_data = load_state_snapshot(watchlist_file, backend)
 
         # Search in OnDeck tracker (keys are full paths, we match by filename)
         for path, info in ondeck_data.items():
@@ -609,16 +585,12 @@ class OperationRunner:
     def _save_activity(self, new_entry: FileActivity = None) -> None:
         """Save activity to disk.
 
-        If new_entry is provided, loads existing entries from disk first
-        to avoid overwriting entries added by MaintenanceRunner.
-        Full load-insert-save runs under a single lock acquisition.
+        If new_entry is provided, it is appended to the shared activity log
+        (entries added by MaintenanceRunner are never overwritten).
+        Otherwise the in-memory list is written as a full snapshot.
         """
         if new_entry:
-            with _activity_file_lock:
-                activities = _load_activity_unlocked()
-                activities.insert(0, new_entry)
-                activities = activities[:MAX_RECENT_ACTIVITY]
-                _save_activity_unlocked(activities)
+            append_activity(new_entry)
         else:
             save_activity(self._recent_activity)
 
@@ -1096,6 +1068,14 @@ class OperationRunner:
             except (ImportError, AttributeError):
                 pass
 
+            # The run may have changed which files pins resolve to (new episodes,
+            # upgrades, orphaned pins) — rebuild the pin map off the request path
+            try:
+                from web.services.pinned_service import get_pinned_service
+                get_pinned_service().refresh_pin_map_in_background()
+            except (ImportError, AttributeError):
+                pass
+
             # After operation completes, check if maintenance actions are queued
             try:
                 from web.services.maintenance_runner import get_maintenance_runner
@@ -14,10 +14,18 @@ converted to **real** paths and then **cache** paths via the settings'
 ``path_mappings``. Subtitles/sidecars are protected at the web layer by
 inheriting from their grouped parent video (``CacheService.get_all_cached_files``
 does the grouping), so this service only exposes video cache paths.
+
+Caching: the resolver output is kept in memory for ``PIN_MAP_TTL_SECONDS``
+and reused by every page that needs pinned paths (Cached Files rows, pin
+chips, budget). It is rebuilt when the set of pins or the resolution
+preference changes, and dropped (then rebuilt in the background) when a
+PlexCache run finishes. Display titles are stored on the tracker entries
+at pin time, so listing pins doesn't fetch each pin from Plex.
 """
 
 import logging
 import threading
+import time
 from typing import Any, Dict, List, Optional, Set, Tuple
 
 from core.pinned_media import (
@@ -43,6 +51,9 @@ logger = logging.getLogger(__name__)
 # Backward-compat alias so any caller that used the private name keeps working.
 _resolve_size_setting = resolve_size_setting
 
+# How long a resolved pin map is reused before Plex is asked again
+PIN_MAP_TTL_SECONDS = 600
+
 
 class PinnedService:
     """Business logic for pinned media (web layer)."""
@@ -50,6 +61,9 @@ class PinnedService:
     def __init__(self):
         from web.dependencies import get_pinned_tracker
         self._tracker: PinnedMediaTracker = get_pinned_tracker()
+        self._pin_map_lock = threading.Lock()
+        # (pinned keys, preference, built_at, resolver tuples) or None
+        self._pin_map: Optional[Tuple[frozenset, str, float, List[tuple]]] = None
 
     # ------------------------------------------------------------------
     # Plex helpers
@@ -66,7 +80,8 @@ class PinnedService:
             return None
         try:
             from plexapi.server import PlexServer
-            return PlexServer(plex_url, plex_token, timeout=30)
+            from core.http_sessions import get_plex_session
+            return PlexServer(plex_url, plex_token, session=get_plex_session(), timeout=30)
         except Exception as e:
             logger.warning(f"PinnedService: could not connect to Plex: {e}")
             return None
@@ -354,6 +369,7 @@ class PinnedService:
             # caller simply skips immediate eviction.
             before_paths = self.resolve_all_to_cache_paths()
             self._tracker.remove_pin(rating_key)
+            self._drop_from_pin_map({rating_key})
             after_paths = self.resolve_all_to_cache_paths()
             freshly_unpinned = sorted(before_paths - after_paths)
             return {
@@ -394,7 +410,8 @@ class PinnedService:
         # This tells us which cache paths are NEWLY protected by the new pin
         # (versus already-protected by another existing pin).
         before_paths = self.resolve_all_to_cache_paths()
-        self._tracker.add_pin(rating_key, pin_type, title, added_by="web")
+        display = self._build_display(self._get_plex_server(), pin_type, rating_key, title)
+        self._tracker.add_pin(rating_key, pin_type, title, added_by="web", display=display)
         after_paths = self.resolve_all_to_cache_paths()
         freshly_pinned = sorted(after_paths - before_paths)
         return {
@@ -422,7 +439,13 @@ class PinnedService:
             item = plex.fetchItem(int(rating_key))
         except Exception:
             return fallback
+        return self._title_for_item(item, pin_type, fallback)
 
+    @staticmethod
+    def _title_for_item(item, pin_type: str, fallback: str) -> str:
+        """Build the ``_decorate_title`` display title from a fetched Plex item."""
+        if pin_type not in ("season", "episode"):
+            return fallback
         try:
             if pin_type == "season":
                 show_title = getattr(item, "parentTitle", "") or getattr(item, "grandparentTitle", "") or ""
@@ -449,26 +472,74 @@ class PinnedService:
         except Exception:
             return fallback
 
+    def _build_display(self, plex, pin_type: str, rating_key: str,
+                       stored_title: str) -> Optional[Dict[str, Any]]:
+        """Fetch a pin's item once and build the display metadata stored on the pin.
+
+        Returns None when Plex is unavailable or the item can't be fetched.
+        """
+        if plex is None:
+            return None
+        try:
+            item = plex.fetchItem(int(rating_key))
+        except Exception:
+            return None
+        ctx = self._default_group_and_scope(pin_type, rating_key, stored_title)
+        self._apply_group_and_scope(ctx, item, pin_type, rating_key, stored_title)
+        return {
+            "title": self._title_for_item(item, pin_type, stored_title),
+            "group_rating_key": ctx["group_rating_key"],
+            "group_title": ctx["group_title"],
+            "group_type": ctx["group_type"],
+            "scope_text": ctx["scope_text"],
+            "sort_key": list(ctx["sort_key"]),
+        }
+
+    def _pin_display(self, pin: Dict[str, Any], get_plex) -> Optional[Dict[str, Any]]:
+        """Return the pin's stored display metadata, backfilling legacy pins.
+
+        ``get_plex`` is only called for pins saved without display metadata
+        (CLI pins, pins from older versions); what it builds is stored so the
+        next listing doesn't need Plex either.
+        """
+        display = pin.get("display")
+        if display:
+            return display
+        display = self._build_display(get_plex(), pin["type"], pin["rating_key"], pin["title"])
+        if display:
+            self._tracker.set_display(pin["rating_key"], display)
+        return display
+
+    def _lazy_plex(self):
+        """Return a callable that connects to Plex on first use only."""
+        conn: List[Any] = []
+
+        def get():
+            if not conn:
+                try:
+                    conn.append(self._get_plex_server())
+                except Exception as e:
+                    logger.debug(f"PinnedService: plex unavailable: {e}")
+                    conn.append(None)
+            return conn[0]
+        return get
+
     def list_pins_with_metadata(self) -> List[Dict[str, Any]]:
         """Return pin entries decorated with resolved size + budget share.
 
         Does not hit Plex for every chip — size comes from files actually
-        on disk so the chip reflects real cache footprint.
+        on disk so the chip reflects real cache footprint, and titles come
+        from the display metadata stored on each pin.
         """
         pins = self._tracker.list_pins()
         if not pins:
             return []
 
-        # Resolve all pins once to compute per-rating-key byte totals.
-        # Returns (resolved, orphaned) where resolved is a list of
-        # (plex_path, rating_key, pin_type) tuples.
-        preference = self._get_preference()
+        # Resolve all pins once (or reuse the cached resolve) to compute
+        # per-rating-key byte totals: (plex_path, rating_key, pin_type) tuples.
         resolved_paths: List[tuple] = []
-        plex = None
         try:
-            plex = self._get_plex_server()
-            if plex is not None:
-                resolved_paths, _ = resolve_pins_to_paths(plex, self._tracker, preference)
+            resolved_paths = self._resolved_pins() or []
         except Exception as e:
             logger.warning(f"PinnedService.list_pins_with_metadata: resolve failed: {e}")
 
@@ -496,13 +567,13 @@ class PinnedService:
         ) if parsed["cache_limit_bytes"] > 0 else 0
 
         from core.system_utils import format_bytes
+        get_plex = self._lazy_plex()
         out: List[Dict[str, Any]] = []
         for pin in pins:
             rk = pin["rating_key"]
             size = bytes_by_rk.get(rk, 0)
-            display_title = self._decorate_title(
-                plex, pin["type"], rk, pin["title"]
-            )
+            display = self._pin_display(pin, get_plex)
+            display_title = (display.get("title") if display else None) or pin["title"]
             out.append({
                 "rating_key": rk,
                 "type": pin["type"],
@@ -545,6 +616,7 @@ class PinnedService:
             if self._tracker.is_pinned(rk):
                 self._tracker.remove_pin(rk)
                 removed += 1
+        self._drop_from_pin_map(set(normalized))
         after_paths = self.resolve_all_to_cache_paths()
         freshly_unpinned = sorted(before_paths - after_paths)
         return {
@@ -566,20 +638,7 @@ class PinnedService:
         Falls back gracefully when Plex is unreachable — the pin keeps its
         stored title as the scope text and is grouped as a standalone entry.
         """
-        scope_icon_map = {
-            "show": "tv",
-            "season": "layers",
-            "episode": "play",
-            "movie": "film",
-        }
-        result = {
-            "group_rating_key": rating_key,
-            "group_title": stored_title,
-            "group_type": "show" if pin_type in ("show", "season", "episode") else "movie",
-            "scope_text": stored_title,
-            "scope_icon": scope_icon_map.get(pin_type, "file-video"),
-            "sort_key": (0, 0, 0),
-        }
+        result = self._default_group_and_scope(pin_type, rating_key, stored_title)
 
         if plex is None:
             return result
@@ -589,6 +648,33 @@ class PinnedService:
         except Exception:
             return result
 
+        self._apply_group_and_scope(result, item, pin_type, rating_key, stored_title)
+        return result
+
+    _SCOPE_ICONS = {
+        "show": "tv",
+        "season": "layers",
+        "episode": "play",
+        "movie": "film",
+    }
+
+    @classmethod
+    def _default_group_and_scope(cls, pin_type: str, rating_key: str,
+                                 stored_title: str) -> Dict[str, Any]:
+        """Group/scope fields for a pin whose Plex item is unavailable."""
+        return {
+            "group_rating_key": rating_key,
+            "group_title": stored_title,
+            "group_type": "show" if pin_type in ("show", "season", "episode") else "movie",
+            "scope_text": stored_title,
+            "scope_icon": cls._SCOPE_ICONS.get(pin_type, "file-video"),
+            "sort_key": (0, 0, 0),
+        }
+
+    @staticmethod
+    def _apply_group_and_scope(result: Dict[str, Any], item, pin_type: str,
+                               rating_key: str, stored_title: str) -> None:
+        """Fill ``result`` with the group/scope fields derived from a fetched item."""
         try:
             if pin_type == "movie":
                 result["group_rating_key"] = rating_key
@@ -656,8 +742,6 @@ class PinnedService:
             # Any unexpected plexapi issue — keep the safe defaults
             pass
 
-        return result
-
     def list_pins_grouped(self) -> List[Dict[str, Any]]:
         """Return pins grouped by show/movie, sorted for stable display.
 
@@ -686,18 +770,24 @@ class PinnedService:
         if not flat:
             return []
 
-        plex = None
-        try:
-            plex = self._get_plex_server()
-        except Exception as e:
-            logger.debug(f"PinnedService.list_pins_grouped: plex unavailable: {e}")
+        # list_pins_with_metadata has stored display metadata on every pin
+        # Plex could describe; only the rest fall back to a live lookup.
+        get_plex = self._lazy_plex()
 
         from core.system_utils import format_bytes
         groups: Dict[str, Dict[str, Any]] = {}
         for pin in flat:
-            ctx = self._pin_group_and_scope(
-                plex, pin["type"], pin["rating_key"], pin["title"]
-            )
+            stored = self._tracker.get_pin(pin["rating_key"]) or {}
+            display = stored.get("display")
+            if display:
+                ctx = self._default_group_and_scope(pin["type"], pin["rating_key"], pin["title"])
+                ctx.update({k: display[k] for k in (
+                    "group_rating_key", "group_title", "group_type", "scope_text") if k in display})
+                ctx["sort_key"] = tuple(display.get("sort_key") or (0, 0, 0))
+            else:
+                ctx = self._pin_group_and_scope(
+                    get_plex(), pin["type"], pin["rating_key"], pin["title"]
+                )
             gk = ctx["group_rating_key"]
             if gk not in groups:
                 groups[gk] = {
@@ -749,19 +839,15 @@ class PinnedService:
         if not self._tracker.list_pins():
             return {}
 
-        plex = self._get_plex_server()
-        if plex is None:
-            return {}
-
         try:
-            resolved, _orphaned = resolve_pins_to_paths(
-                plex, self._tracker, self._get_preference()
-            )
+            resolved = self._resolved_pins()
         except Exception as e:
             logger.warning(
                 f"PinnedService.resolve_all_to_cache_path_map failed: {e}"
             )
             return {}
+        if resolved is None:
+            return {}
 
         from web.services import get_settings_service
         settings = get_settings_service().get_all()
@@ -774,6 +860,68 @@ class PinnedService:
                 path_map[cache_path] = (rk, pin_type)
         return path_map
 
+    def _resolved_pins(self) -> Optional[List[tuple]]:
+        """Return resolver tuples for every pin, reusing the in-memory map.
+
+        The cached map is reused while the set of pinned rating_keys and the
+        resolution preference are unchanged and it is younger than
+        ``PIN_MAP_TTL_SECONDS``. Returns None when Plex is unavailable.
+        """
+        keys = frozenset(self._tracker.pinned_rating_keys())
+        preference = self._get_preference()
+        with self._pin_map_lock:
+            cached = self._pin_map
+            if cached is not None and cached[0] == keys and cached[1] == preference \
+                    and time.monotonic() - cached[2] < PIN_MAP_TTL_SECONDS:
+                return cached[3]
+
+        plex = self._get_plex_server()
+        if plex is None:
+            return None
+        resolved, orphaned = resolve_pins_to_paths(plex, self._tracker, preference)
+        with self._pin_map_lock:
+            # Store the keys this resolve started from (minus orphans it removed),
+            # not a re-read: a pin added meanwhile may be missing from ``resolved``,
+            # and must make the next lookup miss rather than reuse this map
+            self._pin_map = (keys - set(orphaned), preference, time.monotonic(), resolved)
+        return resolved
+
+    def _drop_from_pin_map(self, rating_keys: Set[str]) -> None:
+        """Remove unpinned keys from the cached map so unpinning needs no resolve."""
+        with self._pin_map_lock:
+            if self._pin_map is None:
+                return
+            keys, preference, built_at, resolved = self._pin_map
+            self._pin_map = (
+                keys - rating_keys, preference, built_at,
+                [entry for entry in resolved if entry[1] not in rating_keys],
+            )
+
+    def invalidate_pin_map(self) -> None:
+        """Drop the cached pin map (e.g. after a run changed the library or pins)."""
+        with self._pin_map_lock:
+            self._pin_map = None
+
+    def refresh_pin_map_in_background(self) -> None:
+        """Invalidate the pin map and rebuild it on a daemon thread.
+
+        Keeps the next Cached Files / Pinned page load from paying for the
+        resolve after a run finishes. The run uses its own tracker (and may
+        have removed orphaned pins), so pins are re-read from storage first.
+        """
+        self._tracker.reload()
+        self.invalidate_pin_map()
+        if not self._tracker.pinned_rating_keys():
+            return
+
+        def _refresh():
+            try:
+                self._resolved_pins()
+            except Exception as e:
+                logger.debug(f"PinnedService: background pin map refresh failed: {e}")
+
+        threading.Thread(target=_refresh, name="pin-map-refresh", daemon=True).start()
+
     @staticmethod
     def _plex_to_cache(plex_path: str, path_mappings: List[Dict]) -> Optional[str]:
         """Convert a plex-form path to a cache-form path via prefix swap.
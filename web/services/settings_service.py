@@ -9,6 +9,7 @@ from pathlib import Path
 from typing import Dict, Any, Optional, List
 from dataclasses import dataclass, field, asdict
 
+from core import json_codec
 from web.config import DATA_DIR, SETTINGS_FILE, IS_DOCKER
 from web.dependencies import get_system_detector
 
@@ -91,8 +92,8 @@ class SettingsService:
             return {}
 
         try:
-            with open(self.settings_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(self.settings_file, 'rb') as f:
+                return json_codec.load(f)
         except (json.JSONDecodeError, IOError):
             return {}
 
@@ -943,7 +944,8 @@ class SettingsService:
 
         try:
             from plexapi.server import PlexServer
-            plex = PlexServer(plex_url, plex_token, timeout=10)
+            from core.http_sessions import get_plex_session
+            plex = PlexServer(plex_url, plex_token, session=get_plex_session(), timeout=10)
 
             libraries = []
             for section in plex.library.sections():
@@ -1001,7 +1003,8 @@ class SettingsService:
             if plex_url and plex_token:
                 try:
                     from plexapi.server import PlexServer
-                    plex = PlexServer(plex_url, plex_token, timeout=10)
+                    from core.http_sessions import get_plex_session
+                    plex = PlexServer(plex_url, plex_token, session=get_plex_session(), timeout=10)
                     account = plex.myPlexAccount()
                     users.append({
                         "username": account.username,
@@ -1045,7 +1048,8 @@ class SettingsService:
         try:
             import logging
             from plexapi.server import PlexServer
-            plex = PlexServer(plex_url, plex_token, timeout=10)
+            from core.http_sessions import get_plex_session
+            plex = PlexServer(plex_url, plex_token, session=get_plex_session(), timeout=10)
 
             users = []
             account_error = None
@@ -1157,8 +1161,9 @@ class SettingsService:
 
         try:
             from plexapi.server import PlexServer
+            from core.http_sessions import get_plex_session
 
-            plex = PlexServer(plex_url, plex_token, timeout=15)
+            plex = PlexServer(plex_url, plex_token, session=get_plex_session(), timeout=15)
             account = plex.myPlexAccount()
             machine_id = plex.machineIdentifier
 
@@ -1670,24 +1675,24 @@ class SettingsService:
         return DATA_DIR / "pinned_media.json"
 
     def _read_pinned_tracker_file(self) -> Dict[str, Any]:
-        """Return the raw pinned_media.json contents as a dict, or {} if absent."""
-        import json
-        path = self._pinned_tracker_path()
-        if not path.exists():
-            return {}
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f) or {}
+        """Return the pinned tracker's entries from the configured state backend ({} if absent)."""
+        from core.state_store import load_state
+        from web.config import get_state_backend
+        return load_state(self._pinned_tracker_path(), get_state_backend())
 
     def _restore_pinned_tracker_file(self, payload: Dict[str, Any], merge: bool) -> None:
-        """Write the imported pin payload to the tracker file.
-
-        In merge mode, unions the imported pins with whatever is already on
-        disk (imported values win on key collision). In replace mode, the
-        imported payload overwrites the file entirely. After writing, the
-        PinnedService singleton is reset so the next access constructs a
-        fresh tracker that loads from the new file.
+        """Write the imported pin payload to the pinned tracker.
+
+        In merge mode, unions the imported pins with the existing ones
+        (imported values win on key collision). In replace mode, the
+        imported payload replaces them entirely. Goes through the configured
+        state backend, so with ``state_backend=sqlite`` the pins land in the
+        state database rather than a JSON file nothing reads. After writing,
+        the PinnedService singleton is reset so the next access constructs a
+        fresh tracker that loads the new pins.
         """
-        from core.file_operations import save_json_atomically
+        from core.state_store import replace_state
+        from web.config import get_state_backend
         if not isinstance(payload, dict):
             raise ValueError("pinned_media payload must be a JSON object")
 
@@ -1701,7 +1706,7 @@ class SettingsService:
 
         path = self._pinned_tracker_path()
         path.parent.mkdir(parents=True, exist_ok=True)
-        save_json_atomically(str(path), to_write, "pinned_media")
+        replace_state(path, to_write, get_state_backend())
 
         # Reset the PinnedService singleton so subsequent reads see fresh data.
         try:
@@ -2,17 +2,20 @@
 
 import json
 import logging
+import os
+import re
 import threading
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Set
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
 from web.config import PROJECT_ROOT, DATA_DIR
-from core.system_utils import format_bytes, format_duration, format_cache_age
+from core import json_codec
+from core.system_utils import format_bytes, format_duration, format_cache_age, write_text_atomically
 
 
 @dataclass
@@ -36,7 +39,8 @@ class WebCacheService:
 
     Features:
     - In-memory cache with TTL
-    - Disk persistence for instant startup
+    - Disk persistence for instant startup (one compact file per key,
+      loaded lazily on first access)
     - Background refresh task
     - Thread-safe operations
     """
@@ -47,16 +51,23 @@ class WebCacheService:
     # Background refresh interval (5 minutes)
     REFRESH_INTERVAL_SECONDS = 300
 
-    def __init__(self):
+    # Payloads larger than this are kept in memory only (None = no cap)
+    MAX_PERSIST_BYTES: Optional[int] = 16 * 1024 * 1024
+
+    def __init__(self, cache_dir: Optional[Path] = None, max_persist_bytes: Optional[int] = MAX_PERSIST_BYTES):
         self._cache: Dict[str, CacheEntry] = {}
         self._lock = threading.RLock()
+        self._disk_lock = threading.Lock()  # serializes file writes, not reads
         self._refresh_thread: Optional[threading.Thread] = None
         self._stop_refresh = threading.Event()
         self._refresh_callbacks: Dict[str, Callable] = {}
-        self._disk_cache_file = DATA_DIR / "web_ui_cache.json"
+        self._disk_cache_dir = Path(cache_dir) if cache_dir else DATA_DIR / "web_ui_cache"
+        self._legacy_cache_file = self._disk_cache_dir.parent / "web_ui_cache.json"
+        self._max_persist_bytes = max_persist_bytes
+        # Keys already looked up on disk (hit or miss), so misses stay in memory
+        self._disk_checked: Set[str] = set()
 
-        # Load from disk on init
-        self._load_from_disk()
+        self._migrate_legacy_cache_file()
 
     def get(self, key: str, max_age_seconds: Optional[int] = None) -> Optional[Any]:
         """
@@ -73,7 +84,7 @@ class WebCacheService:
             max_age_seconds = self.DEFAULT_TTL_SECONDS
 
         with self._lock:
-            entry = self._cache.get(key)
+            entry = self._get_entry(key)
             if entry and not entry.is_stale(max_age_seconds):
                 return entry.data
         return None
@@ -86,7 +97,7 @@ class WebCacheService:
             (data, updated_at) or (None, None) if not cached
         """
         with self._lock:
-            entry = self._cache.get(key)
+            entry = self._get_entry(key)
             if entry:
                 return entry.data, entry.updated_at
         return None, None
@@ -100,27 +111,39 @@ class WebCacheService:
             data: Data to cache
             save_to_disk: Whether to persist to disk
         """
+        entry = CacheEntry(data=data, updated_at=datetime.now())
         with self._lock:
-            self._cache[key] = CacheEntry(data=data, updated_at=datetime.now())
+            self._cache[key] = entry
+            self._disk_checked.add(key)
 
         if save_to_disk:
-            self._save_to_disk()
+            self._save_key_to_disk(key, entry)
 
     def invalidate(self, key: str):
-        """Remove a specific cache entry"""
+        """Remove a specific cache entry (in memory and on disk)"""
         with self._lock:
-            if key in self._cache:
-                del self._cache[key]
+            self._cache.pop(key, None)
+            self._disk_checked.add(key)
+        self._remove_key_from_disk(key)
 
     def invalidate_all(self):
-        """Clear all cache entries"""
+        """Clear all cache entries (in memory and on disk)"""
         with self._lock:
+            keys = set(self._cache) | self._disk_checked
             self._cache.clear()
+        try:
+            keys.update(p.stem for p in self._disk_cache_dir.glob("*.json"))
+        except OSError:
+            pass
+        with self._lock:
+            self._disk_checked.update(keys)
+        for key in keys:
+            self._remove_key_from_disk(key)
 
     def get_last_updated(self, key: str) -> Optional[datetime]:
         """Get the timestamp when a cache entry was last updated"""
         with self._lock:
-            entry = self._cache.get(key)
+            entry = self._get_entry(key)
             return entry.updated_at if entry else None
 
     def register_refresh_callback(self, key: str, callback: Callable):
@@ -206,51 +229,119 @@ class WebCacheService:
         if self._refresh_thread:
             self._refresh_thread.join(timeout=5)
 
-    def _load_from_disk(self):
-        """Load cached data from disk"""
-        if not self._disk_cache_file.exists():
-            return
+    # ------------------------------------------------------------------
+    # Disk persistence: <DATA_DIR>/web_ui_cache/<key>.json
+    # ------------------------------------------------------------------
+
+    def _key_file(self, key: str) -> Path:
+        """Return the cache file for ``key`` (unsafe characters replaced)."""
+        return self._disk_cache_dir / (re.sub(r'[^A-Za-z0-9_.-]', '_', key) + ".json")
+
+    def _get_entry(self, key: str) -> Optional[CacheEntry]:
+        """Return the in-memory entry, loading it from disk on first access.
 
+        Caller MUST hold ``self._lock``.
+        """
+        entry = self._cache.get(key)
+        if entry is None and key not in self._disk_checked:
+            self._disk_checked.add(key)
+            entry = self._load_key_from_disk(key)
+            if entry is not None:
+                self._cache[key] = entry
+        return entry
+
+    def _load_key_from_disk(self, key: str) -> Optional[CacheEntry]:
+        """Read one key's cache file, or None if missing or unreadable."""
         try:
-            with open(self._disk_cache_file, 'r', encoding='utf-8') as f:
-                disk_data = json.load(f)
+            with open(self._key_file(key), 'rb') as f:
+                entry_data = json_codec.load(f)
+            return CacheEntry(
+                data=entry_data['data'],
+                updated_at=datetime.fromisoformat(entry_data['updated_at']),
+            )
+        except FileNotFoundError:
+            return None
+        except (json.JSONDecodeError, IOError, KeyError, TypeError, ValueError) as e:
+            logger.warning("Could not load disk cache for '%s': %s", key, e)
+            return None
+
+    def _save_key_to_disk(self, key: str, entry: CacheEntry):
+        """Write one key's cache file compactly and atomically.
+
+        Serialization happens outside ``self._lock`` so readers aren't blocked
+        by a large payload. Payloads over the size cap are not persisted (any
+        older file for the key is removed so it can't be served after restart).
+        """
+        try:
+            payload = json_codec.dumps_bytes(
+                {'data': entry.data, 'updated_at': entry.updated_at.isoformat()},
+                default=str,
+            )
+        except (TypeError, ValueError) as e:
+            # Skip non-serializable entries
+            logger.debug("Not persisting '%s': %s", key, e)
+            return
 
+        with self._disk_lock:
             with self._lock:
-                for key, entry_data in disk_data.items():
-                    # Parse the stored datetime
-                    updated_at = datetime.fromisoformat(entry_data['updated_at'])
-                    self._cache[key] = CacheEntry(
-                        data=entry_data['data'],
-                        updated_at=updated_at
-                    )
-            logger.info("Loaded %d entries from disk cache", len(disk_data))
-        except (json.JSONDecodeError, IOError, KeyError) as e:
-            logger.warning("Could not load disk cache: %s", e)
+                if self._cache.get(key) is not entry:
+                    return  # superseded by a newer set() or invalidated
+            if self._max_persist_bytes is not None and len(payload) > self._max_persist_bytes:
+                logger.debug("Not persisting '%s': %d bytes exceeds %d byte cap",
+                             key, len(payload), self._max_persist_bytes)
+                self._remove_key_file(key)
+                return
+            try:
+                self._disk_cache_dir.mkdir(parents=True, exist_ok=True)
+                write_text_atomically(str(self._key_file(key)), payload)
+            except OSError as e:
+                logger.warning("Could not save disk cache for '%s': %s", key, e)
 
-    def _save_to_disk(self):
-        """Save current cache to disk"""
+    def _remove_key_from_disk(self, key: str):
+        with self._disk_lock:
+            self._remove_key_file(key)
+
+    def _remove_key_file(self, key: str):
+        """Delete one key's cache file. Caller MUST hold ``self._disk_lock``."""
+        try:
+            os.remove(self._key_file(key))
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning("Could not remove disk cache for '%s': %s", key, e)
+
+    def _migrate_legacy_cache_file(self):
+        """Split the old single-file cache (web_ui_cache.json) into per-key files."""
         try:
-            # Ensure data directory exists
-            self._disk_cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self._legacy_cache_file, 'rb') as f:
+                disk_data = json_codec.load(f)
+        except FileNotFoundError:
+            return
+        except (json.JSONDecodeError, IOError) as e:
+            logger.warning("Could not load disk cache: %s", e)
+            return
 
+        migrated = 0
+        for key, entry_data in disk_data.items():
+            try:
+                entry = CacheEntry(
+                    data=entry_data['data'],
+                    updated_at=datetime.fromisoformat(entry_data['updated_at']),
+                )
+            except (KeyError, TypeError, ValueError):
+                continue
             with self._lock:
-                disk_data = {}
-                for key, entry in self._cache.items():
-                    # Only save serializable data
-                    try:
-                        disk_data[key] = {
-                            'data': entry.data,
-                            'updated_at': entry.updated_at.isoformat()
-                        }
-                    except (TypeError, ValueError):
-                        # Skip non-serializable entries
-                        pass
-
-            with open(self._disk_cache_file, 'w', encoding='utf-8') as f:
-                json.dump(disk_data, f, indent=2, default=str)
-
-        except IOError as e:
-            logger.warning("Could not save disk cache: %s", e)
+                self._cache[key] = entry
+                self._disk_checked.add(key)
+            self._save_key_to_disk(key, entry)
+            migrated += 1
+
+        try:
+            os.remove(self._legacy_cache_file)
+        except OSError:
+            pass
+        logger.info("Migrated %d entries from %s to per-key cache files",
+                    migrated, self._legacy_cache_file.name)
 
 
 # Cache keys